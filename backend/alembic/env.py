@@ -48,7 +48,11 @@ _PRESERVED_AI_TABLES = {
 
 def _include_object(object_, name, type_, reflected, compare_to):
     # Excluded tables have no Python model by design — preserved schema for future re-enable.
-    return not (type_ == "table" and name in _PRESERVED_AI_TABLES)
+    if type_ == "table" and name in _PRESERVED_AI_TABLES:
+        return False
+    # pg_trgm search indexes (migration 066) live only in the migration, so
+    # create_all never needs the extension; don't autogenerate drops for them.
+    return not (type_ == "index" and reflected and compare_to is None and name.endswith("_trgm"))
 
 
 def run_migrations_offline() -> None:
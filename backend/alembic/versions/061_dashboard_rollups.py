@@ -0,0 +1,63 @@
+"""Dashboard rollup tables — dashboard_daily_rollups + dashboard_rollup_sources.
+
+Per-owner, per-day aggregates the dashboard reads instead of scanning leads,
+opportunities and activities, plus the per-record snapshot used to apply
+changes as deltas (src/dashboard/rollups.py). Tables start empty; populate
+them with ``scripts/rebuild_dashboard_rollups.py`` before turning on
+``DASHBOARD_ROLLUPS_ENABLED``.
+
+Revision ID: 061_dashboard_rollups
+Revises: 060_stripe_customer_live_root
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "061_dashboard_rollups"
+down_revision = "060_stripe_customer_live_root"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_daily_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("metric", sa.String(length=30), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("dimension", sa.String(length=100), nullable=False, server_default=""),
+        sa.Column("stage_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("record_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("amount", sa.Float(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "metric", "owner_id", "day", "dimension", "stage_id",
+            name="uq_dashboard_daily_rollups_grain",
+        ),
+    )
+    op.create_index(
+        "ix_dashboard_daily_rollups_metric_owner_day",
+        "dashboard_daily_rollups", ["metric", "owner_id", "day"],
+    )
+    op.create_table(
+        "dashboard_rollup_sources",
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("dimension", sa.String(length=100), nullable=False, server_default=""),
+        sa.Column("source_id", sa.Integer(), nullable=True),
+        sa.Column("stage_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("close_day", sa.Date(), nullable=True),
+        sa.Column("amount", sa.Float(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_rollup_sources")
+    op.drop_index("ix_dashboard_daily_rollups_metric_owner_day", table_name="dashboard_daily_rollups")
+    op.drop_table("dashboard_daily_rollups")
@@ -0,0 +1,46 @@
+"""Event outbox — durable delivery queue for domain event handlers.
+
+``emit(..., db=session)`` writes one row per durable handler in the request's
+transaction; ``src.events.dispatcher.OutboxDispatcher`` claims and delivers
+them after commit. Only used when ``EVENT_BUS_DURABLE`` is on.
+
+Revision ID: 062_event_outbox
+Revises: 061_dashboard_rollups
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "062_event_outbox"
+down_revision = "061_dashboard_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("handler", sa.String(length=200), nullable=False),
+        sa.Column("ordering_key", sa.String(length=100), nullable=False, server_default=""),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_event_outbox_status_next_attempt", "event_outbox", ["status", "next_attempt_at"])
+    op.create_index("ix_event_outbox_handler_key", "event_outbox", ["handler", "ordering_key", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_outbox_handler_key", table_name="event_outbox")
+    op.drop_index("ix_event_outbox_status_next_attempt", table_name="event_outbox")
+    op.drop_table("event_outbox")
@@ -0,0 +1,64 @@
+"""Webhook event-subscription index and delivery retry columns.
+
+``webhook_event_subscriptions`` mirrors each webhook's ``events`` JSON list so
+the per-event subscriber lookup is an index seek; it is backfilled here and
+kept in step by ``WebhookService``. ``webhook_deliveries`` gains ``attempts``
+and ``next_retry_at`` for the retry sweep.
+
+Revision ID: 063_webhook_delivery_retries
+Revises: 062_event_outbox
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "063_webhook_delivery_retries"
+down_revision = "062_event_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "webhook_event_subscriptions",
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("webhook_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["webhook_id"], ["webhooks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_type", "webhook_id"),
+    )
+    op.create_index(
+        "ix_webhook_event_subscriptions_webhook_id", "webhook_event_subscriptions", ["webhook_id"]
+    )
+    op.execute(
+        """
+        INSERT INTO webhook_event_subscriptions (event_type, webhook_id)
+        SELECT DISTINCT evt, w.id
+        FROM webhooks w, json_array_elements_text(w.events::json) AS evt
+        """
+    )
+
+    op.add_column(
+        "webhook_deliveries",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "webhook_deliveries",
+        sa.Column("next_retry_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Existing rows each record exactly one attempt.
+    op.execute("UPDATE webhook_deliveries SET attempts = 1")
+    op.create_index(
+        "ix_webhook_deliveries_status_next_retry", "webhook_deliveries", ["status", "next_retry_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhook_deliveries_status_next_retry", table_name="webhook_deliveries")
+    op.drop_column("webhook_deliveries", "next_retry_at")
+    op.drop_column("webhook_deliveries", "attempts")
+    op.drop_index(
+        "ix_webhook_event_subscriptions_webhook_id", table_name="webhook_event_subscriptions"
+    )
+    op.drop_table("webhook_event_subscriptions")
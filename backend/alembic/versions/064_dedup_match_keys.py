@@ -0,0 +1,108 @@
+"""Persisted duplicate-detection keys on contacts, leads and companies.
+
+Adds ``phone_normalized`` (digits only) to all three tables,
+``name_normalized`` to contacts ("first last", lowercased) and companies
+(suffix-stripped, see ``src.dedup.keys``), plus ``lower(email)`` indexes, so
+``DedupService`` checks are indexed equality lookups. Existing rows are
+backfilled here in id-ordered batches using the same Python normalizers the
+models' write hooks use.
+
+Revision ID: 064_dedup_match_keys
+Revises: 063_webhook_delivery_retries
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from src.dedup.keys import company_name_key, person_name_key, phone_key
+
+revision = "064_dedup_match_keys"
+down_revision = "063_webhook_delivery_retries"
+branch_labels = None
+depends_on = None
+
+_BATCH = 5000
+
+
+def _backfill(table_name: str, source_columns: list[str], compute) -> None:
+    """Page through ``table_name`` by id and write the computed keys."""
+    bind = op.get_bind()
+    table = sa.table(
+        table_name,
+        sa.column("id", sa.Integer),
+        *(sa.column(name) for name in source_columns),
+        sa.column("phone_normalized", sa.String),
+        sa.column("name_normalized", sa.String),
+    )
+    key_columns = list(compute({name: None for name in source_columns}))
+    stmt = (
+        table.update()
+        .where(table.c.id == sa.bindparam("row_id"))
+        .values({name: sa.bindparam(f"new_{name}") for name in key_columns})
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(table.c.id, *(table.c[name] for name in source_columns))
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(_BATCH)
+        ).mappings().all()
+        if not rows:
+            return
+        params = []
+        for row in rows:
+            keys = compute(row)
+            if any(value is not None for value in keys.values()):
+                params.append({"row_id": row["id"], **{f"new_{k}": v for k, v in keys.items()}})
+        if params:
+            bind.execute(stmt, params)
+        last_id = rows[-1]["id"]
+
+
+def upgrade() -> None:
+    for table_name in ("contacts", "leads", "companies"):
+        op.add_column(table_name, sa.Column("phone_normalized", sa.String(length=50), nullable=True))
+    op.add_column("contacts", sa.Column("name_normalized", sa.String(length=201), nullable=True))
+    op.add_column("companies", sa.Column("name_normalized", sa.String(length=255), nullable=True))
+
+    _backfill(
+        "contacts",
+        ["phone", "first_name", "last_name"],
+        lambda row: {
+            "phone_normalized": phone_key(row["phone"]),
+            "name_normalized": person_name_key(row["first_name"], row["last_name"]),
+        },
+    )
+    _backfill("leads", ["phone"], lambda row: {"phone_normalized": phone_key(row["phone"])})
+    _backfill(
+        "companies",
+        ["phone", "name"],
+        lambda row: {
+            "phone_normalized": phone_key(row["phone"]),
+            "name_normalized": company_name_key(row["name"]),
+        },
+    )
+
+    op.create_index("ix_contacts_phone_normalized", "contacts", ["phone_normalized"])
+    op.create_index("ix_contacts_name_normalized", "contacts", ["name_normalized"])
+    op.create_index("ix_leads_phone_normalized", "leads", ["phone_normalized"])
+    op.create_index("ix_companies_phone_normalized", "companies", ["phone_normalized"])
+    op.create_index("ix_companies_name_normalized", "companies", ["name_normalized"])
+    op.create_index("ix_contacts_email_lower", "contacts", [sa.text("lower(email)")])
+    op.create_index("ix_leads_email_lower", "leads", [sa.text("lower(email)")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leads_email_lower", table_name="leads")
+    op.drop_index("ix_contacts_email_lower", table_name="contacts")
+    op.drop_index("ix_companies_name_normalized", table_name="companies")
+    op.drop_index("ix_companies_phone_normalized", table_name="companies")
+    op.drop_index("ix_leads_phone_normalized", table_name="leads")
+    op.drop_index("ix_contacts_name_normalized", table_name="contacts")
+    op.drop_index("ix_contacts_phone_normalized", table_name="contacts")
+    op.drop_column("companies", "name_normalized")
+    op.drop_column("contacts", "name_normalized")
+    for table_name in ("companies", "leads", "contacts"):
+        op.drop_column(table_name, "phone_normalized")
@@ -0,0 +1,35 @@
+"""Covering index for per-user share semi-joins.
+
+Scoped list queries now test visibility with
+``id IN (SELECT entity_id FROM entity_shares WHERE shared_with_user_id = ?
+AND entity_type IN (...) AND permission_level IN (...))``.
+``(shared_with_user_id, entity_type, entity_id) INCLUDE (permission_level)``
+answers that with an index-only scan; it also replaces the single-column
+``ix_entity_shares_shared_with``, which is its prefix.
+
+Revision ID: 065_entity_share_covering_index
+Revises: 064_dedup_match_keys
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "065_entity_share_covering_index"
+down_revision = "064_dedup_match_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_entity_shares_user_type_entity",
+        "entity_shares",
+        ["shared_with_user_id", "entity_type", "entity_id"],
+        postgresql_include=["permission_level"],
+    )
+    op.drop_index("ix_entity_shares_shared_with", table_name="entity_shares")
+
+
+def downgrade() -> None:
+    op.create_index("ix_entity_shares_shared_with", "entity_shares", ["shared_with_user_id"])
+    op.drop_index("ix_entity_shares_user_type_entity", table_name="entity_shares")
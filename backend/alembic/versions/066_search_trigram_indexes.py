@@ -0,0 +1,55 @@
+"""Trigram GIN indexes for list-endpoint search.
+
+``build_token_search`` matches each typed token with ``col ILIKE '%token%'``,
+which no b-tree can serve. ``pg_trgm``'s ``gin_trgm_ops`` indexes can, so the
+leads, contacts and companies search boxes become bitmap index scans. The
+same extension provides ``similarity()`` for ``build_search_rank``.
+
+Indexes are built ``CONCURRENTLY`` (outside the migration transaction) so
+large tables keep taking writes while they build.
+
+Revision ID: 066_search_trigram_indexes
+Revises: 065_entity_share_covering_index
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "066_search_trigram_indexes"
+down_revision = "065_entity_share_covering_index"
+branch_labels = None
+depends_on = None
+
+_SEARCH_COLUMNS = {
+    "contacts": ("first_name", "last_name", "email"),
+    "leads": ("first_name", "last_name", "email", "company_name"),
+    "companies": ("name", "email", "website"),
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for table_name, columns in _SEARCH_COLUMNS.items():
+            for column in columns:
+                op.create_index(
+                    f"ix_{table_name}_{column}_trgm",
+                    table_name,
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name, columns in _SEARCH_COLUMNS.items():
+            for column in columns:
+                op.drop_index(
+                    f"ix_{table_name}_{column}_trgm",
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
@@ -0,0 +1,88 @@
+"""Full-text search vectors on email_queue and inbound_emails.
+
+Adds a weighted ``search_vector`` tsvector (subject A, addresses B, body C)
+to both tables with a GIN index, replacing ``EmailService.search_emails``'
+ILIKE scans over every body. New rows are written by the models'
+``_sync_search_vector`` hook; existing rows are backfilled here in id-range
+batches, each committed on its own, with SQL that mirrors
+``src.email.search.search_words`` (lowercase, tags stripped, runs of
+non-alphanumerics collapsed to spaces). Unlike the Python path the SQL
+backfill leaves HTML entities and style/script text in place; those rows
+are re-indexed exactly if they are ever edited.
+
+Revision ID: 067_email_search_vector
+Revises: 066_search_trigram_indexes
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "067_email_search_vector"
+down_revision = "066_search_trigram_indexes"
+branch_labels = None
+depends_on = None
+
+_BATCH = 10_000
+_MAX_INDEXED_CHARS = 200_000
+
+
+def _words(expr: str, limit: bool = False) -> str:
+    words = f"regexp_replace(lower({expr}), '[^[:alnum:]]+', ' ', 'g')"
+    return f"left({words}, {_MAX_INDEXED_CHARS})" if limit else words
+
+
+def _vector_sql(body_expr: str) -> str:
+    subject = _words("coalesce(subject, '')")
+    addresses = _words("concat_ws(' ', from_email, to_email, cc, bcc)")
+    body = _words(f"regexp_replace(coalesce({body_expr}, ''), '<[^>]*>', ' ', 'g')", limit=True)
+    return (
+        f"setweight(to_tsvector('simple', {subject}), 'A')"
+        f" || setweight(to_tsvector('simple', {addresses}), 'B')"
+        f" || setweight(to_tsvector('simple', {body}), 'C')"
+    )
+
+
+def _backfill(table_name: str, body_expr: str) -> None:
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text(f"SELECT max(id) FROM {table_name}")).scalar() or 0
+    stmt = sa.text(
+        f"UPDATE {table_name} SET search_vector = {_vector_sql(body_expr)} "
+        "WHERE id > :lo AND id <= :hi"
+    )
+    for lo in range(0, max_id, _BATCH):
+        bind.execute(stmt, {"lo": lo, "hi": lo + _BATCH})
+
+
+def upgrade() -> None:
+    op.add_column("email_queue", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.add_column(
+        "inbound_emails", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True)
+    )
+
+    with op.get_context().autocommit_block():
+        _backfill("email_queue", "body")
+        _backfill("inbound_emails", "coalesce(body_text, body_html)")
+        op.create_index(
+            "ix_email_queue_search_vector",
+            "email_queue",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_inbound_emails_search_vector",
+            "inbound_emails",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inbound_emails_search_vector", table_name="inbound_emails")
+    op.drop_index("ix_email_queue_search_vector", table_name="email_queue")
+    op.drop_column("inbound_emails", "search_vector")
+    op.drop_column("email_queue", "search_vector")
@@ -0,0 +1,54 @@
+"""Deferred notification emails.
+
+``notification_emails`` holds the email leg of matrix-gated notifications.
+Dispatchers write rows in the triggering request's transaction;
+``NotificationDeliveryService`` renders and sends them from the scheduler,
+merging a user's quiet-hours and daily digest rows into one message.
+
+Revision ID: 068_notification_emails
+Revises: 067_email_search_vector
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "068_notification_emails"
+down_revision = "067_email_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_emails",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("sent_by_id", sa.Integer(), nullable=True),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("context", sa.JSON(), nullable=False),
+        sa.Column("link", sa.String(length=500), nullable=True),
+        sa.Column("entity_type", sa.String(length=50), nullable=True),
+        sa.Column("entity_id", sa.Integer(), nullable=True),
+        sa.Column("deliver_after", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("digest", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["sent_by_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_notification_emails_status_deliver_after",
+        "notification_emails",
+        ["status", "deliver_after"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_emails_status_deliver_after", table_name="notification_emails")
+    op.drop_table("notification_emails")
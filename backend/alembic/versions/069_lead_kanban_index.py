@@ -0,0 +1,39 @@
+"""Composite index behind the paged lead Kanban.
+
+``src.leads.kanban`` ranks each stage's leads by ``(score desc, id desc)``
+and pages a column with a keyset cursor on the same pair.
+``(pipeline_stage_id, score, id)`` serves both as a backward index scan.
+Built ``CONCURRENTLY`` so the leads table keeps taking writes.
+
+Revision ID: 069_lead_kanban_index
+Revises: 068_notification_emails
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "069_lead_kanban_index"
+down_revision = "068_notification_emails"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_leads_stage_score",
+            "leads",
+            ["pipeline_stage_id", "score", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_leads_stage_score",
+            table_name="leads",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,53 @@
+"""Audit summary rollup tables — audit_daily_rollups + audit_rollup_days.
+
+Per-day (user, entity) facts the admin audit summary reads instead of
+aggregating audit_logs, work_sessions and activities for closed days, plus
+the list of days already rolled up (src/audit/rollups.py). Tables start
+empty; populate them with ``scripts/rebuild_audit_rollups.py`` before
+turning on ``AUDIT_ROLLUPS_ENABLED``.
+
+Revision ID: 070_audit_rollups
+Revises: 069_lead_kanban_index
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "070_audit_rollups"
+down_revision = "069_lead_kanban_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_daily_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("entity_type", sa.String(length=50), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("audit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("activity_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("calls", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("call_duration_minutes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("emails", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("active_crm_seconds", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_touched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_daily_rollups_day", "audit_daily_rollups", ["day"])
+    op.create_table(
+        "audit_rollup_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("rolled_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("audit_rollup_days")
+    op.drop_index("ix_audit_daily_rollups_day", table_name="audit_daily_rollups")
+    op.drop_table("audit_daily_rollups")
@@ -0,0 +1,65 @@
+"""Full-text search vector on audit_logs.
+
+Adds a ``search_vector`` tsvector (entity type, entity id, action, IP
+address and the words of ``changes``) with a GIN index, replacing the admin
+feed's ILIKE over ``changes::text``. New rows are written by
+``AuditLog``'s ``_sync_search_vector`` hook; existing rows are backfilled
+here in id-range batches, each committed on its own, with SQL that mirrors
+``src.audit.search.audit_search_words`` (lowercase, runs of
+non-alphanumerics collapsed to spaces).
+
+Revision ID: 071_audit_search_vector
+Revises: 070_audit_rollups
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "071_audit_search_vector"
+down_revision = "070_audit_rollups"
+branch_labels = None
+depends_on = None
+
+_BATCH = 10_000
+_MAX_INDEXED_CHARS = 200_000
+
+_WORDS = (
+    "left(regexp_replace(lower(concat_ws(' ', entity_type, entity_id::text, action, "
+    f"ip_address, changes::text)), '[^[:alnum:]]+', ' ', 'g'), {_MAX_INDEXED_CHARS})"
+)
+
+
+def upgrade() -> None:
+    op.add_column("audit_logs", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        max_id = bind.execute(sa.text("SELECT max(id) FROM audit_logs")).scalar() or 0
+        stmt = sa.text(
+            f"UPDATE audit_logs SET search_vector = to_tsvector('simple', {_WORDS}) "
+            "WHERE id > :lo AND id <= :hi"
+        )
+        for lo in range(0, max_id, _BATCH):
+            bind.execute(stmt, {"lo": lo, "hi": lo + _BATCH})
+        op.create_index(
+            "ix_audit_logs_search_vector",
+            "audit_logs",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_logs_search_vector",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("audit_logs", "search_vector")
@@ -0,0 +1,35 @@
+"""Resume point for Gmail backfills.
+
+Adds ``window_start`` and ``page_token`` to ``gmail_backfill_state`` so a
+backfill that fails or is interrupted continues from the messages.list page
+it stopped on instead of re-listing the mailbox.
+
+Revision ID: 072_gmail_backfill_resume
+Revises: 071_audit_search_vector
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "072_gmail_backfill_resume"
+down_revision = "071_audit_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "gmail_backfill_state",
+        sa.Column("window_start", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "gmail_backfill_state",
+        sa.Column("page_token", sa.String(255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("gmail_backfill_state", "page_token")
+    op.drop_column("gmail_backfill_state", "window_start")
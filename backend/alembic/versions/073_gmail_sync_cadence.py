@@ -0,0 +1,50 @@
+"""Per-account cadence for Gmail forward sync.
+
+Adds ``next_sync_at``, ``sync_interval_seconds``, ``last_activity_at`` and
+``last_sync_duration_ms`` to ``gmail_sync_state``, plus an index on
+``next_sync_at`` for the scheduler's due-account claim. Existing rows keep
+``next_sync_at`` NULL and are synced on the first tick after deploy.
+
+Revision ID: 073_gmail_sync_cadence
+Revises: 072_gmail_backfill_resume
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "073_gmail_sync_cadence"
+down_revision = "072_gmail_backfill_resume"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "gmail_sync_state",
+        sa.Column("next_sync_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "gmail_sync_state",
+        sa.Column("sync_interval_seconds", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "gmail_sync_state",
+        sa.Column("last_activity_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "gmail_sync_state",
+        sa.Column("last_sync_duration_ms", sa.Integer(), nullable=True),
+    )
+    op.create_index(
+        "ix_gmail_sync_state_next_sync_at", "gmail_sync_state", ["next_sync_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gmail_sync_state_next_sync_at", table_name="gmail_sync_state")
+    op.drop_column("gmail_sync_state", "last_sync_duration_ms")
+    op.drop_column("gmail_sync_state", "last_activity_at")
+    op.drop_column("gmail_sync_state", "sync_interval_seconds")
+    op.drop_column("gmail_sync_state", "next_sync_at")
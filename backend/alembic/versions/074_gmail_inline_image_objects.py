@@ -0,0 +1,29 @@
+"""Inline Gmail images move to object storage (no schema change).
+
+The Gmail sync now writes inline images to object storage and references
+them by content hash instead of embedding base64 ``data:`` URIs in
+``inbound_emails.body_html`` / ``email_queue.body``. Those columns keep
+their type, so this revision changes no schema; it marks the point after
+which ``scripts/migrate_inline_images.py`` can rewrite older rows. That
+backfill needs app code and storage credentials and can take a while on a
+large mailbox, so it runs as a resumable script, never inside
+``alembic upgrade``.
+
+Revision ID: 074_gmail_inline_image_objects
+Revises: 073_gmail_sync_cadence
+Create Date: 2026-10-17
+"""
+
+revision = "074_gmail_inline_image_objects"
+down_revision = "073_gmail_sync_cadence"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    # Re-embed stored images first with scripts/migrate_inline_images.py --reverse.
+    pass
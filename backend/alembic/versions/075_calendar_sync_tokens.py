@@ -0,0 +1,35 @@
+"""Incremental Google Calendar sync state.
+
+Adds ``sync_token`` (Google's ``nextSyncToken``) and ``full_synced_at`` to
+``google_calendar_credentials``. Existing credentials start with neither,
+so their next pull is a full window pass that stores the first token.
+
+Revision ID: 075_calendar_sync_tokens
+Revises: 074_gmail_inline_image_objects
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "075_calendar_sync_tokens"
+down_revision = "074_gmail_inline_image_objects"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "google_calendar_credentials",
+        sa.Column("sync_token", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "google_calendar_credentials",
+        sa.Column("full_synced_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("google_calendar_credentials", "full_synced_at")
+    op.drop_column("google_calendar_credentials", "sync_token")
@@ -0,0 +1,39 @@
+"""Keyset index for the notification list.
+
+``GET /api/notifications`` pages with a ``(created_at, id)`` cursor per
+user; ``ix_notifications_user_created`` serves each page as an index range
+scan instead of sorting the user's notifications. Built concurrently so
+the table stays writable.
+
+Revision ID: 076_notifications_keyset_index
+Revises: 075_calendar_sync_tokens
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "076_notifications_keyset_index"
+down_revision = "075_calendar_sync_tokens"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_user_created",
+            "notifications",
+            ["user_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_notifications_user_created",
+            table_name="notifications",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
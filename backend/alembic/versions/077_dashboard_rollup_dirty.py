@@ -0,0 +1,34 @@
+"""Persistent dirty queue for the dashboard rollups.
+
+``dashboard_rollup_dirty`` holds one row per changed lead, opportunity or
+activity, written in the changing transaction and deleted once the
+scheduler's flush has folded it into the rollups (src/dashboard/rollups.py).
+It replaces a per-process in-memory set that lost its ids on restart.
+
+Revision ID: 077_dashboard_rollup_dirty
+Revises: 076_notifications_keyset_index
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "077_dashboard_rollup_dirty"
+down_revision = "076_notifications_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_rollup_dirty",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_rollup_dirty")
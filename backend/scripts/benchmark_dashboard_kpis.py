@@ -0,0 +1,166 @@
+"""Benchmark dashboard KPI generation: batched engine vs card-by-card path.
+
+Compares ``NumberCardGenerator.get_all_kpis`` (one conditional-aggregate query
+per base table) against ``get_all_kpis_sequential`` (one or two queries per
+card) — query count and wall-clock latency, plus a check that both return the
+same cards.
+
+By default it seeds a throwaway in-memory SQLite database with ``--rows``
+synthetic records per table. Pass ``--database-url`` to run read-only against
+an existing database instead (nothing is written), optionally scoped to one
+owner with ``--owner-id``. Round-trip savings show up far more on Postgres
+over a network than on in-process SQLite.
+
+Usage:
+  python scripts/benchmark_dashboard_kpis.py --rows 20000
+  python scripts/benchmark_dashboard_kpis.py --database-url "$DATABASE_URL" --owner-id 7
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("SECRET_KEY", "benchmark-only")
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.activities.models import Activity
+from src.auth.models import User
+from src.companies.models import Company
+from src.contacts.models import Contact
+from src.dashboard.number_cards import NumberCardGenerator
+from src.database import Base
+from src.leads.models import Lead
+from src.opportunities.models import Opportunity, PipelineStage
+
+_CHUNK = 1000
+
+
+async def _seed(session: AsyncSession, rows: int, owners: int) -> None:
+    rng = random.Random(42)
+    now = datetime.now(UTC)
+    users = [
+        {"email": f"bench{i}@example.com", "hashed_password": "x", "full_name": f"Bench {i}"}
+        for i in range(1, owners + 1)
+    ]
+    await session.execute(insert(User), users)
+    stages = [
+        {"name": "Open", "order": 1, "probability": 20, "is_won": False, "is_lost": False},
+        {"name": "Won", "order": 2, "probability": 100, "is_won": True, "is_lost": False},
+        {"name": "Lost", "order": 3, "probability": 0, "is_won": False, "is_lost": True},
+    ]
+    await session.execute(insert(PipelineStage), stages)
+
+    def created() -> datetime:
+        return now - timedelta(days=rng.randint(0, 365))
+
+    def owner() -> int:
+        return rng.randint(1, owners)
+
+    batches = {
+        Contact: lambda i: {
+            "first_name": f"C{i}", "last_name": "Bench", "status": rng.choice(["active", "inactive"]),
+            "owner_id": owner(), "created_at": created(),
+        },
+        Company: lambda i: {"name": f"Company {i}", "owner_id": owner(), "created_at": created()},
+        Lead: lambda i: {
+            "first_name": f"L{i}", "last_name": "Bench",
+            "status": rng.choice(["new", "contacted", "qualified", "converted", "lost"]),
+            "pipeline_stage_id": rng.choice([None, 1, 2, 3]),
+            "owner_id": owner(), "created_at": created(),
+        },
+        Opportunity: lambda i: {
+            "name": f"Deal {i}", "pipeline_stage_id": rng.choice([1, 2, 3]),
+            "amount": rng.randint(100, 100_000),
+            "actual_close_date": date.today() - timedelta(days=rng.randint(0, 120)),
+            "owner_id": owner(), "created_at": created(),
+        },
+        Activity: lambda i: {
+            "activity_type": rng.choice(["task", "call"]), "subject": f"A{i}",
+            "entity_type": "contacts", "entity_id": 1, "is_completed": rng.random() < 0.5,
+            "due_date": date.today() - timedelta(days=rng.randint(0, 3)),
+            "owner_id": owner(), "created_at": created(),
+        },
+    }
+    for model, make in batches.items():
+        for start in range(0, rows, _CHUNK):
+            await session.execute(
+                insert(model), [make(i) for i in range(start, min(rows, start + _CHUNK))]
+            )
+    await session.commit()
+
+
+async def _measure(session_maker, engine, method: str, owner_id: int | None, repeats: int):
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    timings = []
+    cards = None
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        for _ in range(repeats):
+            statements.clear()
+            async with session_maker() as session:
+                generator = NumberCardGenerator(session, user_id=owner_id)
+                started = time.perf_counter()
+                cards = await getattr(generator, method)()
+                timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    return cards, len(statements), timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="synthetic rows per table")
+    parser.add_argument("--owners", type=int, default=10)
+    parser.add_argument("--owner-id", type=int, default=None, help="scope KPIs to one owner")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="benchmark an existing DB read-only")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    if not args.database_url:
+        print(f"Seeding {args.rows} rows per table across {args.owners} owners...")
+        async with session_maker() as session:
+            await _seed(session, args.rows, args.owners)
+
+    results = {}
+    for method in ("get_all_kpis_sequential", "get_all_kpis"):
+        results[method] = await _measure(
+            session_maker, engine, method, args.owner_id, args.repeats
+        )
+
+    print(f"{'path':<26}{'queries':>9}{'median ms':>12}{'p95 ms':>10}")
+    for method, (_, queries, timings) in results.items():
+        p95 = sorted(timings)[max(0, int(len(timings) * 0.95) - 1)]
+        print(f"{method:<26}{queries:>9}{statistics.median(timings):>12.1f}{p95:>10.1f}")
+    same = results["get_all_kpis"][0] == results["get_all_kpis_sequential"][0]
+    print(f"identical cards: {same}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""Benchmark share-aware list scoping: inlined ID list vs entity_shares semi-join.
+
+For reps holding 10, 1k and 50k contact shares, runs the scoped contacts
+list (count + first page) two ways:
+
+- ``in-list``: shared IDs passed as a plain list, rendered as
+  ``contacts.id IN (...)`` with one bind parameter per share;
+- ``semi-join``: the rep's ``SharedScope``, rendered as
+  ``contacts.id IN (SELECT entity_id FROM entity_shares ...)`` by
+  ``shared_with_clause``.
+
+Reports the longest statement sent, bind parameters, and latency. It seeds a
+throwaway in-memory SQLite database by default; pass ``--database-url`` to
+seed a scratch Postgres database instead (tables are created, never
+dropped). Note asyncpg refuses more than 32767 bind parameters, so the 50k
+in-list case fails there outright.
+
+Usage:
+  python scripts/benchmark_shared_scoping.py --contacts 100000
+  python scripts/benchmark_shared_scoping.py --database-url "$SCRATCH_DATABASE_URL"
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("SECRET_KEY", "benchmark-only")
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import src.main  # noqa: F401 - registers every model (and settles import order) for create_all
+from src.auth.models import User
+from src.contacts.models import Contact
+from src.contacts.service import ContactService
+from src.core.models import EntityShare
+from src.core.share_permissions import SharedScope
+from src.database import Base
+
+_CHUNK = 1000
+_SHARE_COUNTS = (10, 1_000, 50_000)
+_OWNER_ID = 1  # owns every seeded contact; reps are users 2..n
+
+
+@dataclass(frozen=True)
+class _InlinedShares:
+    """Stands in for a ``SharedScope`` with every shared ID inlined."""
+
+    ids: tuple[int, ...]
+
+    def entity_ids(self) -> list[int]:
+        return list(self.ids)
+
+
+async def _seed(session: AsyncSession, contacts: int) -> dict[int, list[int]]:
+    """Seed contacts owned by user 1 and one rep per share count."""
+    rng = random.Random(42)
+    users = [
+        {"email": f"bench{i}@example.com", "hashed_password": "x", "full_name": f"Bench {i}"}
+        for i in range(1, len(_SHARE_COUNTS) + 2)
+    ]
+    await session.execute(insert(User), users)
+    for start in range(0, contacts, _CHUNK):
+        await session.execute(insert(Contact), [
+            {"first_name": f"C{i}", "last_name": "Bench", "status": "active", "owner_id": _OWNER_ID}
+            for i in range(start, min(contacts, start + _CHUNK))
+        ])
+
+    shares: dict[int, list[int]] = {}
+    for rep_id, count in enumerate(_SHARE_COUNTS, start=2):
+        ids = sorted(rng.sample(range(1, contacts + 1), min(count, contacts)))
+        shares[rep_id] = ids
+        for start in range(0, len(ids), _CHUNK):
+            await session.execute(insert(EntityShare), [
+                {
+                    "entity_type": "contacts", "entity_id": entity_id,
+                    "shared_with_user_id": rep_id, "shared_by_user_id": _OWNER_ID,
+                    "permission_level": "view",
+                }
+                for entity_id in ids[start:start + _CHUNK]
+            ])
+    await session.commit()
+    return shares
+
+
+async def _measure(session_maker, engine, rep_id: int, shared, repeats: int):
+    longest = {"sql": 0, "params": 0}
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        longest["sql"] = max(longest["sql"], len(statement))
+        longest["params"] = max(longest["params"], len(parameters or ()))
+
+    timings = []
+    total = None
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        for _ in range(repeats):
+            async with session_maker() as session:
+                started = time.perf_counter()
+                _, total = await ContactService(session).get_list(
+                    owner_id=rep_id, shared_entity_ids=shared,
+                )
+                timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    return total, longest, timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=60_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="scratch DB to seed and benchmark")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print(f"Seeding {args.contacts} contacts and reps with {_SHARE_COUNTS} shares...")
+    async with session_maker() as session:
+        shares = await _seed(session, args.contacts)
+
+    print(f"{'shares':>7}  {'path':<10}{'rows':>7}{'sql bytes':>11}{'params':>8}{'median ms':>11}")
+    for rep_id, ids in shares.items():
+        variants = {
+            "in-list": _InlinedShares(tuple(ids)),
+            "semi-join": SharedScope(user_id=rep_id, entity_type="contacts"),
+        }
+        for path, shared in variants.items():
+            try:
+                total, longest, timings = await _measure(
+                    session_maker, engine, rep_id, shared, args.repeats
+                )
+            except Exception as exc:  # noqa: BLE001 - report driver limits, keep going
+                print(f"{len(ids):>7}  {path:<10}  failed: {type(exc).__name__}: {exc}"[:120])
+                continue
+            print(
+                f"{len(ids):>7}  {path:<10}{total:>7}{longest['sql']:>11}"
+                f"{longest['params']:>8}{statistics.median(timings):>11.1f}"
+            )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""Move inline images out of synced email bodies into object storage.
+
+Rewrites every base64 ``data:image/…`` URI in ``inbound_emails.body_html``
+and in Gmail-synced ``email_queue.body`` rows to the content-addressed URL
+``src.integrations.gmail.inline_images`` serves, writing each distinct
+image once (R2, or ``uploads/email_inline/`` without R2 creds). New mail
+is stored this way by the sync; run this once after deploying migration
+074 to shrink the rows synced before it.
+
+* Resumable: rows are walked in id order and each batch commits on its
+  own, logging the last id done. A rewritten row no longer matches, so a
+  plain re-run only revisits rows that still hold a ``data:`` URI;
+  ``--table`` / ``--after-id`` skip straight to where a run stopped.
+* An image that is not a storable type, or whose write fails, keeps its
+  ``data:`` URI.
+* ``--reverse`` re-embeds stored images as ``data:`` URIs, e.g. before
+  downgrading past 074 or moving off R2.
+
+Usage:
+  docker compose exec backend python scripts/migrate_inline_images.py
+  (or)  python scripts/migrate_inline_images.py --table email_queue --after-id 120000
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import asyncio
+import base64
+import binascii
+import logging
+import re
+import time
+from collections.abc import Callable
+
+from sqlalchemy import text
+
+from src.database import async_session_maker
+from src.integrations.gmail.inline_images import (
+    INLINE_IMAGE_MIME_TYPES,
+    INLINE_IMAGE_URL_PREFIX,
+    INLINE_IMAGE_URL_RE,
+    read_inline_image_sync,
+    store_inline_image_sync,
+)
+
+logger = logging.getLogger("migrate_inline_images")
+
+_DATA_URI_RE = re.compile(r"data:(image/[a-z0-9.+-]+);base64,([A-Za-z0-9+/]+=*)", re.IGNORECASE)
+
+# table -> (html column, extra row filter)
+_TARGETS: dict[str, tuple[str, str | None]] = {
+    "inbound_emails": ("body_html", None),
+    "email_queue": ("body", "sent_via = 'gmail'"),
+}
+
+
+def _to_urls(html: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        try:
+            content = base64.b64decode(match.group(2), validate=True)
+            return store_inline_image_sync(content, match.group(1).lower()) or match.group(0)
+        except (binascii.Error, ValueError):
+            return match.group(0)
+        except Exception as exc:  # noqa: BLE001 — leave the data: URI in place
+            logger.warning("inline image store failed: %s", exc)
+            return match.group(0)
+
+    return _DATA_URI_RE.sub(replace, html)
+
+
+def _to_data_uris(html: str) -> str:
+    def replace(match: re.Match[str]) -> str:
+        name = match.group(1)
+        try:
+            content = read_inline_image_sync(name)
+        except Exception as exc:  # noqa: BLE001 — leave the URL in place
+            logger.warning("inline image %s unreadable: %s", name, exc)
+            return match.group(0)
+        mime = INLINE_IMAGE_MIME_TYPES[name.rsplit(".", 1)[1]]
+        return f"data:{mime};base64,{base64.b64encode(content).decode('ascii')}"
+
+    return INLINE_IMAGE_URL_RE.sub(replace, html)
+
+
+async def _rewrite_table(
+    table: str, after_id: int, batch: int, marker: str, rewrite: Callable[[str], str]
+) -> int:
+    column, extra = _TARGETS[table]
+    where = f"id > :after AND {column} LIKE :marker"
+    if extra:
+        where += f" AND {extra}"
+    select = text(f"SELECT id, {column} FROM {table} WHERE {where} ORDER BY id LIMIT :batch")
+    update = text(f"UPDATE {table} SET {column} = :html WHERE id = :id")
+
+    changed = 0
+    while True:
+        async with async_session_maker() as session:
+            rows = (await session.execute(
+                select, {"after": after_id, "marker": f"%{marker}%", "batch": batch}
+            )).all()
+            if not rows:
+                return changed
+            params = []
+            for row_id, html in rows:
+                # Storage calls block; keep them off the event loop.
+                new_html = await asyncio.to_thread(rewrite, html)
+                if new_html != html:
+                    params.append({"id": row_id, "html": new_html})
+            if params:
+                await session.execute(update, params)
+            await session.commit()
+        changed += len(params)
+        after_id = rows[-1][0]
+        logger.info("%s: done through id %d (%d rows rewritten)", table, after_id, changed)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--table", choices=sorted(_TARGETS), help="only this table")
+    parser.add_argument("--after-id", type=int, default=0, help="resume after this row id")
+    parser.add_argument("--batch", type=int, default=200, help="rows per transaction")
+    parser.add_argument("--reverse", action="store_true", help="re-embed stored images")
+    args = parser.parse_args()
+    if args.after_id and not args.table:
+        parser.error("--after-id needs --table")
+
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    marker, rewrite = (
+        (INLINE_IMAGE_URL_PREFIX, _to_data_uris) if args.reverse else ("data:image/", _to_urls)
+    )
+    tables = [args.table] if args.table else list(_TARGETS)
+    for table in tables:
+        changed = await _rewrite_table(table, args.after_id, args.batch, marker, rewrite)
+        logger.info("%s: %d rows rewritten", table, changed)
+    logger.info("Inline images migrated in %.1fs", time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
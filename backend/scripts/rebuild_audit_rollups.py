@@ -0,0 +1,62 @@
+"""Rebuild the audit summary rollups from audit logs, work sessions and activities.
+
+Rolls up every finished UTC day from the first recorded audit log, work
+session or activity through yesterday into ``audit_daily_rollups`` (see
+``src/audit/rollups.py``), committing each day on its own. Run once after
+migration 070 to backfill, before setting AUDIT_ROLLUPS_ENABLED=true;
+afterwards the scheduler rolls up each new day shortly after midnight.
+
+* Idempotent: each day's rows are replaced wholesale, so re-running a range
+  is also the fix for any suspected drift.
+* ``--since`` limits the rebuild to recent days, e.g. after a bulk import.
+
+Usage:
+  docker compose exec backend python scripts/rebuild_audit_rollups.py
+  (or)  python scripts/rebuild_audit_rollups.py --since 2026-01-01
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import UTC, date, datetime, timedelta
+
+from src.audit.rollups import AuditRollupService
+from src.database import async_session_maker
+
+logger = logging.getLogger("rebuild_audit_rollups")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--since", type=date.fromisoformat, help="first day to rebuild (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    last_day = datetime.now(UTC).date() - timedelta(days=1)
+    async with async_session_maker() as session:
+        first_day = args.since or await AuditRollupService(session).earliest_day()
+    if first_day is None or first_day > last_day:
+        logger.info("Nothing to roll up")
+        return
+
+    day = first_day
+    while day <= last_day:
+        async with async_session_maker() as session:
+            await AuditRollupService(session).roll_up_day(day)
+            await session.commit()
+        day += timedelta(days=1)
+    logger.info(
+        "Audit rollups rebuilt in %.1fs: %s .. %s",
+        time.perf_counter() - started, first_day.isoformat(), last_day.isoformat(),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
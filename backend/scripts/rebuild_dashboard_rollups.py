@@ -0,0 +1,55 @@
+"""Rebuild the dashboard rollup tables from leads, opportunities and activities.
+
+Recomputes ``dashboard_daily_rollups`` and the per-record
+``dashboard_rollup_sources`` snapshots in a single transaction (see
+``src/dashboard/rollups.py``). Run once after migration 061 to backfill,
+before setting DASHBOARD_ROLLUPS_ENABLED=true; afterwards domain events keep
+the rollups current and the scheduler repeats this nightly to reconcile
+writes that bypass events.
+
+* Idempotent: every run replaces the tables wholesale, so it is also the fix
+  for any suspected drift.
+* Streams each base table in ``--chunk-size`` primary-key pages; readers keep
+  seeing the previous rollups until the commit.
+
+Usage:
+  docker compose exec backend python scripts/rebuild_dashboard_rollups.py
+  (or)  python scripts/rebuild_dashboard_rollups.py --chunk-size 10000
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import asyncio
+import logging
+import time
+
+from src.dashboard.rollups import DashboardRollupService
+from src.database import async_session_maker
+
+logger = logging.getLogger("rebuild_dashboard_rollups")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=5000, help="base-table rows per page")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    async with async_session_maker() as session:
+        counts = await DashboardRollupService(session).rebuild(chunk_size=args.chunk_size)
+        await session.commit()
+    logger.info(
+        "Dashboard rollups rebuilt in %.1fs: %d lead(s), %d opportunity(ies), "
+        "%d activity(ies) -> %d rollup row(s)",
+        time.perf_counter() - started,
+        counts["lead"], counts["opportunity"], counts["activity"], counts["rollups"],
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -9,12 +9,18 @@ Settings → Notifications.
 Defensive contract: unexpected exceptions are logged and we fail-closed
 (return False) for both channels. A silent-drop here is the lesser evil
 compared to leaking notifications to users who haven't opted in.
+
+Fan-out dispatchers use :func:`load_recipient_contexts` instead: one query
+resolves prefs, timezone and address for every recipient, and
+:func:`resolve_channels` / :func:`email_schedule` then decide each
+recipient in pure Python.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from sqlalchemy import select
@@ -22,6 +28,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.account.models import UserNotificationPrefs, UserPreferences
+from src.auth.models import User
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,19 @@ logger = logging.getLogger(__name__)
 # propagate so they're visible, not silently swallowed as "transient".
 _GATE_RECOVERABLE = (SQLAlchemyError, TypeError, AttributeError)
 
+_DEFAULT_TIMEZONE = "America/Chicago"
+_DAILY_DIGEST_AT = "08:00"
+
+
+@dataclass(frozen=True)
+class RecipientContext:
+    """Everything the gate needs about one recipient, loaded up front."""
+
+    user_id: int
+    email: str | None
+    prefs: UserNotificationPrefs | None
+    timezone: str
+
 
 async def _load_prefs(
     db: AsyncSession, user_id: int
@@ -49,7 +69,45 @@ async def _load_user_timezone(db: AsyncSession, user_id: int) -> str:
             UserPreferences.user_id == user_id
         )
     )
-    return result.scalar_one_or_none() or "America/Chicago"
+    return result.scalar_one_or_none() or _DEFAULT_TIMEZONE
+
+
+async def load_recipient_contexts(
+    db: AsyncSession, user_ids
+) -> dict[int, RecipientContext]:
+    """Prefs, timezone and address for every user in ``user_ids``, in one query.
+
+    Users that don't exist are absent from the result. A recoverable load
+    error returns ``{}``, which callers treat as "nobody opted in" — the
+    same fail-closed outcome :func:`gate_event` gives a single user.
+    """
+    ids = sorted(set(user_ids))
+    if not ids:
+        return {}
+    try:
+        result = await db.execute(
+            select(User.id, User.email, UserNotificationPrefs, UserPreferences.timezone)
+            .outerjoin(UserNotificationPrefs, UserNotificationPrefs.user_id == User.id)
+            .outerjoin(UserPreferences, UserPreferences.user_id == User.id)
+            .where(User.id.in_(ids))
+        )
+        rows = result.all()
+    except _GATE_RECOVERABLE:
+        logger.warning(
+            "notification_gate.load_recipient_contexts failed for %d user(s); defaulting suppress",
+            len(ids),
+            exc_info=True,
+        )
+        return {}
+    return {
+        user_id: RecipientContext(
+            user_id=user_id,
+            email=email or None,
+            prefs=prefs,
+            timezone=tz_name or _DEFAULT_TIMEZONE,
+        )
+        for user_id, email, prefs, tz_name in rows
+    }
 
 
 def _matrix_allows(
@@ -79,6 +137,55 @@ def _in_quiet_window(now_hhmm: str, start: str, end: str) -> bool:
     return now_hhmm >= start or now_hhmm < end
 
 
+def _has_quiet_hours(prefs: UserNotificationPrefs) -> bool:
+    return bool(
+        prefs.quiet_hours_enabled
+        and prefs.quiet_hours_start
+        and prefs.quiet_hours_end
+    )
+
+
+def _user_zone(tz_name: str, user_id: int) -> ZoneInfo:
+    try:
+        return ZoneInfo(tz_name)
+    except ZoneInfoNotFoundError:
+        logger.warning(
+            "Unknown timezone %r for user %s; falling back to America/Chicago",
+            tz_name,
+            user_id,
+        )
+        return ZoneInfo(_DEFAULT_TIMEZONE)
+
+
+def _in_quiet_hours(
+    prefs: UserNotificationPrefs, tz: ZoneInfo, now: datetime | None = None
+) -> bool:
+    if not _has_quiet_hours(prefs):
+        return False
+    now_hhmm = (now or datetime.now(UTC)).astimezone(tz).strftime("%H:%M")
+    return _in_quiet_window(
+        now_hhmm, prefs.quiet_hours_start, prefs.quiet_hours_end
+    )
+
+
+def _next_local_time(now: datetime, tz: ZoneInfo, hhmm: str) -> datetime:
+    """The next ``HH:MM`` wall-clock time in ``tz`` after ``now``, in UTC."""
+    hour, minute = (int(part) for part in hhmm.split(":"))
+    local_now = now.astimezone(tz)
+    candidate = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= local_now:
+        candidate += timedelta(days=1)
+    return candidate.astimezone(UTC)
+
+
+def _email_allowed(prefs: UserNotificationPrefs, event_type: str) -> bool:
+    return (
+        prefs.email_enabled
+        and prefs.email_digest != "off"
+        and _matrix_allows(prefs.event_matrix, event_type, "email")
+    )
+
+
 async def _resolve_in_app(
     db: AsyncSession,
     prefs: UserNotificationPrefs,
@@ -97,26 +204,9 @@ async def _resolve_in_app(
     if not _matrix_allows(prefs.event_matrix, event_type, "in_app"):
         return False
 
-    if (
-        prefs.quiet_hours_enabled
-        and prefs.quiet_hours_start
-        and prefs.quiet_hours_end
-    ):
+    if _has_quiet_hours(prefs):
         tz_name = await _load_user_timezone(db, user_id)
-        try:
-            tz = ZoneInfo(tz_name)
-        except ZoneInfoNotFoundError:
-            logger.warning(
-                "Unknown timezone %r for user %s; falling back to America/Chicago",
-                tz_name,
-                user_id,
-            )
-            tz = ZoneInfo("America/Chicago")
-        now_hhmm = datetime.now(tz).strftime("%H:%M")
-        if _in_quiet_window(
-            now_hhmm, prefs.quiet_hours_start, prefs.quiet_hours_end
-        ):
-            return False
+        return not _in_quiet_hours(prefs, _user_zone(tz_name, user_id))
 
     return True
 
@@ -159,15 +249,48 @@ async def gate_event(
         )
         in_app_allowed = False
 
-    email_allowed = (
-        prefs.email_enabled
-        and prefs.email_digest != "off"
-        and _matrix_allows(prefs.event_matrix, event_type, "email")
-    )
+    email_allowed = _email_allowed(prefs, event_type)
 
     return (in_app_allowed, email_allowed)
 
 
+def resolve_channels(
+    ctx: RecipientContext, event_type: str, now: datetime | None = None
+) -> tuple[bool, bool]:
+    """:func:`gate_event` for a preloaded recipient; no DB access."""
+    prefs = ctx.prefs
+    if prefs is None:
+        return (False, False)
+    in_app_allowed = (
+        prefs.in_app_enabled
+        and _matrix_allows(prefs.event_matrix, event_type, "in_app")
+        and not _in_quiet_hours(prefs, _user_zone(ctx.timezone, ctx.user_id), now)
+    )
+    return (in_app_allowed, _email_allowed(prefs, event_type))
+
+
+def email_schedule(
+    ctx: RecipientContext, now: datetime | None = None
+) -> tuple[datetime, bool]:
+    """When an allowed email should go out, and whether it joins a digest.
+
+    ``email_digest="daily_8am"`` holds everything for the next 08:00 in
+    the user's timezone. An ``instant`` email that lands inside quiet
+    hours is held until the window ends; either way the held emails are
+    sent as one digest per user. Everything else goes out now.
+    """
+    now = now or datetime.now(UTC)
+    prefs = ctx.prefs
+    if prefs is None:
+        return (now, False)
+    tz = _user_zone(ctx.timezone, ctx.user_id)
+    if prefs.email_digest == "daily_8am":
+        return (_next_local_time(now, tz, _DAILY_DIGEST_AT), True)
+    if _in_quiet_hours(prefs, tz, now):
+        return (_next_local_time(now, tz, prefs.quiet_hours_end), True)
+    return (now, False)
+
+
 async def should_notify_in_app(
     db: AsyncSession, user_id: int, event_type: str
 ) -> bool:
@@ -36,7 +36,7 @@ from src.core.router_utils import (
     get_entity_or_404,
     parse_comma_separated,
 )
-from src.events.service import ACTIVITY_ASSIGNED, ACTIVITY_CREATED, emit
+from src.events.service import ACTIVITY_ASSIGNED, ACTIVITY_CREATED, ACTIVITY_DELETED, emit
 from src.notifications.service import notify_on_activity_due, notify_on_assignment
 
 router = APIRouter(prefix="/api/activities", tags=["activities"])
@@ -181,7 +181,7 @@ async def list_activities(
         is_completed=is_completed,
         priority=priority,
         filters=parsed_filters,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_ACTIVITIES),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_ACTIVITIES),
         current_user_id=current_user.id,
     )
 
@@ -213,7 +213,7 @@ async def create_activity(
         "entity_type": "activity",
         "user_id": current_user.id,
         "data": {"activity_type": activity.activity_type, "subject": activity.subject},
-    })
+    }, db=db)
 
     if activity.due_date:
         notify_user = activity.assigned_to_id or activity.owner_id or current_user.id
@@ -349,9 +349,9 @@ async def get_activity(
     """Get an activity by ID."""
     service = ActivityService(db)
     activity = await get_entity_or_404(service, activity_id, EntityNames.ACTIVITY)
-    check_record_access_or_shared(
-        activity, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_ACTIVITIES),
+    await check_record_access_or_shared(
+        db, activity, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_ACTIVITIES),
     )
     return ActivityResponse.model_validate(activity)
 
@@ -386,7 +386,7 @@ async def update_activity(
             "entity_type": "activity",
             "user_id": updated_activity.assigned_to_id,
             "data": {"subject": updated_activity.subject, "old_assigned_to_id": old_assigned_to_id},
-        })
+        }, db=db)
 
     return ActivityResponse.model_validate(updated_activity)
 
@@ -422,3 +422,10 @@ async def delete_activity(
     await audit_entity_delete(db, "activity", activity.id, current_user.id, ip_address)
 
     await service.delete(activity)
+
+    await emit(ACTIVITY_DELETED, {
+        "entity_id": activity_id,
+        "entity_type": "activity",
+        "user_id": current_user.id,
+        "data": {},
+    }, db=db)
@@ -14,6 +14,7 @@ from src.core.constants import (
     ENTITY_TYPE_USERS,
 )
 from src.core.filtering import apply_filters_to_query
+from src.core.share_permissions import SharedScope, shared_with_clause
 
 
 class ActivityService(CRUDService[Activity, ActivityCreate, ActivityUpdate]):
@@ -36,7 +37,7 @@ class ActivityService(CRUDService[Activity, ActivityCreate, ActivityUpdate]):
         is_completed: bool | None = None,
         priority: str | None = None,
         filters: dict[str, Any] | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
         current_user_id: int | None = None,
     ) -> tuple[list[Activity], int]:
         """Get paginated list of activities with filters.
@@ -69,8 +70,8 @@ class ActivityService(CRUDService[Activity, ActivityCreate, ActivityUpdate]):
             query = query.where(Activity.activity_type == activity_type)
 
         if owner_id:
-            if shared_entity_ids:
-                query = query.where(or_(Activity.owner_id == owner_id, Activity.id.in_(shared_entity_ids)))
+            if shared_entity_ids is not None:
+                query = query.where(or_(Activity.owner_id == owner_id, shared_with_clause(Activity.id, shared_entity_ids)))
             else:
                 query = query.where(Activity.owner_id == owner_id)
 
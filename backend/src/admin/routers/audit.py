@@ -26,6 +26,7 @@ from src.audit.schemas import (
 )
 from src.audit.service import AuditService
 from src.core.entity_types import canonical_plural
+from src.core.http_errors import value_error_as_400
 from src.core.router_utils import CurrentUser, DBSession, calculate_pages
 
 router = APIRouter(prefix="/audit")
@@ -79,6 +80,20 @@ def _format_csv_row(row: dict, writer: csv.writer, buffer: io.StringIO) -> str:
     return chunk
 
 
+def _feed_response(result: dict, page: int, page_size: int) -> AdminAuditFeedResponse:
+    total = result["total"]
+    return AdminAuditFeedResponse(
+        items=[AdminAuditFeedItem(**item) for item in result["items"]],
+        total=total,
+        total_capped=result["total_capped"],
+        total_estimated=result["total_estimated"],
+        page=page,
+        page_size=page_size,
+        pages=calculate_pages(total, page_size) if total is not None else None,
+        next_cursor=result["next_cursor"],
+    )
+
+
 @router.get("/feed", response_model=AdminAuditFeedResponse)
 async def get_admin_audit_feed(
     request: Request,
@@ -86,6 +101,7 @@ async def get_admin_audit_feed(
     db: DBSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     start_date: date | None = None,
     end_date: date | None = None,
     user_id: int | None = None,
@@ -97,24 +113,20 @@ async def get_admin_audit_feed(
     """Filtered audit feed across the whole CRM."""
     _require_admin(current_user)
     service = AuditService(db)
-    items, total = await service.get_admin_feed(
-        page=page,
-        page_size=page_size,
-        start_date=start_date,
-        end_date=end_date,
-        user_id=user_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        search=search,
-    )
-    return AdminAuditFeedResponse(
-        items=[AdminAuditFeedItem(**item) for item in items],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=calculate_pages(total, page_size),
-    )
+    with value_error_as_400():
+        feed = await service.get_admin_feed(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            search=search,
+        )
+    return _feed_response(feed, page, page_size)
 
 
 @router.get("/export.csv")
@@ -221,6 +233,7 @@ async def get_admin_audit_user_detail(
     db: DBSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     start_date: date | None = None,
     end_date: date | None = None,
     entity_type: str | None = None,
@@ -242,16 +255,18 @@ async def get_admin_audit_user_detail(
         (AdminAuditUserSummary(**row) for row in summary["users"] if row["user_id"] == user_id),
         AdminAuditUserSummary(user_id=user_id, user_name=f"User #{user_id}"),
     )
-    items, total = await service.get_admin_feed(
-        page=page,
-        page_size=page_size,
-        start_date=start_date,
-        end_date=end_date,
-        user_id=user_id,
-        entity_type=entity_type,
-        action=action,
-        search=search,
-    )
+    with value_error_as_400():
+        feed = await service.get_admin_feed(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            entity_type=entity_type,
+            action=action,
+            search=search,
+        )
     sessions = await service.get_work_sessions(
         start_date=start_date,
         end_date=end_date,
@@ -260,13 +275,7 @@ async def get_admin_audit_user_detail(
     )
     return AdminAuditUserDetail(
         summary=user_summary,
-        feed=AdminAuditFeedResponse(
-            items=[AdminAuditFeedItem(**item) for item in items],
-            total=total,
-            page=page,
-            page_size=page_size,
-            pages=calculate_pages(total, page_size),
-        ),
+        feed=_feed_response(feed, page, page_size),
         sessions=[WorkSessionResponse(**session) for session in sessions],
     )
 
@@ -280,6 +289,7 @@ async def get_admin_audit_entity_detail(
     db: DBSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     start_date: date | None = None,
     end_date: date | None = None,
     user_id: int | None = None,
@@ -306,17 +316,19 @@ async def get_admin_audit_entity_detail(
         ),
         AdminAuditEntitySummary(entity_type=entity_type, entity_id=entity_id),
     )
-    items, total = await service.get_admin_feed(
-        page=page,
-        page_size=page_size,
-        start_date=start_date,
-        end_date=end_date,
-        user_id=user_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        search=search,
-    )
+    with value_error_as_400():
+        feed = await service.get_admin_feed(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            start_date=start_date,
+            end_date=end_date,
+            user_id=user_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            search=search,
+        )
     sessions = await service.get_work_sessions(
         start_date=start_date,
         end_date=end_date,
@@ -326,12 +338,6 @@ async def get_admin_audit_entity_detail(
     )
     return AdminAuditEntityDetail(
         summary=entity_summary,
-        feed=AdminAuditFeedResponse(
-            items=[AdminAuditFeedItem(**item) for item in items],
-            total=total,
-            page=page,
-            page_size=page_size,
-            pages=calculate_pages(total, page_size),
-        ),
+        feed=_feed_response(feed, page, page_size),
         sessions=[WorkSessionResponse(**session) for session in sessions],
     )
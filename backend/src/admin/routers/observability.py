@@ -1,4 +1,5 @@
-"""Admin observability endpoints: system stats, team overview, activity feed."""
+"""Admin observability endpoints: system stats, event bus and Gmail sync health,
+team overview, activity feed."""
 
 from datetime import UTC, datetime, timedelta
 
@@ -8,15 +9,22 @@ from sqlalchemy import func, select
 from src.admin._router_helpers import _require_admin
 from src.admin.schemas import (
     ActivityFeedEntry,
+    EventBusHandlerStats,
+    EventBusStats,
+    GmailSyncAccountStats,
+    GmailSyncStats,
     SystemStats,
     TeamMemberOverview,
 )
 from src.audit.models import AuditLog
 from src.auth.models import User
 from src.companies.models import Company
+from src.config import settings
 from src.contacts.models import Contact
 from src.core.rate_limit import limiter
 from src.core.router_utils import CurrentUser, DBSession
+from src.events.dispatcher import get_dispatcher, queue_depth
+from src.integrations.gmail.scheduler import get_gmail_sync_scheduler, sync_lag
 from src.leads.models import Lead
 from src.opportunities.models import Opportunity, PipelineStage
 from src.payments.models import Payment
@@ -69,6 +77,65 @@ async def get_system_stats(
     )
 
 
+# ---------------------------------------------------------------------------
+# GET /api/admin/event-bus
+# ---------------------------------------------------------------------------
+@router.get("/event-bus", response_model=EventBusStats)
+@limiter.limit("30/minute")
+async def get_event_bus_stats(
+    request: Request,
+    current_user: CurrentUser,
+    db: DBSession,
+):
+    """Event outbox depth per handler plus this worker's delivery latency."""
+    _require_admin(current_user)
+
+    depth = await queue_depth(db)
+    dispatcher = get_dispatcher()
+    live = dispatcher.stats() if dispatcher else {}
+    latency = live.get("handlers", {})
+    handlers = [
+        EventBusHandlerStats(handler=name, **depth.get(name, {}), **latency.get(name, {}))
+        for name in sorted(set(depth) | set(latency))
+    ]
+    return EventBusStats(
+        enabled=settings.EVENT_BUS_DURABLE,
+        running=live.get("running", False),
+        workers=live.get("workers", 0),
+        in_flight=live.get("in_flight", 0),
+        handlers=handlers,
+    )
+
+
+# ---------------------------------------------------------------------------
+# GET /api/admin/gmail-sync
+# ---------------------------------------------------------------------------
+@router.get("/gmail-sync", response_model=GmailSyncStats)
+@limiter.limit("30/minute")
+async def get_gmail_sync_stats(
+    request: Request,
+    current_user: CurrentUser,
+    db: DBSession,
+):
+    """Per-account Gmail sync lag and cadence plus this worker's running syncs."""
+    _require_admin(current_user)
+
+    gmail_scheduler = get_gmail_sync_scheduler()
+    syncing = gmail_scheduler.syncing_user_ids()
+    accounts = [
+        GmailSyncAccountStats(**account, syncing=account["user_id"] in syncing)
+        for account in await sync_lag(db)
+    ]
+    lags = [account.lag_seconds for account in accounts if account.lag_seconds is not None]
+    live = gmail_scheduler.stats()
+    return GmailSyncStats(
+        concurrency=live["concurrency"],
+        in_flight=live["in_flight"],
+        max_lag_seconds=max(lags) if lags else None,
+        accounts=accounts,
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET /api/admin/team-overview
 # ---------------------------------------------------------------------------
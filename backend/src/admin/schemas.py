@@ -67,6 +67,51 @@ class SystemStats(BaseModel):
     active_users_7d: int = 0
 
 
+class EventBusHandlerStats(BaseModel):
+    """Outbox queue depth and delivery latency for one durable handler."""
+    handler: str
+    pending: int = 0
+    dead: int = 0
+    oldest_pending_seconds: float | None = None
+    delivered: int = 0
+    failed: int = 0
+    avg_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class EventBusStats(BaseModel):
+    """Durable event bus health: queue depth (shared) + this worker's deliveries."""
+    enabled: bool
+    running: bool = False
+    workers: int = 0
+    in_flight: int = 0
+    handlers: list[EventBusHandlerStats] = []
+
+
+class GmailSyncAccountStats(BaseModel):
+    """Forward-sync cadence and lag for one connected Gmail account."""
+    user_id: int
+    email: str
+    last_synced_at: datetime | None = None
+    next_sync_at: datetime | None = None
+    lag_seconds: float | None = None
+    overdue_seconds: float | None = None
+    interval_seconds: int | None = None
+    last_duration_ms: int | None = None
+    last_activity_at: datetime | None = None
+    failure_count: int = 0
+    syncing: bool = False
+
+
+class GmailSyncStats(BaseModel):
+    """Gmail sync health: per-account lag (shared) + this worker's scheduler."""
+    concurrency: int
+    in_flight: int = 0
+    max_lag_seconds: float | None = None
+    accounts: list[GmailSyncAccountStats] = []
+
+
 class TeamMemberOverview(BaseModel):
     """Per-user breakdown for the team overview."""
     user_id: int
@@ -13,6 +13,13 @@ from typing import TypeVar
 import boto3
 from botocore.config import Config as BotoConfig
 
+from src.attachments.streaming import (
+    FileStream,
+    NotModified,
+    RangeNotSatisfiable,
+    parse_range,
+)
+
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
@@ -154,6 +161,64 @@ async def download_object_bytes(object_key: str) -> bytes:
     return await _run_boto(_download)
 
 
+async def open_object_stream(
+    object_key: str,
+    *,
+    range_header: str | None = None,
+    if_none_match: str | None = None,
+) -> FileStream:
+    """Open an R2 object for a streamed (optionally ranged / conditional) download.
+
+    ``Range`` and ``If-None-Match`` are passed through to ``GetObject`` so
+    R2 does the slicing and the ETag check. Raises ``NotModified`` /
+    ``RangeNotSatisfiable`` for the 304 / 416 outcomes; other boto errors
+    surface directly, as in :func:`download_object_bytes`.
+    """
+    from botocore.exceptions import ClientError
+
+    client = _get_r2_client()
+    bucket = _get_bucket_name()
+    byte_range = parse_range(range_header)
+
+    def _open() -> FileStream:
+        params: dict[str, str] = {"Bucket": bucket, "Key": object_key}
+        if byte_range is not None:
+            params["Range"] = byte_range.header()
+        if if_none_match:
+            params["IfNoneMatch"] = if_none_match
+        try:
+            response = client.get_object(**params)
+        except ClientError as exc:
+            error = exc.response.get("Error", {})
+            meta = exc.response.get("ResponseMetadata", {})
+            code = str(error.get("Code"))
+            if code in ("304", "NotModified"):
+                raise NotModified(meta.get("HTTPHeaders", {}).get("etag")) from exc
+            if code in ("416", "InvalidRange"):
+                head = client.head_object(Bucket=bucket, Key=object_key)
+                raise RangeNotSatisfiable(head.get("ContentLength")) from exc
+            raise
+        body = response["Body"]
+        length = response["ContentLength"]
+        size, start = length, None
+        content_range = response.get("ContentRange")
+        if content_range:
+            # "bytes <first>-<last>/<size>"
+            span, _, total = content_range.removeprefix("bytes ").partition("/")
+            start = int(span.split("-", 1)[0])
+            size = int(total)
+        return FileStream(
+            read=body.read,
+            close=body.close,
+            size=size,
+            length=length,
+            start=start,
+            etag=response.get("ETag"),
+        )
+
+    return await _run_boto(_open)
+
+
 async def upload_file_bytes(
     content: bytes,
     object_key: str,
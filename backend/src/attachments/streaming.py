@@ -0,0 +1,288 @@
+"""Streamed, range-capable responses for files proxied through the app.
+
+Some routes deliberately proxy stored PDFs instead of redirecting to an R2
+presign (to set ``Cache-Control`` / ``Referrer-Policy``, keep the bearer
+check, or avoid R2's missing CORS headers). They used to read the whole
+object into memory and return it as one ``Response``, so a few concurrent
+20 MB downloads ballooned worker memory. They now open the object (R2
+``GetObject`` or a disk file) and return a ``StreamingResponse`` fed in
+``STREAM_CHUNK_SIZE`` reads, at most ``STREAM_READ_AHEAD`` chunks ahead of
+the client: a download holds about a megabyte however large the file is.
+
+A single ``Range: bytes=…`` request gets a 206; multi-range and malformed
+headers get the whole file, as RFC 9110 allows. Every response carries an
+``ETag`` (R2's, or size + mtime on disk), and a matching ``If-None-Match``
+gets a 304 with no body.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import re
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastapi.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.core.constants import HTTPStatus
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 256 * 1024
+STREAM_READ_AHEAD = 4
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class NotModified(Exception):
+    """The client's ``If-None-Match`` matches the stored file."""
+
+    def __init__(self, etag: str | None):
+        super().__init__(etag)
+        self.etag = etag
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested range starts past the end of the file."""
+
+    def __init__(self, size: int | None):
+        super().__init__(size)
+        self.size = size
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """One ``bytes=`` range. ``start`` None is a suffix range (last ``end`` bytes)."""
+
+    start: int | None
+    end: int | None
+
+    def header(self) -> str:
+        first = "" if self.start is None else str(self.start)
+        last = "" if self.end is None else str(self.end)
+        return f"bytes={first}-{last}"
+
+    def resolve(self, size: int) -> tuple[int, int]:
+        """``(start, end)`` inclusive within a file of ``size`` bytes."""
+        if self.start is None:
+            assert self.end is not None
+            if self.end == 0 or size == 0:
+                raise RangeNotSatisfiable(size)
+            return max(0, size - self.end), size - 1
+        if self.start >= size:
+            raise RangeNotSatisfiable(size)
+        end = size - 1 if self.end is None else min(self.end, size - 1)
+        return self.start, end
+
+
+def parse_range(header: str | None) -> ByteRange | None:
+    """The single byte range in a ``Range`` header, or None to send it all."""
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    start = int(first) if first else None
+    end = int(last) if last else None
+    if start is not None and end is not None and end < start:
+        return None
+    return ByteRange(start, end)
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """Weak comparison of ``If-None-Match`` against ``etag``."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == wanted
+        for candidate in if_none_match.split(",")
+    )
+
+
+@dataclass
+class FileStream:
+    """An opened stored file, positioned at the first byte to send.
+
+    ``read`` and ``close`` are blocking and run off the event loop.
+    ``start`` is None when the whole file is sent. Release it with
+    :meth:`aclose`, which waits out a read still running in its thread.
+    """
+
+    read: Callable[[int], bytes]
+    close: Callable[[], None]
+    size: int
+    length: int
+    start: int | None
+    etag: str | None
+    _reading: asyncio.Future[bytes] | None = field(default=None, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    async def aclose(self) -> None:
+        """Close the file once, after any in-flight ``read`` has returned.
+
+        Cancelling ``asyncio.to_thread`` does not stop the thread, so closing
+        straight away could pull the handle out from under a running read.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._reading is not None:
+            with contextlib.suppress(Exception):
+                await self._reading
+        await asyncio.to_thread(self.close)
+
+    async def chunks(self) -> AsyncGenerator[bytes, None]:
+        """Yield the body, reading at most ``STREAM_READ_AHEAD`` chunks ahead."""
+        queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(
+            maxsize=STREAM_READ_AHEAD
+        )
+
+        async def produce() -> None:
+            remaining = self.length
+            try:
+                while remaining > 0:
+                    # Shielded so a cancelled producer leaves the read running
+                    # to completion as a task aclose() can wait for.
+                    self._reading = asyncio.ensure_future(
+                        asyncio.to_thread(self.read, min(STREAM_CHUNK_SIZE, remaining))
+                    )
+                    chunk = await asyncio.shield(self._reading)
+                    if not chunk:
+                        raise OSError(f"stored file ended {remaining} bytes early")
+                    remaining -= len(chunk)
+                    await queue.put(chunk)
+            except Exception as exc:
+                await queue.put(exc)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        sent = 0
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    # Headers are already out; all that's left is to drop the
+                    # connection so the client sees a short read, not a bad file.
+                    logger.warning(
+                        "[streaming] read failed after %d of %d bytes: %s", sent, self.length, item
+                    )
+                    raise item
+                sent += len(item)
+                yield item
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+            await self.aclose()
+
+
+def open_file_stream(
+    path: Path,
+    *,
+    range_header: str | None = None,
+    if_none_match: str | None = None,
+) -> FileStream:
+    """Open a disk file for streaming. Blocking; raises ``OSError`` as ``open`` does."""
+    handle = path.open("rb")
+    try:
+        stat = os.fstat(handle.fileno())
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        if etag_matches(if_none_match, etag):
+            raise NotModified(etag)
+        start, length = None, stat.st_size
+        byte_range = parse_range(range_header)
+        if byte_range is not None:
+            first, last = byte_range.resolve(stat.st_size)
+            handle.seek(first)
+            start, length = first, last - first + 1
+    except BaseException:
+        handle.close()
+        raise
+    return FileStream(
+        read=handle.read,
+        close=handle.close,
+        size=stat.st_size,
+        length=length,
+        start=start,
+        etag=etag,
+    )
+
+
+class FileStreamResponse(StreamingResponse):
+    """A ``StreamingResponse`` that still owns the ``FileStream`` behind it.
+
+    The stream is closed once the response is done, however it ends: a
+    client that disconnects mid-body or before the first chunk cancels the
+    body iterator without finishing it. A route that opens one and then
+    fails before returning it must call :meth:`discard`.
+    """
+
+    def __init__(self, stream: FileStream, **kwargs):
+        self._chunks = stream.chunks()
+        super().__init__(self._chunks, **kwargs)
+        self.stream = stream
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Shielded: this runs while the request is being cancelled too.
+            await asyncio.shield(self.discard())
+
+    async def discard(self) -> None:
+        """Close the stream of a response that will not be sent (or is done)."""
+        await self._chunks.aclose()
+        await self.stream.aclose()
+
+
+async def discard_response(response: Response) -> None:
+    """Release whatever ``response`` holds open; it is not going to be sent."""
+    if isinstance(response, FileStreamResponse):
+        await response.discard()
+
+
+async def stream_file_response(
+    opening: Awaitable[FileStream],
+    *,
+    media_type: str,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Await ``opening`` and return the 200 / 206 / 304 / 416 response for it.
+
+    ``headers`` go on every outcome. Storage errors from ``opening``
+    propagate for the caller to map. A caller that fails after this
+    returns must :func:`discard_response` it.
+    """
+    headers = dict(headers or {})
+    try:
+        stream = await opening
+    except NotModified as exc:
+        if exc.etag:
+            headers["ETag"] = exc.etag
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    except RangeNotSatisfiable as exc:
+        if exc.size is not None:
+            headers["Content-Range"] = f"bytes */{exc.size}"
+        return Response(status_code=HTTPStatus.RANGE_NOT_SATISFIABLE, headers=headers)
+
+    headers["Accept-Ranges"] = "bytes"
+    headers["Content-Length"] = str(stream.length)
+    if stream.etag:
+        headers["ETag"] = stream.etag
+    status_code = HTTPStatus.OK
+    if stream.start is not None:
+        status_code = HTTPStatus.PARTIAL_CONTENT
+        last = stream.start + stream.length - 1
+        headers["Content-Range"] = f"bytes {stream.start}-{last}/{stream.size}"
+    return FileStreamResponse(
+        stream, status_code=status_code, media_type=media_type, headers=headers
+    )
@@ -1,10 +1,22 @@
 """Audit models for tracking entity changes and active CRM work sessions."""
 
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    event,
+    func,
+    inspect,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.core.column_types import SearchVector
 from src.database import Base
 
 
@@ -28,11 +40,16 @@ class AuditLog(Base):
         server_default=func.now(),
         nullable=False,
     )
+    # Admin feed search document, written by _sync_search_vector below.
+    search_vector: Mapped[str | None] = mapped_column(
+        SearchVector(), nullable=True, deferred=True
+    )
 
     __table_args__ = (
         Index("ix_audit_logs_entity", "entity_type", "entity_id"),
         Index("ix_audit_logs_user", "user_id"),
         Index("ix_audit_logs_timestamp", "timestamp"),
+        Index("ix_audit_logs_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
@@ -82,3 +99,79 @@ class WorkSession(Base):
         Index("ix_work_sessions_entity", "entity_type", "entity_id"),
         Index("ix_work_sessions_open", "user_id", "entity_type", "entity_id", "ended_at"),
     )
+
+
+class AuditDailyRollup(Base):
+    """Per-day audit dashboard facts for one (user, entity) pair.
+
+    One row per ``(day, user_id, entity_type, entity_id)`` that saw audit
+    events, work sessions or activities that UTC day. ``entity_type`` is the
+    canonical plural; ``user_id`` is the audit actor, session owner or
+    activity actor (owner, else assignee). Sessions are bucketed by their
+    ``last_seen_at`` day. Days are rebuilt wholesale by
+    ``src.audit.rollups.AuditRollupService``, so there is no unique grain to
+    upsert against.
+    """
+
+    __tablename__ = "audit_daily_rollups"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    audit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    call_duration_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    emails: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    active_crm_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_touched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_audit_daily_rollups_day", "day"),
+    )
+
+
+class AuditRollupDay(Base):
+    """A UTC day whose ``audit_daily_rollups`` rows are complete.
+
+    Kept separately so a day with no activity still counts as rolled up.
+    """
+
+    __tablename__ = "audit_rollup_days"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    rolled_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+_SEARCHED_FIELDS = ("entity_type", "entity_id", "action", "ip_address", "changes")
+
+
+def _sync_search_vector(_mapper, conn, target: AuditLog) -> None:
+    """Rebuild ``search_vector`` on insert, and on update when searched fields changed."""
+    state = inspect(target)
+    if state.persistent and not any(
+        state.attrs[name].history.has_changes() for name in _SEARCHED_FIELDS
+    ):
+        return
+    from src.audit.search import audit_search_words, search_vector_value
+
+    target.search_vector = search_vector_value(
+        conn.dialect.name,
+        audit_search_words(
+            target.entity_type,
+            target.entity_id,
+            target.action,
+            target.ip_address,
+            target.changes,
+        ),
+    )
+
+
+event.listen(AuditLog, "before_insert", _sync_search_vector)
+event.listen(AuditLog, "before_update", _sync_search_vector)
@@ -0,0 +1,254 @@
+"""SQL-side aggregation for the admin audit summary, and its daily rollups.
+
+``AuditService.get_admin_summary`` works on *facts*: one row per
+(user, entity) pair carrying ``audit_count``, ``activity_count``, ``calls``,
+``call_duration_minutes``, ``emails``, ``active_crm_seconds`` and
+``last_touched_at``. ``live_fact_selects`` builds them from audit logs, work
+sessions and activities with ``GROUP BY`` in the database; the
+``audit_daily_rollups`` table stores the same shape per UTC day. The summary
+unions whichever sources cover the requested range and aggregates per user
+and per entity in SQL, so it never holds more than one row per user plus the
+top entities in memory, however many raw rows the range spans.
+
+Rollups are opt-in (``AUDIT_ROLLUPS_ENABLED``). ``audit_rollup_days`` records
+which days are complete; the summary reads rollups through the last such day
+and the raw tables after it. ``AuditRollupService.roll_up_pending`` rolls up
+each finished day from the scheduler, and ``scripts/rebuild_audit_rollups.py``
+backfills history before the flag is turned on.
+"""
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import case, delete, func, insert, literal, literal_column, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit.models import AuditDailyRollup, AuditLog, AuditRollupDay, WorkSession
+from src.core.entity_types import ENTITY_PLURALS, canonical_plural
+
+FACT_COLUMNS = (
+    "user_id",
+    "entity_type",
+    "entity_id",
+    "audit_count",
+    "activity_count",
+    "calls",
+    "call_duration_minutes",
+    "emails",
+    "active_crm_seconds",
+    "last_touched_at",
+)
+
+
+def canonical_type_expr(column: Any) -> Any:
+    """SQL twin of ``canonical_plural`` for an ``entity_type`` column."""
+    lowered = func.lower(column)
+    return case(
+        *((lowered.in_((singular, plural)), plural) for singular, plural in ENTITY_PLURALS.items()),
+        else_=lowered,
+    )
+
+
+def _zero(name: str) -> Any:
+    # Inline literal so Postgres types the UNION branches without bind casts.
+    return literal_column("0").label(name)
+
+
+def live_fact_selects(
+    *,
+    audit_conditions: list[Any],
+    session_conditions: list[Any],
+    activity_conditions: list[Any],
+) -> list[Any]:
+    """Grouped fact selects over the raw audit, session and activity tables.
+
+    The canonical entity type is computed in an inner select so the outer
+    ``GROUP BY`` names a plain column on every dialect.
+    """
+    from src.activities.models import Activity  # noqa: PLC0415 - activities imports audit
+
+    audits = select(
+        AuditLog.user_id,
+        canonical_type_expr(AuditLog.entity_type).label("entity_type"),
+        AuditLog.entity_id,
+        AuditLog.timestamp,
+    ).where(*audit_conditions).subquery("audit_source")
+
+    sessions = select(
+        WorkSession.user_id,
+        canonical_type_expr(WorkSession.entity_type).label("entity_type"),
+        WorkSession.entity_id,
+        WorkSession.duration_seconds,
+        WorkSession.last_seen_at,
+    ).where(*session_conditions).subquery("session_source")
+
+    activities = select(
+        func.coalesce(Activity.owner_id, Activity.assigned_to_id).label("user_id"),
+        canonical_type_expr(Activity.entity_type).label("entity_type"),
+        Activity.entity_id,
+        Activity.activity_type,
+        Activity.call_duration_minutes,
+        Activity.created_at,
+    ).where(*activity_conditions).subquery("activity_source")
+    is_call = activities.c.activity_type == "call"
+
+    return [
+        select(
+            audits.c.user_id,
+            audits.c.entity_type,
+            audits.c.entity_id,
+            func.count().label("audit_count"),
+            _zero("activity_count"),
+            _zero("calls"),
+            _zero("call_duration_minutes"),
+            _zero("emails"),
+            _zero("active_crm_seconds"),
+            func.max(audits.c.timestamp).label("last_touched_at"),
+        ).group_by(audits.c.user_id, audits.c.entity_type, audits.c.entity_id),
+        select(
+            sessions.c.user_id,
+            sessions.c.entity_type,
+            sessions.c.entity_id,
+            _zero("audit_count"),
+            _zero("activity_count"),
+            _zero("calls"),
+            _zero("call_duration_minutes"),
+            _zero("emails"),
+            func.coalesce(func.sum(sessions.c.duration_seconds), 0).label("active_crm_seconds"),
+            func.max(sessions.c.last_seen_at).label("last_touched_at"),
+        ).group_by(sessions.c.user_id, sessions.c.entity_type, sessions.c.entity_id),
+        select(
+            activities.c.user_id,
+            activities.c.entity_type,
+            activities.c.entity_id,
+            _zero("audit_count"),
+            func.count().label("activity_count"),
+            func.sum(case((is_call, 1), else_=0)).label("calls"),
+            func.sum(
+                case((is_call, func.coalesce(activities.c.call_duration_minutes, 0)), else_=0)
+            ).label("call_duration_minutes"),
+            func.sum(case((activities.c.activity_type == "email", 1), else_=0)).label("emails"),
+            _zero("active_crm_seconds"),
+            func.max(activities.c.created_at).label("last_touched_at"),
+        ).group_by(activities.c.user_id, activities.c.entity_type, activities.c.entity_id),
+    ]
+
+
+def rollup_fact_select(
+    first_day: date | None,
+    last_day: date | None,
+    entity_type: str | None = None,
+) -> Any:
+    """Fact rows from ``audit_daily_rollups`` for an inclusive day window."""
+    conditions: list[Any] = []
+    if first_day is not None:
+        conditions.append(AuditDailyRollup.day >= first_day)
+    if last_day is not None:
+        conditions.append(AuditDailyRollup.day <= last_day)
+    if entity_type:
+        conditions.append(AuditDailyRollup.entity_type == canonical_plural(entity_type))
+    return select(
+        *(getattr(AuditDailyRollup, name).label(name) for name in FACT_COLUMNS)
+    ).where(*conditions)
+
+
+def facts_subquery(selects: list[Any]) -> Any:
+    """``UNION ALL`` of fact selects as one subquery."""
+    compound = selects[0] if len(selects) == 1 else union_all(*selects)
+    return compound.subquery("facts")
+
+
+async def rolled_through(db: AsyncSession) -> date | None:
+    """Last day covered by the rollups, or ``None`` before the backfill."""
+    value = (await db.execute(select(func.max(AuditRollupDay.day)))).scalar()
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    return datetime.combine(day, time.min, tzinfo=UTC), datetime.combine(day, time.max, tzinfo=UTC)
+
+
+def _to_date(value: Any) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+class AuditRollupService:
+    """Builds ``audit_daily_rollups`` one UTC day at a time."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def roll_up_day(self, day: date) -> None:
+        """Replace ``day``'s rollup rows with a fresh aggregate.
+
+        One ``INSERT … SELECT``; nothing is materialized in Python.
+        Runs in the caller's transaction.
+        """
+        from src.activities.models import Activity  # noqa: PLC0415
+
+        start_at, end_at = _day_bounds(day)
+        facts = facts_subquery(live_fact_selects(
+            audit_conditions=[AuditLog.timestamp >= start_at, AuditLog.timestamp <= end_at],
+            session_conditions=[
+                WorkSession.last_seen_at >= start_at,
+                WorkSession.last_seen_at <= end_at,
+            ],
+            activity_conditions=[Activity.created_at >= start_at, Activity.created_at <= end_at],
+        ))
+        await self.db.execute(delete(AuditDailyRollup).where(AuditDailyRollup.day == day))
+        await self.db.execute(delete(AuditRollupDay).where(AuditRollupDay.day == day))
+        rows = select(
+            literal(day, AuditDailyRollup.day.type),
+            facts.c.user_id,
+            facts.c.entity_type,
+            facts.c.entity_id,
+            *(func.sum(facts.c[name]) for name in FACT_COLUMNS[3:-1]),
+            func.max(facts.c.last_touched_at),
+        ).group_by(facts.c.user_id, facts.c.entity_type, facts.c.entity_id)
+        await self.db.execute(
+            insert(AuditDailyRollup).from_select(["day", *FACT_COLUMNS], rows)
+        )
+        self.db.add(AuditRollupDay(day=day))
+        await self.db.flush()
+
+    async def roll_up_days(self, first_day: date, last_day: date) -> int:
+        """Roll up every day in the inclusive window. Returns days rolled."""
+        day, rolled = first_day, 0
+        while day <= last_day:
+            await self.roll_up_day(day)
+            day += timedelta(days=1)
+            rolled += 1
+        return rolled
+
+    async def earliest_day(self) -> date | None:
+        """First UTC day holding any audit log, work session or activity."""
+        from src.activities.models import Activity  # noqa: PLC0415
+
+        firsts = [
+            (await self.db.execute(select(func.min(column)))).scalar()
+            for column in (AuditLog.timestamp, WorkSession.last_seen_at, Activity.created_at)
+        ]
+        days = [d for d in (_to_date(value) for value in firsts) if d is not None]
+        return min(days) if days else None
+
+    async def roll_up_pending(self, today: date | None = None) -> int:
+        """Roll up each finished day after the last rolled one.
+
+        Starts from the earliest data day when nothing is rolled up yet —
+        for large histories run ``scripts/rebuild_audit_rollups.py`` first,
+        which commits day by day.
+        """
+        today = today or datetime.now(UTC).date()
+        last_done = await rolled_through(self.db)
+        first_day = last_done + timedelta(days=1) if last_done else await self.earliest_day()
+        if first_day is None or first_day >= today:
+            return 0
+        return await self.roll_up_days(first_day, today - timedelta(days=1))
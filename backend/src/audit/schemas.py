@@ -84,10 +84,15 @@ class AdminAuditFeedResponse(BaseModel):
     """Paginated admin audit feed."""
 
     items: list[AdminAuditFeedItem]
-    total: int
+    # Reported on the first request only (no cursor). total_estimated marks
+    # a planner estimate; total_capped marks a lower bound.
+    total: int | None = None
+    total_capped: bool = False
+    total_estimated: bool = False
     page: int
     page_size: int
-    pages: int
+    pages: int | None = None
+    next_cursor: str | None = None
 
 
 class AdminAuditTotals(BaseModel):
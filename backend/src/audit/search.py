@@ -0,0 +1,103 @@
+"""Search index, keyset cursors and estimated totals for the admin audit feed.
+
+Each ``audit_logs`` row carries a ``search_vector`` built from its entity
+type, entity id, action, IP address and the field names and values in
+``changes``: a ``tsvector`` behind a GIN index on Postgres, the same words
+as a space-separated string on SQLite (the pytest default). Words are
+produced by :func:`src.email.search.search_words`, so a query word matches
+any indexed word it is a prefix of on either dialect, exactly as in email
+search. The vector is written by a ``before_insert`` / ``before_update``
+hook on ``AuditLog`` (see ``audit/models.py``), so ``log_change`` and every
+other writer keep it current.
+
+The feed pages with a keyset cursor on ``(timestamp, id)``. Its first page
+counts matches up to ``FEED_COUNT_CAP``; past the cap Postgres reports the
+planner's row estimate instead of counting every match.
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.core.cursors import decode_keyset_cursor
+from src.email.search import SEARCH_CONFIG, search_words
+
+FEED_COUNT_CAP = 1000
+
+
+def audit_search_words(
+    entity_type: str | None,
+    entity_id: int | None,
+    action: str | None,
+    ip_address: str | None,
+    changes: Any,
+) -> str:
+    """Indexed words for one audit row; ``changes`` contributes keys and values."""
+    changes_text = (
+        json.dumps(changes, default=str, ensure_ascii=False) if changes is not None else None
+    )
+    return search_words(
+        entity_type,
+        str(entity_id) if entity_id is not None else None,
+        action,
+        ip_address,
+        changes_text,
+    )
+
+
+def search_vector_value(dialect_name: str, words: str):
+    """Value to store in ``search_vector`` for ``words`` on ``dialect_name``."""
+    if dialect_name != "postgresql":
+        return f" {words} "
+    return func.to_tsvector(SEARCH_CONFIG, words)
+
+
+def after_cursor_clause(timestamp_column, id_column, cursor: str):
+    """Rows strictly after ``cursor`` in (timestamp desc, id desc) order."""
+    timestamp, log_id = decode_keyset_cursor(cursor, (datetime, int))
+    return or_(
+        timestamp_column < timestamp,
+        and_(timestamp_column == timestamp, id_column < log_id),
+    )
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` around a select, keeping its bind params."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimated_row_count(db: AsyncSession, statement: Any) -> int | None:
+    """Planner row estimate for ``statement``; ``None`` off Postgres.
+
+    Costs one planning pass, not a scan — the figure is as good as the
+    table statistics, which is enough to label a large result set.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    plan = (await db.execute(_Explain(statement))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (LookupError, TypeError, ValueError):
+        return None
+
+
+async def capped_count(db: AsyncSession, statement: Any, cap: int = FEED_COUNT_CAP) -> int:
+    """Number of rows ``statement`` returns, counting at most ``cap + 1``."""
+    capped = statement.limit(cap + 1).subquery()
+    return int((await db.execute(select(func.count()).select_from(capped))).scalar() or 0)
@@ -5,7 +5,7 @@ from collections import defaultdict
 from datetime import UTC, date, datetime, time, timedelta
 from typing import Any
 
-from sqlalchemy import String, cast, func, or_, select, text
+from sqlalchemy import String, and_, case, cast, func, or_, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,11 +13,31 @@ logger = logging.getLogger(__name__)
 
 from src.activities.models import Activity
 from src.audit.models import AuditLog, WorkSession
+from src.audit.rollups import (
+    canonical_type_expr,
+    facts_subquery,
+    live_fact_selects,
+    rolled_through,
+    rollup_fact_select,
+)
+from src.audit.search import (
+    FEED_COUNT_CAP,
+    after_cursor_clause,
+    capped_count,
+    estimated_row_count,
+)
 from src.auth.models import User
+from src.config import settings
 from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.cursors import encode_keyset_cursor
 from src.core.entity_types import canonical_plural, canonical_singular, entity_type_variants
+from src.email.search import search_match_clause, search_tokens
 
 WORK_SESSION_IDLE_TIMEOUT_SECONDS = 5 * 60
+# The summary returns at most this many security signal rows (newest first);
+# the totals still count every match.
+SECURITY_EVENT_LIMIT = 200
+HIGH_VOLUME_EDIT_THRESHOLD = 25
 
 
 class AuditService:
@@ -102,6 +122,7 @@ class AuditService:
         *,
         page: int = 1,
         page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
         start_date: date | None = None,
         end_date: date | None = None,
         user_id: int | None = None,
@@ -109,8 +130,18 @@ class AuditService:
         entity_id: int | None = None,
         action: str | None = None,
         search: str | None = None,
-    ) -> tuple[list[dict], int]:
-        """Get a filtered, paginated audit feed for admins."""
+    ) -> dict:
+        """Get a filtered audit feed for admins, newest first.
+
+        Follow ``next_cursor`` for later pages (keyset on ``(timestamp,
+        id)``); ``page`` remains as an OFFSET fallback. ``total`` is reported
+        when no cursor is given: counted exactly up to ``FEED_COUNT_CAP``,
+        beyond that the Postgres planner's estimate (``total_estimated``) or,
+        failing one, the cap itself as a lower bound (``total_capped``).
+
+        Raises:
+            ValueError: ``cursor`` is not one this method issued.
+        """
         conditions = self._audit_filter_conditions(
             start_date=start_date,
             end_date=end_date,
@@ -121,13 +152,17 @@ class AuditService:
             search=search,
         )
 
-        count_query = select(func.count()).select_from(
-            select(AuditLog.id)
-            .outerjoin(User, AuditLog.user_id == User.id)
-            .where(*conditions)
-            .subquery()
-        )
-        total = (await self.db.execute(count_query)).scalar() or 0
+        total = None
+        total_capped = total_estimated = False
+        if cursor is None:
+            matching = select(AuditLog.id).where(*conditions)
+            total = await capped_count(self.db, matching, FEED_COUNT_CAP)
+            if total > FEED_COUNT_CAP:
+                estimate = await estimated_row_count(self.db, matching)
+                if estimate is not None and estimate > FEED_COUNT_CAP:
+                    total, total_estimated = estimate, True
+                else:
+                    total, total_capped = FEED_COUNT_CAP, True
 
         query = (
             select(
@@ -138,26 +173,25 @@ class AuditService:
             .outerjoin(User, AuditLog.user_id == User.id)
             .where(*conditions)
             .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
         )
-        rows = (await self.db.execute(query)).all()
-
-        items = []
-        for log, user_name, user_email in rows:
-            items.append({
-                "id": log.id,
-                "entity_type": log.entity_type,
-                "entity_id": log.entity_id,
-                "user_id": log.user_id,
-                "user_name": user_name,
-                "user_email": user_email,
-                "action": log.action,
-                "changes": log.changes,
-                "ip_address": log.ip_address,
-                "created_at": log.timestamp,
-            })
-        return items, total
+        if cursor:
+            query = query.where(after_cursor_clause(AuditLog.timestamp, AuditLog.id, cursor))
+        else:
+            query = query.offset((page - 1) * page_size)
+        rows = (await self.db.execute(query.limit(page_size + 1))).all()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1][0]
+            next_cursor = encode_keyset_cursor(last.timestamp, last.id)
+        return {
+            "items": [_feed_item(*row) for row in rows],
+            "total": total,
+            "total_capped": total_capped,
+            "total_estimated": total_estimated,
+            "next_cursor": next_cursor,
+        }
 
     async def iter_admin_feed_rows(
         self,
@@ -185,8 +219,8 @@ class AuditService:
             action=action,
             search=search,
         )
-        # Cap cursor at 5min on Postgres. Wide-date + JSON `search`
-        # casts `changes` to text and forces a full scan that can pin a
+        # Cap cursor at 5min on Postgres. A wide date range with no
+        # selective filter streams most of audit_logs and can pin a
         # Neon pooler slot. SET LOCAL no-ops silently outside a txn, so
         # we verify via SHOW after — the router's broad except already
         # converts a real timeout into the CSV "EXPORT TRUNCATED"
@@ -219,18 +253,7 @@ class AuditService:
         )
         result = await self.db.stream(query)
         async for log, user_name, user_email in result:
-            yield {
-                "id": log.id,
-                "entity_type": log.entity_type,
-                "entity_id": log.entity_id,
-                "user_id": log.user_id,
-                "user_name": user_name,
-                "user_email": user_email,
-                "action": log.action,
-                "changes": log.changes,
-                "ip_address": log.ip_address,
-                "created_at": log.timestamp,
-            }
+            yield _feed_item(log, user_name, user_email)
 
     async def get_admin_summary(
         self,
@@ -249,16 +272,18 @@ class AuditService:
         opening ``/admin/audit`` with no filter doesn't trigger a full
         audit_logs scan. The dashboard exposes a "All time" preset that
         passes an explicit very-old start_date when the user wants
-        unfiltered history; the slow query is then opt-in.
+        unfiltered history.
+
+        Everything is aggregated in SQL (see ``src.audit.rollups``): one
+        grouped query per user, one top-``entity_limit`` query per entity,
+        and security signals capped at ``SECURITY_EVENT_LIMIT`` rows, so
+        memory stays bounded on any range.
         """
         if start_date is None and end_date is None:
             start_date = (datetime.now(UTC) - timedelta(days=30)).date()
         start_at, end_at = _date_range_to_datetimes(start_date, end_date)
 
         users = await self._load_users()
-        user_stats = _new_user_stats()
-        entity_stats = _new_entity_stats()
-
         audit_conditions = self._audit_filter_conditions(
             start_date=start_date,
             end_date=end_date,
@@ -267,98 +292,63 @@ class AuditService:
             action=action,
             search=search,
         )
-        audit_rows = (
-            await self.db.execute(
-                select(AuditLog)
-                .outerjoin(User, AuditLog.user_id == User.id)
-                .where(*audit_conditions)
-                .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
-            )
-        ).scalars().all()
-
-        security_events = self._build_security_events(audit_rows, users)
-
-        for log in audit_rows:
-            timestamp = log.timestamp
-            if log.user_id is not None:
-                stats = user_stats[log.user_id]
-                stats["audit_events"] += 1
-                stats["last_active_at"] = _max_dt(stats["last_active_at"], timestamp)
-                singular = canonical_singular(log.entity_type)
-                if singular == "proposal":
-                    stats["proposals_touched"].add(log.entity_id)
-                elif singular == "opportunity":
-                    stats["opportunities_touched"].add(log.entity_id)
-
-            entity_key = _entity_key(log.entity_type, log.entity_id)
-            estats = entity_stats[entity_key]
-            estats["audit_count"] += 1
-            estats["last_touched_at"] = _max_dt(estats["last_touched_at"], timestamp)
-            if estats["last_touched_by_id"] is None:
-                estats["last_touched_by_id"] = log.user_id
-
-        session_conditions = self._work_session_filter_conditions(
-            start_at=start_at,
-            end_at=end_at,
-            user_id=user_id,
-            entity_type=entity_type,
-        )
-        session_rows = (
-            await self.db.execute(select(WorkSession).where(*session_conditions))
-        ).scalars().all()
-        for session in session_rows:
-            duration = int(session.duration_seconds or 0)
-            if session.user_id is not None:
-                stats = user_stats[session.user_id]
-                stats["active_crm_seconds"] += duration
-                stats["last_active_at"] = _max_dt(stats["last_active_at"], session.last_seen_at)
-
-            entity_key = _entity_key(session.entity_type, session.entity_id)
-            estats = entity_stats[entity_key]
-            estats["active_crm_seconds"] += duration
-            estats["last_touched_at"] = _max_dt(estats["last_touched_at"], session.last_seen_at)
-
-        activity_conditions = self._activity_filter_conditions(
-            start_at=start_at,
-            end_at=end_at,
+        facts = await self._summary_facts(
+            start_date=start_date,
+            end_date=end_date,
             user_id=user_id,
             entity_type=entity_type,
+            action=action,
+            search=search,
         )
-        activities = (
-            await self.db.execute(select(Activity).where(*activity_conditions))
-        ).scalars().all()
-        for activity in activities:
-            actor_id = activity.owner_id or activity.assigned_to_id
-            if actor_id is not None:
-                stats = user_stats[actor_id]
-                if activity.activity_type == "call":
-                    stats["calls"] += 1
-                    stats["call_duration_minutes"] += int(activity.call_duration_minutes or 0)
-                elif activity.activity_type == "email":
-                    stats["emails"] += 1
-                stats["last_active_at"] = _max_dt(stats["last_active_at"], activity.created_at)
-
-            entity_key = _entity_key(activity.entity_type, activity.entity_id)
-            estats = entity_stats[entity_key]
-            estats["activity_count"] += 1
-            estats["last_touched_at"] = _max_dt(estats["last_touched_at"], activity.created_at)
-
-        entity_records = await self._load_entity_records(entity_stats)
-        owner_names = await self._load_user_names(
-            {
-                record["owner_id"]
-                for record in entity_records.values()
-                if record.get("owner_id") is not None
+
+        touched = {
+            "proposals_touched": "proposals",
+            "opportunities_touched": "opportunities",
+        }
+        user_rows = (await self.db.execute(
+            select(
+                facts.c.user_id,
+                func.sum(facts.c.audit_count).label("audit_events"),
+                func.sum(facts.c.activity_count).label("activities"),
+                func.sum(facts.c.active_crm_seconds).label("active_crm_seconds"),
+                func.sum(facts.c.calls).label("calls"),
+                func.sum(facts.c.call_duration_minutes).label("call_duration_minutes"),
+                func.sum(facts.c.emails).label("emails"),
+                func.max(facts.c.last_touched_at).label("last_active_at"),
+                *(
+                    func.count(func.distinct(case(
+                        (
+                            and_(facts.c.entity_type == plural, facts.c.audit_count > 0),
+                            facts.c.entity_id,
+                        ),
+                    ))).label(label)
+                    for label, plural in touched.items()
+                ),
+            ).group_by(facts.c.user_id)
+        )).all()
+
+        user_stats: dict[int, dict[str, Any]] = {}
+        total_audit_events = total_activities = 0
+        for row in user_rows:
+            total_audit_events += int(row.audit_events or 0)
+            total_activities += int(row.activities or 0)
+            if row.user_id is None:
+                continue
+            user_stats[row.user_id] = {
+                "active_crm_seconds": int(row.active_crm_seconds or 0),
+                "audit_events": int(row.audit_events or 0),
+                "calls": int(row.calls or 0),
+                "call_duration_minutes": int(row.call_duration_minutes or 0),
+                "emails": int(row.emails or 0),
+                "proposals_touched": int(row.proposals_touched or 0),
+                "opportunities_touched": int(row.opportunities_touched or 0),
+                "last_active_at": row.last_active_at,
             }
-        )
 
         user_summaries = []
         for uid, user in users.items():
-            stats = user_stats[uid]
-            if (
-                user_id is not None
-                and uid != user_id
-            ):
+            stats = user_stats.get(uid) or _empty_user_stats()
+            if user_id is not None and uid != user_id:
                 continue
             if not user.is_active and not _user_stats_has_activity(stats):
                 continue
@@ -367,14 +357,7 @@ class AuditService:
                 "user_name": user.full_name,
                 "user_email": user.email,
                 "role": user.role,
-                "active_crm_seconds": stats["active_crm_seconds"],
-                "audit_events": stats["audit_events"],
-                "calls": stats["calls"],
-                "call_duration_minutes": stats["call_duration_minutes"],
-                "emails": stats["emails"],
-                "proposals_touched": len(stats["proposals_touched"]),
-                "opportunities_touched": len(stats["opportunities_touched"]),
-                "last_active_at": stats["last_active_at"],
+                **stats,
             })
 
         # Include orphaned/inactive users that no longer have a users row.
@@ -386,39 +369,61 @@ class AuditService:
                 "user_name": f"Deleted user #{uid}",
                 "user_email": None,
                 "role": None,
-                "active_crm_seconds": stats["active_crm_seconds"],
-                "audit_events": stats["audit_events"],
-                "calls": stats["calls"],
-                "call_duration_minutes": stats["call_duration_minutes"],
-                "emails": stats["emails"],
-                "proposals_touched": len(stats["proposals_touched"]),
-                "opportunities_touched": len(stats["opportunities_touched"]),
-                "last_active_at": stats["last_active_at"],
+                **stats,
             })
 
         user_summaries.sort(
-            key=lambda row: (
-                row["active_crm_seconds"],
-                row["last_active_at"] or datetime.min.replace(tzinfo=UTC),
-            ),
+            key=lambda row: (row["active_crm_seconds"], _sort_dt(row["last_active_at"])),
             reverse=True,
         )
 
+        last_touched = func.max(facts.c.last_touched_at).label("last_touched_at")
+        entity_seconds = func.sum(facts.c.active_crm_seconds).label("active_crm_seconds")
+        entity_rows = (await self.db.execute(
+            select(
+                facts.c.entity_type,
+                facts.c.entity_id,
+                entity_seconds,
+                func.sum(facts.c.activity_count).label("activity_count"),
+                func.sum(facts.c.audit_count).label("audit_count"),
+                last_touched,
+            )
+            .group_by(facts.c.entity_type, facts.c.entity_id)
+            .order_by(
+                last_touched.desc().nulls_last(),
+                entity_seconds.desc(),
+                facts.c.entity_type,
+                facts.c.entity_id,
+            )
+            .limit(entity_limit)
+        )).all()
+        entity_keys = {(row.entity_type, row.entity_id): row for row in entity_rows}
+
+        entity_records = await self._load_entity_records(entity_keys)
+        last_actors = await self._last_audit_actors(audit_conditions, entity_keys)
+        owner_names = await self._load_user_names(
+            {
+                record["owner_id"]
+                for record in entity_records.values()
+                if record.get("owner_id") is not None
+            }
+        )
+
         entity_summaries = []
-        for key, stats in entity_stats.items():
+        for key, row in entity_keys.items():
             record = entity_records.get(key, {})
             owner_id = record.get("owner_id")
-            last_touched_by_id = stats["last_touched_by_id"]
+            last_touched_by_id = last_actors.get(key)
             entity_summaries.append({
                 "entity_type": key[0],
                 "entity_id": key[1],
                 "label": record.get("label"),
                 "owner_id": owner_id,
                 "owner_name": owner_names.get(owner_id) if owner_id is not None else None,
-                "active_crm_seconds": stats["active_crm_seconds"],
-                "activity_count": stats["activity_count"],
-                "audit_count": stats["audit_count"],
-                "last_touched_at": stats["last_touched_at"],
+                "active_crm_seconds": int(row.active_crm_seconds or 0),
+                "activity_count": int(row.activity_count or 0),
+                "audit_count": int(row.audit_count or 0),
+                "last_touched_at": row.last_touched_at,
                 "last_touched_by_id": last_touched_by_id,
                 "last_touched_by_name": (
                     users[last_touched_by_id].full_name
@@ -427,22 +432,15 @@ class AuditService:
                 ),
             })
 
-        entity_summaries.sort(
-            key=lambda row: (
-                row["last_touched_at"] or datetime.min.replace(tzinfo=UTC),
-                row["active_crm_seconds"],
-            ),
-            reverse=True,
-        )
-        entity_summaries = entity_summaries[:entity_limit]
+        security_events, security_total = await self._security_events(audit_conditions, users)
 
         totals = {
-            "audit_events": len(audit_rows),
+            "audit_events": total_audit_events,
             "active_crm_seconds": sum(row["active_crm_seconds"] for row in user_summaries),
-            "activities": len(activities),
+            "activities": total_activities,
             "calls": sum(row["calls"] for row in user_summaries),
             "emails": sum(row["emails"] for row in user_summaries),
-            "security_events": len(security_events),
+            "security_events": security_total,
         }
 
         return {
@@ -454,6 +452,101 @@ class AuditService:
             "security": security_events,
         }
 
+    async def _summary_facts(
+        self,
+        *,
+        start_date: date | None,
+        end_date: date | None,
+        user_id: int | None,
+        entity_type: str | None,
+        action: str | None,
+        search: str | None,
+    ) -> Any:
+        """Fact subquery for the summary range.
+
+        With ``AUDIT_ROLLUPS_ENABLED``, days the rollups cover come from
+        ``audit_daily_rollups`` and only later days are aggregated from the
+        raw tables. Rollups carry no action/search dimension and bucket
+        activities by actor, so user/action/search filters always read the
+        raw tables.
+        """
+        selects: list[Any] = []
+        live_start = start_date
+        if (
+            settings.AUDIT_ROLLUPS_ENABLED
+            and user_id is None
+            and not action
+            and not (search and search.strip())
+        ):
+            through = await rolled_through(self.db)
+            if through is not None and (start_date is None or start_date <= through):
+                last_day = through if end_date is None else min(end_date, through)
+                selects.append(rollup_fact_select(start_date, last_day, entity_type))
+                if end_date is not None and end_date <= through:
+                    return facts_subquery(selects)
+                live_start = through + timedelta(days=1)
+
+        live_start_at, end_at = _date_range_to_datetimes(live_start, end_date)
+        selects.extend(live_fact_selects(
+            audit_conditions=self._audit_filter_conditions(
+                start_date=live_start,
+                end_date=end_date,
+                user_id=user_id,
+                entity_type=entity_type,
+                action=action,
+                search=search,
+            ),
+            session_conditions=self._work_session_filter_conditions(
+                start_at=live_start_at,
+                end_at=end_at,
+                user_id=user_id,
+                entity_type=entity_type,
+            ),
+            activity_conditions=self._activity_filter_conditions(
+                start_at=live_start_at,
+                end_at=end_at,
+                user_id=user_id,
+                entity_type=entity_type,
+            ),
+        ))
+        return facts_subquery(selects)
+
+    async def _last_audit_actors(
+        self,
+        audit_conditions: list[Any],
+        entity_keys: dict[tuple[str, int], Any],
+    ) -> dict[tuple[str, int], int]:
+        """Actor of each entity's newest attributed audit row in the range."""
+        if not entity_keys:
+            return {}
+        entity_type = canonical_type_expr(AuditLog.entity_type)
+        ranked = (
+            select(
+                entity_type.label("entity_type"),
+                AuditLog.entity_id,
+                AuditLog.user_id,
+                func.row_number().over(
+                    partition_by=(entity_type, AuditLog.entity_id),
+                    order_by=(AuditLog.timestamp.desc(), AuditLog.id.desc()),
+                ).label("rank"),
+            )
+            .where(
+                *audit_conditions,
+                AuditLog.user_id.is_not(None),
+                AuditLog.entity_id.in_(sorted({entity_id for _, entity_id in entity_keys})),
+            )
+            .subquery()
+        )
+        rows = (await self.db.execute(
+            select(ranked.c.entity_type, ranked.c.entity_id, ranked.c.user_id)
+            .where(ranked.c.rank == 1)
+        )).all()
+        return {
+            (row.entity_type, row.entity_id): row.user_id
+            for row in rows
+            if (row.entity_type, row.entity_id) in entity_keys
+        }
+
     async def get_work_sessions(
         self,
         *,
@@ -510,18 +603,28 @@ class AuditService:
         if action:
             conditions.append(AuditLog.action == action)
         if search and search.strip():
-            pattern = f"%{search.strip()}%"
-            conditions.append(or_(
-                AuditLog.entity_type.ilike(pattern),
-                AuditLog.action.ilike(pattern),
-                AuditLog.ip_address.ilike(pattern),
-                cast(AuditLog.entity_id, String).ilike(pattern),
-                cast(AuditLog.changes, String).ilike(pattern),
-                User.full_name.ilike(pattern),
-                User.email.ilike(pattern),
-            ))
+            conditions.append(self._audit_search_condition(search.strip()))
         return conditions
 
+    def _audit_search_condition(self, search: str) -> Any:
+        """Indexed match on ``search_vector``, or the actor's name / email.
+
+        Actors are matched with a ``users`` subquery (a small table), so the
+        audit rows never need a join to be filtered.
+        """
+        pattern = f"%{search}%"
+        matches = [
+            AuditLog.user_id.in_(
+                select(User.id).where(or_(User.full_name.ilike(pattern), User.email.ilike(pattern)))
+            )
+        ]
+        tokens = search_tokens(search)
+        if tokens:
+            matches.append(
+                search_match_clause(AuditLog.search_vector, tokens, _dialect_name(self.db))
+            )
+        return or_(*matches)
+
     def _work_session_filter_conditions(
         self,
         *,
@@ -691,13 +794,65 @@ class AuditService:
             })
         return records
 
+    async def _security_events(
+        self,
+        audit_conditions: list[Any],
+        users: dict[int, User],
+    ) -> tuple[list[dict], int]:
+        """Newest security signals in the range, plus how many there are.
+
+        Only rows matching a signal are read (at most
+        ``SECURITY_EVENT_LIMIT``); high-volume editors come from a grouped
+        count.
+        """
+        action = func.lower(AuditLog.action)
+        flagged = or_(
+            action == "delete",
+            action.contains("import"),
+            action.in_(("share", "unshare")),
+            func.lower(AuditLog.entity_type).in_(("user", "role")),
+            cast(AuditLog.changes, String).ilike("%permission%"),
+            cast(AuditLog.changes, String).ilike("%role%"),
+        )
+
+        flagged_rows = (await self.db.execute(
+            select(AuditLog)
+            .where(*audit_conditions, flagged)
+            .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+            .limit(SECURITY_EVENT_LIMIT)
+        )).scalars().all()
+        if len(flagged_rows) < SECURITY_EVENT_LIMIT:
+            flagged_total = len(flagged_rows)
+        else:
+            flagged_total = int((await self.db.execute(
+                select(func.count()).select_from(AuditLog).where(*audit_conditions, flagged)
+            )).scalar() or 0)
+
+        volume_rows = (await self.db.execute(
+            select(
+                AuditLog.user_id,
+                func.count().label("edits"),
+                func.max(AuditLog.timestamp).label("latest"),
+            )
+            .where(
+                *audit_conditions,
+                action.in_(("update", "import_merge")),
+                AuditLog.user_id.is_not(None),
+            )
+            .group_by(AuditLog.user_id)
+            .having(func.count() >= HIGH_VOLUME_EDIT_THRESHOLD)
+        )).all()
+
+        events = self._build_security_events(flagged_rows, volume_rows, users)
+        return events, flagged_total + len(volume_rows)
+
     def _build_security_events(
         self,
         audit_rows: list[AuditLog],
+        volume_rows: list[Any],
         users: dict[int, User],
     ) -> list[dict]:
         events: list[dict] = []
-        edit_counts: dict[int, dict[str, Any]] = defaultdict(lambda: {"count": 0, "latest": None})
 
         for log in audit_rows:
             user_name = users[log.user_id].full_name if log.user_id in users else None
@@ -705,11 +860,6 @@ class AuditService:
             singular = canonical_singular(log.entity_type)
             changes_text = str(log.changes or "").lower()
 
-            if action in {"update", "import_merge"} and log.user_id is not None:
-                bucket = edit_counts[log.user_id]
-                bucket["count"] += 1
-                bucket["latest"] = _max_dt(bucket["latest"], log.timestamp)
-
             if action == "delete":
                 events.append({
                     "id": f"audit-{log.id}",
@@ -763,21 +913,19 @@ class AuditService:
                     "created_at": log.timestamp,
                 })
 
-        for uid, bucket in edit_counts.items():
-            if bucket["count"] < 25:
-                continue
-            user_name = users[uid].full_name if uid in users else f"User #{uid}"
+        for row in volume_rows:
+            user_name = users[row.user_id].full_name if row.user_id in users else f"User #{row.user_id}"
             events.append({
-                "id": f"volume-{uid}",
+                "id": f"volume-{row.user_id}",
                 "severity": "medium",
                 "category": "high_volume_edits",
-                "description": f"{user_name} made {bucket['count']} edits in the selected period",
-                "user_id": uid,
+                "description": f"{user_name} made {row.edits} edits in the selected period",
+                "user_id": row.user_id,
                 "user_name": user_name,
                 "entity_type": None,
                 "entity_id": None,
-                "count": bucket["count"],
-                "created_at": bucket["latest"] or datetime.now(UTC),
+                "count": row.edits,
+                "created_at": row.latest or datetime.now(UTC),
             })
 
         events.sort(key=lambda item: item["created_at"], reverse=True)
@@ -877,6 +1025,10 @@ class WorkSessionService:
         return new_session
 
 
+def _dialect_name(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
 def _date_range_to_datetimes(
     start_date: date | None,
     end_date: date | None,
@@ -896,39 +1048,21 @@ def _duration_seconds(started_at: datetime, ended_at: datetime) -> int:
     return max(0, int((_ensure_aware(ended_at) - _ensure_aware(started_at)).total_seconds()))
 
 
-def _max_dt(current: datetime | None, candidate: datetime | None) -> datetime | None:
-    if candidate is None:
-        return current
-    if current is None:
-        return candidate
-    return candidate if _ensure_aware(candidate) > _ensure_aware(current) else current
+def _sort_dt(value: datetime | None) -> datetime:
+    return _ensure_aware(value) if value is not None else datetime.min.replace(tzinfo=UTC)
 
 
-def _entity_key(entity_type: str, entity_id: int) -> tuple[str, int]:
-    return canonical_plural(entity_type), entity_id
-
-
-def _new_user_stats() -> defaultdict[int, dict[str, Any]]:
-    return defaultdict(lambda: {
+def _empty_user_stats() -> dict[str, Any]:
+    return {
         "active_crm_seconds": 0,
         "audit_events": 0,
         "calls": 0,
         "call_duration_minutes": 0,
         "emails": 0,
-        "proposals_touched": set(),
-        "opportunities_touched": set(),
+        "proposals_touched": 0,
+        "opportunities_touched": 0,
         "last_active_at": None,
-    })
-
-
-def _new_entity_stats() -> defaultdict[tuple[str, int], dict[str, Any]]:
-    return defaultdict(lambda: {
-        "active_crm_seconds": 0,
-        "activity_count": 0,
-        "audit_count": 0,
-        "last_touched_at": None,
-        "last_touched_by_id": None,
-    })
+    }
 
 
 def _user_stats_has_activity(stats: dict[str, Any]) -> bool:
@@ -941,6 +1075,21 @@ def _user_stats_has_activity(stats: dict[str, Any]) -> bool:
     )
 
 
+def _feed_item(log: AuditLog, user_name: str | None, user_email: str | None) -> dict:
+    return {
+        "id": log.id,
+        "entity_type": log.entity_type,
+        "entity_id": log.entity_id,
+        "user_id": log.user_id,
+        "user_name": user_name,
+        "user_email": user_email,
+        "action": log.action,
+        "changes": log.changes,
+        "ip_address": log.ip_address,
+        "created_at": log.timestamp,
+    }
+
+
 def _work_session_to_dict(session: WorkSession, user_name: str | None = None) -> dict:
     return {
         "id": session.id,
@@ -1,8 +1,17 @@
-"""Authentication dependencies for FastAPI."""
+"""Authentication dependencies for FastAPI.
 
+A request with a warm cache resolves its user without touching the
+database: the verified token maps to a user id in ``_token_cache`` and the
+detached user snapshot comes from ``_user_cache``. The injected session is
+only used on a miss, and an unused ``AsyncSession`` never checks a
+connection out of the pool.
+"""
+
+import hashlib
+import time
 from typing import Annotated
 
-from cachetools import TTLCache
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,11 +20,55 @@ from sqlalchemy.orm import make_transient
 from src.auth.models import User
 from src.auth.security import decode_token
 from src.auth.service import AuthService
+from src.core.cache import CACHE_AUTH_USERS, app_cache, get_cache, invalidate_cache
 from src.database import get_db
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/google/authorize")
 
-_user_cache: TTLCache = TTLCache(maxsize=500, ttl=30)
+# User snapshots, stored as (user, loaded_at). A named cache so
+# invalidate_user_cache() reaches every worker, not just the one that
+# handled the admin change -- but only a shared CACHE_BACKEND carries that
+# broadcast. Without one, another worker's admin change reaches this one
+# only by expiry, so snapshots are trusted for the shorter TTL.
+_USER_CACHE_TTL_SHARED = 60
+_USER_CACHE_TTL_LOCAL = 30
+_user_cache = get_cache(CACHE_AUTH_USERS, maxsize=500, ttl=_USER_CACHE_TTL_SHARED)
+
+
+def _user_cache_ttl() -> int:
+    return _USER_CACHE_TTL_SHARED if app_cache.backend.shared else _USER_CACHE_TTL_LOCAL
+
+# sha256(token) -> (user_id, exp). Entries never outlive the token's own
+# expiry, so a cached hit is exactly as valid as re-running decode_token.
+_TOKEN_CACHE_TTL = 300
+
+
+def _token_ttu(_key: str, value: tuple[int, float | None], now: float) -> float:
+    _user_id, exp = value
+    ttl = _TOKEN_CACHE_TTL if exp is None else min(_TOKEN_CACHE_TTL, exp - time.time())
+    return now + ttl
+
+
+_token_cache: TLRUCache = TLRUCache(maxsize=2000, ttu=_token_ttu)
+
+
+def _resolve_user_id(token: str) -> int | None:
+    """Verify ``token`` (or reuse an earlier verification) and return its subject."""
+    token_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _token_cache.get(token_key)
+    if cached is not None:
+        return cached[0]
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    try:
+        user_id = int(payload.get("sub"))
+    except (ValueError, TypeError):
+        return None
+    exp = payload.get("exp")
+    _token_cache[token_key] = (user_id, float(exp) if exp is not None else None)
+    return user_id
 
 
 async def get_current_user(
@@ -29,22 +82,15 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(token)
-    if payload is None:
+    user_id = _resolve_user_id(token)
+    if user_id is None:
         raise credentials_exception
 
-    user_id_str = payload.get("sub")
-    if user_id_str is None:
-        raise credentials_exception
-
-    try:
-        user_id = int(user_id_str)
-    except (ValueError, TypeError) as exc:
-        raise credentials_exception from exc
-
     cached = _user_cache.get(user_id)
     if cached is not None:
-        return cached
+        user, loaded_at = cached
+        if time.monotonic() - loaded_at < _user_cache_ttl():
+            return user
 
     service = AuthService(db)
     user = await service.get_user_by_id(user_id)
@@ -54,13 +100,21 @@ async def get_current_user(
     # Detach from session before caching to prevent DetachedInstanceError
     db.expunge(user)
     make_transient(user)
-    _user_cache[user_id] = user
+    _user_cache[user_id] = (user, time.monotonic())
     return user
 
 
 def invalidate_user_cache(user_id: int) -> None:
-    """Remove a user from the auth cache (call on deactivation/role change)."""
-    _user_cache.pop(user_id, None)
+    """Drop a user's auth snapshot (call on deactivation/role change).
+
+    Snapshots are per-worker, so this clears the whole snapshot cache on
+    every worker; admin user changes are rare enough that the reloads are
+    cheap.
+    """
+    from src.core.data_scope import invalidate_scope_cache
+
+    invalidate_cache(CACHE_AUTH_USERS)
+    invalidate_scope_cache(user_id)
 
 
 async def get_current_active_user(
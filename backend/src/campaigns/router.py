@@ -218,7 +218,7 @@ async def list_campaigns(
         campaign_type=campaign_type,
         status=status,
         owner_id=resolved_owner_id,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CAMPAIGNS),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CAMPAIGNS),
     )
 
     return CampaignListResponse(
@@ -258,9 +258,9 @@ async def get_campaign(
     """Get a campaign by ID."""
     service = CampaignService(db)
     campaign = await get_entity_or_404(service, campaign_id, EntityNames.CAMPAIGN)
-    check_record_access_or_shared(
-        campaign, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CAMPAIGNS),
+    await check_record_access_or_shared(
+        db, campaign, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CAMPAIGNS),
     )
     return CampaignResponse.model_validate(campaign)
 
@@ -303,9 +303,9 @@ async def get_campaign_stats(
     """Get campaign statistics."""
     service = CampaignService(db)
     campaign = await get_entity_or_404(service, campaign_id, EntityNames.CAMPAIGN)
-    check_record_access_or_shared(
-        campaign, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CAMPAIGNS),
+    await check_record_access_or_shared(
+        db, campaign, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CAMPAIGNS),
     )
     stats = await service.get_campaign_stats(campaign_id)
     return CampaignStats(**stats)
@@ -321,9 +321,9 @@ async def get_campaign_analytics(
     """Get email analytics (open/click/bounce rates) for a campaign, per step."""
     service = CampaignService(db)
     campaign = await get_entity_or_404(service, campaign_id, EntityNames.CAMPAIGN)
-    check_record_access_or_shared(
-        campaign, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CAMPAIGNS),
+    await check_record_access_or_shared(
+        db, campaign, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CAMPAIGNS),
     )
     return await service.get_campaign_analytics(campaign_id)
 
@@ -343,9 +343,9 @@ async def list_campaign_members(
     """List members of a campaign."""
     campaign_service = CampaignService(db)
     campaign = await get_entity_or_404(campaign_service, campaign_id, EntityNames.CAMPAIGN)
-    check_record_access_or_shared(
-        campaign, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CAMPAIGNS),
+    await check_record_access_or_shared(
+        db, campaign, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CAMPAIGNS),
     )
 
     member_service = CampaignMemberService(db)
@@ -453,9 +453,9 @@ async def get_campaign_steps(
     """Get all steps for a campaign."""
     campaign_service = CampaignService(db)
     campaign = await get_entity_or_404(campaign_service, campaign_id, EntityNames.CAMPAIGN)
-    check_record_access_or_shared(
-        campaign, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CAMPAIGNS),
+    await check_record_access_or_shared(
+        db, campaign, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CAMPAIGNS),
     )
 
     step_service = EmailCampaignStepService(db)
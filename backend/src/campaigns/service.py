@@ -6,6 +6,7 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import and_, func, or_, select
 
 from src.campaigns.models import Campaign, CampaignMember, EmailCampaignStep, EmailTemplate
+from src.campaigns.recipients import mark_recipients_sent
 from src.campaigns.schemas import (
     CampaignAnalytics,
     CampaignCreate,
@@ -21,6 +22,7 @@ from src.campaigns.schemas import (
 from src.core.base_service import BaseService, CRUDService
 from src.core.constants import DEFAULT_PAGE_SIZE
 from src.core.filtering import build_token_search
+from src.core.share_permissions import SharedScope, shared_with_clause
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +43,7 @@ class CampaignService(CRUDService[Campaign, CampaignCreate, CampaignUpdate]):
         campaign_type: str | None = None,
         status: str | None = None,
         owner_id: int | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
     ) -> tuple[list[Campaign], int]:
         """Get paginated list of campaigns with filters."""
         query = select(Campaign)
@@ -57,12 +59,12 @@ class CampaignService(CRUDService[Campaign, CampaignCreate, CampaignUpdate]):
         if status:
             query = query.where(Campaign.status == status)
 
-        if owner_id or shared_entity_ids:
+        if owner_id:
             clauses = []
             if owner_id:
                 clauses.append(Campaign.owner_id == owner_id)
-            if shared_entity_ids:
-                clauses.append(Campaign.id.in_(shared_entity_ids))
+            if shared_entity_ids is not None:
+                clauses.append(shared_with_clause(Campaign.id, shared_entity_ids))
             query = query.where(or_(*clauses))
 
         count_query = select(func.count()).select_from(query.subquery())
@@ -108,20 +110,14 @@ class CampaignService(CRUDService[Campaign, CampaignCreate, CampaignUpdate]):
         return processed
 
     async def _update_member_statuses(self, campaign_id: int, sent_emails) -> None:
-        """Mark campaign members as 'sent' for emails that were actually queued."""
-        from src.email.service import EmailService
+        """Mark campaign members as 'sent' once their emails are queued.
 
-        now = datetime.now(UTC)
-        email_addresses = {e.to_email for e in sent_emails}
-        email_service = EmailService(self.db)
-        members_result = await self.db.execute(
-            select(CampaignMember).where(CampaignMember.campaign_id == campaign_id)
-        )
-        for member in members_result.scalars().all():
-            member_email = await email_service.get_member_email(member)
-            if member_email in email_addresses:
-                member.status = "sent"
-                member.sent_at = now
+        Every member that resolves to an address gets a queue row, so one
+        ``UPDATE … FROM`` over the recipient join covers them all.
+        """
+        if not sent_emails:
+            return
+        await mark_recipients_sent(self.db, campaign_id, datetime.now(UTC))
 
     def _advance_to_next_step(self, campaign: Campaign, steps: list) -> None:
         """Advance campaign to the next step, or mark completed if done."""
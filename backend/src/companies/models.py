@@ -2,11 +2,12 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String, Text, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.mixins.auditable import AuditableMixin
 from src.database import Base
+from src.dedup.keys import sync_dedup_keys
 
 if TYPE_CHECKING:
     from src.contacts.models import Contact
@@ -28,6 +29,10 @@ class Company(Base, AuditableMixin):
     phone: Mapped[str | None] = mapped_column(String(50))
     email: Mapped[str | None] = mapped_column(String(255))
 
+    # Duplicate-detection keys, maintained by sync_dedup_keys (src.dedup.keys)
+    phone_normalized: Mapped[str | None] = mapped_column(String(50), index=True)
+    name_normalized: Mapped[str | None] = mapped_column(String(255), index=True)
+
     # Address
     address_line1: Mapped[str | None] = mapped_column(String(255))
     address_line2: Mapped[str | None] = mapped_column(String(255))
@@ -96,3 +101,7 @@ class Company(Base, AuditableMixin):
         Index("ix_companies_owner_created", "owner_id", "created_at"),
         UniqueConstraint("name", "owner_id", name="ix_companies_unique_name_owner"),
     )
+
+
+event.listen(Company, "before_insert", sync_dedup_keys)
+event.listen(Company, "before_update", sync_dedup_keys)
@@ -82,7 +82,7 @@ async def list_companies(
         owner_id=effective_owner_id(data_scope, owner_id),
         tag_ids=parse_tag_ids(tag_ids),
         filters=parse_json_filters(filters),
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_COMPANIES),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_COMPANIES),
     )
 
     # Bulk-load tags and contact counts to avoid N+1 queries
@@ -134,7 +134,7 @@ async def create_company(
         "entity_type": "company",
         "user_id": current_user.id,
         "data": {"name": company.name, "industry": company.industry, "status": company.status},
-    })
+    }, db=db)
 
     # New company has no contacts, so pass include_contact_count=False to avoid query
     # and manually set contact_count to 0
@@ -154,9 +154,9 @@ async def get_company(
     """Get a company by ID."""
     service = CompanyService(db)
     company = await get_entity_or_404(service, company_id, EntityNames.COMPANY)
-    check_record_access_or_shared(
-        company, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_COMPANIES),
+    await check_record_access_or_shared(
+        db, company, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_COMPANIES),
     )
     return await _build_company_response(service, company)
 
@@ -188,7 +188,7 @@ async def update_company(
         "entity_type": "company",
         "user_id": current_user.id,
         "data": {"name": updated_company.name, "industry": updated_company.industry, "status": updated_company.status},
-    })
+    }, db=db)
 
     return await _build_company_response(service, updated_company)
 
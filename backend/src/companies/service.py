@@ -9,7 +9,8 @@ from src.companies.schemas import CompanyCreate, CompanyUpdate
 from src.contacts.models import Contact
 from src.core.base_service import CRUDService, TaggableServiceMixin
 from src.core.constants import DEFAULT_PAGE_SIZE, ENTITY_TYPE_COMPANIES
-from src.core.filtering import apply_filters_to_query, build_token_search
+from src.core.filtering import apply_filters_to_query, build_search_rank, build_token_search
+from src.core.share_permissions import SharedScope
 
 
 class CompanyService(
@@ -31,7 +32,7 @@ class CompanyService(
         owner_id: int | None = None,
         tag_ids: list[int] | None = None,
         filters: dict[str, Any] | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
     ) -> tuple[list[Company], int]:
         """Get paginated list of companies with filters.
 
@@ -46,10 +47,17 @@ class CompanyService(
         if filters:
             query = apply_filters_to_query(query, Company, filters)
 
+        search_columns = (Company.name, Company.email, Company.website)
+        order_by = None
         if search:
-            search_condition = build_token_search(search, Company.name, Company.email, Company.website)
+            search_condition = build_token_search(search, *search_columns)
             if search_condition is not None:
                 query = query.where(search_condition)
+                order_by = [
+                    build_search_rank(search, *search_columns).desc(),
+                    Company.created_at.desc(),
+                    Company.id.desc(),
+                ]
 
         if status:
             query = query.where(Company.status == status)
@@ -64,7 +72,7 @@ class CompanyService(
         if tag_ids:
             query = await self._filter_by_tags(query, tag_ids)
 
-        return await self.paginate_query(query, page, page_size)
+        return await self.paginate_query(query, page, page_size, order_by=order_by)
 
 
     async def get_contact_count(self, company_id: int) -> int:
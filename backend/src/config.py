@@ -90,6 +90,95 @@ class Settings(BaseSettings):
 
     SEED_ON_STARTUP: bool = False
 
+    # /api/dashboard runs its KPI + chart queries concurrently, each on its own
+    # pooled session, at most DASHBOARD_QUERY_FANOUT at a time. Keep the fan-out
+    # below the engine's pool_size + max_overflow (database.py) so a dashboard
+    # burst leaves connections for other requests.
+    DASHBOARD_CONCURRENT_QUERIES: bool = True
+    DASHBOARD_QUERY_FANOUT: int = 4
+
+    # Serve dashboard leads/pipeline/revenue/activity figures from the per-day
+    # rollup tables (src.dashboard.rollups) instead of scanning the base tables.
+    # Backfill first with scripts/rebuild_dashboard_rollups.py, then enable.
+    # Entities changed by committed ORM writes are refreshed every
+    # DASHBOARD_ROLLUP_FLUSH_SECONDS; a nightly rebuild reconciles anything
+    # written outside the ORM unit of work (imports, bulk edits).
+    DASHBOARD_ROLLUPS_ENABLED: bool = False
+    DASHBOARD_ROLLUP_FLUSH_SECONDS: int = 15
+
+    # Notification emails are queued in notification_emails by the request
+    # that triggers them and sent by a scheduler job every
+    # NOTIFICATION_EMAIL_FLUSH_SECONDS (quiet-hours / daily digests wait
+    # for their delivery time). A request that queues an email due now wakes
+    # the job when it commits, so the interval only bounds retries of leased
+    # rows and the release of held digests.
+    NOTIFICATION_EMAIL_FLUSH_SECONDS: int = 120
+
+    # Unread counts are pushed to the notification bell over
+    # GET /api/notifications/stream instead of being polled. Each worker keeps
+    # its users' counts in memory and moves them as notifications are written;
+    # a count is recounted from the table once it is older than
+    # NOTIFICATION_UNREAD_TTL_SECONDS. Only a shared CACHE_BACKEND carries
+    # one worker's changes to the others; without it counts are trusted for
+    # NOTIFICATION_UNREAD_LOCAL_TTL_SECONDS and open streams recount on their
+    # keepalive. Open streams get a keepalive comment every
+    # NOTIFICATION_STREAM_KEEPALIVE_SECONDS so proxies don't cut them.
+    NOTIFICATION_UNREAD_TTL_SECONDS: int = 600
+    NOTIFICATION_UNREAD_LOCAL_TTL_SECONDS: int = 30
+    NOTIFICATION_STREAM_KEEPALIVE_SECONDS: int = 25
+
+    # Gmail forward sync is scheduled per account. Every GMAIL_SYNC_TICK_SECONDS
+    # the scheduler claims connections whose next poll is due, only as many as
+    # it has free of GMAIL_SYNC_CONCURRENCY per process (each sync holds a
+    # pooled connection while it runs). An account that just received
+    # mail is polled again after GMAIL_SYNC_MIN_INTERVAL_SECONDS; each idle poll
+    # doubles the wait up to GMAIL_SYNC_MAX_INTERVAL_SECONDS, which bounds how
+    # long a reply can take to appear. Failing accounts back off up to
+    # GMAIL_SYNC_FAILURE_MAX_SECONDS.
+    GMAIL_SYNC_TICK_SECONDS: int = 15
+    GMAIL_SYNC_CONCURRENCY: int = 4
+    GMAIL_SYNC_MIN_INTERVAL_SECONDS: int = 30
+    GMAIL_SYNC_MAX_INTERVAL_SECONDS: int = 120
+    GMAIL_SYNC_FAILURE_MAX_SECONDS: int = 1800
+
+    # Serve the admin audit summary's closed days from audit_daily_rollups
+    # (src.audit.rollups) and only aggregate the raw tables for days not yet
+    # rolled up. Backfill first with scripts/rebuild_audit_rollups.py, then
+    # enable; a nightly job rolls up each finished day.
+    AUDIT_ROLLUPS_ENABLED: bool = False
+
+    # Deliver webhook / notification / rollup event handlers through the
+    # event_outbox table (written in the request's transaction) instead of
+    # awaiting them inside the request. EVENT_BUS_WORKERS bounds concurrent
+    # deliveries per process; a handler that keeps failing is parked as
+    # "dead" after EVENT_BUS_MAX_ATTEMPTS tries with exponential backoff.
+    EVENT_BUS_DURABLE: bool = False
+    EVENT_BUS_WORKERS: int = 8
+    EVENT_BUS_MAX_ATTEMPTS: int = 8
+
+    # Outbound webhooks share one keep-alive connection pool. At most
+    # WEBHOOK_MAX_CONCURRENCY requests are in flight per process; 5xx / 429 /
+    # network failures are retried with backoff up to WEBHOOK_MAX_ATTEMPTS,
+    # and an endpoint that fails WEBHOOK_BREAKER_THRESHOLD times in a row is
+    # skipped for WEBHOOK_BREAKER_RESET_SECONDS before a single probe.
+    WEBHOOK_MAX_CONCURRENCY: int = 20
+    WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+    WEBHOOK_MAX_ATTEMPTS: int = 6
+    WEBHOOK_BREAKER_THRESHOLD: int = 5
+    WEBHOOK_BREAKER_RESET_SECONDS: int = 60
+
+    # Storage behind core.cache.app_cache. "memory" keeps each uvicorn worker's
+    # cache private (invalidation only reaches the worker that handled the
+    # write); "redis" shares entries and fans invalidation out to every worker
+    # via CACHE_REDIS_URL. "local" runs the shared code path against an
+    # in-process stand-in — dev/tests only.
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: str = ""
+    # Per-worker bounds for the "memory" backend. Entries beyond either bound
+    # are evicted least-recently-used first; 0 bytes means entry-bounded only.
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_MAX_BYTES: int = 0
+
     @property
     def cors_origins(self) -> list[str]:
         return json.loads(self.BACKEND_CORS_ORIGINS)
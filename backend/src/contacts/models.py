@@ -3,11 +3,22 @@
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    event,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.mixins.auditable import AuditableMixin
 from src.database import Base
+from src.dedup.keys import sync_dedup_keys
 
 
 class ContactEmailAlias(Base):
@@ -55,6 +66,10 @@ class Contact(Base, AuditableMixin):
     phone: Mapped[str | None] = mapped_column(String(50))
     mobile: Mapped[str | None] = mapped_column(String(50))
 
+    # Duplicate-detection keys, maintained by sync_dedup_keys (src.dedup.keys)
+    phone_normalized: Mapped[str | None] = mapped_column(String(50), index=True)
+    name_normalized: Mapped[str | None] = mapped_column(String(201), index=True)
+
     # Professional info
     job_title: Mapped[str | None] = mapped_column(String(100))
     department: Mapped[str | None] = mapped_column(String(100))
@@ -127,5 +142,10 @@ class Contact(Base, AuditableMixin):
     __table_args__ = (
         Index("ix_contacts_name", "first_name", "last_name"),
         Index("ix_contacts_owner_created", "owner_id", "created_at"),
+        Index("ix_contacts_email_lower", func.lower(email)),
         UniqueConstraint("email", name="ix_contacts_unique_email"),
     )
+
+
+event.listen(Contact, "before_insert", sync_dedup_keys)
+event.listen(Contact, "before_update", sync_dedup_keys)
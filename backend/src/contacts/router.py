@@ -86,7 +86,7 @@ async def list_contacts(
             owner_id=effective_owner_id(data_scope, owner_id),
             tag_ids=parse_tag_ids(tag_ids),
             filters=parsed_filters,
-            shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTACTS),
+            shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTACTS),
             order_by=order_by,
             order_dir=order_dir,
         )
@@ -123,7 +123,7 @@ async def create_contact(
         "entity_type": "contact",
         "user_id": current_user.id,
         "data": {"first_name": contact.first_name, "last_name": contact.last_name, "email": contact.email, "status": contact.status},
-    })
+    }, db=db)
 
     if contact.owner_id and contact.owner_id != current_user.id:
         await notify_on_assignment(db, contact.owner_id, "contacts", contact.id, contact.full_name)
@@ -141,9 +141,9 @@ async def get_contact_payment_summary(
     """Get payment summary for a contact via their StripeCustomer link."""
     service = ContactService(db)
     contact = await get_entity_or_404(service, contact_id, EntityNames.CONTACT)
-    check_record_access_or_shared(
-        contact, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTACTS),
+    await check_record_access_or_shared(
+        db, contact, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTACTS),
     )
     return await service.get_payment_summary(contact_id)
 
@@ -158,9 +158,9 @@ async def get_contact(
     """Get a contact by ID."""
     service = ContactService(db)
     contact = await get_entity_or_404(service, contact_id, EntityNames.CONTACT)
-    check_record_access_or_shared(
-        contact, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTACTS),
+    await check_record_access_or_shared(
+        db, contact, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTACTS),
     )
     return await _build_contact_response(service, contact)
 
@@ -194,7 +194,7 @@ async def update_contact(
         "entity_type": "contact",
         "user_id": current_user.id,
         "data": {"first_name": updated_contact.first_name, "last_name": updated_contact.last_name, "email": updated_contact.email, "status": updated_contact.status},
-    })
+    }, db=db)
 
     if updated_contact.owner_id and updated_contact.owner_id != old_owner_id:
         await notify_on_assignment(db, updated_contact.owner_id, "contacts", updated_contact.id, updated_contact.full_name)
@@ -245,9 +245,9 @@ async def list_aliases(
     """
     service = ContactService(db)
     contact = await get_entity_or_404(service, contact_id, EntityNames.CONTACT)
-    check_record_access_or_shared(
-        contact, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTACTS),
+    await check_record_access_or_shared(
+        db, contact, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTACTS),
     )
 
     result = await db.execute(
@@ -11,7 +11,8 @@ from src.contacts.models import Contact
 from src.contacts.schemas import ContactCreate, ContactUpdate
 from src.core.base_service import CRUDService, TaggableServiceMixin
 from src.core.constants import DEFAULT_PAGE_SIZE, ENTITY_TYPE_CONTACTS
-from src.core.filtering import apply_filters_to_query, build_token_search
+from src.core.filtering import apply_filters_to_query, build_search_rank, build_token_search
+from src.core.share_permissions import SharedScope
 from src.core.sorting import build_order_clauses
 
 logger = logging.getLogger(__name__)
@@ -60,7 +61,7 @@ class ContactService(
         owner_id: int | None = None,
         tag_ids: list[int] | None = None,
         filters: dict[str, Any] | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
         order_by: str | None = None,
         order_dir: str | None = None,
     ) -> tuple[list[Contact], int]:
@@ -75,10 +76,13 @@ class ContactService(
         if filters:
             query = apply_filters_to_query(query, Contact, filters)
 
+        search_columns = (Contact.first_name, Contact.last_name, Contact.email)
+        default_order = [Contact.created_at.desc(), Contact.id.desc()]
         if search:
-            search_condition = build_token_search(search, Contact.first_name, Contact.last_name, Contact.email)
+            search_condition = build_token_search(search, *search_columns)
             if search_condition is not None:
                 query = query.where(search_condition)
+                default_order.insert(0, build_search_rank(search, *search_columns).desc())
 
         if company_id:
             query = query.where(Contact.company_id == company_id)
@@ -99,7 +103,7 @@ class ContactService(
             CONTACT_SORTABLE_FIELDS,
             order_by,
             order_dir,
-            default=[Contact.created_at.desc(), Contact.id.desc()],
+            default=default_order,
         )
         return await self.paginate_query(query, page, page_size, order_by=order_clauses)
 
@@ -148,6 +152,7 @@ class ContactService(
         Quote rows keep their original owner.
         """
         # legacy Quote.owner_id rows are NOT repointed — retired module, see PR2 #330
+        from src.dashboard.rollups import mark_dirty
         from src.opportunities.models import Opportunity
         from src.payments.models import Payment, StripeCustomer
         from src.proposals.models import Proposal
@@ -158,12 +163,14 @@ class ContactService(
             .where(Proposal.owner_id == old_owner_id)
             .values(owner_id=new_owner_id)
         )
-        opportunity_result = await self.db.execute(
+        opportunity_ids = (await self.db.execute(
             update(Opportunity)
             .where(Opportunity.contact_id == contact_id)
             .where(Opportunity.owner_id == old_owner_id)
             .values(owner_id=new_owner_id)
-        )
+            .returning(Opportunity.id)
+        )).scalars().all()
+        await mark_dirty(self.db, "opportunity", opportunity_ids)
         # Payments are linked to a contact through StripeCustomer.contact_id,
         # not directly. Scope the update to payments whose customer points
         # at this contact.
@@ -183,7 +190,7 @@ class ContactService(
             "%d opportunities, %d payments",
             contact_id,
             proposal_result.rowcount or 0,
-            opportunity_result.rowcount or 0,
+            len(opportunity_ids),
             payment_result.rowcount or 0,
         )
 
@@ -71,7 +71,7 @@ async def list_contracts(
         company_id=company_id,
         status=status,
         owner_id=effective_owner_id,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTRACTS),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTRACTS),
         search=search,
         order_by=order_by,
         order_dir=order_dir,
@@ -117,9 +117,9 @@ async def get_contract(
     """Get a contract by ID."""
     service = ContractService(db)
     contract = await get_entity_or_404(service, contract_id, ENTITY_NAME)
-    check_record_access_or_shared(
-        contract, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTRACTS),
+    await check_record_access_or_shared(
+        db, contract, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTRACTS),
     )
     return ContractResponse.model_validate(contract)
 
@@ -182,9 +182,9 @@ async def download_signed_pdf(
 
     service = ContractService(db)
     contract = await get_entity_or_404(service, contract_id, ENTITY_NAME)
-    check_record_access_or_shared(
-        contract, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTRACTS),
+    await check_record_access_or_shared(
+        db, contract, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTRACTS),
     )
 
     if not contract.signed_pdf_r2_key:
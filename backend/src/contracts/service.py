@@ -15,6 +15,7 @@ from src.contracts.schemas import ContractCreate, ContractUpdate
 from src.core.base_service import CRUDService
 from src.core.constants import DEFAULT_PAGE_SIZE
 from src.core.filtering import build_token_search
+from src.core.share_permissions import SharedScope, shared_with_clause
 from src.core.sorting import build_order_clauses
 from src.core.url_safety import UnsafeUrlError, validate_public_url
 from src.email.branded_templates import TenantBrandingHelper, render_contract_send_email
@@ -103,7 +104,7 @@ class ContractService(CRUDService[Contract, ContractCreate, ContractUpdate]):
         company_id: int | None = None,
         status: str | None = None,
         owner_id: int | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
         search: str | None = None,
         order_by: str | None = None,
         order_dir: str | None = None,
@@ -123,12 +124,12 @@ class ContractService(CRUDService[Contract, ContractCreate, ContractUpdate]):
         if status:
             query = query.where(Contract.status == status)
 
-        if owner_id or shared_entity_ids:
+        if owner_id:
             clauses = []
             if owner_id:
                 clauses.append(Contract.owner_id == owner_id)
-            if shared_entity_ids:
-                clauses.append(Contract.id.in_(shared_entity_ids))
+            if shared_entity_ids is not None:
+                clauses.append(shared_with_clause(Contract.id, shared_entity_ids))
             query = query.where(or_(*clauses))
 
         if search:
@@ -2,7 +2,7 @@
 
 from collections import defaultdict
 from datetime import UTC, datetime
-from typing import Any, Generic, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
 
 from pydantic import BaseModel
 from sqlalchemy import delete as sa_delete
@@ -13,6 +13,9 @@ from sqlalchemy.orm import InstrumentedAttribute
 from src.core.constants import DEFAULT_PAGE_SIZE
 from src.core.models import EntityTag, Tag
 
+if TYPE_CHECKING:
+    from src.core.share_permissions import SharedScope
+
 
 class _Entity(Protocol):
     id: Any
@@ -86,7 +89,7 @@ class BaseService(Generic[ModelType]):
         items = list(result.scalars().all())
         return items, total
 
-    def apply_owner_filter(self, query, owner_id: int | None, shared_entity_ids: list[int] | None = None):
+    def apply_owner_filter(self, query, owner_id: int | None, shared_entity_ids: "SharedScope | None" = None):
         """Filter by owner_id, including shared entities if present.
 
         Only callable on services whose model has owner_id — not enforced at type level
@@ -95,8 +98,12 @@ class BaseService(Generic[ModelType]):
         if not owner_id:
             return query
         model_owner_id: Any = self.model.owner_id  # type: ignore[attr-defined]
-        if shared_entity_ids:
-            return query.where(or_(model_owner_id == owner_id, self.model.id.in_(shared_entity_ids)))
+        if shared_entity_ids is not None:
+            # Lazy: share_permissions imports auth models, which import src.core.
+            from src.core.share_permissions import shared_with_clause
+
+            shared = shared_with_clause(self.model.id, shared_entity_ids)
+            return query.where(or_(model_owner_id == owner_id, shared))
         return query.where(model_owner_id == owner_id)
 
     async def get_multi(
@@ -1,20 +1,25 @@
 """In-memory caching utilities for shared reference data.
 
-This module provides a comprehensive TTL-based in-memory cache with:
-- Async-safe operations via asyncio.Lock
+This module provides a comprehensive TTL-based cache with:
+- Pluggable storage (``src.core.cache_backends``): per-process by default, or a
+  shared Redis-protocol store so every worker reads the same warm cache
+- A sharded, size-bounded in-process store with lock-free reads, background
+  expiry and prefix-indexed pattern deletes (the default backend)
 - Pattern-based key deletion
 - Cache statistics and cleanup
-- Decorator for caching async function results
-- Entity-aware invalidation helpers
+- Decorator for caching async function results, with concurrent misses
+  coalesced into one call (``SingleFlight``)
+- Entity-aware invalidation helpers, fanned out to every worker when the
+  backend is shared
 
-NOTE: This is for single-instance deployment only. For multi-instance
-deployments, use Redis or another distributed cache.
+The backend is chosen at startup by ``configure_cache_backend`` from the
+``CACHE_BACKEND`` setting; until then ``app_cache`` is single-instance only.
 """
 
 import asyncio
-import fnmatch
 import functools
 import inspect
+import logging
 import sys
 import threading
 import time
@@ -24,96 +29,176 @@ from typing import Any, TypeVar
 # Legacy imports kept for backward compatibility with existing code
 from cachetools import TTLCache as _CacheToolsTTL
 
+from src.core.cache_backends import (
+    DEFAULT_MAX_ENTRIES,
+    RESUBSCRIBED_MESSAGE,
+    CacheBackend,
+    InMemoryBackend,
+    LocalRedisStandIn,
+    RedisBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# SingleFlight - request coalescing for cache misses
+# ---------------------------------------------------------------------------
+
+class _LeaderCancelled(Exception):
+    """The coroutine computing a shared result was cancelled mid-flight."""
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller (the leader) runs ``fn`` inline — on its own task, so a
+    DB session it closes over is never touched by another coroutine. Callers
+    arriving while it runs await the leader's result instead of repeating the
+    work. If the leader is cancelled the waiters retry, electing a new leader,
+    rather than inheriting a cancellation that wasn't theirs.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        while (pending := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark any exception retrieved so an un-awaited failure isn't logged.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+
 # ---------------------------------------------------------------------------
-# TTLCache - Async-safe in-memory cache
+# TTLCache - Async-safe cache over a pluggable backend
 # ---------------------------------------------------------------------------
 
 class TTLCache:
-    """Simple in-memory TTL cache. Thread-safe via asyncio.Lock."""
+    """TTL cache over a ``CacheBackend``. In-process dict unless told otherwise.
 
-    def __init__(self, default_ttl: int = 300):
-        self._store: dict[str, tuple[Any, float]] = {}
-        self._lock = asyncio.Lock()
+    Hit/miss counters are per process even when the store is shared.
+    """
+
+    def __init__(self, default_ttl: int = 300, backend: CacheBackend | None = None):
+        self._backend = backend or InMemoryBackend()
         self._default_ttl = default_ttl
         self._hits = 0
         self._misses = 0
+        self._flights = SingleFlight()
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    async def set_backend(self, backend: CacheBackend) -> None:
+        """Swap the storage backend, closing the previous one."""
+        previous, self._backend = self._backend, backend
+        if previous is not backend:
+            await previous.close()
 
     async def get(self, key: str) -> Any | None:
         """Get value if exists and not expired."""
-        async with self._lock:
-            entry = self._store.get(key)
-            if entry is None:
-                self._misses += 1
-                return None
-            value, expires_at = entry
-            if time.time() > expires_at:
-                del self._store[key]
-                self._misses += 1
-                return None
-            self._hits += 1
-            return value
+        entry = await self._backend.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        value, expires_at = entry
+        if time.time() > expires_at:
+            await self._backend.delete(key)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set value with TTL."""
         effective_ttl = ttl if ttl is not None else self._default_ttl
-        async with self._lock:
-            self._store[key] = (value, time.time() + effective_ttl)
+        await self._backend.set(key, value, time.time() + effective_ttl)
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int | None = None,
+    ) -> Any:
+        """Return the cached value or compute it once, however many callers miss.
+
+        Concurrent misses for ``key`` share one ``compute()`` call (see
+        ``SingleFlight``). ``None`` results are returned but not cached.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        async def _load() -> Any:
+            result = await compute()
+            if result is not None:
+                await self.set(key, result, ttl=ttl)
+            return result
+
+        return await self._flights.do(key, _load)
 
     async def delete(self, key: str) -> None:
         """Delete specific key."""
-        async with self._lock:
-            self._store.pop(key, None)
+        await self._backend.delete(key)
 
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching pattern (e.g., 'quotes:*'). Returns count deleted."""
-        async with self._lock:
-            keys_to_delete = [
-                k for k in self._store if fnmatch.fnmatch(k, pattern)
-            ]
-            for k in keys_to_delete:
-                del self._store[k]
-            return len(keys_to_delete)
+        return await self._backend.delete_pattern(pattern)
 
     async def clear(self) -> int:
         """Clear entire cache. Returns count cleared."""
-        async with self._lock:
-            count = len(self._store)
-            self._store.clear()
-            self._hits = 0
-            self._misses = 0
-            return count
+        count = await self._backend.clear()
+        self._hits = 0
+        self._misses = 0
+        return count
 
     async def stats(self) -> dict:
         """Return cache stats: total keys, expired, memory estimate."""
-        async with self._lock:
-            now = time.time()
-            total = len(self._store)
-            expired = sum(1 for _, (_, exp) in self._store.items() if now > exp)
-            active = total - expired
-            memory_bytes = sum(
-                sys.getsizeof(k) + sys.getsizeof(v)
-                for k, (v, _) in self._store.items()
-            )
-            total_requests = self._hits + self._misses
-            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
-            return {
-                "total_keys": total,
-                "active_keys": active,
-                "expired_keys": expired,
-                "memory_bytes": memory_bytes,
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate_percent": round(hit_rate, 1),
-            }
+        now = time.time()
+        entries = await self._backend.entries()
+        total = len(entries)
+        expired = sum(1 for _, _, exp in entries if now > exp)
+        active = total - expired
+        memory_bytes = sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v, _ in entries)
+        total_requests = self._hits + self._misses
+        hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
+        return {
+            "backend": type(self._backend).__name__,
+            "total_keys": total,
+            "active_keys": active,
+            "expired_keys": expired,
+            "memory_bytes": memory_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate_percent": round(hit_rate, 1),
+            **self._backend.extra_stats(),
+        }
 
     async def cleanup(self) -> int:
         """Remove expired entries. Returns count removed."""
-        async with self._lock:
-            now = time.time()
-            expired_keys = [k for k, (_, exp) in self._store.items() if now > exp]
-            for k in expired_keys:
-                del self._store[k]
-            return len(expired_keys)
+        return await self._backend.purge_expired(time.time())
 
 
 # Global cache instance
@@ -154,16 +239,10 @@ def cached(key_template: str, ttl: int = 300):
             except (KeyError, IndexError):
                 cache_key = key_template
 
-            # Check cache
-            result = await app_cache.get(cache_key)
-            if result is not None:
-                return result
-
-            # Call function and cache result
-            result = await func(*args, **kwargs)
-            if result is not None:
-                await app_cache.set(cache_key, result, ttl=ttl)
-            return result
+            # Check cache; concurrent misses share one call of func
+            return await app_cache.get_or_set(
+                cache_key, lambda: func(*args, **kwargs), ttl=ttl
+            )
         return wrapper
     return decorator
 
@@ -211,6 +290,7 @@ DEFAULT_MAXSIZE = 100
 
 _cache_lock = threading.Lock()
 _caches: dict[str, _CacheToolsTTL] = {}
+_legacy_flights = SingleFlight()
 
 CACHE_TAGS = "tags"
 CACHE_LEAD_SOURCES = "lead_sources"
@@ -219,6 +299,8 @@ CACHE_ROLES = "roles"
 CACHE_TENANT_SETTINGS = "tenant_settings"
 CACHE_DASHBOARD = "dashboard"
 CACHE_ADMIN_STATS = "admin_stats"
+CACHE_DEDUP_CLUSTERS = "dedup_clusters"
+CACHE_AUTH_USERS = "auth_users"
 
 
 def get_cache(name: str, maxsize: int = DEFAULT_MAXSIZE, ttl: int = DEFAULT_TTL) -> _CacheToolsTTL:
@@ -229,17 +311,24 @@ def get_cache(name: str, maxsize: int = DEFAULT_MAXSIZE, ttl: int = DEFAULT_TTL)
         return _caches[name]
 
 
-def invalidate_cache(name: str) -> None:
-    """Invalidate (clear) a named cache."""
+def _clear_local(name: str) -> None:
     with _cache_lock:
-        if name in _caches:
+        if name == "*":
+            for cache in _caches.values():
+                cache.clear()
+        elif name in _caches:
             _caches[name].clear()
 
 
+def invalidate_cache(name: str) -> None:
+    """Invalidate (clear) a named cache — on every worker when the backend is shared."""
+    _clear_local(name)
+    _broadcast_invalidation(name)
+
+
 def invalidate_all_caches() -> None:
-    with _cache_lock:
-        for cache in _caches.values():
-            cache.clear()
+    _clear_local("*")
+    _broadcast_invalidation("*")
 
 
 T = TypeVar("T")
@@ -257,6 +346,10 @@ def cache_set(cache_name: str, key: str, value: Any) -> None:
         cache[key] = value
 
 
+def _shared_key(cache_name: str, key: str) -> str:
+    return f"{_LEGACY_NAMESPACE}{cache_name}:{key}"
+
+
 async def cached_fetch(
     cache_name: str,
     key: str,
@@ -264,15 +357,131 @@ async def cached_fetch(
 ) -> Any:
     """Fetch data with caching support.
 
-    Checks cache first, if miss calls fetch_func and caches result.
+    Checks the per-process cache first, then (with a shared backend) the
+    shared store, and only calls fetch_func when both miss — so one worker's
+    fetch warms every other worker.
     """
     cached_value = cache_get(cache_name, key)
     if cached_value is not None:
         return cached_value
 
-    result = await fetch_func()
-    cache_set(cache_name, key, result)
-    return result
+    async def _load() -> Any:
+        shared = app_cache.backend.shared
+        if shared:
+            shared_value = await app_cache.get(_shared_key(cache_name, key))
+            if shared_value is not None:
+                cache_set(cache_name, key, shared_value)
+                return shared_value
+
+        result = await fetch_func()
+        cache_set(cache_name, key, result)
+        if shared and result is not None:
+            await app_cache.set(_shared_key(cache_name, key), result, ttl=DEFAULT_TTL)
+        return result
+
+    # Concurrent misses for the same entry share one fetch.
+    return await _legacy_flights.do(f"{cache_name}:{key}", _load)
+
+
+# ---------------------------------------------------------------------------
+# Cross-worker invalidation
+# ---------------------------------------------------------------------------
+
+_LEGACY_NAMESPACE = "legacy:"
+_pending_broadcasts: set[asyncio.Task] = set()
+
+
+def _on_invalidation_message(message: str) -> None:
+    """Apply an invalidation broadcast from any worker (including this one)."""
+    if message == RESUBSCRIBED_MESSAGE:
+        # Broadcasts sent while the subscriber was down were missed.
+        _clear_local("*")
+    elif message.startswith(_LEGACY_NAMESPACE):
+        _clear_local(message[len(_LEGACY_NAMESPACE):])
+
+
+async def _publish_invalidation(name: str) -> None:
+    pattern = "*" if name == "*" else f"{name}:*"
+    try:
+        # Drop the shared copies before telling workers to drop their local
+        # copies, so a worker refilling its local cache can't re-read stale data.
+        await app_cache.delete_pattern(f"{_LEGACY_NAMESPACE}{pattern}")
+        await app_cache.backend.publish(f"{_LEGACY_NAMESPACE}{name}")
+    except Exception:
+        logger.exception("[cache] failed to broadcast invalidation of %r", name)
+
+
+def _unfinished_broadcasts(loop: asyncio.AbstractEventLoop) -> list[asyncio.Task]:
+    return [task for task in _pending_broadcasts if task.get_loop() is loop and not task.done()]
+
+
+async def _publish_after(earlier: list[asyncio.Task], name: str) -> None:
+    if earlier:
+        await asyncio.wait(earlier)
+    await _publish_invalidation(name)
+
+
+def _broadcast_invalidation(name: str) -> None:
+    """Fan a legacy-cache invalidation out to every worker.
+
+    The legacy helpers are sync, so the broadcast is scheduled on the running
+    loop, after every broadcast still in flight so workers see them in call
+    order; ``flush_cache_invalidations`` waits for them, and the app does so
+    before each response goes out. No loop (scripts, sync tests) or a
+    process-local backend means there is nobody else to tell.
+    """
+    if not app_cache.backend.shared:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_publish_after(_unfinished_broadcasts(loop), name))
+    _pending_broadcasts.add(task)
+    task.add_done_callback(_pending_broadcasts.discard)
+
+
+async def flush_cache_invalidations() -> None:
+    """Wait until every invalidation broadcast scheduled so far is published."""
+    pending = _unfinished_broadcasts(asyncio.get_running_loop())
+    if pending:
+        await asyncio.wait(pending)
+
+
+async def configure_cache_backend(backend: CacheBackend) -> None:
+    """Point ``app_cache`` at ``backend`` and subscribe to its invalidations."""
+    await app_cache.set_backend(backend)
+    backend.add_listener(_on_invalidation_message)
+    await backend.start()
+
+
+def build_cache_backend(
+    kind: str,
+    redis_url: str = "",
+    *,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+) -> CacheBackend:
+    """Construct the backend named by the ``CACHE_BACKEND`` setting.
+
+    ``memory`` — per-process (default), bounded by ``max_entries`` /
+    ``max_bytes`` when given. ``redis`` — shared via ``redis_url``.
+    ``local`` — ``RedisBackend`` over an in-process stand-in; exercises the
+    shared code path without a server (dev/tests only, still one process).
+    """
+    kind = (kind or "memory").lower()
+    if kind == "memory":
+        return InMemoryBackend(
+            max_entries=max_entries or DEFAULT_MAX_ENTRIES,
+            max_bytes=max_bytes or None,
+        )
+    if kind == "redis":
+        if not redis_url:
+            raise RuntimeError("CACHE_BACKEND=redis requires CACHE_REDIS_URL")
+        return RedisBackend.from_url(redis_url)
+    if kind == "local":
+        return RedisBackend(LocalRedisStandIn())
+    raise ValueError(f"Unknown CACHE_BACKEND {kind!r}")
 
 
 # Convenience functions for invalidating specific caches
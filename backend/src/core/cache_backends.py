@@ -0,0 +1,621 @@
+"""Storage backends for :class:`src.core.cache.TTLCache`.
+
+``TTLCache`` owns the TTL bookkeeping and hit/miss stats; a backend only stores
+``(value, expires_at)`` pairs and, when it is shared between processes, carries
+invalidation messages to every worker.
+
+Three backends ship here:
+
+- ``InMemoryBackend`` — sharded, size-bounded per-process store with lock-free
+  reads, an expiry wheel and a prefix index. Default; no fan-out.
+- ``RedisBackend`` — entries live in a Redis-protocol server so every uvicorn
+  worker reads the same warm cache, and invalidation messages are broadcast on a
+  pub/sub channel so per-process layers (the legacy named caches) drop stale
+  entries on every worker, not just the one that handled the write.
+- ``LocalRedisStandIn`` — a tiny in-process implementation of the handful of
+  Redis commands ``RedisBackend`` uses. Several ``RedisBackend`` instances
+  sharing one stand-in behave like several workers sharing one Redis, which is
+  how the tests exercise the shared path without a server.
+
+Values cross the process boundary pickled. Redis is trusted infrastructure on
+the private network, the same trust level as Postgres.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fnmatch
+import heapq
+import logging
+import math
+import pickle
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+InvalidationListener = Callable[[str], None]
+
+DEFAULT_KEY_PREFIX = "crm:cache:"
+DEFAULT_CHANNEL = "crm:cache:invalidate"
+_SCAN_BATCH = 500
+
+# Dispatched locally (never published) when a shared backend re-subscribes
+# after losing its pub/sub connection: invalidations sent meanwhile are lost,
+# so listeners should drop whatever they cannot vouch for.
+RESUBSCRIBED_MESSAGE = "*resubscribed*"
+_RESUBSCRIBE_MIN_DELAY = 0.5  # seconds; doubles per failed attempt
+_RESUBSCRIBE_MAX_DELAY = 30.0
+
+
+class CacheBackend(ABC):
+    """Key/value storage used by ``TTLCache``.
+
+    Entries are ``(value, expires_at)`` where ``expires_at`` is a ``time.time()``
+    timestamp; expiry is enforced by ``TTLCache`` so every backend agrees on it.
+    """
+
+    #: True when the store is visible to other processes (fan-out is needed).
+    shared: bool = False
+
+    def __init__(self) -> None:
+        self._listeners: list[InvalidationListener] = []
+
+    @abstractmethod
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        """Return ``(value, expires_at)`` or ``None`` when absent."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Store ``value`` until ``expires_at``."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove one key (no-op when absent)."""
+
+    @abstractmethod
+    async def delete_pattern(self, pattern: str) -> int:
+        """Remove every key matching a glob pattern. Returns count deleted."""
+
+    @abstractmethod
+    async def clear(self) -> int:
+        """Remove every key owned by this cache. Returns count cleared."""
+
+    @abstractmethod
+    async def entries(self) -> list[tuple[str, Any, float]]:
+        """Snapshot of ``(key, value, expires_at)`` for stats and cleanup."""
+
+    async def purge_expired(self, now: float) -> int:
+        """Remove entries whose ``expires_at`` is before ``now``."""
+        removed = 0
+        for key, _, expires_at in await self.entries():
+            if now > expires_at:
+                await self.delete(key)
+                removed += 1
+        return removed
+
+    def extra_stats(self) -> dict:
+        """Backend-specific counters merged into ``TTLCache.stats()``."""
+        return {}
+
+    # -- invalidation fan-out ------------------------------------------------
+
+    def add_listener(self, listener: InvalidationListener) -> None:
+        """Register a callback run for every invalidation message."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _dispatch(self, message: str) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(message)
+            except Exception:
+                logger.exception("[cache] invalidation listener failed for %r", message)
+
+    async def publish(self, message: str) -> None:
+        """Deliver an invalidation message to every worker's listeners.
+
+        Process-local backends only have one worker to tell.
+        """
+        self._dispatch(message)
+
+    async def start(self) -> None:  # noqa: B027 — optional hook
+        """Begin receiving invalidation messages (shared backends)."""
+
+    async def close(self) -> None:  # noqa: B027 — optional hook
+        """Release connections / background tasks."""
+
+
+# ---------------------------------------------------------------------------
+# In-process backend
+# ---------------------------------------------------------------------------
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_SHARDS = 16
+DEFAULT_EXPIRY_RESOLUTION = 5.0  # seconds per expiry-wheel slot
+# Keys are indexed by their first N ``:``-delimited prefixes, which covers every
+# invalidation pattern in the tree (``mktg:{company_id}:*``, ``legacy:{name}:*``).
+_INDEX_DEPTH = 3
+_GLOB_CHARS = "*?["
+
+
+def _index_prefixes(key: str, depth: int = _INDEX_DEPTH) -> list[str]:
+    """``"mktg:42:overview:..."`` → ``["mktg:", "mktg:42:", "mktg:42:overview:"]``."""
+    prefixes = []
+    start = 0
+    for _ in range(depth):
+        i = key.find(":", start)
+        if i < 0:
+            break
+        prefixes.append(key[:i + 1])
+        start = i + 1
+    return prefixes
+
+
+class _Entry:
+    __slots__ = ("expires_at", "referenced", "size", "value")
+
+    def __init__(self, value: Any, expires_at: float, size: int) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.referenced = False
+
+
+class _Shard:
+    """One slice of the key space: its own LRU order, prefix index and expiry wheel.
+
+    Writers take the shard's ``threading.Lock`` (the legacy helpers are called
+    from threads too); readers never do — a dict lookup plus setting the
+    entry's reference bit is atomic under the GIL and never awaits.
+    """
+
+    def __init__(self, max_entries: int | None, max_bytes: int | None, resolution: float) -> None:
+        self.entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.index: dict[str, set[str]] = {}
+        self.wheel: dict[int, set[str]] = {}
+        self.slots: list[int] = []  # min-heap of occupied wheel slots
+        self.bytes = 0
+        self.evictions = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.resolution = resolution
+        self.lock = threading.Lock()
+
+    def put(self, key: str, entry: _Entry) -> None:
+        with self.lock:
+            if key in self.entries:
+                self._unlink(key)
+            self.entries[key] = entry
+            self.bytes += entry.size
+            for prefix in _index_prefixes(key):
+                self.index.setdefault(prefix, set()).add(key)
+            slot = int(entry.expires_at // self.resolution)
+            bucket = self.wheel.get(slot)
+            if bucket is None:
+                self.wheel[slot] = bucket = set()
+                heapq.heappush(self.slots, slot)
+            bucket.add(key)
+            self._evict()
+
+    def remove(self, key: str) -> bool:
+        with self.lock:
+            if key not in self.entries:
+                return False
+            self._unlink(key)
+            return True
+
+    def _unlink(self, key: str) -> None:
+        # Wheel slots are cleaned lazily when they come due.
+        entry = self.entries.pop(key)
+        self.bytes -= entry.size
+        for prefix in _index_prefixes(key):
+            keys = self.index.get(prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.index[prefix]
+
+    def _over_budget(self) -> bool:
+        return bool(
+            (self.max_entries is not None and len(self.entries) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        )
+
+    def _evict(self) -> None:
+        # CLOCK / second-chance: a recently read entry is spared once and moved
+        # to the young end, so this approximates LRU without reads reordering.
+        while self._over_budget() and self.entries:
+            key, entry = next(iter(self.entries.items()))
+            if entry.referenced:
+                entry.referenced = False
+                self.entries.move_to_end(key)
+                continue
+            self._unlink(key)
+            self.evictions += 1
+
+    def match(self, pattern: str) -> list[str]:
+        literal = pattern
+        for ch in _GLOB_CHARS:
+            cut = literal.find(ch)
+            if cut >= 0:
+                literal = literal[:cut]
+        prefixes = _index_prefixes(literal)
+        with self.lock:
+            if prefixes:
+                candidates = list(self.index.get(prefixes[-1], ()))
+                if pattern == prefixes[-1] + "*":
+                    return candidates
+            else:
+                candidates = list(self.entries)
+        return [k for k in candidates if fnmatch.fnmatch(k, pattern)]
+
+    def purge(self, now: float) -> int:
+        removed = 0
+        due = int(now // self.resolution)
+        with self.lock:
+            while self.slots and self.slots[0] <= due:
+                slot = self.slots[0]
+                bucket = self.wheel.get(slot, set())
+                for key in list(bucket):
+                    entry = self.entries.get(key)
+                    if entry is None or int(entry.expires_at // self.resolution) != slot:
+                        bucket.discard(key)  # deleted or re-set into another slot
+                    elif now > entry.expires_at:
+                        self._unlink(key)
+                        bucket.discard(key)
+                        removed += 1
+                if bucket and slot == due:
+                    break  # current slot: the rest expire later this slot
+                heapq.heappop(self.slots)
+                self.wheel.pop(slot, None)
+        return removed
+
+
+class InMemoryBackend(CacheBackend):
+    """Sharded, size-bounded per-process store.
+
+    - reads are lock-free (see ``_Shard``);
+    - each shard is bounded by ``max_entries`` / ``max_bytes`` split evenly and
+      evicts by CLOCK (approximate LRU);
+    - ``start()`` runs an expiry-wheel sweeper so expired entries free memory
+      without waiting to be read;
+    - ``delete_pattern("mktg:42:*")`` is answered from a prefix index instead
+      of scanning every key.
+
+    ``max_bytes`` sizes values by their pickled length, which costs a
+    serialisation per ``set`` — leave it ``None`` to bound by entries only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        shards: int = DEFAULT_SHARDS,
+        expiry_resolution: float = DEFAULT_EXPIRY_RESOLUTION,
+    ) -> None:
+        super().__init__()
+        per_shard_entries = max(1, -(-max_entries // shards)) if max_entries else None
+        per_shard_bytes = max(1, -(-max_bytes // shards)) if max_bytes else None
+        self._shards = [
+            _Shard(per_shard_entries, per_shard_bytes, expiry_resolution)
+            for _ in range(shards)
+        ]
+        self._measure = max_bytes is not None
+        self._resolution = expiry_resolution
+        self._sweeper: asyncio.Task | None = None
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(value)
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        entry = self._shard(key).entries.get(key)
+        if entry is None:
+            return None
+        entry.referenced = True
+        return entry.value, entry.expires_at
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        size = self._sizeof(value) if self._measure else 0
+        self._shard(key).put(key, _Entry(value, expires_at, size))
+
+    async def delete(self, key: str) -> None:
+        self._shard(key).remove(key)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        deleted = 0
+        for shard in self._shards:
+            for key in shard.match(pattern):
+                deleted += shard.remove(key)
+        return deleted
+
+    async def clear(self) -> int:
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.entries)
+                shard.entries.clear()
+                shard.index.clear()
+                shard.wheel.clear()
+                shard.slots.clear()
+                shard.bytes = 0
+        return count
+
+    async def entries(self) -> list[tuple[str, Any, float]]:
+        out = []
+        for shard in self._shards:
+            with shard.lock:
+                out.extend((k, e.value, e.expires_at) for k, e in shard.entries.items())
+        return out
+
+    async def purge_expired(self, now: float) -> int:
+        return sum(shard.purge(now) for shard in self._shards)
+
+    def extra_stats(self) -> dict:
+        return {
+            "evictions": sum(s.evictions for s in self._shards),
+            "tracked_bytes": sum(s.bytes for s in self._shards) if self._measure else None,
+        }
+
+    async def start(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self._resolution)
+            try:
+                await self.purge_expired(time.time())
+            except Exception:
+                logger.exception("[cache] expiry sweep failed")
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+
+
+# ---------------------------------------------------------------------------
+# Redis-protocol backend
+# ---------------------------------------------------------------------------
+
+class RedisBackend(CacheBackend):
+    """Shared backend over any ``redis.asyncio``-compatible client.
+
+    Keys are namespaced under ``key_prefix`` so ``clear()`` never touches data
+    other services keep in the same Redis database. The server-side TTL is set
+    from ``expires_at`` so abandoned keys age out even if no worker reads them.
+    A dropped pub/sub connection is re-subscribed with exponential backoff;
+    listeners then get ``RESUBSCRIBED_MESSAGE``, since anything published
+    during the gap never arrived.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        channel: str = DEFAULT_CHANNEL,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._prefix = key_prefix
+        self._channel = channel
+        self._pubsub: Any = None
+        self._listen_task: asyncio.Task | None = None
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisBackend:
+        """Build a backend from a ``redis://`` URL (requires the ``redis`` package)."""
+        try:
+            import redis.asyncio as redis_asyncio  # pyright: ignore[reportMissingImports]
+        except ImportError as exc:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package to be installed"
+            ) from exc
+        return cls(redis_asyncio.from_url(url), **kwargs)
+
+    def _k(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    async def _scan(self, pattern: str) -> list[str]:
+        keys = []
+        async for raw in self._client.scan_iter(match=self._k(pattern), count=_SCAN_BATCH):
+            keys.append(raw.decode() if isinstance(raw, bytes) else raw)
+        return keys
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        raw = await self._client.get(self._k(key))
+        if raw is None:
+            return None
+        try:
+            return pickle.loads(raw)
+        except Exception:
+            # A payload written by an incompatible release — treat as a miss.
+            logger.warning("[cache] undecodable entry for %s; dropping", key)
+            await self._client.delete(self._k(key))
+            return None
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        ttl = max(1, math.ceil(expires_at - time.time()))
+        await self._client.set(self._k(key), pickle.dumps((value, expires_at)), ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._k(key))
+
+    async def delete_pattern(self, pattern: str) -> int:
+        keys = await self._scan(pattern)
+        deleted = 0
+        for i in range(0, len(keys), _SCAN_BATCH):
+            deleted += await self._client.delete(*keys[i:i + _SCAN_BATCH])
+        return deleted
+
+    async def clear(self) -> int:
+        return await self.delete_pattern("*")
+
+    async def entries(self) -> list[tuple[str, Any, float]]:
+        keys = await self._scan("*")
+        out: list[tuple[str, Any, float]] = []
+        for i in range(0, len(keys), _SCAN_BATCH):
+            chunk = keys[i:i + _SCAN_BATCH]
+            for full_key, raw in zip(chunk, await self._client.mget(chunk), strict=True):
+                if raw is None:
+                    continue
+                try:
+                    value, expires_at = pickle.loads(raw)
+                except Exception:
+                    continue
+                out.append((full_key[len(self._prefix):], value, expires_at))
+        return out
+
+    async def publish(self, message: str) -> None:
+        # Every subscriber — including this process — applies the message when
+        # it comes back off the channel, so the local apply is not repeated here.
+        await self._client.publish(self._channel, message)
+
+    async def start(self) -> None:
+        if self._listen_task is not None:
+            return
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        delay = _RESUBSCRIBE_MIN_DELAY
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = self._client.pubsub()
+                    await self._pubsub.subscribe(self._channel)
+                    self._dispatch(RESUBSCRIBED_MESSAGE)
+                    logger.info("[cache] invalidation subscriber reconnected")
+                async for msg in self._pubsub.listen():
+                    delay = _RESUBSCRIBE_MIN_DELAY
+                    if msg.get("type") != "message":
+                        continue
+                    data = msg.get("data")
+                    self._dispatch(data.decode() if isinstance(data, bytes) else str(data))
+                raise ConnectionError("pub/sub stream ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "[cache] invalidation subscriber lost; reconnecting in %.1fs", delay, exc_info=True,
+                )
+                await self._drop_pubsub()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RESUBSCRIBE_MAX_DELAY)
+
+    async def _drop_pubsub(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._listen_task
+            self._listen_task = None
+        if self._pubsub is not None:
+            with contextlib.suppress(Exception):
+                await self._pubsub.unsubscribe(self._channel)
+            await self._drop_pubsub()
+
+
+# ---------------------------------------------------------------------------
+# Local stand-in for a Redis server
+# ---------------------------------------------------------------------------
+
+class _LocalPubSub:
+    def __init__(self, server: LocalRedisStandIn) -> None:
+        self._server = server
+        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._channels: set[str] = set()
+
+    async def subscribe(self, *channels: str) -> None:
+        for channel in channels:
+            self._channels.add(channel)
+            self._server._subscribers.setdefault(channel, set()).add(self)
+            self._queue.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def unsubscribe(self, *channels: str) -> None:
+        for channel in channels or tuple(self._channels):
+            self._channels.discard(channel)
+            self._server._subscribers.get(channel, set()).discard(self)
+
+    async def listen(self) -> AsyncIterator[dict]:
+        while True:
+            yield await self._queue.get()
+
+    async def aclose(self) -> None:
+        await self.unsubscribe()
+
+
+class LocalRedisStandIn:
+    """In-process substitute for the Redis commands ``RedisBackend`` issues.
+
+    Not a general Redis emulator: GET/SET EX/DEL/MGET/SCAN/PUBLISH/SUBSCRIBE
+    only, enough to run several ``RedisBackend`` "workers" against one store.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+        self._subscribers: dict[str, set[_LocalPubSub]] = {}
+
+    def _live(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, deadline = entry
+        if deadline is not None and time.monotonic() >= deadline:
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> bytes | None:
+        return self._live(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self._live(k) for k in keys]
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        deadline = time.monotonic() + ex if ex is not None else None
+        self._data[key] = (value, deadline)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for k in keys if self._data.pop(k, None) is not None)
+
+    async def scan_iter(self, match: str = "*", count: int | None = None) -> AsyncIterator[str]:
+        for key in list(self._data):
+            if fnmatch.fnmatchcase(key, match) and self._live(key) is not None:
+                yield key
+
+    async def publish(self, channel: str, message: str) -> int:
+        subscribers = list(self._subscribers.get(channel, ()))
+        for sub in subscribers:
+            sub._queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+    def pubsub(self) -> _LocalPubSub:
+        return _LocalPubSub(self)
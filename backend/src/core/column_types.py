@@ -0,0 +1,23 @@
+"""Column types shared by models on more than one dialect."""
+
+from sqlalchemy import Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.types import TypeDecorator
+
+
+class SearchVector(TypeDecorator):
+    """TSVECTOR on Postgres, plain text of the indexed words elsewhere.
+
+    Used by the email and audit-log full-text search columns; see
+    ``email/search.py`` and ``audit/search.py`` for how each builds and
+    queries the value. Map it ``deferred`` so ORM loads never ship the
+    vector back to Python.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(TSVECTOR())
+        return dialect.type_descriptor(Text())
@@ -53,6 +53,8 @@ class HTTPStatus:
     OK = status.HTTP_200_OK
     CREATED = status.HTTP_201_CREATED
     NO_CONTENT = status.HTTP_204_NO_CONTENT
+    PARTIAL_CONTENT = status.HTTP_206_PARTIAL_CONTENT
+    NOT_MODIFIED = status.HTTP_304_NOT_MODIFIED
     BAD_REQUEST = status.HTTP_400_BAD_REQUEST
     UNAUTHORIZED = status.HTTP_401_UNAUTHORIZED
     FORBIDDEN = status.HTTP_403_FORBIDDEN
@@ -61,6 +63,7 @@ class HTTPStatus:
     GONE = status.HTTP_410_GONE
     LENGTH_REQUIRED = status.HTTP_411_LENGTH_REQUIRED
     PAYLOAD_TOO_LARGE = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    RANGE_NOT_SATISFIABLE = status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
     UNPROCESSABLE_ENTITY = status.HTTP_422_UNPROCESSABLE_ENTITY
     TOO_MANY_REQUESTS = status.HTTP_429_TOO_MANY_REQUESTS
     INTERNAL_SERVER_ERROR = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -0,0 +1,36 @@
+"""Opaque keyset-pagination cursors.
+
+A cursor holds the sort-key values of the last row on a page, JSON-encoded
+and URL-safe base64'd without padding. The caller decoding it names the
+types it expects back; anything that does not decode to exactly those is
+rejected with ``ValueError`` (mapped to a 400 by ``core/http_errors``).
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+
+def encode_keyset_cursor(*values: Any) -> str:
+    """Cursor for a row whose sort key is ``values``. Datetimes go as ISO 8601."""
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str, types: tuple[type, ...]) -> tuple[Any, ...]:
+    """The values in ``cursor``, converted to ``types`` in order."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, values, strict=True)
+        )
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
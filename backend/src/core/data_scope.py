@@ -4,25 +4,26 @@ Provides a reusable FastAPI dependency that determines which records
 a user can access based on their role:
 - admin/manager: see all records (owner_id filter = None)
 - sales_rep/viewer: see only own records + shared records
+
+Shared records are never loaded into the scope; ``DataScope.shared_scope``
+describes them and callers query ``entity_shares`` through it.
 """
 
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Annotated, Any
 
 from fastapi import Depends
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_active_user
 from src.auth.models import User
 from src.core.entity_types import canonical_plural
-from src.core.models import EntityShare
-from src.core.share_permissions import VALID_SHARE_PERMISSIONS
+from src.core.share_permissions import SharedScope
 from src.database import get_db
 from src.roles.models import RoleName
 
-# Cache data scope per user to avoid repeated role + shared entity queries
+# Cache data scope per user to avoid repeated role queries
 _scope_cache: dict[int, tuple[float, Any]] = {}
 _SCOPE_CACHE_TTL = 60  # seconds
 
@@ -37,14 +38,11 @@ class DataScope:
         owner_id: If set, filter records to this owner_id.
                   None means the user can see all records.
         is_scoped: Whether data filtering should be applied.
-        shared_entity_ids: Dict of entity_type -> list of entity IDs
-                          that have been shared with this user.
     """
     user_id: int
     role_name: str
     owner_id: int | None = None
     is_scoped: bool = True
-    shared_entity_ids: dict = field(default_factory=dict)
 
     def can_see_all(self) -> bool:
         """Whether this user can see all records regardless of owner."""
@@ -56,16 +54,16 @@ class DataScope:
             return None
         return [self.user_id]
 
-    def get_shared_ids(self, entity_type: str) -> list[int]:
-        """Get entity IDs shared with this user for a given entity type."""
-        return self.shared_entity_ids.get(canonical_plural(entity_type), [])
+    def shared_scope(self, entity_type: str) -> SharedScope:
+        """The records of ``entity_type`` shared with this user."""
+        return SharedScope(user_id=self.user_id, entity_type=canonical_plural(entity_type))
 
 
 def invalidate_scope_cache(user_id: int | None = None) -> None:
     """Invalidate the scope cache for a specific user or all users.
 
-    Call this when sharing permissions change (create, revoke, update)
-    so that the next request re-queries the database for shared entity IDs.
+    Call this when a user's role or sharing permissions change so the
+    next request re-reads them.
     """
     if user_id is not None:
         _scope_cache.pop(user_id, None)
@@ -122,32 +120,23 @@ async def get_data_scope(
         _scope_cache[current_user.id] = (now, scope)
         return scope
 
-    # Sales rep and viewer: load shared entity IDs
-    shared = {}
-    result = await db.execute(
-        select(EntityShare.entity_type, EntityShare.entity_id)
-        .where(EntityShare.shared_with_user_id == current_user.id)
-        .where(EntityShare.permission_level.in_(VALID_SHARE_PERMISSIONS))
-    )
-    for entity_type, entity_id in result.all():
-        shared.setdefault(canonical_plural(entity_type), []).append(entity_id)
-
+    # Sales rep and viewer: own records plus shared ones
     scope = DataScope(
         user_id=current_user.id,
         role_name=role_name,
         owner_id=current_user.id,
         is_scoped=True,
-        shared_entity_ids=shared,
     )
     _scope_cache[current_user.id] = (now, scope)
     return scope
 
 
-def check_record_access_or_shared(
+async def check_record_access_or_shared(
+    db: AsyncSession,
     entity,
     current_user: User,
     role_name: str,
-    shared_entity_ids: list[int] | None = None,
+    shared_entity_ids: SharedScope | None = None,
     entity_type: str | None = None,
 ) -> None:
     """Check if a user can access a record, considering sharing.
@@ -160,13 +149,15 @@ def check_record_access_or_shared(
     - caller created the record (created_by_id == user.id) — many create
       paths set `created_by_id` without setting `owner_id`, so the creator
       of a record should still be able to read it.
-    - entity is in the caller's shared list.
+    - entity is shared with the caller (one ``entity_shares`` lookup, made
+      only when none of the above apply).
 
     Args:
+        db: Session for the share lookup.
         entity: The entity to check access for.
         current_user: The authenticated user.
         role_name: The user's role name.
-        shared_entity_ids: List of entity IDs shared with this user.
+        shared_entity_ids: The caller's shares of this entity type.
         entity_type: The entity type for shared lookup.
     """
     from fastapi import HTTPException
@@ -190,8 +181,8 @@ def check_record_access_or_shared(
         return
 
     # Check if shared
-    if shared_entity_ids and hasattr(entity, 'id'):
-        if entity.id in shared_entity_ids:
+    if shared_entity_ids is not None and hasattr(entity, 'id'):
+        if await shared_entity_ids.includes(db, entity.id):
             return
 
     raise HTTPException(
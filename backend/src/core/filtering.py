@@ -21,7 +21,9 @@ Supports AND/OR filter groups:
 
 from typing import Any
 
-from sqlalchemy import String, and_, cast, or_
+from sqlalchemy import Float, String, and_, case, cast, func, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 
 
 def apply_filter_condition(model: type, field_name: str, op: str, value: Any):
@@ -181,6 +183,18 @@ def apply_filters_to_query(query, model: type, filters: dict[str, Any] | None):
     return query
 
 
+_LIKE_ESCAPE = "!"
+
+
+def _escape_like(token: str) -> str:
+    """Escape LIKE wildcards so a typed ``%`` or ``_`` matches literally.
+
+    ``!`` rather than backslash keeps the ESCAPE literal independent of
+    Postgres' ``standard_conforming_strings``.
+    """
+    return token.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+
+
 def build_token_search(search: str, *columns):
     """Build a token-based search condition for SQLAlchemy.
 
@@ -191,6 +205,11 @@ def build_token_search(search: str, *columns):
     Example: "john sm" matches any row where one column contains "john" AND
     one column contains "sm" (e.g. first_name="John", last_name="Smith").
 
+    On Postgres the searched columns carry ``pg_trgm`` GIN indexes
+    (migration 066), which serve these leading-wildcard ILIKEs as bitmap
+    index scans instead of sequential scans. Tokens shorter than three
+    characters yield no trigrams, so the first keystroke or two still scan.
+
     Args:
         search: The search query string (e.g. "john sm")
         *columns: SQLAlchemy model columns to search against
@@ -204,8 +223,76 @@ def build_token_search(search: str, *columns):
 
     token_conditions = []
     for token in tokens:
-        pattern = f"%{token}%"
-        column_matches = [col.ilike(pattern) for col in columns]
+        pattern = f"%{_escape_like(token)}%"
+        column_matches = [col.ilike(pattern, escape=_LIKE_ESCAPE) for col in columns]
         token_conditions.append(or_(*column_matches))
 
     return and_(*token_conditions)
+
+
+class trigram_similarity(FunctionElement):
+    """``similarity(column, term)`` from ``pg_trgm``, a float in ``[0, 1]``.
+
+    Other dialects (SQLite in tests) get a coarse stand-in: 1.0 for an
+    exact case-insensitive match, 0.6 for a prefix, 0.3 for a substring.
+    """
+
+    type = Float()
+    name = "similarity"
+    inherit_cache = True
+
+
+@compiles(trigram_similarity)
+def _compile_similarity_fallback(element, compiler, **kw):
+    column, term = list(element.clauses)
+    position = func.instr(func.lower(column), func.lower(term))
+    return compiler.process(
+        case(
+            (func.lower(column) == func.lower(term), 1.0),
+            (position == 1, 0.6),
+            (position > 1, 0.3),
+            else_=0.0,
+        ),
+        **kw,
+    )
+
+
+@compiles(trigram_similarity, "postgresql")
+def _compile_similarity_pg(element, compiler, **kw):
+    return compiler.visit_function(element, **kw)
+
+
+class greatest(FunctionElement):
+    """``GREATEST(...)``; SQLite spells the scalar form ``max(...)``."""
+
+    type = Float()
+    name = "greatest"
+    inherit_cache = True
+
+
+@compiles(greatest)
+def _compile_greatest(element, compiler, **kw):
+    return compiler.visit_function(element, **kw)
+
+
+@compiles(greatest, "sqlite")
+def _compile_greatest_sqlite(element, compiler, **kw):
+    return f"max({compiler.process(element.clauses, **kw)})"
+
+
+def build_search_rank(search: str, *columns):
+    """Relevance of a row to ``search``: the best similarity across ``columns``.
+
+    Meant as the leading ORDER BY key (descending) when a list is searched
+    without an explicit sort, so "Jon Smith" surfaces before rows that
+    merely contain "jon" somewhere in an email. NULL columns score 0.
+
+    Returns:
+        A float SQL expression, or None if search is empty/whitespace.
+    """
+    term = " ".join(search.split())
+    if not term or not columns:
+        return None
+
+    scores = [func.coalesce(trigram_similarity(col, term), 0.0) for col in columns]
+    return scores[0] if len(scores) == 1 else greatest(*scores)
@@ -107,7 +107,15 @@ class EntityShare(Base, TimestampMixin):
             name="ck_entity_shares_permission_level",
         ),
         Index("ix_entity_shares_entity", "entity_type", "entity_id"),
-        Index("ix_entity_shares_shared_with", "shared_with_user_id"),
+        # Covers the per-user share semi-join that scopes list queries
+        # (share_permissions.shared_with_clause) as an index-only scan.
+        Index(
+            "ix_entity_shares_user_type_entity",
+            "shared_with_user_id",
+            "entity_type",
+            "entity_id",
+            postgresql_include=["permission_level"],
+        ),
         UniqueConstraint(
             "entity_type", "entity_id", "shared_with_user_id",
             name="uq_entity_share_unique",
@@ -9,6 +9,7 @@ from apscheduler.triggers.cron import CronTrigger  # pyright: ignore[reportMissi
 from apscheduler.triggers.interval import IntervalTrigger  # pyright: ignore[reportMissingImports]
 
 import src.database as db_module
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -40,33 +41,59 @@ async def _process_due_campaign_steps():
     await _run_scheduled_job("campaign_steps", CampaignService, "process_due_campaign_steps")
 
 
+async def _process_webhook_retries():
+    # Normally retries fire from an in-process timer; this catches any that
+    # a restart dropped.
+    from src.webhooks.event_handler import retry_webhook_deliveries
+    await retry_webhook_deliveries()
+
+
 async def _deliver_scheduled_reports():
     from src.reports.delivery import ReportDeliveryService
     await _run_scheduled_job("report_delivery", ReportDeliveryService, "deliver_due_reports")
 
 
 async def _sync_google_calendars():
+    import asyncio
+
+    import httpx
     from sqlalchemy import select
 
     from src.integrations.google_calendar.models import GoogleCalendarCredential
-    from src.integrations.google_calendar.service import GoogleCalendarService
+    from src.integrations.google_calendar.service import (
+        CALENDAR_SYNC_CONCURRENCY,
+        GoogleCalendarService,
+    )
 
     async with db_module.async_session_maker() as session:
-        result = await session.execute(select(GoogleCalendarCredential))
-        credentials = result.scalars().all()
-
-    for credential in credentials:
-        try:
-            async with db_module.async_session_maker() as session:
-                service = GoogleCalendarService(session)
-                synced = await service.sync_from_google(credential.user_id)
-                await session.commit()
-                if synced:
-                    logger.info("[google_calendar_sync] user_id=%s synced %s event(s)", credential.user_id, len(synced))
-        except Exception:
-            # Isolate per-user failures so one revoked token doesn't abort
-            # the whole tick; keep full traceback in logs.
-            logger.exception("[google_calendar_sync] user_id=%s error", credential.user_id)
+        result = await session.execute(
+            select(GoogleCalendarCredential.user_id).where(
+                GoogleCalendarCredential.is_active.is_(True)
+            )
+        )
+        user_ids = list(result.scalars())
+    if not user_ids:
+        return
+
+    semaphore = asyncio.Semaphore(CALENDAR_SYNC_CONCURRENCY)
+
+    async def _sync_user(user_id: int, http: httpx.AsyncClient) -> None:
+        async with semaphore:
+            try:
+                async with db_module.async_session_maker() as session:
+                    service = GoogleCalendarService(session, http=http)
+                    synced = await service.sync_from_google(user_id)
+                    await session.commit()
+                    if synced:
+                        logger.info("[google_calendar_sync] user_id=%s synced %s event(s)", user_id, len(synced))
+            except Exception:
+                # Isolate per-user failures so one revoked token doesn't abort
+                # the whole tick; keep full traceback in logs.
+                logger.exception("[google_calendar_sync] user_id=%s error", user_id)
+
+    # One connection pool for the whole run instead of a client per call.
+    async with httpx.AsyncClient() as http:
+        await asyncio.gather(*(_sync_user(user_id, http) for user_id in user_ids))
 
 
 async def _sync_marketing_daily():
@@ -77,26 +104,48 @@ async def _sync_marketing_daily():
     await run_daily_marketing_sync()
 
 
+async def _flush_dashboard_rollups():
+    from src.dashboard.rollups import flush_dirty_rollups
+
+    try:
+        changed = await flush_dirty_rollups()
+        if changed:
+            logger.info("[dashboard_rollups] Refreshed %s record(s)", changed)
+    except Exception:
+        logger.exception("[dashboard_rollups] Error")
+
+
+async def _rebuild_dashboard_rollups():
+    from src.dashboard.rollups import DashboardRollupService
+    await _run_scheduled_job("dashboard_rollup_rebuild", DashboardRollupService, "rebuild")
+
+
+async def _roll_up_audit_days():
+    from src.audit.rollups import AuditRollupService
+    await _run_scheduled_job("audit_rollups", AuditRollupService, "roll_up_pending")
+
+
+async def _deliver_notification_emails():
+    from src.notifications.delivery import NotificationDeliveryService
+    await _run_scheduled_job(
+        "notification_emails", NotificationDeliveryService, "deliver_due_emails"
+    )
+
+
 async def _background_tick():
-    # Single periodic wakeup runs all four handlers sequentially so Neon's
+    # Single periodic wakeup runs all handlers sequentially so Neon's
     # compute only has to come out of autosuspend once per interval.
     # Gmail sync runs on its own faster cadence — see start_scheduler.
     # Sequence step processing retired with the feature in PR #309 — the
     # scheduler hook was missed at the time and used to fail silently
     # every 90 min with no UI / test coverage to surface it.
     await _process_email_retries()
+    await _process_webhook_retries()
     await _process_due_campaign_steps()
     await _deliver_scheduled_reports()
     await _sync_google_calendars()
 
 
-# Gmail sync needs near-real-time cadence so replies show up in the CRM
-# within a couple of minutes, not 90 minutes. history.list is cheap
-# (empty response when nothing new), so polling often doesn't wake Neon
-# unless there are actual messages to process.
-GMAIL_SYNC_INTERVAL_SECONDS = 120
-
-
 def start_scheduler():
     """Register background jobs and start the scheduler."""
     scheduler.add_job(
@@ -107,14 +156,28 @@ def start_scheduler():
         coalesce=True,
         max_instances=1,
     )
+    # Gmail sync needs near-real-time cadence so replies show up in the CRM
+    # within a couple of minutes, not 90 minutes. Each tick only starts the
+    # accounts whose own poll is due (see integrations/gmail/scheduler.py);
+    # history.list is cheap when nothing is new.
     scheduler.add_job(
         _sync_gmail_accounts,
-        trigger=IntervalTrigger(seconds=GMAIL_SYNC_INTERVAL_SECONDS),
+        trigger=IntervalTrigger(seconds=settings.GMAIL_SYNC_TICK_SECONDS),
         id="gmail_sync",
         replace_existing=True,
         coalesce=True,
         max_instances=1,
     )
+    # Notification emails are queued by the triggering request and sent
+    # here, off the request path; digests simply wait for deliver_after.
+    scheduler.add_job(
+        _deliver_notification_emails,
+        trigger=IntervalTrigger(seconds=settings.NOTIFICATION_EMAIL_FLUSH_SECONDS),
+        id="notification_emails",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+    )
     # Marketing ingest runs on its OWN daily cron (D1), not the 90-min tick which
     # would re-pull 16×/day. ~09:00 UTC so "yesterday" is final across US zones;
     # misfire_grace_time means a deploy spanning the fire time still runs the day.
@@ -127,13 +190,45 @@ def start_scheduler():
         max_instances=1,
         misfire_grace_time=3600,
     )
+    # Dashboard rollups: event-dirtied records are folded in every few
+    # seconds; the nightly rebuild reconciles writes that bypass events.
+    if settings.DASHBOARD_ROLLUPS_ENABLED:
+        scheduler.add_job(
+            _flush_dashboard_rollups,
+            trigger=IntervalTrigger(seconds=settings.DASHBOARD_ROLLUP_FLUSH_SECONDS),
+            id="dashboard_rollups",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+        )
+        scheduler.add_job(
+            _rebuild_dashboard_rollups,
+            trigger=CronTrigger(hour=4, minute=0),
+            id="dashboard_rollup_rebuild",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=3600,
+        )
+    # Audit summary rollups: each finished UTC day is folded into
+    # audit_daily_rollups once, shortly after midnight.
+    if settings.AUDIT_ROLLUPS_ENABLED:
+        scheduler.add_job(
+            _roll_up_audit_days,
+            trigger=CronTrigger(hour=0, minute=15),
+            id="audit_rollups",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=3600,
+        )
     # Contract lifecycle cron unregistered 2026-05-14 — contracts router
     # unmounted. The service module is preserved as dead code under
     # ``src/contracts/scheduler.py`` but no scheduler hook fires it.
     scheduler.start()
     logger.info(
-        "Background scheduler started (tick every 90m, gmail sync every %ss)",
-        GMAIL_SYNC_INTERVAL_SECONDS,
+        "Background scheduler started (tick every 90m, gmail sync tick every %ss)",
+        settings.GMAIL_SYNC_TICK_SECONDS,
     )
 
 
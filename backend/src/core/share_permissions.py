@@ -1,8 +1,12 @@
 """Permission helpers for EntityShare-backed collaboration."""
 
+from dataclasses import dataclass
+from typing import Any
+
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.auth.models import User
 from src.core.constants import HTTPStatus
@@ -14,6 +18,50 @@ VALID_SHARE_PERMISSIONS = ("view", "edit", "assignee")
 WRITE_SHARE_PERMISSIONS = ("edit", "assignee")
 
 
+@dataclass(frozen=True)
+class SharedScope:
+    """The records of one entity type shared with one user.
+
+    Never loaded into Python: list queries filter with
+    ``shared_with_clause`` and single-record checks ask ``includes``, both
+    reading ``entity_shares`` live.
+    """
+
+    user_id: int
+    entity_type: str
+    permissions: tuple[str, ...] = VALID_SHARE_PERMISSIONS
+
+    def entity_ids(self) -> Select:
+        """``SELECT entity_id FROM entity_shares`` for these shares."""
+        return select(EntityShare.entity_id).where(
+            EntityShare.shared_with_user_id == self.user_id,
+            EntityShare.entity_type.in_(sorted(entity_type_variants(self.entity_type))),
+            EntityShare.permission_level.in_(self.permissions),
+        )
+
+    async def includes(self, db: AsyncSession, *entity_ids: int) -> bool:
+        """Whether any of ``entity_ids`` is shared."""
+        if not entity_ids:
+            return False
+        result = await db.execute(
+            self.entity_ids().where(EntityShare.entity_id.in_(entity_ids)).limit(1)
+        )
+        return result.first() is not None
+
+
+def shared_with_clause(id_column: Any, shared: SharedScope) -> ColumnElement[bool]:
+    """Condition matching rows of ``id_column`` shared per ``shared``.
+
+    A semi-join, ``id IN (SELECT entity_id FROM entity_shares WHERE ...)``,
+    rather than one bind parameter per share: the statement is the same for
+    every user, so it stays plannable and cacheable however many shares the
+    user has. The subquery is uncorrelated so it runs once (a hashed
+    subplan on Postgres) even under the ``owner_id = ? OR ...`` the callers
+    build, where a correlated EXISTS would be probed for every row.
+    """
+    return id_column.in_(shared.entity_ids())
+
+
 def has_owner_or_manager_access(entity, current_user: User, role_name: str) -> bool:
     """Return True when caller can administer owner-only record actions."""
     if current_user.is_superuser:
@@ -215,11 +215,12 @@ async def list_entity_shares(
             detail=f"{entity_type} {entity_id} not found",
         )
 
-    check_record_access_or_shared(
+    await check_record_access_or_shared(
+        db,
         entity,
         current_user,
         data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(plural),
+        shared_entity_ids=data_scope.shared_scope(plural),
         entity_type=plural,
     )
 
@@ -1,4 +1,17 @@
-from src.dashboard.models import DashboardChart, DashboardNumberCard
+from src.dashboard.models import (
+    DashboardChart,
+    DashboardDailyRollup,
+    DashboardNumberCard,
+    DashboardRollupDirty,
+    DashboardRollupSource,
+)
 from src.dashboard.router import router as dashboard_router
 
-__all__ = ["DashboardNumberCard", "DashboardChart", "dashboard_router"]
+__all__ = [
+    "DashboardNumberCard",
+    "DashboardChart",
+    "DashboardDailyRollup",
+    "DashboardRollupSource",
+    "DashboardRollupDirty",
+    "dashboard_router",
+]
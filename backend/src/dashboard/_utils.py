@@ -1,9 +1,18 @@
 """Shared helpers for dashboard sub-routers."""
 
+import asyncio
 import time
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import date
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config import settings
+
+DashboardQuery = Callable[[AsyncSession], Awaitable[Any]]
+
 
 def _parse_date(date_str: str | None) -> date | None:
     """Parse a YYYY-MM-DD string to a date object."""
@@ -29,3 +38,49 @@ def _get_cached(key: str) -> Any | None:
 
 def _set_cached(key: str, value: Any) -> None:
     _dashboard_cache[key] = (time.monotonic(), value)
+
+
+async def run_dashboard_queries(
+    db: AsyncSession,
+    queries: Sequence[DashboardQuery],
+    *,
+    max_concurrency: int | None = None,
+) -> list[Any]:
+    """Run independent read-only dashboard queries, concurrently when possible.
+
+    Each query gets its own short-lived session (one pooled connection each)
+    so cold-cache latency tracks the slowest query rather than the sum. At
+    most ``max_concurrency`` (default ``DASHBOARD_QUERY_FANOUT``) run at once
+    so one dashboard load can't drain the pool for every other request.
+
+    Falls back to running them one after another on ``db`` when concurrency
+    is disabled or the engine has a single shared connection (``StaticPool``,
+    i.e. the in-memory SQLite test DB). Results keep the order of ``queries``.
+    """
+    fanout = max_concurrency or settings.DASHBOARD_QUERY_FANOUT
+    engine = db.bind
+    if (
+        not settings.DASHBOARD_CONCURRENT_QUERIES
+        or fanout < 2
+        or len(queries) < 2
+        or engine is None
+        or isinstance(engine.pool, StaticPool)
+    ):
+        return [await query(db) for query in queries]
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    semaphore = asyncio.Semaphore(fanout)
+
+    async def _run(query: DashboardQuery) -> Any:
+        async with semaphore, session_maker() as session:
+            return await query(session)
+
+    tasks = [asyncio.create_task(_run(query)) for query in queries]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # One failure fails the dashboard; don't leave siblings holding connections.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
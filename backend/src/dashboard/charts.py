@@ -3,17 +3,32 @@
 from datetime import date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import ColumnElement, and_, func, select
+from sqlalchemy import ColumnElement, String, and_, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.activities.models import Activity
+from src.config import settings
 from src.core.constants import SECONDS_PER_DAY
+from src.dashboard.models import DashboardDailyRollup
+from src.dashboard.rollups import (
+    METRIC_ACTIVITY_TYPE,
+    METRIC_LEAD_SOURCE,
+    METRIC_LEAD_STATUS,
+    METRIC_OPPORTUNITY_CLOSE,
+    METRIC_OPPORTUNITY_STAGE,
+    rollup_conditions,
+)
 from src.leads.models import Lead
 from src.opportunities.models import Opportunity, PipelineStage
 
 
 class ChartDataGenerator:
-    """Generates data for dashboard charts."""
+    """Generates data for dashboard charts.
+
+    With ``DASHBOARD_ROLLUPS_ENABLED`` the funnel, lead, revenue and activity
+    charts are summed from ``dashboard_daily_rollups`` (day-grained) instead
+    of grouping the base tables.
+    """
 
     def __init__(
         self,
@@ -35,7 +50,55 @@ class ChartDataGenerator:
             filters.append(date_column <= datetime.combine(self.date_to, datetime.max.time()))
         return filters
 
+    def _rollup_conditions(self, metric: str) -> list:
+        return rollup_conditions(metric, self.user_id, self.date_from, self.date_to)
+
+    async def _rollup_counts(self, metric: str, *extra) -> dict[str, int]:
+        """Summed record counts per dimension for one rollup metric."""
+        total = func.sum(DashboardDailyRollup.record_count)
+        result = await self.db.execute(
+            select(DashboardDailyRollup.dimension, total.label("n"))
+            .where(*self._rollup_conditions(metric), *extra)
+            .group_by(DashboardDailyRollup.dimension)
+            .having(total > 0)
+        )
+        return {row.dimension: int(row.n) for row in result.all()}
+
+    async def _rollup_daily(self, metric: str, value, *extra, join_stage: bool = False) -> list:
+        """(day, value) rows for one rollup metric, for bucketing into weeks/months."""
+        query = select(DashboardDailyRollup.day, func.sum(value).label("v"))
+        if join_stage:
+            query = query.join(PipelineStage, DashboardDailyRollup.stage_id == PipelineStage.id)
+        result = await self.db.execute(
+            query.where(*self._rollup_conditions(metric), *extra)
+            .group_by(DashboardDailyRollup.day)
+            .order_by(DashboardDailyRollup.day)
+        )
+        return result.all()
+
     async def get_pipeline_funnel(self) -> dict[str, Any]:
+        if settings.DASHBOARD_ROLLUPS_ENABLED:
+            join_conditions = [
+                DashboardDailyRollup.stage_id == PipelineStage.id,
+                *self._rollup_conditions(METRIC_OPPORTUNITY_STAGE),
+            ]
+            query = (
+                select(
+                    PipelineStage.name,
+                    PipelineStage.color,
+                    PipelineStage.order,
+                    func.sum(DashboardDailyRollup.record_count).label("n"),
+                )
+                .outerjoin(DashboardDailyRollup, and_(*join_conditions))
+                .where(
+                    PipelineStage.is_active == True,
+                    PipelineStage.pipeline_type.in_(["opportunity", None]),
+                )
+                .group_by(PipelineStage.id)
+                .order_by(PipelineStage.order)
+            )
+            return self._pipeline_funnel_chart((await self.db.execute(query)).all())
+
         join_conditions = [Opportunity.pipeline_stage_id == PipelineStage.id]
         if self.user_id:
             join_conditions.append(Opportunity.owner_id == self.user_id)
@@ -67,9 +130,12 @@ class ChartDataGenerator:
             .order_by(PipelineStage.order)
         )
         result = await self.db.execute(query)
+        return self._pipeline_funnel_chart(result.all())
 
+    @staticmethod
+    def _pipeline_funnel_chart(rows) -> dict[str, Any]:
         data = []
-        for row in result.all():
+        for row in rows:
             data.append({
                 "label": row.name,
                 "value": row.n or 0,
@@ -83,6 +149,10 @@ class ChartDataGenerator:
         }
 
     async def get_leads_by_status(self) -> dict[str, Any]:
+        if settings.DASHBOARD_ROLLUPS_ENABLED:
+            counts = await self._rollup_counts(METRIC_LEAD_STATUS)
+            return self._leads_by_status_chart(counts.items())
+
         filters = []
         if self.user_id:
             filters.append(Lead.owner_id == self.user_id)
@@ -95,7 +165,10 @@ class ChartDataGenerator:
             query = query.where(and_(*filters))
         query = query.group_by(Lead.status)
         result = await self.db.execute(query)
+        return self._leads_by_status_chart(result.all())
 
+    @staticmethod
+    def _leads_by_status_chart(rows) -> dict[str, Any]:
         data = []
         colors = {
             "new": "#3b82f6",
@@ -106,11 +179,11 @@ class ChartDataGenerator:
             "lost": "#6b7280",
         }
 
-        for row in result.all():
+        for status, n in rows:
             data.append({
-                "label": row.status.capitalize(),
-                "value": row.n,
-                "color": colors.get(row.status, "#6b7280"),
+                "label": status.capitalize(),
+                "value": n,
+                "color": colors.get(status, "#6b7280"),
             })
 
         return {
@@ -122,6 +195,21 @@ class ChartDataGenerator:
     async def get_leads_by_source(self) -> dict[str, Any]:
         from src.leads.models import LeadSource
 
+        if settings.DASHBOARD_ROLLUPS_ENABLED:
+            n = func.coalesce(func.sum(DashboardDailyRollup.record_count), 0)
+            join_conditions = [
+                DashboardDailyRollup.dimension == cast(LeadSource.id, String),
+                *self._rollup_conditions(METRIC_LEAD_SOURCE),
+            ]
+            result = await self.db.execute(
+                select(LeadSource.name, n.label("n"))
+                .outerjoin(DashboardDailyRollup, and_(*join_conditions))
+                .group_by(LeadSource.id)
+                .order_by(n.desc())
+                .limit(10)
+            )
+            return self._leads_by_source_chart(result.all())
+
         join_conditions = [Lead.source_id == LeadSource.id]
         if self.user_id:
             join_conditions.append(Lead.owner_id == self.user_id)
@@ -147,9 +235,12 @@ class ChartDataGenerator:
             .limit(10)
         )
         result = await self.db.execute(query)
+        return self._leads_by_source_chart(result.all())
 
+    @staticmethod
+    def _leads_by_source_chart(rows) -> dict[str, Any]:
         data = []
-        for row in result.all():
+        for row in rows:
             if row.n > 0:
                 data.append({
                     "label": row.name,
@@ -167,6 +258,21 @@ class ChartDataGenerator:
         today = date.today()
         start_date = date(today.year, today.month, 1) - timedelta(days=30 * (months - 1))
 
+        # Rollups are keyed by close day; a created-date window needs the base table.
+        if settings.DASHBOARD_ROLLUPS_ENABLED and not (self.date_from or self.date_to):
+            rows = await self._rollup_daily(
+                METRIC_OPPORTUNITY_CLOSE,
+                DashboardDailyRollup.amount,
+                PipelineStage.is_won == True,
+                DashboardDailyRollup.day >= start_date,
+                join_stage=True,
+            )
+            revenue: dict[date, float] = {}
+            for row in rows:
+                month = date(row.day.year, row.day.month, 1)
+                revenue[month] = revenue.get(month, 0.0) + float(row.v or 0)
+            return self._revenue_trend_chart(sorted(revenue.items()))
+
         month_col = func.date_trunc("month", Opportunity.actual_close_date).label("month")
         filters = [
             PipelineStage.is_won == True,
@@ -186,13 +292,16 @@ class ChartDataGenerator:
             .group_by(month_col)
             .order_by(month_col)
         )
+        return self._revenue_trend_chart([(row.month, row.revenue) for row in result.all()])
 
+    @staticmethod
+    def _revenue_trend_chart(rows) -> dict[str, Any]:
         data = []
-        for row in result.all():
-            if row.month:
+        for month, revenue in rows:
+            if month:
                 data.append({
-                    "label": row.month.strftime("%b %Y"),
-                    "value": float(row.revenue or 0),
+                    "label": month.strftime("%b %Y"),
+                    "value": float(revenue or 0),
                 })
 
         return {
@@ -205,6 +314,12 @@ class ChartDataGenerator:
         """Get activities grouped by type for recent period."""
         start_date = datetime.now() - timedelta(days=days)
 
+        if settings.DASHBOARD_ROLLUPS_ENABLED:
+            counts = await self._rollup_counts(
+                METRIC_ACTIVITY_TYPE, DashboardDailyRollup.day >= start_date.date()
+            )
+            return self._activities_by_type_chart(counts.items(), days)
+
         filters = [Activity.created_at >= start_date]
         if self.user_id:
             filters.append(Activity.owner_id == self.user_id)
@@ -218,7 +333,10 @@ class ChartDataGenerator:
             .where(and_(*filters))
             .group_by(Activity.activity_type)
         )
+        return self._activities_by_type_chart(result.all(), days)
 
+    @staticmethod
+    def _activities_by_type_chart(rows, days: int) -> dict[str, Any]:
         data = []
         colors = {
             "call": "#3b82f6",
@@ -228,11 +346,11 @@ class ChartDataGenerator:
             "note": "#6b7280",
         }
 
-        for row in result.all():
+        for activity_type, n in rows:
             data.append({
-                "label": row.activity_type.capitalize(),
-                "value": row.n,
-                "color": colors.get(row.activity_type, "#6b7280"),
+                "label": activity_type.capitalize(),
+                "value": n,
+                "color": colors.get(activity_type, "#6b7280"),
             })
 
         return {
@@ -244,6 +362,18 @@ class ChartDataGenerator:
     async def get_new_leads_trend(self, weeks: int = 8) -> dict[str, Any]:
         start_date = datetime.now() - timedelta(weeks=weeks)
 
+        if settings.DASHBOARD_ROLLUPS_ENABLED:
+            rows = await self._rollup_daily(
+                METRIC_LEAD_STATUS,
+                DashboardDailyRollup.record_count,
+                DashboardDailyRollup.day >= start_date.date(),
+            )
+            weekly: dict[date, int] = {}
+            for row in rows:
+                week = row.day - timedelta(days=row.day.weekday())
+                weekly[week] = weekly.get(week, 0) + int(row.v or 0)
+            return self._new_leads_trend_chart(sorted(weekly.items()))
+
         filters = [Lead.created_at >= start_date]
         if self.user_id:
             filters.append(Lead.owner_id == self.user_id)
@@ -259,13 +389,16 @@ class ChartDataGenerator:
             .group_by(week_col)
             .order_by(week_col)
         )
+        return self._new_leads_trend_chart([(row.week, row.n) for row in result.all()])
 
+    @staticmethod
+    def _new_leads_trend_chart(rows) -> dict[str, Any]:
         data = []
-        for row in result.all():
-            if row.week:
+        for week, n in rows:
+            if week:
                 data.append({
-                    "label": f"Week of {row.week.strftime('%b %d')}",
-                    "value": row.n,
+                    "label": f"Week of {week.strftime('%b %d')}",
+                    "value": n,
                 })
 
         return {
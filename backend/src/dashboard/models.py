@@ -1,7 +1,19 @@
 """Dashboard configuration models - ERPNext pattern."""
 
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
+from datetime import date
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.mixins.auditable import TimestampMixin
@@ -89,3 +101,78 @@ class DashboardReportWidget(Base, TimestampMixin):
     position: Mapped[int] = mapped_column(Integer, default=0)
     width: Mapped[str] = mapped_column(String(10), default="half")  # half, full
     is_visible: Mapped[bool] = mapped_column(Boolean, default=True)
+
+
+class DashboardDailyRollup(Base):
+    """
+    Per-owner, per-day dashboard aggregate, maintained incrementally.
+
+    One row per ``(metric, owner_id, day, dimension, stage_id)`` grain:
+
+    - ``lead_status``: leads by created day; ``dimension`` = status,
+      ``stage_id`` = the lead's pipeline stage (0 = none).
+    - ``lead_source``: leads by created day; ``dimension`` = source id.
+    - ``opportunity_stage``: opportunities by created day and stage, with
+      ``amount`` summed (pipeline value / revenue by stage).
+    - ``opportunity_close``: opportunities by actual close day and stage
+      (won revenue by month).
+    - ``activity_type``: activities by created day; ``dimension`` = type.
+
+    ``owner_id`` is 0 for unowned records so the grain stays unique on every
+    backend. Stage flags (won/lost/open) are joined at read time, so editing
+    a stage never requires rewriting rollups.
+    """
+    __tablename__ = "dashboard_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "metric", "owner_id", "day", "dimension", "stage_id",
+            name="uq_dashboard_daily_rollups_grain",
+        ),
+        Index("ix_dashboard_daily_rollups_metric_owner_day", "metric", "owner_id", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    metric: Mapped[str] = mapped_column(String(30), nullable=False)
+    owner_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    dimension: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    stage_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    record_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amount: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+
+class DashboardRollupSource(Base):
+    """
+    What one lead/opportunity/activity currently contributes to the rollups.
+
+    Holds the last-applied snapshot of the fields the rollups group by, so a
+    refresh can subtract the old contribution and add the new one without the
+    event payload having to carry before/after values.
+    """
+    __tablename__ = "dashboard_rollup_sources"
+
+    entity_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    entity_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    owner_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    dimension: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    source_id: Mapped[int | None] = mapped_column(Integer)
+    stage_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    close_day: Mapped[date | None] = mapped_column(Date)
+    amount: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+
+class DashboardRollupDirty(Base):
+    """
+    A lead/opportunity/activity waiting to be re-folded into the rollups.
+
+    Written in the same transaction as the change it records, so a
+    committed change always leaves a mark and a rolled-back one never does.
+    The flush deletes the marks it read once their refresh commits; an
+    entity changed again meanwhile has a newer mark and is refreshed again.
+    """
+    __tablename__ = "dashboard_rollup_dirty"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -3,12 +3,21 @@
 from datetime import date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.activities.models import Activity
 from src.companies.models import Company
+from src.config import settings
 from src.contacts.models import Contact
+from src.dashboard.models import DashboardDailyRollup
+from src.dashboard.rollups import (
+    METRIC_LEAD_STATUS,
+    METRIC_OPPORTUNITY_CLOSE,
+    METRIC_OPPORTUNITY_STAGE,
+    rollup_conditions,
+    rollup_window,
+)
 from src.leads.models import Lead
 from src.opportunities.models import Opportunity, PipelineStage
 
@@ -31,11 +40,54 @@ class NumberCardGenerator:
     async def get_all_kpis(self, user_id: int | None = None) -> list[dict[str, Any]]:
         """Get all KPI data for number cards.
 
+        Batched: one conditional-aggregate query per base table (contacts,
+        leads, opportunities, companies, activities) instead of two or more
+        round-trips per card. Returns exactly what ``get_all_kpis_sequential``
+        returns, in the same order.
+
+        With ``DASHBOARD_ROLLUPS_ENABLED`` the lead and opportunity cards
+        are summed from ``dashboard_daily_rollups`` instead (day-grained; the
+        opportunity cards fall back to the base table when a date window is
+        set, since "won this month" filters on two different dates).
+
         Caching is handled one layer up in src.dashboard.router._dashboard_cache
         (keyed by user/date range with a short TTL) so we don't add a second
         redundant cache here.
         """
         # Use passed user_id or fall back to instance user_id
+        if user_id and not self.user_id:
+            self.user_id = user_id
+
+        contacts = await self._contact_aggregates()
+        if settings.DASHBOARD_ROLLUPS_ENABLED:
+            leads = await self._lead_rollup_aggregates()
+            if self.date_from or self.date_to:
+                opps = await self._opportunity_aggregates()
+            else:
+                opps = await self._opportunity_rollup_aggregates()
+        else:
+            leads = await self._lead_aggregates()
+            opps = await self._opportunity_aggregates()
+        companies = await self._company_count()
+        tasks_due = await self._tasks_due_today_count(self.user_id)
+
+        return [
+            self._total_contacts_card(contacts["total"], contacts["total_prev"]),
+            self._total_leads_card(leads["total"], leads["total_prev"]),
+            self._open_opportunities_card(opps["open"], opps["open_prev"]),
+            self._total_revenue_card(opps["revenue"], opps["revenue_prev"]),
+            self._total_companies_card(companies),
+            self._open_leads_card(leads["open"]),
+            self._pipeline_value_card(opps["pipeline_value"]),
+            self._won_this_month_card(opps["won_this_month"]),
+            self._tasks_due_today_card(tasks_due),
+            self._new_leads_this_week_card(leads["this_week"], leads["last_week"]),
+            self._conversion_rate_card(leads["conversion_base"], leads["converted"]),
+        ]
+
+    async def get_all_kpis_sequential(self, user_id: int | None = None) -> list[dict[str, Any]]:
+        """Card-by-card path (20+ queries). Kept as the reference the batched
+        ``get_all_kpis`` is benchmarked and regression-tested against."""
         if user_id and not self.user_id:
             self.user_id = user_id
         return [
@@ -52,6 +104,329 @@ class NumberCardGenerator:
             await self.get_conversion_rate(),
         ]
 
+    # ------------------------------------------------------------------
+    # Batched aggregates — one query per base table
+    # ------------------------------------------------------------------
+
+    def _date_conditions(self, date_column) -> list:
+        return self._apply_date_filter([], date_column)
+
+    @staticmethod
+    def _count_if(column, conditions: list):
+        agg = func.count(column)
+        return agg.filter(and_(*conditions)) if conditions else agg
+
+    @staticmethod
+    def _sum_if(column, conditions: list):
+        agg = func.sum(column)
+        return agg.filter(and_(*conditions)) if conditions else agg
+
+    @staticmethod
+    def _comparison_windows() -> dict[str, datetime]:
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        return {
+            "month_ago": datetime.combine(today - timedelta(days=30), datetime.min.time()),
+            "week_start": datetime.combine(week_start, datetime.min.time()),
+            "last_week_start": datetime.combine(week_start - timedelta(days=7), datetime.min.time()),
+        }
+
+    async def _contact_aggregates(self) -> dict[str, int]:
+        windows = self._comparison_windows()
+        current = self._date_conditions(Contact.created_at)
+        query = select(
+            self._count_if(Contact.id, current).label("total"),
+            self._count_if(Contact.id, [Contact.created_at < windows["month_ago"]]).label("total_prev"),
+        ).where(Contact.status == "active")
+        if self.user_id:
+            query = query.where(Contact.owner_id == self.user_id)
+        row = (await self.db.execute(query)).one()
+        return {"total": row.total or 0, "total_prev": row.total_prev or 0}
+
+    async def _lead_aggregates(self) -> dict[str, int]:
+        windows = self._comparison_windows()
+        current = self._date_conditions(Lead.created_at)
+        query = select(
+            self._count_if(Lead.id, current).label("total"),
+            self._count_if(Lead.id, [Lead.created_at < windows["month_ago"]]).label("total_prev"),
+            self._count_if(Lead.id, [self._open_lead_condition(), *current]).label("open"),
+            self._count_if(
+                Lead.id, [Lead.created_at >= windows["week_start"], *current]
+            ).label("this_week"),
+            self._count_if(Lead.id, [
+                Lead.created_at >= windows["last_week_start"],
+                Lead.created_at < windows["week_start"],
+            ]).label("last_week"),
+            self._count_if(
+                Lead.id, [Lead.created_at < datetime.now() - timedelta(days=7), *current]
+            ).label("conversion_base"),
+            self._count_if(Lead.id, [Lead.status == "converted", *current]).label("converted"),
+        ).select_from(Lead).outerjoin(PipelineStage, Lead.pipeline_stage_id == PipelineStage.id)
+        if self.user_id:
+            query = query.where(Lead.owner_id == self.user_id)
+        row = (await self.db.execute(query)).one()
+        return {key: getattr(row, key) or 0 for key in row._fields}
+
+    async def _opportunity_aggregates(self) -> dict[str, Any]:
+        windows = self._comparison_windows()
+        today = date.today()
+        current = self._date_conditions(Opportunity.created_at)
+        is_open = [PipelineStage.is_won == False, PipelineStage.is_lost == False]
+        is_won = PipelineStage.is_won == True
+        query = select(
+            self._count_if(Opportunity.id, [*is_open, *current]).label("open"),
+            self._count_if(
+                Opportunity.id, [*is_open, Opportunity.created_at < windows["month_ago"]]
+            ).label("open_prev"),
+            self._sum_if(Opportunity.amount, [is_won, *current]).label("revenue"),
+            self._sum_if(Opportunity.amount, [
+                is_won, Opportunity.actual_close_date < today - timedelta(days=30),
+            ]).label("revenue_prev"),
+            self._sum_if(Opportunity.amount, [*is_open, *current]).label("pipeline_value"),
+            self._sum_if(Opportunity.amount, [
+                is_won, Opportunity.actual_close_date >= date(today.year, today.month, 1), *current,
+            ]).label("won_this_month"),
+        ).select_from(Opportunity).join(PipelineStage)
+        if self.user_id:
+            query = query.where(Opportunity.owner_id == self.user_id)
+        row = (await self.db.execute(query)).one()
+        return {key: getattr(row, key) or 0 for key in row._fields}
+
+    # ------------------------------------------------------------------
+    # Rollup-backed aggregates — sums over dashboard_daily_rollups
+    # ------------------------------------------------------------------
+
+    async def _lead_rollup_aggregates(self) -> dict[str, int]:
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        day, count = DashboardDailyRollup.day, DashboardDailyRollup.record_count
+        current = rollup_window(self.date_from, self.date_to)
+        is_open = or_(
+            and_(
+                DashboardDailyRollup.stage_id != 0,
+                PipelineStage.is_won == False,
+                PipelineStage.is_lost == False,
+            ),
+            and_(
+                DashboardDailyRollup.stage_id == 0,
+                DashboardDailyRollup.dimension.in_(["new", "contacted", "qualified"]),
+            ),
+        )
+        query = (
+            select(
+                self._sum_if(count, current).label("total"),
+                self._sum_if(count, [day < today - timedelta(days=30)]).label("total_prev"),
+                self._sum_if(count, [is_open, *current]).label("open"),
+                self._sum_if(count, [day >= week_start, *current]).label("this_week"),
+                self._sum_if(count, [
+                    day >= week_start - timedelta(days=7), day < week_start,
+                ]).label("last_week"),
+                self._sum_if(count, [day < today - timedelta(days=7), *current]).label("conversion_base"),
+                self._sum_if(
+                    count, [DashboardDailyRollup.dimension == "converted", *current]
+                ).label("converted"),
+            )
+            .select_from(DashboardDailyRollup)
+            .outerjoin(PipelineStage, DashboardDailyRollup.stage_id == PipelineStage.id)
+            .where(*rollup_conditions(METRIC_LEAD_STATUS, self.user_id))
+        )
+        row = (await self.db.execute(query)).one()
+        return {key: int(getattr(row, key) or 0) for key in row._fields}
+
+    async def _opportunity_rollup_aggregates(self) -> dict[str, Any]:
+        today = date.today()
+        day = DashboardDailyRollup.day
+        count, amount = DashboardDailyRollup.record_count, DashboardDailyRollup.amount
+        by_created = DashboardDailyRollup.metric == METRIC_OPPORTUNITY_STAGE
+        by_close = DashboardDailyRollup.metric == METRIC_OPPORTUNITY_CLOSE
+        is_open = [by_created, PipelineStage.is_won == False, PipelineStage.is_lost == False]
+        is_won = PipelineStage.is_won == True
+        query = (
+            select(
+                self._sum_if(count, is_open).label("open"),
+                self._sum_if(count, [*is_open, day < today - timedelta(days=30)]).label("open_prev"),
+                self._sum_if(amount, [by_created, is_won]).label("revenue"),
+                self._sum_if(amount, [by_close, is_won, day < today - timedelta(days=30)]).label("revenue_prev"),
+                self._sum_if(amount, is_open).label("pipeline_value"),
+                self._sum_if(amount, [
+                    by_close, is_won, day >= date(today.year, today.month, 1),
+                ]).label("won_this_month"),
+            )
+            .select_from(DashboardDailyRollup)
+            .join(PipelineStage, DashboardDailyRollup.stage_id == PipelineStage.id)
+            .where(DashboardDailyRollup.metric.in_([METRIC_OPPORTUNITY_STAGE, METRIC_OPPORTUNITY_CLOSE]))
+        )
+        if self.user_id:
+            query = query.where(DashboardDailyRollup.owner_id == self.user_id)
+        row = (await self.db.execute(query)).one()
+        return {
+            "open": int(row.open or 0),
+            "open_prev": int(row.open_prev or 0),
+            **{key: getattr(row, key) or 0 for key in ("revenue", "revenue_prev", "pipeline_value", "won_this_month")},
+        }
+
+    async def _company_count(self) -> int:
+        filters = []
+        if self.user_id:
+            filters.append(Company.owner_id == self.user_id)
+        self._apply_date_filter(filters, Company.created_at)
+        query = select(func.count(Company.id))
+        if filters:
+            query = query.where(and_(*filters))
+        return (await self.db.execute(query)).scalar() or 0
+
+    async def _tasks_due_today_count(self, user_id: int | None) -> int:
+        filters = [
+            Activity.activity_type == "task",
+            Activity.is_completed == False,
+            Activity.due_date == date.today(),
+        ]
+        self._apply_date_filter(filters, Activity.created_at)
+        if user_id:
+            filters.append(
+                or_(
+                    Activity.owner_id == user_id,
+                    Activity.assigned_to_id == user_id,
+                )
+            )
+        result = await self.db.execute(select(func.count(Activity.id)).where(and_(*filters)))
+        return result.scalar() or 0
+
+    @staticmethod
+    def _open_lead_condition():
+        """Open = in a non-terminal pipeline stage, or stage-less with an open status."""
+        return or_(
+            and_(
+                Lead.pipeline_stage_id.isnot(None),
+                PipelineStage.is_won == False,
+                PipelineStage.is_lost == False,
+            ),
+            and_(
+                Lead.pipeline_stage_id.is_(None),
+                Lead.status.in_(["new", "contacted", "qualified"]),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Card builders — shared by the batched and per-card paths
+    # ------------------------------------------------------------------
+
+    def _total_contacts_card(self, count: int, last_month_count: int) -> dict[str, Any]:
+        return {
+            "id": "total_contacts",
+            "label": "Total Contacts",
+            "value": count,
+            "icon": "users",
+            "color": "#3b82f6",
+            "change": self._calculate_change(count, last_month_count),
+        }
+
+    def _total_leads_card(self, count: int, last_month_count: int) -> dict[str, Any]:
+        return {
+            "id": "total_leads",
+            "label": "Total Leads",
+            "value": count,
+            "icon": "target",
+            "color": "#22c55e",
+            "change": self._calculate_change(count, last_month_count),
+        }
+
+    def _open_opportunities_card(self, count: int, last_month_count: int) -> dict[str, Any]:
+        return {
+            "id": "open_opportunities",
+            "label": "Open Opportunities",
+            "value": count,
+            "icon": "briefcase",
+            "color": "#8b5cf6",
+            "change": self._calculate_change(count, last_month_count),
+        }
+
+    def _total_revenue_card(self, value: Any, last_month_value: Any) -> dict[str, Any]:
+        return {
+            "id": "total_revenue",
+            "label": "Total Revenue",
+            "value": float(value),
+            "format": "currency",
+            "icon": "dollar-sign",
+            "color": "#10b981",
+            "change": self._calculate_change(float(value), float(last_month_value)),
+        }
+
+    @staticmethod
+    def _total_companies_card(count: int) -> dict[str, Any]:
+        return {
+            "id": "total_companies",
+            "label": "Companies",
+            "value": count,
+            "icon": "building",
+            "color": "#8b5cf6",
+        }
+
+    @staticmethod
+    def _open_leads_card(count: int) -> dict[str, Any]:
+        return {
+            "id": "open_leads",
+            "label": "Open Leads",
+            "value": count,
+            "icon": "target",
+            "color": "#22c55e",
+        }
+
+    @staticmethod
+    def _pipeline_value_card(value: Any) -> dict[str, Any]:
+        return {
+            "id": "pipeline_value",
+            "label": "Pipeline Value",
+            "value": float(value),
+            "format": "currency",
+            "icon": "chart-line",
+            "color": "#f59e0b",
+        }
+
+    @staticmethod
+    def _won_this_month_card(value: Any) -> dict[str, Any]:
+        return {
+            "id": "won_this_month",
+            "label": "Won This Month",
+            "value": float(value),
+            "format": "currency",
+            "icon": "trophy",
+            "color": "#22c55e",
+        }
+
+    @staticmethod
+    def _tasks_due_today_card(count: int) -> dict[str, Any]:
+        return {
+            "id": "tasks_due_today",
+            "label": "Tasks Due Today",
+            "value": count,
+            "icon": "check-circle",
+            "color": "#ef4444" if count > 0 else "#22c55e",
+        }
+
+    def _new_leads_this_week_card(self, count: int, last_week_count: int) -> dict[str, Any]:
+        return {
+            "id": "new_leads_week",
+            "label": "New Leads This Week",
+            "value": count,
+            "icon": "user-plus",
+            "color": "#06b6d4",
+            "change": self._calculate_change(count, last_week_count),
+        }
+
+    @staticmethod
+    def _conversion_rate_card(total: int, converted: int) -> dict[str, Any]:
+        total = total or 1
+        rate = round((converted / total) * 100, 1) if total > 0 else 0
+        return {
+            "id": "conversion_rate",
+            "label": "Conversion Rate",
+            "value": rate,
+            "format": "percentage",
+            "icon": "trending-up",
+            "color": "#8b5cf6",
+        }
+
     def _apply_date_filter(self, filters: list, date_column) -> list:
         """Apply date_from/date_to filters to a filter list."""
         if self.date_from:
@@ -83,16 +458,7 @@ class NumberCardGenerator:
             select(func.count(Contact.id)).where(and_(*last_month_filters))
         )
         last_month_count = last_month_result.scalar() or 0
-        change = self._calculate_change(count, last_month_count)
-
-        return {
-            "id": "total_contacts",
-            "label": "Total Contacts",
-            "value": count,
-            "icon": "users",
-            "color": "#3b82f6",
-            "change": change,
-        }
+        return self._total_contacts_card(count, last_month_count)
 
     async def get_total_leads(self) -> dict[str, Any]:
         """Get total leads count (all statuses)."""
@@ -117,16 +483,7 @@ class NumberCardGenerator:
             select(func.count(Lead.id)).where(and_(*last_month_filters))
         )
         last_month_count = last_month_result.scalar() or 0
-        change = self._calculate_change(count, last_month_count)
-
-        return {
-            "id": "total_leads",
-            "label": "Total Leads",
-            "value": count,
-            "icon": "target",
-            "color": "#22c55e",
-            "change": change,
-        }
+        return self._total_leads_card(count, last_month_count)
 
     async def get_open_opportunities(self) -> dict[str, Any]:
         filters = [
@@ -158,16 +515,7 @@ class NumberCardGenerator:
             .where(and_(*last_month_filters))
         )
         last_month_count = last_month_result.scalar() or 0
-        change = self._calculate_change(count, last_month_count)
-
-        return {
-            "id": "open_opportunities",
-            "label": "Open Opportunities",
-            "value": count,
-            "icon": "briefcase",
-            "color": "#8b5cf6",
-            "change": change,
-        }
+        return self._open_opportunities_card(count, last_month_count)
 
     async def get_total_revenue(self) -> dict[str, Any]:
         """Get total revenue from won opportunities."""
@@ -196,17 +544,7 @@ class NumberCardGenerator:
             .where(and_(*last_month_filters))
         )
         last_month_value = last_month_result.scalar() or 0
-        change = self._calculate_change(float(value), float(last_month_value))
-
-        return {
-            "id": "total_revenue",
-            "label": "Total Revenue",
-            "value": float(value),
-            "format": "currency",
-            "icon": "dollar-sign",
-            "color": "#10b981",
-            "change": change,
-        }
+        return self._total_revenue_card(value, last_month_value)
 
     def _calculate_change(self, current: float, previous: float) -> float | None:
         """Calculate percentage change between current and previous values."""
@@ -217,45 +555,15 @@ class NumberCardGenerator:
         return None
 
     async def get_total_companies(self) -> dict[str, Any]:
-        filters = []
-        if self.user_id:
-            filters.append(Company.owner_id == self.user_id)
-        self._apply_date_filter(filters, Company.created_at)
-        query = select(func.count(Company.id))
-        if filters:
-            query = query.where(and_(*filters))
-        result = await self.db.execute(query)
-        count = result.scalar() or 0
-
-        return {
-            "id": "total_companies",
-            "label": "Companies",
-            "value": count,
-            "icon": "building",
-            "color": "#8b5cf6",
-        }
+        return self._total_companies_card(await self._company_count())
 
     async def get_open_leads(self) -> dict[str, Any]:
         """Get count of open leads (not in won/lost pipeline stages, or status-based fallback)."""
-        from sqlalchemy import or_
-
         base_query = select(func.count(Lead.id)).outerjoin(
             PipelineStage, Lead.pipeline_stage_id == PipelineStage.id
         )
 
-        open_condition = or_(
-            and_(
-                Lead.pipeline_stage_id.isnot(None),
-                PipelineStage.is_won == False,
-                PipelineStage.is_lost == False,
-            ),
-            and_(
-                Lead.pipeline_stage_id.is_(None),
-                Lead.status.in_(["new", "contacted", "qualified"]),
-            ),
-        )
-
-        filters = [open_condition]
+        filters = [self._open_lead_condition()]
         if self.user_id:
             filters.append(Lead.owner_id == self.user_id)
         self._apply_date_filter(filters, Lead.created_at)
@@ -265,13 +573,7 @@ class NumberCardGenerator:
         )
         count = result.scalar() or 0
 
-        return {
-            "id": "open_leads",
-            "label": "Open Leads",
-            "value": count,
-            "icon": "target",
-            "color": "#22c55e",
-        }
+        return self._open_leads_card(count)
 
     async def get_pipeline_value(self) -> dict[str, Any]:
         """Get total value of open opportunities."""
@@ -289,14 +591,7 @@ class NumberCardGenerator:
         )
         value = result.scalar() or 0
 
-        return {
-            "id": "pipeline_value",
-            "label": "Pipeline Value",
-            "value": float(value),
-            "format": "currency",
-            "icon": "chart-line",
-            "color": "#f59e0b",
-        }
+        return self._pipeline_value_card(value)
 
     async def get_won_this_month(self) -> dict[str, Any]:
         """Get value of opportunities won this month."""
@@ -317,45 +612,10 @@ class NumberCardGenerator:
         )
         value = result.scalar() or 0
 
-        return {
-            "id": "won_this_month",
-            "label": "Won This Month",
-            "value": float(value),
-            "format": "currency",
-            "icon": "trophy",
-            "color": "#22c55e",
-        }
+        return self._won_this_month_card(value)
 
     async def get_tasks_due_today(self, user_id: int | None = None) -> dict[str, Any]:
-        today = date.today()
-
-        filters = [
-            Activity.activity_type == "task",
-            Activity.is_completed == False,
-            Activity.due_date == today,
-        ]
-        self._apply_date_filter(filters, Activity.created_at)
-
-        if user_id:
-            from sqlalchemy import or_
-            filters.append(
-                or_(
-                    Activity.owner_id == user_id,
-                    Activity.assigned_to_id == user_id,
-                )
-            )
-
-        query = select(func.count(Activity.id)).where(and_(*filters))
-        result = await self.db.execute(query)
-        count = result.scalar() or 0
-
-        return {
-            "id": "tasks_due_today",
-            "label": "Tasks Due Today",
-            "value": count,
-            "icon": "check-circle",
-            "color": "#ef4444" if count > 0 else "#22c55e",
-        }
+        return self._tasks_due_today_card(await self._tasks_due_today_count(user_id))
 
     async def get_new_leads_this_week(self) -> dict[str, Any]:
         """Get count of new leads created this week."""
@@ -385,16 +645,7 @@ class NumberCardGenerator:
             select(func.count(Lead.id)).where(and_(*last_week_filters))
         )
         last_week_count = last_week_result.scalar() or 0
-        change = self._calculate_change(count, last_week_count)
-
-        return {
-            "id": "new_leads_week",
-            "label": "New Leads This Week",
-            "value": count,
-            "icon": "user-plus",
-            "color": "#06b6d4",
-            "change": change,
-        }
+        return self._new_leads_this_week_card(count, last_week_count)
 
     async def get_conversion_rate(self) -> dict[str, Any]:
         """Get overall lead to opportunity conversion rate."""
@@ -418,13 +669,4 @@ class NumberCardGenerator:
         )
         converted = converted_result.scalar() or 0
 
-        rate = round((converted / total) * 100, 1) if total > 0 else 0
-
-        return {
-            "id": "conversion_rate",
-            "label": "Conversion Rate",
-            "value": rate,
-            "format": "percentage",
-            "icon": "trending-up",
-            "color": "#8b5cf6",
-        }
+        return self._conversion_rate_card(total, converted)
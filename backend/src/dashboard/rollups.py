@@ -0,0 +1,419 @@
+"""Incrementally maintained dashboard rollups.
+
+The dashboard's lead, pipeline, revenue and activity figures are sums over
+``dashboard_daily_rollups`` — one row per (metric, owner, day, dimension,
+stage) — so their cost tracks the number of days on screen, not the number of
+records in the tenant.
+
+Maintenance is delta-based. ``dashboard_rollup_sources`` remembers, per lead /
+opportunity / activity, the field values last folded into the rollups. A
+refresh reloads the entity, subtracts the old contribution, adds the new one
+and stores the new snapshot, so an event only has to say *which* record
+changed — never its before/after values — and a deleted record simply
+contributes nothing.
+
+ORM inserts, updates and deletes of leads, opportunities and activities
+write a ``dashboard_rollup_dirty`` mark in their own transaction, so a
+committed change is queued even if the process restarts and a rolled-back
+one queues nothing; bulk statements mark their rows with ``mark_dirty``.
+``flush_dirty_rollups`` refreshes the marked entities from the scheduler on
+its own session. Anything else that bypasses both (raw SQL, restores) is
+reconciled by ``DashboardRollupService.rebuild``, run nightly and by
+``scripts/rebuild_dashboard_rollups.py`` for the initial backfill.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import delete, event, func, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+import src.database as _db
+from src.activities.models import Activity
+from src.config import settings
+from src.dashboard.models import DashboardDailyRollup, DashboardRollupDirty, DashboardRollupSource
+from src.leads.models import Lead
+from src.opportunities.models import Opportunity
+
+logger = logging.getLogger(__name__)
+
+METRIC_LEAD_STATUS = "lead_status"
+METRIC_LEAD_SOURCE = "lead_source"
+METRIC_OPPORTUNITY_STAGE = "opportunity_stage"
+METRIC_OPPORTUNITY_CLOSE = "opportunity_close"
+METRIC_ACTIVITY_TYPE = "activity_type"
+
+ROLLUP_ENTITY_TYPES = ("lead", "opportunity", "activity")
+
+_REFRESH_BATCH = 500
+_REBUILD_CHUNK = 5000
+
+# (metric, owner_id, day, dimension, stage_id)
+Grain = tuple[str, int, date, str, int]
+Snapshot = dict[str, Any]
+
+
+def _day(value: datetime | date) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _lead_snapshot(row) -> Snapshot:
+    return {
+        "owner_id": row.owner_id or 0,
+        "day": _day(row.created_at),
+        "dimension": row.status or "",
+        "source_id": row.source_id,
+        "stage_id": row.pipeline_stage_id or 0,
+        "close_day": None,
+        "amount": 0.0,
+    }
+
+
+def _opportunity_snapshot(row) -> Snapshot:
+    return {
+        "owner_id": row.owner_id or 0,
+        "day": _day(row.created_at),
+        "dimension": "",
+        "source_id": None,
+        "stage_id": row.pipeline_stage_id or 0,
+        "close_day": row.actual_close_date,
+        "amount": float(row.amount or 0),
+    }
+
+
+def _activity_snapshot(row) -> Snapshot:
+    return {
+        "owner_id": row.owner_id or 0,
+        "day": _day(row.created_at),
+        "dimension": row.activity_type or "",
+        "source_id": None,
+        "stage_id": 0,
+        "close_day": None,
+        "amount": 0.0,
+    }
+
+
+# entity_type -> (model, columns to load, row -> snapshot)
+_SOURCES = {
+    "lead": (
+        Lead,
+        (Lead.id, Lead.owner_id, Lead.created_at, Lead.status, Lead.source_id, Lead.pipeline_stage_id),
+        _lead_snapshot,
+    ),
+    "opportunity": (
+        Opportunity,
+        (
+            Opportunity.id, Opportunity.owner_id, Opportunity.created_at,
+            Opportunity.pipeline_stage_id, Opportunity.actual_close_date, Opportunity.amount,
+        ),
+        _opportunity_snapshot,
+    ),
+    "activity": (
+        Activity,
+        (Activity.id, Activity.owner_id, Activity.created_at, Activity.activity_type),
+        _activity_snapshot,
+    ),
+}
+
+
+def contributions(entity_type: str, snapshot: Snapshot | None) -> dict[Grain, tuple[int, float]]:
+    """The (count, amount) one entity adds to each rollup grain."""
+    if snapshot is None:
+        return {}
+    owner, day = snapshot["owner_id"], snapshot["day"]
+    if entity_type == "lead":
+        source = "" if snapshot["source_id"] is None else str(snapshot["source_id"])
+        return {
+            (METRIC_LEAD_STATUS, owner, day, snapshot["dimension"], snapshot["stage_id"]): (1, 0.0),
+            (METRIC_LEAD_SOURCE, owner, day, source, 0): (1, 0.0),
+        }
+    if entity_type == "opportunity":
+        amount = snapshot["amount"]
+        result = {(METRIC_OPPORTUNITY_STAGE, owner, day, "", snapshot["stage_id"]): (1, amount)}
+        if snapshot["close_day"] is not None:
+            result[(METRIC_OPPORTUNITY_CLOSE, owner, snapshot["close_day"], "", snapshot["stage_id"])] = (1, amount)
+        return result
+    return {(METRIC_ACTIVITY_TYPE, owner, day, snapshot["dimension"], 0): (1, 0.0)}
+
+
+def _add(totals: dict[Grain, list], grain: Grain, count: int, amount: float) -> None:
+    entry = totals[grain]
+    entry[0] += count
+    entry[1] += amount
+
+
+def _rollup_rows(totals: dict[Grain, list]) -> list[dict[str, Any]]:
+    return [
+        {
+            "metric": metric, "owner_id": owner, "day": day, "dimension": dimension,
+            "stage_id": stage_id, "record_count": count, "amount": amount,
+        }
+        for (metric, owner, day, dimension, stage_id), (count, amount) in sorted(totals.items())
+        if count or amount
+    ]
+
+
+class DashboardRollupService:
+    """Applies entity changes to the dashboard rollups and rebuilds them."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _upsert(self):
+        dialect = self.db.bind.dialect.name if self.db.bind is not None else "postgresql"
+        return (sqlite_insert if dialect == "sqlite" else pg_insert)(DashboardDailyRollup)
+
+    async def _apply(self, deltas: dict[Grain, list]) -> None:
+        rows = _rollup_rows(deltas)
+        if not rows:
+            return
+        # Sorted grains keep concurrent refreshes from deadlocking on row locks.
+        stmt = self._upsert().values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["metric", "owner_id", "day", "dimension", "stage_id"],
+            set_={
+                "record_count": DashboardDailyRollup.record_count + stmt.excluded.record_count,
+                "amount": DashboardDailyRollup.amount + stmt.excluded.amount,
+            },
+        )
+        await self.db.execute(stmt)
+        # Drop grains that no longer hold any record so the tables only grow
+        # with real activity.
+        touched = sorted({(row["metric"], row["owner_id"], row["day"]) for row in rows})
+        await self.db.execute(
+            delete(DashboardDailyRollup).where(
+                DashboardDailyRollup.record_count <= 0,
+                tuple_(
+                    DashboardDailyRollup.metric, DashboardDailyRollup.owner_id, DashboardDailyRollup.day,
+                ).in_(touched),
+            )
+        )
+
+    async def refresh(self, entity_type: str, entity_ids: list[int]) -> int:
+        """Re-fold the given entities into the rollups. Returns how many changed."""
+        if entity_type not in _SOURCES:
+            raise ValueError(f"Unknown rollup entity type: {entity_type}")
+        model, columns, snapshot_of = _SOURCES[entity_type]
+        changed = 0
+        ids = sorted(set(entity_ids))
+        for start in range(0, len(ids), _REFRESH_BATCH):
+            batch = ids[start:start + _REFRESH_BATCH]
+            # Lock the stored snapshots before reading the live rows, so two
+            # concurrent refreshes of an entity apply their deltas one after
+            # the other. A first refresh has no row to lock; two racing ones
+            # collide on the primary key and the loser retries next flush.
+            stored = {
+                source.entity_id: source
+                for source in (await self.db.execute(
+                    select(DashboardRollupSource)
+                    .where(
+                        DashboardRollupSource.entity_type == entity_type,
+                        DashboardRollupSource.entity_id.in_(batch),
+                    )
+                    .order_by(DashboardRollupSource.entity_id)
+                    .with_for_update()
+                )).scalars()
+            }
+            live = {
+                row.id: snapshot_of(row)
+                for row in (await self.db.execute(select(*columns).where(model.id.in_(batch)))).all()
+            }
+            deltas: dict[Grain, list] = defaultdict(lambda: [0, 0.0])
+            for entity_id in batch:
+                source = stored.get(entity_id)
+                old = _snapshot_from_source(source) if source is not None else None
+                new = live.get(entity_id)
+                if old == new:
+                    continue
+                changed += 1
+                for grain, (count, amount) in contributions(entity_type, old).items():
+                    _add(deltas, grain, -count, -amount)
+                for grain, (count, amount) in contributions(entity_type, new).items():
+                    _add(deltas, grain, count, amount)
+                if new is None:
+                    await self.db.delete(source)
+                elif source is None:
+                    self.db.add(DashboardRollupSource(entity_type=entity_type, entity_id=entity_id, **new))
+                else:
+                    for key, value in new.items():
+                        setattr(source, key, value)
+            await self._apply(deltas)
+        await self.db.flush()
+        return changed
+
+    async def rebuild(self, *, chunk_size: int = _REBUILD_CHUNK) -> dict[str, int]:
+        """Recompute every rollup and source snapshot from the base tables.
+
+        Streams each base table in primary-key order so memory stays bounded
+        by ``chunk_size`` plus the number of distinct grains. Runs in the
+        caller's transaction; commit to publish.
+        """
+        await self.db.execute(delete(DashboardDailyRollup))
+        await self.db.execute(delete(DashboardRollupSource))
+        totals: dict[Grain, list] = defaultdict(lambda: [0, 0.0])
+        counts: dict[str, int] = {}
+        for entity_type, (model, columns, snapshot_of) in _SOURCES.items():
+            counts[entity_type] = 0
+            last_id = 0
+            while True:
+                rows = (await self.db.execute(
+                    select(*columns).where(model.id > last_id).order_by(model.id).limit(chunk_size)
+                )).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+                sources = []
+                for row in rows:
+                    snapshot = snapshot_of(row)
+                    sources.append({"entity_type": entity_type, "entity_id": row.id, **snapshot})
+                    for grain, (count, amount) in contributions(entity_type, snapshot).items():
+                        _add(totals, grain, count, amount)
+                await self.db.execute(insert(DashboardRollupSource), sources)
+                counts[entity_type] += len(rows)
+        rows = _rollup_rows(totals)
+        for start in range(0, len(rows), chunk_size):
+            await self.db.execute(insert(DashboardDailyRollup), rows[start:start + chunk_size])
+        counts["rollups"] = len(rows)
+        return counts
+
+
+def _snapshot_from_source(source: DashboardRollupSource) -> Snapshot:
+    return {
+        "owner_id": source.owner_id,
+        "day": source.day,
+        "dimension": source.dimension,
+        "source_id": source.source_id,
+        "stage_id": source.stage_id,
+        "close_day": source.close_day,
+        "amount": float(source.amount or 0),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Event-driven maintenance
+# ---------------------------------------------------------------------------
+
+# session.info key holding the entities a session has changed since its last
+# flush wrote their marks.
+_PENDING_KEY = "dashboard_rollup_dirty"
+
+_ENTITY_TYPES = {Lead: "lead", Opportunity: "opportunity", Activity: "activity"}
+
+_FLUSH_BATCH = 5000
+
+
+async def mark_dirty(db: AsyncSession, entity_type: str, entity_ids: Iterable[int]) -> None:
+    """Queue entities for the next rollup flush, in the caller's transaction.
+
+    For writes that bypass the ORM unit of work (``update(Lead)`` and the
+    like); ORM writes are marked automatically.
+    """
+    if not settings.DASHBOARD_ROLLUPS_ENABLED or entity_type not in _SOURCES:
+        return
+    rows = [{"entity_type": entity_type, "entity_id": entity_id} for entity_id in set(entity_ids)]
+    if rows:
+        await db.execute(insert(DashboardRollupDirty), rows)
+
+
+async def pending_rollup_refreshes(db: AsyncSession) -> int:
+    return (await db.execute(select(func.count()).select_from(DashboardRollupDirty))).scalar_one()
+
+
+def _record_change(_mapper, _connection, target) -> None:
+    if not settings.DASHBOARD_ROLLUPS_ENABLED or target.id is None:
+        return
+    session = object_session(target)
+    if session is None:
+        return
+    session.info.setdefault(_PENDING_KEY, set()).add((_ENTITY_TYPES[type(target)], target.id))
+    if not event.contains(session, "after_flush", _write_pending):
+        event.listen(session, "after_flush", _write_pending)
+        event.listen(session, "after_rollback", _drop_pending)
+
+
+def _write_pending(session: Session, _flush_context) -> None:
+    # The marks share the change's transaction: they become visible to the
+    # scheduler's flush together with the change and vanish with a rollback.
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        session.connection().execute(
+            insert(DashboardRollupDirty),
+            [{"entity_type": entity_type, "entity_id": entity_id} for entity_type, entity_id in sorted(pending)],
+        )
+
+
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+for _model in _ENTITY_TYPES:
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _record_change)
+
+
+async def flush_dirty_rollups() -> int:
+    """Refresh every queued entity.
+
+    Marks are read in id order and deleted, by id, in the transaction that
+    refreshes their entities, so a mark leaves the queue only once its
+    refresh has committed. One written meanwhile has a new id and is picked
+    up on the next pass; a failed refresh leaves its marks for the next run.
+    """
+    changed = 0
+    after_id = 0
+    while True:
+        async with _db.async_session_maker() as session:
+            marks = (await session.execute(
+                select(DashboardRollupDirty.id, DashboardRollupDirty.entity_type, DashboardRollupDirty.entity_id)
+                .where(DashboardRollupDirty.id > after_id)
+                .order_by(DashboardRollupDirty.id)
+                .limit(_FLUSH_BATCH)
+            )).all()
+            if not marks:
+                return changed
+            after_id = marks[-1].id
+            by_type: dict[str, list] = defaultdict(list)
+            for mark in marks:
+                by_type[mark.entity_type].append(mark)
+            for entity_type, queued in by_type.items():
+                try:
+                    if entity_type in _SOURCES:
+                        changed += await DashboardRollupService(session).refresh(
+                            entity_type, [mark.entity_id for mark in queued]
+                        )
+                    await session.execute(
+                        delete(DashboardRollupDirty).where(DashboardRollupDirty.id.in_([mark.id for mark in queued]))
+                    )
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    logger.exception("Dashboard rollup refresh failed for %d %s(s)", len(queued), entity_type)
+
+
+def rollup_window(date_from: date | None = None, date_to: date | None = None) -> list:
+    """Day-window conditions on ``dashboard_daily_rollups.day``."""
+    conditions = []
+    if date_from:
+        conditions.append(DashboardDailyRollup.day >= date_from)
+    if date_to:
+        conditions.append(DashboardDailyRollup.day <= date_to)
+    return conditions
+
+
+def rollup_conditions(
+    metric: str,
+    owner_id: int | None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> list:
+    """WHERE conditions selecting one metric's rows for an owner and day window."""
+    conditions = [DashboardDailyRollup.metric == metric]
+    if owner_id:
+        conditions.append(DashboardDailyRollup.owner_id == owner_id)
+    return conditions + rollup_window(date_from, date_to)
@@ -13,6 +13,7 @@ from src.dashboard._utils import (
     _get_cached,
     _parse_date,
     _set_cached,
+    run_dashboard_queries,
 )
 from src.dashboard.charts import ChartDataGenerator
 from src.dashboard.charts_router import charts_router
@@ -63,20 +64,21 @@ async def get_dashboard(
         response.headers["Cache-Control"] = "private, max-age=60"
         return cached
 
-    # Get KPIs
-    kpi_generator = NumberCardGenerator(db, user_id=resolved_owner_id, date_from=parsed_from, date_to=parsed_to)
-    kpis = await kpi_generator.get_all_kpis(user_id=resolved_owner_id)
-
-    # Get charts
-    chart_generator = ChartDataGenerator(db, user_id=resolved_owner_id, date_from=parsed_from, date_to=parsed_to)
-    charts_data = [
-        await chart_generator.get_pipeline_funnel(),
-        await chart_generator.get_leads_by_status(),
-        await chart_generator.get_leads_by_source(),
-        await chart_generator.get_revenue_trend(),
-        await chart_generator.get_activities_by_type(),
-        await chart_generator.get_new_leads_trend(),
-    ]
+    scope = {"user_id": resolved_owner_id, "date_from": parsed_from, "date_to": parsed_to}
+
+    def _chart(method: str):
+        return lambda session: getattr(ChartDataGenerator(session, **scope), method)()
+
+    # KPIs and the six charts are independent reads — fan them out.
+    kpis, *charts_data = await run_dashboard_queries(db, [
+        lambda session: NumberCardGenerator(session, **scope).get_all_kpis(),
+        _chart("get_pipeline_funnel"),
+        _chart("get_leads_by_status"),
+        _chart("get_leads_by_source"),
+        _chart("get_revenue_trend"),
+        _chart("get_activities_by_type"),
+        _chart("get_new_leads_trend"),
+    ])
 
     # Convert to response format
     number_cards = [NumberCardData(**kpi) for kpi in kpis]
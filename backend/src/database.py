@@ -97,4 +97,6 @@ async def init_db():
     async with engine.begin() as conn:
         # pgvector DB extension retained — AI tables preserved for future re-enable (PR #281).
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        # pg_trgm backs similarity() search ranking; its GIN indexes come from migration 066.
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,64 @@
+"""Normalized match keys for duplicate detection.
+
+The ``*_key`` helpers produce the values persisted on ``contacts``, ``leads``
+and ``companies`` (``phone_normalized`` / ``name_normalized``), so duplicate
+checks are indexed equality lookups instead of Python-side scans. The models
+recompute them in ``before_insert`` / ``before_update`` hooks; this module
+imports no models so those hooks can depend on it.
+"""
+
+import re
+
+# Company suffixes to strip for normalization
+COMPANY_SUFFIXES = re.compile(
+    r"\b(inc|incorporated|llc|ltd|limited|corp|corporation|co|company|group|holdings|plc|gmbh|sa|ag)\b\.?",
+    re.IGNORECASE,
+)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for comparison: lowercase, strip extra whitespace."""
+    return " ".join(name.lower().split())
+
+
+def normalize_company_name(name: str) -> str:
+    """Normalize company name: lowercase, strip suffixes and extra whitespace."""
+    normalized = name.lower().strip()
+    normalized = COMPANY_SUFFIXES.sub("", normalized)
+    normalized = re.sub(r"[.,]", "", normalized)
+    return " ".join(normalized.split())
+
+
+def normalize_phone(phone: str) -> str:
+    """Normalize phone number by stripping non-digit characters."""
+    return re.sub(r"\D", "", phone)
+
+
+def phone_key(phone: str | None) -> str | None:
+    """Digits-only phone, or ``None`` when there are no digits."""
+    return (normalize_phone(phone) or None) if isinstance(phone, str) else None
+
+
+def person_name_key(first_name: str | None, last_name: str | None) -> str | None:
+    """``"first last"`` lowercased with whitespace collapsed, or ``None`` if blank."""
+    return normalize_name(f"{first_name or ''} {last_name or ''}") or None
+
+
+def company_name_key(name: str | None) -> str | None:
+    """Suffix-stripped company name, or ``None`` when nothing is left."""
+    return (normalize_company_name(name) or None) if isinstance(name, str) else None
+
+
+def sync_dedup_keys(_mapper, _connection, target) -> None:
+    """``before_insert`` / ``before_update`` hook refreshing the persisted keys.
+
+    Bulk ``update()`` statements bypass mapper events; callers that change
+    phone or name that way must set the key columns themselves.
+    """
+    if hasattr(target, "phone_normalized"):
+        target.phone_normalized = phone_key(target.phone)
+    if hasattr(target, "name_normalized"):
+        if hasattr(target, "first_name"):
+            target.name_normalized = person_name_key(target.first_name, target.last_name)
+        else:
+            target.name_normalized = company_name_key(target.name)
@@ -12,6 +12,8 @@ from src.core.router_utils import CurrentUser, DBSession, raise_bad_request
 from src.dedup.service import (
     ALLOWED_CLUSTER_ENTITIES,
     ALLOWED_CLUSTER_KEYS_BY_ENTITY,
+    CLUSTER_PAGE_SIZE,
+    MAX_CLUSTER_PAGE_SIZE,
     DedupService,
 )
 
@@ -98,7 +100,11 @@ class ClustersResponse(BaseModel):
     entity_type: str
     key: str
     clusters: list[dict[str, Any]]
-    skipped_no_key: int
+    next_cursor: str | None = None
+    # Reported on the first page only (no cursor).
+    skipped_no_key: int | None = None
+    total_clusters: int | None = None
+    total_redundant: int | None = None
 
 
 class MergeClusterRequest(BaseModel):
@@ -120,11 +126,15 @@ async def list_duplicate_clusters(
     db: DBSession,
     entity_type: str = Query("contacts"),
     key: str = Query("email"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(CLUSTER_PAGE_SIZE, ge=1, le=MAX_CLUSTER_PAGE_SIZE),
+    refresh: bool = Query(False, description="Bypass the cached cluster pages"),
 ):
-    """Return every cluster of 2+ live records that share a match key.
+    """Return one page of clusters of 2+ live records that share a match key.
 
-    Manager+ only — this surfaces every contact in the system in a single
-    page so it carries the same trust level as bulk update/delete.
+    Biggest clusters first; follow ``next_cursor`` for the rest. Manager+
+    only — this surfaces every contact in the system so it carries the
+    same trust level as bulk update/delete.
     """
     if entity_type not in ALLOWED_CLUSTER_ENTITIES:
         raise_bad_request(
@@ -138,14 +148,11 @@ async def list_duplicate_clusters(
 
     service = DedupService(db)
     with value_error_as_400():
-        result = await service.find_duplicate_clusters(entity_type=entity_type, key=key)
+        result = await service.find_duplicate_clusters(
+            entity_type=entity_type, key=key, cursor=cursor, limit=limit, refresh=refresh,
+        )
 
-    return ClustersResponse(
-        entity_type=entity_type,
-        key=key,
-        clusters=result["clusters"],
-        skipped_no_key=result["skipped_no_key"],
-    )
+    return ClustersResponse(entity_type=entity_type, key=key, **result)
 
 
 @router.post("/merge-cluster", response_model=MergeClusterResponse)
@@ -1,17 +1,25 @@
 """Duplicate detection and merge service for CRM entities."""
 
 import logging
-import re
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.activities.models import Activity
 from src.companies.models import Company
 from src.contacts.models import Contact
+from src.core.cache import CACHE_DEDUP_CLUSTERS, cached_fetch, invalidate_cache
+from src.core.cursors import decode_keyset_cursor, encode_keyset_cursor
 from src.core.models import EntityTag, Note
+from src.dedup.keys import (
+    company_name_key,
+    normalize_name,
+    normalize_phone,
+    person_name_key,
+    phone_key,
+)
 from src.leads.models import Lead
 
 logger = logging.getLogger(__name__)
@@ -19,31 +27,6 @@ logger = logging.getLogger(__name__)
 ACTIVE_SUBSCRIPTION_STATUSES = ("active", "trialing", "past_due")
 
 
-# Company suffixes to strip for normalization
-COMPANY_SUFFIXES = re.compile(
-    r"\b(inc|incorporated|llc|ltd|limited|corp|corporation|co|company|group|holdings|plc|gmbh|sa|ag)\b\.?",
-    re.IGNORECASE,
-)
-
-
-def normalize_name(name: str) -> str:
-    """Normalize a name for comparison: lowercase, strip extra whitespace."""
-    return " ".join(name.lower().split())
-
-
-def normalize_company_name(name: str) -> str:
-    """Normalize company name: lowercase, strip suffixes and extra whitespace."""
-    normalized = name.lower().strip()
-    normalized = COMPANY_SUFFIXES.sub("", normalized)
-    normalized = re.sub(r"[.,]", "", normalized)
-    return " ".join(normalized.split())
-
-
-def normalize_phone(phone: str) -> str:
-    """Normalize phone number by stripping non-digit characters."""
-    return re.sub(r"\D", "", phone)
-
-
 def _stripe_customer_recency_key(customer: Any) -> tuple[bool, str, int]:
     created_at = getattr(customer, "created_at", None)
     return (
@@ -90,28 +73,33 @@ def _classify_merge_failure(reason: str) -> str:
     return "other"
 
 
-def _cluster_key_for(entity: Any, key: str) -> str | None:
-    """Compute the bucket key for grouping. ``None`` means the row is not
-    a candidate (no value at all)."""
+CLUSTER_PAGE_SIZE = 50
+MAX_CLUSTER_PAGE_SIZE = 200
+# Members rendered per cluster; ``member_count`` still reports the full size.
+MAX_CLUSTER_MEMBERS = 100
+_CLUSTER_MODELS: dict[str, Any] = {"contacts": Contact, "companies": Company, "leads": Lead}
+
+
+def _cluster_key_expr(model: Any, key: str) -> Any:
+    """SQL expression for the bucket key. Email is compared trimmed and
+    lowercased; phone and name use the persisted normalized columns."""
     if key == "email":
-        email = getattr(entity, "email", None)
-        return email.lower().strip() if isinstance(email, str) and email.strip() else None
+        return func.lower(func.trim(model.email))
     if key == "phone":
-        phone = getattr(entity, "phone", None)
-        normalized = normalize_phone(phone) if isinstance(phone, str) else ""
-        return normalized or None
-    if key == "name":
-        # For companies use the normalized name (strips suffixes); for
-        # contacts/leads collapse first+last lowercased.
-        company_name = getattr(entity, "name", None)
-        if isinstance(company_name, str) and company_name.strip():
-            return normalize_company_name(company_name)
-        first = (getattr(entity, "first_name", "") or "").strip().lower()
-        last = (getattr(entity, "last_name", "") or "").strip().lower()
-        if first or last:
-            return f"{first} {last}".strip()
-        return None
-    return None
+        return model.phone_normalized
+    return model.name_normalized
+
+
+def _live_conditions(model: Any) -> list[Any]:
+    """Exclude soft-deleted and merged-away rows."""
+    conditions = []
+    if hasattr(model, "deleted_at"):
+        conditions.append(model.deleted_at.is_(None))
+    if hasattr(model, "status"):
+        conditions.append(model.status != "merged")
+    if hasattr(model, "merged_into_id"):
+        conditions.append(model.merged_into_id.is_(None))
+    return conditions
 
 
 class DedupService:
@@ -126,22 +114,22 @@ class DedupService:
         last_name: str | None = None,
         exclude_id: int | None = None,
     ) -> list[Contact]:
-        """Find potential duplicate contacts by email, phone, or name."""
+        """Find potential duplicate contacts by email, phone, or name.
+
+        Each criterion is an indexed equality on a persisted key
+        (``lower(email)``, ``phone_normalized``, ``name_normalized``).
+        """
         conditions = []
 
         if email:
             conditions.append(func.lower(Contact.email) == email.lower())
 
-        if phone:
-            normalized = normalize_phone(phone)
-            if normalized:
-                conditions.append(Contact.phone.isnot(None))
+        phone_digits = phone_key(phone)
+        if phone_digits:
+            conditions.append(Contact.phone_normalized == phone_digits)
 
         if first_name and last_name:
-            conditions.append(
-                (func.lower(Contact.first_name) == first_name.lower())
-                & (func.lower(Contact.last_name) == last_name.lower())
-            )
+            conditions.append(Contact.name_normalized == person_name_key(first_name, last_name))
 
         if not conditions:
             return []
@@ -151,26 +139,7 @@ class DedupService:
             query = query.where(Contact.id != exclude_id)
 
         result = await self.db.execute(query)
-        candidates = list(result.scalars().all())
-
-        # Post-filter phone matches by normalized comparison
-        if phone:
-            normalized_input = normalize_phone(phone)
-            filtered = []
-            for c in candidates:
-                # Already matched by email or name
-                match_by_email = email and c.email and c.email.lower() == email.lower()
-                match_by_name = (
-                    first_name and last_name
-                    and c.first_name.lower() == first_name.lower()
-                    and c.last_name.lower() == last_name.lower()
-                )
-                match_by_phone = c.phone and normalize_phone(c.phone) == normalized_input
-                if match_by_email or match_by_name or match_by_phone:
-                    filtered.append(c)
-            return filtered
-
-        return candidates
+        return list(result.scalars().all())
 
     async def find_duplicate_companies(
         self,
@@ -178,11 +147,12 @@ class DedupService:
         exclude_id: int | None = None,
     ) -> list[Company]:
         """Find potential duplicate companies by normalized name."""
-        if not name:
+        name_key = company_name_key(name)
+        if not name_key:
             return []
 
-        # Fetch live companies and compare normalized names
         query = select(Company).where(
+            Company.name_normalized == name_key,
             Company.status != "merged",
             Company.merged_into_id.is_(None),
         )
@@ -190,13 +160,7 @@ class DedupService:
             query = query.where(Company.id != exclude_id)
 
         result = await self.db.execute(query)
-        companies = result.scalars().all()
-
-        target_normalized = normalize_company_name(name)
-        return [
-            c for c in companies
-            if normalize_company_name(c.name) == target_normalized
-        ]
+        return list(result.scalars().all())
 
     async def find_duplicate_leads(
         self,
@@ -210,8 +174,9 @@ class DedupService:
         if email:
             conditions.append(func.lower(Lead.email) == email.lower())
 
-        if phone:
-            conditions.append(Lead.phone.isnot(None))
+        phone_digits = phone_key(phone)
+        if phone_digits:
+            conditions.append(Lead.phone_normalized == phone_digits)
 
         if not conditions:
             return []
@@ -221,19 +186,7 @@ class DedupService:
             query = query.where(Lead.id != exclude_id)
 
         result = await self.db.execute(query)
-        candidates = list(result.scalars().all())
-
-        if phone:
-            normalized_input = normalize_phone(phone)
-            filtered = []
-            for l in candidates:
-                match_by_email = email and l.email and l.email.lower() == email.lower()
-                match_by_phone = l.phone and normalize_phone(l.phone) == normalized_input
-                if match_by_email or match_by_phone:
-                    filtered.append(l)
-            return filtered
-
-        return candidates
+        return list(result.scalars().all())
 
     async def check_duplicates(
         self,
@@ -297,8 +250,8 @@ class DedupService:
             reasons.append("Phone match")
         if (
             data.get("first_name") and data.get("last_name")
-            and contact.first_name.lower() == data["first_name"].lower()
-            and contact.last_name.lower() == data["last_name"].lower()
+            and person_name_key(contact.first_name, contact.last_name)
+            == person_name_key(data["first_name"], data["last_name"])
         ):
             reasons.append("Name match")
         return ", ".join(reasons) if reasons else "Potential match"
@@ -353,6 +306,7 @@ class DedupService:
         )
 
         await self.db.flush()
+        invalidate_cache(CACHE_DEDUP_CLUSTERS)
         await self.db.refresh(primary)
         return primary
 
@@ -386,6 +340,7 @@ class DedupService:
         )
 
         await self.db.flush()
+        invalidate_cache(CACHE_DEDUP_CLUSTERS)
         await self.db.refresh(primary)
         return primary
 
@@ -419,6 +374,7 @@ class DedupService:
         )
 
         await self.db.flush()
+        invalidate_cache(CACHE_DEDUP_CLUSTERS)
         await self.db.refresh(primary)
         return primary
 
@@ -772,29 +728,36 @@ class DedupService:
         self,
         entity_type: str,
         key: str,
+        cursor: str | None = None,
+        limit: int = CLUSTER_PAGE_SIZE,
+        refresh: bool = False,
     ) -> dict[str, Any]:
-        """Group live rows of an entity by the chosen match key.
-
-        Returns ``{"clusters": [...], "skipped_no_key": int}`` — each
-        cluster dict has the matched key value, the member count, and
-        the list of members. Each member carries id, display label,
-        ``created_at``, ``last_activity_at`` (max(activities.created_at)),
-        and the polymorphic activity count — enough for the admin UI to
-        pick the "winner" without round-tripping per row.
-
-        ``skipped_no_key`` is the count of live rows that lacked a value
-        for the chosen match key (e.g. a contact with no phone when
-        ``key="phone"``). Surfacing it tells the operator how much of
-        the dataset the current match key actually evaluates — a small
-        cluster count next to a big skipped count is usually a hint to
-        switch keys.
+        """One page of live rows of an entity grouped by the chosen match key.
+
+        Returns ``{"clusters": [...], "next_cursor": str | None, ...}`` —
+        each cluster dict has the matched key value, the member count, and
+        up to ``MAX_CLUSTER_MEMBERS`` members. Each member carries id,
+        display label, ``created_at``, ``last_activity_at``
+        (max(activities.created_at)), and the polymorphic activity count —
+        enough for the admin UI to pick the "winner" without
+        round-tripping per row.
+
+        Grouping happens in SQL on the indexed key (``lower(trim(email))``,
+        ``phone_normalized``, ``name_normalized``), so only the page's
+        keys and members are ever loaded. Pages are ordered biggest
+        cluster first, ties by key value, and ``next_cursor`` is a keyset
+        position in that order — stable while other clusters are merged
+        away.
+
+        The first page also reports ``skipped_no_key`` (live rows lacking
+        a value for the key — a small cluster count next to a big skipped
+        count is usually a hint to switch keys), ``total_clusters`` and
+        ``total_redundant``; later pages leave them ``None``.
 
         Soft-deleted and already-merged rows are excluded so the operator
-        only sees clusters they can actually act on.
-
-        Today this reads the full live table for the entity into memory.
-        TODO: paginate or stream when a tenant grows past ~25k rows; the
-        normalize-in-Python branch (name match) is the bottleneck.
+        only sees clusters they can actually act on. Pages are cached for
+        a few minutes and dropped on every merge; ``refresh`` bypasses the
+        cache for records created since.
         """
         if entity_type not in ALLOWED_CLUSTER_ENTITIES:
             raise ValueError(
@@ -805,35 +768,94 @@ class DedupService:
             raise ValueError(
                 f"Invalid key '{key}' for {entity_type}. Allowed: {', '.join(allowed_keys)}"
             )
+        limit = max(1, min(limit, MAX_CLUSTER_PAGE_SIZE))
+        after = decode_keyset_cursor(cursor, (int, str)) if cursor else None
 
-        model = {"contacts": Contact, "companies": Company, "leads": Lead}[entity_type]
+        async def _compute() -> dict[str, Any]:
+            return await self._cluster_page(entity_type, key, after, limit)
 
-        query = select(model)
-        if hasattr(model, "deleted_at"):
-            query = query.where(model.deleted_at.is_(None))
-        if hasattr(model, "status"):
-            query = query.where(model.status != "merged")
-        if hasattr(model, "merged_into_id"):
-            query = query.where(model.merged_into_id.is_(None))
-        result = await self.db.execute(query)
-        rows = list(result.scalars().all())
-
-        # Bucket rows by key. One pass; rows with no value land in
-        # `skipped_no_key` so the UI can surface "412 records had no
-        # phone, switch to email if you expected coverage there".
-        buckets: dict[str, list[Any]] = {}
-        skipped_no_key = 0
-        for row in rows:
-            bucket_key = _cluster_key_for(row, key)
-            if bucket_key is None:
-                skipped_no_key += 1
-                continue
-            buckets.setdefault(bucket_key, []).append(row)
-
-        # Only buckets with >= 2 members are actual duplicate clusters.
-        dup_ids: list[int] = [r.id for members in buckets.values() if len(members) >= 2 for r in members]
+        if refresh:
+            invalidate_cache(CACHE_DEDUP_CLUSTERS)
+        return await cached_fetch(
+            CACHE_DEDUP_CLUSTERS, f"{entity_type}:{key}:{cursor or ''}:{limit}", _compute
+        )
+
+    async def _cluster_page(
+        self,
+        entity_type: str,
+        key: str,
+        after: tuple[int, str] | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        model = _CLUSTER_MODELS[entity_type]
+        key_expr = _cluster_key_expr(model, key)
+        live = _live_conditions(model)
+        has_key = and_(key_expr.isnot(None), key_expr != "")
+
+        grouped = (
+            select(key_expr.label("key_value"), func.count().label("member_count"))
+            .where(*live, has_key)
+            .group_by(key_expr)
+            .having(func.count() >= 2)
+            .subquery()
+        )
+        page_query = select(grouped.c.key_value, grouped.c.member_count)
+        if after is not None:
+            after_count, after_key = after
+            page_query = page_query.where(or_(
+                grouped.c.member_count < after_count,
+                and_(grouped.c.member_count == after_count, grouped.c.key_value > after_key),
+            ))
+        page_rows = (await self.db.execute(
+            page_query
+            .order_by(grouped.c.member_count.desc(), grouped.c.key_value)
+            .limit(limit + 1)
+        )).all()
+        has_more = len(page_rows) > limit
+        page_rows = page_rows[:limit]
+
+        totals: dict[str, Any] = dict.fromkeys(("skipped_no_key", "total_clusters", "total_redundant"))
+        if after is None:
+            skipped = await self.db.execute(
+                select(func.count()).select_from(model).where(*live, ~has_key)
+            )
+            summary = (await self.db.execute(
+                select(func.count(), func.coalesce(func.sum(grouped.c.member_count), 0))
+            )).one()
+            totals = {
+                "skipped_no_key": int(skipped.scalar() or 0),
+                "total_clusters": int(summary[0]),
+                "total_redundant": int(summary[1]) - int(summary[0]),
+            }
+
+        members_by_key: dict[str, list[Any]] = {row.key_value: [] for row in page_rows}
+        if page_rows:
+            # Cap each cluster's members in SQL so a junk key shared by
+            # thousands of rows (a placeholder phone) stays bounded.
+            ranked = (
+                select(
+                    model.id.label("member_id"),
+                    key_expr.label("key_value"),
+                    func.row_number().over(
+                        partition_by=key_expr,
+                        order_by=(model.created_at.desc(), model.id.desc()),
+                    ).label("rank"),
+                )
+                .where(*live, key_expr.in_(list(members_by_key)))
+                .subquery()
+            )
+            result = await self.db.execute(
+                select(model, ranked.c.key_value)
+                .join(ranked, ranked.c.member_id == model.id)
+                .where(ranked.c.rank <= MAX_CLUSTER_MEMBERS)
+                .order_by(model.id)
+            )
+            for entity, key_value in result.all():
+                members_by_key[key_value].append(entity)
+
+        member_ids = [m.id for members in members_by_key.values() for m in members]
         try:
-            activity_meta = await self._activity_meta_for(entity_type, dup_ids)
+            activity_meta = await self._activity_meta_for(entity_type, member_ids)
         except Exception:
             # Bubble the underlying error after capturing context — the
             # cluster meta lookup failing leaves us unable to render a
@@ -841,17 +863,15 @@ class DedupService:
             # loudly than serve zeros that look like real data.
             logger.exception(
                 "dedup cluster meta lookup failed",
-                extra={"entity_type": entity_type, "dup_id_count": len(dup_ids)},
+                extra={"entity_type": entity_type, "dup_id_count": len(member_ids)},
             )
             raise
 
         clusters: list[dict[str, Any]] = []
-        for bucket_key, members in buckets.items():
-            if len(members) < 2:
-                continue
+        for row in page_rows:
             cluster_members = [
                 self._render_cluster_member(entity_type, m, activity_meta)
-                for m in members
+                for m in members_by_key[row.key_value]
             ]
             # Sort members so the most-recently-active appears first — the
             # operator usually wants to keep the most-touched record as
@@ -862,15 +882,20 @@ class DedupService:
             )
             clusters.append({
                 "key": key,
-                "key_value": bucket_key,
-                "member_count": len(cluster_members),
+                "key_value": row.key_value,
+                "member_count": int(row.member_count),
                 "members": cluster_members,
             })
 
-        # Stable order: biggest clusters first; ties broken by key_value
-        # so a deterministic order shows up in tests and the UI.
-        clusters.sort(key=lambda c: (-c["member_count"], c["key_value"]))
-        return {"clusters": clusters, "skipped_no_key": skipped_no_key}
+        last = page_rows[-1] if page_rows else None
+        return {
+            "clusters": clusters,
+            "next_cursor": (
+                encode_keyset_cursor(int(last.member_count), last.key_value)
+                if has_more and last is not None else None
+            ),
+            **totals,
+        }
 
     async def _activity_meta_for(
         self,
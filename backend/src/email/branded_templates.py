@@ -7,6 +7,7 @@ tenant's brand.
 
 import logging
 import re
+from collections.abc import Callable
 from html import escape
 
 from sqlalchemy import select
@@ -1433,6 +1434,36 @@ def render_campaign_wrapper(
     )
 
 
+# Private-use characters never occur in a URL we build, and escape() leaves
+# them alone, so the placeholder survives rendering verbatim.
+_UNSUBSCRIBE_PLACEHOLDER = "/\ue000unsubscribe\ue001"
+
+
+def campaign_wrapper_renderer(
+    branding: dict,
+    campaign_body: str,
+) -> Callable[[str], str]:
+    """Render the campaign wrapper once; return a per-recipient filler.
+
+    The filler takes a recipient's unsubscribe URL and returns exactly what
+    ``render_campaign_wrapper`` would, by splicing the escaped URL into the
+    pre-rendered HTML instead of rebuilding it for every recipient.
+    """
+    head, _, tail = render_campaign_wrapper(
+        branding=branding,
+        campaign_body=campaign_body,
+        unsubscribe_url=_UNSUBSCRIBE_PLACEHOLDER,
+    ).rpartition(_UNSUBSCRIBE_PLACEHOLDER)
+
+    def fill(unsubscribe_url: str) -> str:
+        safe_unsub = _safe_url(unsubscribe_url)
+        if not safe_unsub:
+            return render_campaign_wrapper(branding, campaign_body, unsubscribe_url)
+        return f"{head}{escape(safe_unsub)}{tail}"
+
+    return fill
+
+
 # ---------------------------------------------------------------------------
 # Contract send email
 # ---------------------------------------------------------------------------
@@ -14,11 +14,13 @@ from sqlalchemy import (
     Text,
     event,
     func,
+    inspect,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import TypeDecorator
 
+from src.core.column_types import SearchVector
 from src.database import Base
 
 
@@ -118,12 +120,18 @@ class EmailQueue(Base):
         _ParticipantEmails(), nullable=False, server_default="{}", default=list
     )
 
+    # Full-text search document, written by _sync_search_vector below.
+    search_vector: Mapped[str | None] = mapped_column(
+        SearchVector(), nullable=True, deferred=True
+    )
+
     __table_args__ = (
         Index("ix_email_queue_entity", "entity_type", "entity_id"),
         Index("ix_email_queue_status", "status"),
         Index("ix_email_queue_sent_by", "sent_by_id"),
         Index("ix_email_queue_thread_id", "thread_id"),
         Index("ix_email_queue_participants", "participant_emails", postgresql_using="gin"),
+        Index("ix_email_queue_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
@@ -183,11 +191,17 @@ class InboundEmail(Base):
         _ParticipantEmails(), nullable=False, server_default="{}", default=list
     )
 
+    # See EmailQueue.search_vector.
+    search_vector: Mapped[str | None] = mapped_column(
+        SearchVector(), nullable=True, deferred=True
+    )
+
     __table_args__ = (
         Index("ix_inbound_emails_entity", "entity_type", "entity_id"),
         Index("ix_inbound_emails_from", "from_email"),
         Index("ix_inbound_emails_thread_id", "thread_id"),
         Index("ix_inbound_emails_participants", "participant_emails", postgresql_using="gin"),
+        Index("ix_inbound_emails_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
@@ -212,3 +226,35 @@ def _autofill_participants(_mapper, _conn, target) -> None:
 
 event.listen(InboundEmail, "before_insert", _autofill_participants)
 event.listen(EmailQueue, "before_insert", _autofill_participants)
+
+
+_SEARCHED_FIELDS = ("subject", "body", "body_text", "body_html", "from_email", "to_email", "cc", "bcc")
+
+
+def _sync_search_vector(_mapper, conn, target) -> None:
+    """Rebuild ``search_vector`` on insert, and on update when searched text changed.
+
+    Inbound rows index ``body_text``, falling back to ``body_html`` when the
+    message had no plain-text part.
+    """
+    state = inspect(target)
+    if state.persistent and not any(
+        state.attrs[name].history.has_changes()
+        for name in _SEARCHED_FIELDS
+        if name in state.attrs
+    ):
+        return
+    from src.email.search import search_vector_value
+
+    body = (target.body_text or target.body_html) if isinstance(target, InboundEmail) else target.body
+    target.search_vector = search_vector_value(
+        conn.dialect.name,
+        target.subject,
+        [target.from_email, target.to_email, target.cc, target.bcc],
+        body,
+    )
+
+
+for _model in (InboundEmail, EmailQueue):
+    event.listen(_model, "before_insert", _sync_search_vector)
+    event.listen(_model, "before_update", _sync_search_vector)
@@ -48,6 +48,32 @@ async def get_user_connection_emails(db: AsyncSession, user_id: int) -> list[str
     return out
 
 
+async def get_connection_emails_by_user(
+    db: AsyncSession, user_ids
+) -> dict[int, set[str]]:
+    """Batch form of :func:`get_user_connection_emails` — one query for many users.
+
+    Users without an active connection are absent from the result.
+    """
+    from src.integrations.gmail.models import GmailConnection
+
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(GmailConnection.user_id, GmailConnection.email, GmailConnection.aliases).where(
+            GmailConnection.user_id.in_(ids),
+            GmailConnection.revoked_at.is_(None),
+        )
+    )
+    out: dict[int, set[str]] = {}
+    for row in result:
+        addrs = {a.lower() for a in [row.email, *(row.aliases or [])] if a}
+        if addrs:
+            out.setdefault(row.user_id, set()).update(addrs)
+    return out
+
+
 async def find_user_ids_by_addresses(
     db: AsyncSession, addresses: list[str]
 ) -> list[int]:
@@ -234,24 +234,30 @@ async def search_emails(
     page_size: int = Query(25, ge=1, le=50),
     entity_type: str | None = Query(None),
     entity_id: int | None = Query(None),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
 ):
     """Search emails by keyword. Admins search across every row; non-admins
     are scoped to their participated threads."""
     service = EmailService(db)
-    items, total = await service.search_emails(
-        q=q,
-        user_id=None if current_user.is_superuser else current_user.id,
-        page=page,
-        page_size=page_size,
-        entity_type=entity_type,
-        entity_id=entity_id,
-    )
+    with value_error_as_400():
+        result = await service.search_emails(
+            q=q,
+            user_id=None if current_user.is_superuser else current_user.id,
+            page=page,
+            page_size=page_size,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            cursor=cursor,
+        )
+    total = result["total"]
     return EmailSearchResponse(
-        items=[EmailSearchResult(**item) for item in items],
+        items=[EmailSearchResult(**item) for item in result["items"]],
         total=total,
+        total_capped=result["total_capped"],
         page=page,
         page_size=page_size,
-        pages=calculate_pages(total, page_size),
+        pages=calculate_pages(total, page_size) if total is not None else None,
+        next_cursor=result["next_cursor"],
     )
 
 
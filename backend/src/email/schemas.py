@@ -7,6 +7,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
 
+from src.integrations.gmail.inline_images import sign_inline_image_urls
+
 # Per-message attachment limits. 25 MB matches Gmail's user-facing send
 # cap and is well under Resend's hard ceiling, so the same numbers
 # apply regardless of which provider lights up at send time.
@@ -147,6 +149,12 @@ class EmailQueueResponse(BaseModel):
     campaign_id: int | None = None
     sent_by_id: int | None = None
 
+    # Gmail-synced bodies reference stored inline images; hand out signed URLs.
+    @field_validator("body")
+    @classmethod
+    def _sign_inline_images(cls, v: str) -> str:
+        return sign_inline_image_urls(v)
+
 
 class EmailListResponse(BaseModel):
     """Paginated list of emails."""
@@ -178,6 +186,11 @@ class InboundEmailResponse(BaseModel):
     received_at: datetime
     created_at: datetime
 
+    @field_validator("body_html")
+    @classmethod
+    def _sign_inline_images(cls, v: str | None) -> str | None:
+        return sign_inline_image_urls(v)
+
 
 class EmailSettingsResponse(BaseModel):
     """Email settings response."""
@@ -219,6 +232,11 @@ class ThreadEmailItem(BaseModel):
     attachments: Any | None = None  # inbound only
     thread_id: str | None = None
 
+    @field_validator("body", "body_html")
+    @classmethod
+    def _sign_inline_images(cls, v: str | None) -> str | None:
+        return sign_inline_image_urls(v)
+
 
 class ThreadResponse(BaseModel):
     """Paginated email thread combining inbound and outbound."""
@@ -235,6 +253,9 @@ class EmailSearchResult(BaseModel):
     kind: str  # 'sent' | 'received'
     subject: str
     snippet: str
+    # (start, end) offsets of matched words within ``snippet``.
+    highlights: list[tuple[int, int]] = []
+    rank: float
     from_email: str | None
     to_email: str
     sent_at: datetime | None
@@ -246,7 +267,11 @@ class EmailSearchResult(BaseModel):
 class EmailSearchResponse(BaseModel):
     """Paginated email search results."""
     items: list[EmailSearchResult]
-    total: int
+    # Reported on the first request only (no cursor); when total_capped is
+    # set it is a lower bound.
+    total: int | None = None
+    total_capped: bool = False
     page: int
     page_size: int
-    pages: int
+    pages: int | None = None
+    next_cursor: str | None = None
@@ -0,0 +1,153 @@
+"""Full-text search index for ``email_queue`` and ``inbound_emails``.
+
+Each row carries a ``search_vector``: on Postgres a weighted ``tsvector``
+(subject A, From/To/CC/BCC B, body C) behind a GIN index; on SQLite (the
+pytest default) the same words as a space-separated lowercase string. Both
+are built from :func:`search_words`, which reduces text to bare alphanumeric
+words, so a query word matches the same things on either dialect: any
+indexed word it is a prefix of.
+
+The vector is written by a ``before_insert`` / ``before_update`` hook on
+both models (see ``email/models.py``), so every ingest path —
+``EmailService.queue_email``, Gmail ``_store_sent`` / ``_store_inbound``,
+the Resend webhook — keeps it current without calling in here.
+"""
+
+import html
+import re
+
+from sqlalchemy import and_, case, func, literal
+
+SEARCH_CONFIG = "simple"
+# Documents are capped well below tsvector's 1 MB limit; long threads
+# quote themselves, so the tail rarely holds words the head doesn't.
+MAX_INDEXED_CHARS = 200_000
+MAX_QUERY_TOKENS = 10
+# First-page totals count at most this many matches; beyond it the total
+# is reported as a lower bound instead of scanning every hit.
+SEARCH_COUNT_CAP = 1000
+
+_WORD = re.compile(r"[^\W_]+")
+_HIDDEN_BLOCK = re.compile(r"<(style|script)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r"<[^>]*>")
+
+# ts_headline wraps matches in these private-use characters; split_headline
+# turns them into offsets so the snippet itself stays plain text.
+_MARK_START = "\ue000"
+_MARK_STOP = "\ue001"
+_HEADLINE_OPTIONS = (
+    f'StartSel="{_MARK_START}", StopSel="{_MARK_STOP}", '
+    "MaxWords=35, MinWords=15, MaxFragments=1"
+)
+_SNIPPET_CHARS = 200
+
+
+def html_to_text(value: str | None) -> str:
+    """Strip tags (and style/script bodies) and unescape entities."""
+    if not value:
+        return ""
+    return html.unescape(_TAG.sub(" ", _HIDDEN_BLOCK.sub(" ", value)))
+
+
+def search_words(*parts: str | None) -> str:
+    """Lowercase alphanumeric words of ``parts``, space-separated."""
+    words = _WORD.findall(" ".join(p for p in parts if p).lower())
+    return " ".join(words)[:MAX_INDEXED_CHARS]
+
+
+def search_tokens(q: str) -> list[str]:
+    """Query words, deduped in order; punctuation-only queries yield none."""
+    return list(dict.fromkeys(_WORD.findall(q.lower())))[:MAX_QUERY_TOKENS]
+
+
+def search_vector_value(
+    dialect_name: str,
+    subject: str | None,
+    addresses: list[str | None],
+    body: str | None,
+):
+    """Value to store in ``search_vector`` for one message.
+
+    ``body`` may be HTML; tags are stripped before indexing.
+    """
+    subject_words = search_words(subject)
+    address_words = search_words(*addresses)
+    body_words = search_words(html_to_text(body))
+    if dialect_name != "postgresql":
+        return f" {subject_words} {address_words} {body_words} "
+
+    def _weighted(words: str, weight: str):
+        return func.setweight(func.to_tsvector(SEARCH_CONFIG, words), weight)
+
+    return (
+        _weighted(subject_words, "A")
+        .op("||")(_weighted(address_words, "B"))
+        .op("||")(_weighted(body_words, "C"))
+    )
+
+
+def _tsquery(tokens: list[str]):
+    # Tokens are bare alphanumerics, so no tsquery syntax can leak in.
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{t}:*" for t in tokens))
+
+
+def search_match_clause(vector_column, tokens: list[str], dialect_name: str):
+    """Every token must prefix-match an indexed word."""
+    if dialect_name == "postgresql":
+        return vector_column.op("@@")(_tsquery(tokens))
+    return and_(*(vector_column.like(f"% {t}%") for t in tokens))
+
+
+def search_rank_expr(vector_column, subject_column, tokens: list[str], dialect_name: str):
+    """Relevance score. SQLite ranks subject hits above body-only hits."""
+    if dialect_name == "postgresql":
+        return func.ts_rank(vector_column, _tsquery(tokens))
+    subject_hit = and_(*(func.lower(subject_column).like(f"%{t}%") for t in tokens))
+    return case((subject_hit, 1.0), else_=0.5)
+
+
+def search_headline_expr(body_column, tokens: list[str], dialect_name: str):
+    """``ts_headline`` over the tag-stripped body, or ``None`` off Postgres.
+
+    Apply it to the final page only: it re-parses each body it touches.
+    """
+    if dialect_name != "postgresql":
+        return None
+    plain = func.regexp_replace(body_column, "<[^>]*>", " ", "g")
+    return func.ts_headline(SEARCH_CONFIG, plain, _tsquery(tokens), literal(_HEADLINE_OPTIONS))
+
+
+def split_headline(headline: str | None) -> tuple[str, list[tuple[int, int]]]:
+    """Turn a marked ``ts_headline`` into plain text plus match offsets."""
+    snippet = ""
+    highlights: list[tuple[int, int]] = []
+    for i, chunk in enumerate((headline or "").split(_MARK_START)):
+        marked, _, rest = chunk.partition(_MARK_STOP) if i else ("", "", chunk)
+        if marked:
+            marked = html.unescape(marked)
+            highlights.append((len(snippet), len(snippet) + len(marked)))
+            snippet += marked
+        snippet += html.unescape(rest)
+    return snippet, highlights
+
+
+def fallback_headline(body: str | None, tokens: list[str]) -> tuple[str, list[tuple[int, int]]]:
+    """Python snippet + offsets for dialects without ``ts_headline``."""
+    text = " ".join(html_to_text(body).split())
+    low = text.lower()
+    positions = [p for p in (low.find(t) for t in tokens) if p >= 0]
+    start = max(0, min(positions) - 60) if positions else 0
+    snippet = text[start : start + _SNIPPET_CHARS]
+    low_snippet = snippet.lower()
+    spans = sorted(
+        (m.start(), m.end()) for t in tokens for m in re.finditer(re.escape(t), low_snippet)
+    )
+    highlights: list[tuple[int, int]] = []
+    for begin, end in spans:
+        if highlights and begin <= highlights[-1][1]:
+            highlights[-1] = (highlights[-1][0], max(end, highlights[-1][1]))
+        else:
+            highlights.append((begin, end))
+    return snippet, highlights
+
+
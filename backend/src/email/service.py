@@ -12,15 +12,25 @@ import logging
 import re
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, func, literal, or_, select, union_all
+from sqlalchemy import and_, func, literal, or_, select, tuple_, union_all
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
 from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.cursors import decode_keyset_cursor, encode_keyset_cursor
 from src.email.branded_templates import TenantBrandingHelper, render_branded_email
 from src.email.models import EmailQueue, InboundEmail
 from src.email.participants import collect_participants, get_user_connection_emails
+from src.email.search import (
+    SEARCH_COUNT_CAP,
+    fallback_headline,
+    search_headline_expr,
+    search_match_clause,
+    search_rank_expr,
+    search_tokens,
+    split_headline,
+)
 from src.email.types import EmailAttachment
 
 logger = logging.getLogger(__name__)
@@ -121,7 +131,7 @@ async def _try_gmail_send(
 
     # Pre-generate the RFC Message-ID so we can persist the SAME value the
     # message envelope carries. Gmail's sync worker dedups outbound rows by
-    # exact match on the RFC header (sync.py::_is_duplicate). Storing
+    # exact match on the RFC header (sync.py::_stored_rfc_message_ids). Storing
     # Gmail's internal numeric id on EmailQueue.message_id was the bug —
     # when sync polled history for the user's own mailbox it re-ingested
     # every outbound CRM send as a brand-new EmailQueue row because the
@@ -241,6 +251,48 @@ async def _create_email_activity(
     await db.flush()
 
 MAX_RETRIES = 5
+# Campaign sends flush this many queue rows per multi-row INSERT.
+CAMPAIGN_QUEUE_BATCH_SIZE = 500
+
+
+def _new_queue_row(
+    *,
+    to_email: str,
+    subject: str,
+    body: str,
+    from_email: str | None = None,
+    cc: str | None = None,
+    bcc: str | None = None,
+    sent_by_id: int | None = None,
+    entity_type: str | None = None,
+    entity_id: int | None = None,
+    template_id: int | None = None,
+    campaign_id: int | None = None,
+) -> EmailQueue:
+    return EmailQueue(
+        to_email=to_email,
+        from_email=from_email,
+        subject=subject,
+        body=body,
+        cc=cc,
+        bcc=bcc,
+        sent_by_id=sent_by_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        template_id=template_id,
+        campaign_id=campaign_id,
+        status="pending",
+        attempts=0,
+        participant_emails=collect_participants(from_email, to_email, cc, bcc),
+    )
+
+
+def _mark_throttled(email: EmailQueue) -> None:
+    """Hold ``email`` until 09:00 UTC tomorrow, when the daily limit resets."""
+    email.status = "throttled"
+    email.next_retry_at = (datetime.now(UTC) + timedelta(days=1)).replace(
+        hour=9, minute=0, second=0, microsecond=0
+    )
 
 
 class GmailNotConnectedError(RuntimeError):
@@ -355,7 +407,7 @@ class EmailService:
         ground truth in the meantime.
         """
         from_email = self._validate_from_email(from_email)
-        email = EmailQueue(
+        email = _new_queue_row(
             to_email=to_email,
             from_email=from_email,
             subject=subject,
@@ -367,9 +419,6 @@ class EmailService:
             entity_id=entity_id,
             template_id=template_id,
             campaign_id=campaign_id,
-            status="pending",
-            attempts=0,
-            participant_emails=collect_participants(from_email, to_email, cc, bcc),
         )
         self.db.add(email)
         await self.db.flush()
@@ -377,11 +426,7 @@ class EmailService:
         from src.email.throttle import EmailThrottleService
         throttle = EmailThrottleService(self.db)
         if not await throttle.can_send():
-            email.status = "throttled"
-            tomorrow_9am = (datetime.now(UTC) + timedelta(days=1)).replace(
-                hour=9, minute=0, second=0, microsecond=0
-            )
-            email.next_retry_at = tomorrow_9am
+            _mark_throttled(email)
             await self.db.flush()
             return email
 
@@ -592,10 +637,16 @@ class EmailService:
         """Send branded emails to all members of a campaign.
 
         Wraps each email in the tenant's branded template with an
-        unsubscribe link in the footer.
+        unsubscribe link in the footer. Recipients are resolved with one
+        joined query, the wrapper is rendered once with each member's
+        unsubscribe URL spliced in, and queue rows are inserted
+        ``CAMPAIGN_QUEUE_BATCH_SIZE`` at a time. The daily throttle is read
+        once and counted down as messages go out.
         """
-        from src.campaigns.models import CampaignMember, EmailTemplate
-        from src.email.branded_templates import render_campaign_wrapper
+        from src.campaigns.models import EmailTemplate
+        from src.campaigns.recipients import resolve_campaign_recipients
+        from src.email.branded_templates import campaign_wrapper_renderer
+        from src.email.throttle import EmailThrottleService
 
         branding = TenantBrandingHelper.get_default_branding()
         if sent_by_id:
@@ -613,36 +664,40 @@ class EmailService:
         vars_dict = variables or {}
         subject = render_template(template.subject_template, vars_dict, is_html=False)
         raw_body = render_template(template.body_template or "", vars_dict)
+        branded_body = campaign_wrapper_renderer(branding, raw_body)
 
-        result = await self.db.execute(
-            select(CampaignMember).where(CampaignMember.campaign_id == campaign_id)
-        )
-        members = result.scalars().all()
-
-        sent_emails = []
-        for member in members:
-            email_addr = await self.get_member_email(member)
-            if email_addr:
-                unsubscribe_url = (
-                    f"/api/campaigns/{campaign_id}/unsubscribe"
-                    f"?member_id={member.id}&email={email_addr}"
-                )
-                branded_body = render_campaign_wrapper(
-                    branding=branding,
-                    campaign_body=raw_body,
-                    unsubscribe_url=unsubscribe_url,
-                )
-                email = await self.queue_email(
-                    to_email=email_addr,
+        recipients = await resolve_campaign_recipients(self.db, campaign_id)
+        remaining = await EmailThrottleService(self.db).remaining_today()
+
+        sent_emails: list[EmailQueue] = []
+        for start in range(0, len(recipients), CAMPAIGN_QUEUE_BATCH_SIZE):
+            batch = [
+                _new_queue_row(
+                    to_email=recipient.email,
                     subject=subject,
-                    body=branded_body,
+                    body=branded_body(
+                        f"/api/campaigns/{campaign_id}/unsubscribe"
+                        f"?member_id={recipient.campaign_member_id}&email={recipient.email}"
+                    ),
                     sent_by_id=sent_by_id,
-                    entity_type=member.member_type,
-                    entity_id=member.member_id,
+                    entity_type=recipient.member_type,
+                    entity_id=recipient.member_id,
                     template_id=template_id,
                     campaign_id=campaign_id,
                 )
-                sent_emails.append(email)
+                for recipient in recipients[start : start + CAMPAIGN_QUEUE_BATCH_SIZE]
+            ]
+            self.db.add_all(batch)
+            await self.db.flush()
+            for email in batch:
+                if remaining <= 0:
+                    _mark_throttled(email)
+                    continue
+                await self._attempt_send(email)
+                if email.status == "sent":
+                    remaining -= 1
+            await self.db.flush()
+            sent_emails.extend(batch)
 
         return sent_emails
 
@@ -792,26 +847,40 @@ class EmailService:
         page_size: int = 25,
         entity_type: str | None = None,
         entity_id: int | None = None,
-    ) -> tuple[list[dict], int]:
-        """Search emails by keyword across subject, body, from, to, cc, bcc.
+        cursor: str | None = None,
+    ) -> dict:
+        """Full-text search across subject, body, from, to, cc, bcc.
+
+        Matches every query word as a prefix against the ``search_vector``
+        index (see ``email/search.py``), best-ranked first with newest as the
+        tiebreaker. Snippets and their highlight offsets come from
+        ``ts_headline`` on Postgres, computed for the returned page only.
+
+        Follow ``next_cursor`` for later pages (keyset); ``page`` remains as
+        an OFFSET fallback for older clients. ``total`` is reported when no
+        cursor is given, counted up to ``SEARCH_COUNT_CAP`` —
+        ``total_capped`` says the real number is higher.
 
         Scoped to the requesting user via participant overlap: outbound rows
         match if the user composed them or appears in the participant set;
         inbound rows match if the user is on the From/To/CC/BCC of the
         original message. Pass ``user_id=None`` to bypass scoping (admin /
         audit usage).
+
+        Raises:
+            ValueError: ``cursor`` is not one this method issued.
         """
+        after = decode_keyset_cursor(cursor, (float, datetime, str, int)) if cursor else None
+        tokens = search_tokens(q)
+        if not tokens:
+            return {"items": [], "total": 0, "total_capped": False, "next_cursor": None}
+
         user_emails = (
             await get_user_connection_emails(self.db, user_id)
             if user_id is not None
             else []
         )
 
-        # Escape LIKE metacharacters so a user typing `%` matches literally
-        # instead of "every row I have access to". Keep `\` first so we
-        # don't double-escape our own escapes.
-        escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        pat = f"%{escaped}%"
         dialect = _dialect_name(self.db)
         outbound_visibility = (
             literal(True)  # admin: no scoping
@@ -820,14 +889,7 @@ class EmailService:
         )
         sent_filters = [
             outbound_visibility,
-            or_(
-                EmailQueue.subject.ilike(pat, escape="\\"),
-                EmailQueue.body.ilike(pat, escape="\\"),
-                EmailQueue.from_email.ilike(pat, escape="\\"),
-                EmailQueue.to_email.ilike(pat, escape="\\"),
-                EmailQueue.cc.ilike(pat, escape="\\"),
-                EmailQueue.bcc.ilike(pat, escape="\\"),
-            ),
+            search_match_clause(EmailQueue.search_vector, tokens, dialect),
         ]
         if entity_type:
             sent_filters.append(EmailQueue.entity_type == entity_type)
@@ -838,6 +900,9 @@ class EmailService:
             select(
                 EmailQueue.id.label("id"),
                 literal("sent").label("kind"),
+                search_rank_expr(
+                    EmailQueue.search_vector, EmailQueue.subject, tokens, dialect
+                ).label("rank"),
                 EmailQueue.subject.label("subject"),
                 EmailQueue.body.label("body"),
                 func.coalesce(EmailQueue.from_email, literal(settings.EMAIL_FROM)).label("from_email"),
@@ -850,17 +915,7 @@ class EmailService:
             .where(*sent_filters)
         )
 
-        recv_filters = [
-            or_(
-                InboundEmail.subject.ilike(pat, escape="\\"),
-                InboundEmail.body_text.ilike(pat, escape="\\"),
-                InboundEmail.body_html.ilike(pat, escape="\\"),
-                InboundEmail.from_email.ilike(pat, escape="\\"),
-                InboundEmail.to_email.ilike(pat, escape="\\"),
-                InboundEmail.cc.ilike(pat, escape="\\"),
-                InboundEmail.bcc.ilike(pat, escape="\\"),
-            ),
-        ]
+        recv_filters = [search_match_clause(InboundEmail.search_vector, tokens, dialect)]
         # Admins (user_id=None) skip inbound scoping entirely; everyone else
         # is bounded by participant overlap (or no rows when unconnected).
         if user_id is not None:
@@ -874,8 +929,11 @@ class EmailService:
             select(
                 InboundEmail.id.label("id"),
                 literal("received").label("kind"),
+                search_rank_expr(
+                    InboundEmail.search_vector, InboundEmail.subject, tokens, dialect
+                ).label("rank"),
                 InboundEmail.subject.label("subject"),
-                InboundEmail.body_text.label("body"),
+                func.coalesce(InboundEmail.body_text, InboundEmail.body_html).label("body"),
                 InboundEmail.from_email.label("from_email"),
                 InboundEmail.to_email.label("to_email"),
                 InboundEmail.received_at.label("sent_at"),
@@ -887,48 +945,66 @@ class EmailService:
         )
 
         combined = union_all(outbound_q, inbound_q).subquery()
-        count_q = select(func.count()).select_from(combined)
-        total = (await self.db.execute(count_q)).scalar() or 0
-
-        offset = (page - 1) * page_size
-        data_q = (
-            select(combined)
-            # Tiebreakers on (kind, id) prevent UNION ALL pagination from
-            # shuffling rows that share a sent_at timestamp (common for
-            # batch-queued emails) — without these, page 1 and page 2 can
-            # return overlapping or skipped rows.
-            .order_by(combined.c.sent_at.desc(), combined.c.kind.desc(), combined.c.id.desc())
-            .offset(offset)
-            .limit(page_size)
-        )
+        total = None
+        total_capped = False
+        if after is None:
+            capped = select(combined.c.id).limit(SEARCH_COUNT_CAP + 1).subquery()
+            counted = (await self.db.execute(select(func.count()).select_from(capped))).scalar() or 0
+            total = min(counted, SEARCH_COUNT_CAP)
+            total_capped = counted > SEARCH_COUNT_CAP
+
+        # Tiebreakers on (kind, id) prevent UNION ALL pagination from
+        # shuffling rows that share a rank and sent_at timestamp (common
+        # for batch-queued emails) — they also make the keyset total.
+        order_key = (combined.c.rank, combined.c.sent_at, combined.c.kind, combined.c.id)
+        page_q = select(combined).order_by(*(c.desc() for c in order_key))
+        if after is not None:
+            page_q = page_q.where(tuple_(*order_key) < tuple_(*after))
+        else:
+            page_q = page_q.offset((page - 1) * page_size)
+        page_rows = page_q.limit(page_size + 1).subquery("page_rows")
+
+        headline = search_headline_expr(page_rows.c.body, tokens, dialect)
+        data_q = select(
+            page_rows,
+            (headline if headline is not None else literal(None)).label("headline"),
+        ).order_by(*(page_rows.c[c.name].desc() for c in order_key))
         rows = (await self.db.execute(data_q)).mappings().all()
 
-        def _snippet(body: str | None, pattern: str) -> str:
-            if not body:
-                return ""
-            low = body.lower()
-            pos = low.find(pattern.lower())
-            if pos >= 0:
-                start = max(0, pos - 60)
-                return body[start : start + 200]
-            return body[:200]
-
-        items = [
-            {
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        items = []
+        for row in rows:
+            if headline is not None:
+                snippet, highlights = split_headline(row["headline"])
+            else:
+                snippet, highlights = fallback_headline(row["body"], tokens)
+            items.append({
                 "id": row["id"],
                 "kind": row["kind"],
                 "subject": row["subject"],
-                "snippet": _snippet(row["body"], q),
+                "snippet": snippet,
+                "highlights": highlights,
+                "rank": row["rank"],
                 "from_email": row["from_email"],
                 "to_email": row["to_email"],
                 "sent_at": row["sent_at"],
                 "thread_id": row["thread_id"],
                 "entity_type": row["entity_type"],
                 "entity_id": row["entity_id"],
-            }
-            for row in rows
-        ]
-        return items, total
+            })
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_keyset_cursor(
+                float(last["rank"]), last["sent_at"], last["kind"], last["id"]
+            )
+        return {
+            "items": items,
+            "total": total,
+            "total_capped": total_capped,
+            "next_cursor": next_cursor,
+        }
 
     async def get_thread(
         self,
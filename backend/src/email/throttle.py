@@ -72,9 +72,17 @@ class EmailThrottleService:
 
     async def can_send(self) -> bool:
         """Return True if we haven't hit the daily send limit yet."""
+        return await self.remaining_today() > 0
+
+    async def remaining_today(self) -> int:
+        """Sends left under today's effective limit.
+
+        Bulk senders read this once and count down locally instead of
+        re-checking ``can_send`` before every message.
+        """
         sent = await self.get_today_sent_count()
         limit = await self.get_effective_daily_limit()
-        return sent < limit
+        return max(0, limit - sent)
 
     async def get_volume_stats(self) -> dict:
         """Return current email volume statistics."""
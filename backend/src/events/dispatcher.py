@@ -0,0 +1,344 @@
+"""Outbox dispatcher — delivers queued domain events to durable handlers.
+
+``emit(..., db=session)`` writes one ``event_outbox`` row per durable handler
+in the request's transaction. This dispatcher claims committed rows and runs
+their handlers on a bounded pool of concurrent deliveries:
+
+* Claims use ``FOR UPDATE SKIP LOCKED`` plus a lease (``locked_until``), so
+  several app processes can drain the same table without double delivery;
+  a crashed worker's rows become claimable again once the lease expires.
+* Ordering is per (handler, entity): a row is only claimable when no earlier
+  row for the same handler and ``ordering_key`` is still pending, including
+  one waiting out a retry backoff. Different entities and handlers proceed
+  in parallel.
+* A failing handler is retried with capped exponential backoff and jitter;
+  after ``max_attempts`` the row is parked as ``dead`` for inspection.
+* ``stats()`` reports in-process delivery counts and per-handler latency;
+  ``queue_depth()`` reports pending/dead rows and the oldest pending age.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections import deque
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+import src.database as _db
+from src.config import settings
+from src.events.models import OUTBOX_DEAD, OUTBOX_DONE, OUTBOX_PENDING, EventOutbox
+from src.events.service import get_durable_handler
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_SAMPLES = 512
+_PURGE_EVERY_SECONDS = 600
+
+
+class _HandlerStats:
+    __slots__ = ("delivered", "failed", "total_seconds", "max_seconds", "recent")
+
+    def __init__(self) -> None:
+        self.delivered = 0
+        self.failed = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    def record(self, seconds: float, ok: bool) -> None:
+        if ok:
+            self.delivered += 1
+        else:
+            self.failed += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        calls = self.delivered + self.failed
+        recent = sorted(self.recent)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "avg_ms": round(self.total_seconds / calls * 1000, 2) if calls else 0.0,
+            "p95_ms": round(p95 * 1000, 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+class OutboxDispatcher:
+    """Drains ``event_outbox`` into the registered durable handlers."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        workers: int | None = None,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 300.0,
+        handler_timeout: float = 60.0,
+        max_attempts: int | None = None,
+        base_backoff: float = 2.0,
+        max_backoff: float = 900.0,
+        retention_days: int = 7,
+    ):
+        self._session_maker = session_maker
+        self.workers = workers or settings.EVENT_BUS_WORKERS
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease_seconds)
+        self.handler_timeout = handler_timeout
+        self.max_attempts = max_attempts or settings.EVENT_BUS_MAX_ATTEMPTS
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.retention = timedelta(days=retention_days)
+        self._handler_stats: dict[str, _HandlerStats] = {}
+        self._dead = 0
+        self._in_flight: set[asyncio.Task] = set()
+        self._wake = asyncio.Event()
+        self._loop_task: asyncio.Task | None = None
+        self._stopping = False
+        self._last_purge = 0.0
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        # Resolved lazily so test fixtures that swap src.database's maker apply.
+        return self._session_maker or _db.async_session_maker
+
+    # ------------------------------------------------------------------
+    # Claiming and delivery
+    # ------------------------------------------------------------------
+
+    async def _claim(self, limit: int) -> list[tuple]:
+        now = datetime.now(UTC)
+        earlier = aliased(EventOutbox)
+        blocked = exists().where(
+            earlier.handler == EventOutbox.handler,
+            earlier.ordering_key == EventOutbox.ordering_key,
+            earlier.id < EventOutbox.id,
+            earlier.status == OUTBOX_PENDING,
+        )
+        query = (
+            select(
+                EventOutbox.id, EventOutbox.handler, EventOutbox.event_type,
+                EventOutbox.payload, EventOutbox.attempts,
+            )
+            .where(
+                EventOutbox.status == OUTBOX_PENDING,
+                EventOutbox.next_attempt_at <= now,
+                or_(EventOutbox.locked_until.is_(None), EventOutbox.locked_until < now),
+                or_(EventOutbox.ordering_key == "", ~blocked),
+            )
+            .order_by(EventOutbox.id)
+            .limit(limit)
+        )
+        async with self._sessions()() as session:
+            if session.bind is not None and session.bind.dialect.name == "postgresql":
+                query = query.with_for_update(skip_locked=True, of=EventOutbox)
+            rows = (await session.execute(query)).all()
+            if rows:
+                await session.execute(
+                    update(EventOutbox)
+                    .where(EventOutbox.id.in_([row.id for row in rows]))
+                    .values(locked_until=now + self.lease)
+                )
+                await session.commit()
+        return [tuple(row) for row in rows]
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+        return timedelta(seconds=delay / 2 + random.uniform(0, delay / 2))
+
+    async def _deliver(self, row: tuple) -> bool:
+        row_id, name, event_type, payload, attempts = row
+        handler = get_durable_handler(name)
+        error: str | None = None
+        started = time.perf_counter()
+        if handler is None:
+            error = f"No durable handler registered as {name}"
+        else:
+            try:
+                await asyncio.wait_for(handler(event_type, payload), self.handler_timeout)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+        elapsed = time.perf_counter() - started
+        self._handler_stats.setdefault(name, _HandlerStats()).record(elapsed, error is None)
+
+        attempts += 1
+        now = datetime.now(UTC)
+        values: dict[str, Any] = {"attempts": attempts, "locked_until": None}
+        if error is None:
+            values.update(status=OUTBOX_DONE, processed_at=now, last_error=None)
+        elif handler is None or attempts >= self.max_attempts:
+            self._dead += 1
+            values.update(status=OUTBOX_DEAD, processed_at=now, last_error=error[:2000])
+            logger.error("Event %s for %s dead after %d attempt(s): %s", row_id, name, attempts, error)
+        else:
+            values.update(next_attempt_at=now + self._backoff(attempts), last_error=error[:2000])
+            logger.warning("Event %s for %s failed (attempt %d), retrying: %s", row_id, name, attempts, error)
+        async with self._sessions()() as session:
+            await session.execute(update(EventOutbox).where(EventOutbox.id == row_id).values(**values))
+            await session.commit()
+        return error is None
+
+    async def run_once(self, limit: int = 100) -> int:
+        """Claim up to ``limit`` ready rows and deliver them. Returns rows handled."""
+        rows = await self._claim(limit)
+        if not rows:
+            return 0
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def _bounded(row: tuple) -> bool:
+            async with semaphore:
+                return await self._deliver(row)
+
+        await asyncio.gather(*(_bounded(row) for row in rows))
+        return len(rows)
+
+    async def drain(self, limit: int = 100) -> int:
+        """Deliver until nothing is ready (rows in retry backoff are left alone)."""
+        total = 0
+        while handled := await self.run_once(limit):
+            total += handled
+        return total
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    @property
+    def running(self) -> bool:
+        return self._loop_task is not None
+
+    def start(self) -> None:
+        if self._loop_task is None:
+            self._stopping = False
+            # Fresh per start: an Event is bound to the loop that first waits on it.
+            self._wake = asyncio.Event()
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming and give in-flight deliveries ``timeout`` to finish."""
+        self._stopping = True
+        self._wake.set()
+        if self._loop_task is not None:
+            await self._loop_task
+            self._loop_task = None
+        if self._in_flight:
+            _, pending = await asyncio.wait(set(self._in_flight), timeout=timeout)
+            for task in pending:
+                # Their leases expire and another worker picks them up.
+                task.cancel()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            self._wake.clear()
+            free = self.workers - len(self._in_flight)
+            claimed: list[tuple] = []
+            try:
+                if free > 0:
+                    claimed = await self._claim(free)
+                await self._maybe_purge()
+            except Exception:
+                logger.exception("Event outbox poll failed")
+            for row in claimed:
+                task = asyncio.create_task(self._deliver(row))
+                self._in_flight.add(task)
+                task.add_done_callback(self._on_delivered)
+            if claimed and len(claimed) == free:
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+
+    def _on_delivered(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Event delivery crashed: %s", task.exception())
+        # A finished row may unblock the next one for the same entity.
+        self._wake.set()
+
+    async def _maybe_purge(self) -> None:
+        if time.monotonic() - self._last_purge < _PURGE_EVERY_SECONDS:
+            return
+        self._last_purge = time.monotonic()
+        async with self._sessions()() as session:
+            await session.execute(
+                delete(EventOutbox).where(
+                    EventOutbox.status == OUTBOX_DONE,
+                    EventOutbox.processed_at < datetime.now(UTC) - self.retention,
+                )
+            )
+            await session.commit()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """In-process delivery counters and per-handler latency."""
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "in_flight": len(self._in_flight),
+            "dead": self._dead,
+            "handlers": {name: stats.snapshot() for name, stats in self._handler_stats.items()},
+        }
+
+
+async def queue_depth(db: AsyncSession) -> dict[str, dict[str, Any]]:
+    """Pending and dead rows per handler, with the oldest pending row's age."""
+    result = await db.execute(
+        select(
+            EventOutbox.handler,
+            func.count(EventOutbox.id).filter(EventOutbox.status == OUTBOX_PENDING).label("pending"),
+            func.count(EventOutbox.id).filter(EventOutbox.status == OUTBOX_DEAD).label("dead"),
+            func.min(EventOutbox.created_at).filter(EventOutbox.status == OUTBOX_PENDING).label("oldest"),
+        )
+        .where(EventOutbox.status.in_([OUTBOX_PENDING, OUTBOX_DEAD]))
+        .group_by(EventOutbox.handler)
+    )
+    now = datetime.now(UTC)
+    depth = {}
+    for row in result.all():
+        oldest = row.oldest
+        if oldest is not None and oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=UTC)
+        depth[row.handler] = {
+            "pending": row.pending,
+            "dead": row.dead,
+            "oldest_pending_seconds": round((now - oldest).total_seconds(), 1) if oldest else None,
+        }
+    return depth
+
+
+# Process-wide dispatcher, started from the app lifespan when EVENT_BUS_DURABLE is on.
+event_dispatcher = OutboxDispatcher()
+
+
+def get_dispatcher() -> OutboxDispatcher | None:
+    """The dispatcher when it is running in this process, else None."""
+    return event_dispatcher if event_dispatcher.running else None
+
+
+def notify_dispatcher(*_args: Any) -> None:
+    """Wake the running dispatcher (used as a session ``after_commit`` hook)."""
+    if event_dispatcher.running:
+        event_dispatcher.wake()
+
+
+def start_event_dispatcher() -> OutboxDispatcher:
+    event_dispatcher.start()
+    return event_dispatcher
+
+
+async def stop_event_dispatcher() -> None:
+    if event_dispatcher.running:
+        await event_dispatcher.stop()
@@ -0,0 +1,48 @@
+"""Event outbox model — durable delivery queue for domain events."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, BigInteger, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+OUTBOX_PENDING = "pending"
+OUTBOX_DONE = "done"
+OUTBOX_DEAD = "dead"
+
+
+class EventOutbox(Base):
+    """
+    One domain event awaiting delivery to one durable handler.
+
+    Rows are written in the emitting request's transaction (fan-out per
+    handler, so each handler retries independently) and drained by
+    ``src.events.dispatcher.OutboxDispatcher``. ``ordering_key`` is
+    ``"<entity_type>:<entity_id>"``; a row is only dispatched once every
+    earlier row for the same handler and key has finished.
+    """
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        Index("ix_event_outbox_status_next_attempt", "status", "next_attempt_at"),
+        Index("ix_event_outbox_handler_key", "handler", "ordering_key", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    handler: Mapped[str] = mapped_column(String(200), nullable=False)
+    ordering_key: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default=OUTBOX_PENDING)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_error: Mapped[str | None] = mapped_column(Text)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -2,24 +2,43 @@
 
 Allows registering handlers for event types and emitting events
 that trigger all registered handlers.
+
+Handlers registered with ``durable=True`` can instead be delivered through
+the event outbox: with ``EVENT_BUS_DURABLE`` on and the caller's session
+passed to ``emit``, one ``event_outbox`` row per durable handler is added to
+that session — committed or rolled back with the request — and
+``src.events.dispatcher.OutboxDispatcher`` delivers it after commit with
+retries. Without a session (or with the setting off) durable handlers run
+inline like every other handler.
 """
 
+import json
 import logging
 from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.events.models import EventOutbox
+
 logger = logging.getLogger(__name__)
 
 # Event type constants
 LEAD_CREATED = "lead.created"
 LEAD_UPDATED = "lead.updated"
+LEAD_DELETED = "lead.deleted"
 CONTACT_CREATED = "contact.created"
 CONTACT_UPDATED = "contact.updated"
 OPPORTUNITY_CREATED = "opportunity.created"
 OPPORTUNITY_UPDATED = "opportunity.updated"
 OPPORTUNITY_STAGE_CHANGED = "opportunity.stage_changed"
+OPPORTUNITY_DELETED = "opportunity.deleted"
 ACTIVITY_CREATED = "activity.created"
 ACTIVITY_ASSIGNED = "activity.assigned"
+ACTIVITY_DELETED = "activity.deleted"
 COMPANY_CREATED = "company.created"
 COMPANY_UPDATED = "company.updated"
 
@@ -39,12 +58,27 @@ PAYMENT_RECEIVED = "payment.received"
 # Registry: event_type -> list of async handler functions
 _handlers: dict[str, list[Callable]] = {}
 
+# Durable handlers by stable name (what event_outbox.handler stores)
+_durable_handlers: dict[str, Callable] = {}
+
 
-def on(event_type: str, handler: Callable) -> None:
-    """Register a handler for a given event type."""
+def handler_name(handler: Callable) -> str:
+    """Stable identifier for a handler, stored on its outbox rows."""
+    return f"{handler.__module__}.{handler.__qualname__}"
+
+
+def on(event_type: str, handler: Callable, *, durable: bool = False) -> None:
+    """Register a handler for a given event type.
+
+    ``durable`` handlers are delivered via the event outbox when the emitter
+    passes its session (see module docstring); they must tolerate being
+    retried and run after the request has committed.
+    """
     if event_type not in _handlers:
         _handlers[event_type] = []
     _handlers[event_type].append(handler)
+    if durable:
+        _durable_handlers[handler_name(handler)] = handler
 
 
 def off(event_type: str, handler: Callable) -> None:
@@ -53,23 +87,69 @@ def off(event_type: str, handler: Callable) -> None:
         _handlers[event_type] = [h for h in _handlers[event_type] if h is not handler]
 
 
-async def emit(event_type: str, payload: dict[str, Any]) -> None:
+def get_durable_handler(name: str) -> Callable | None:
+    """Look up a durable handler by the name stored on its outbox rows."""
+    return _durable_handlers.get(name)
+
+
+def _is_durable(handler: Callable) -> bool:
+    return _durable_handlers.get(handler_name(handler)) is handler
+
+
+def _ordering_key(payload: dict[str, Any]) -> str:
+    entity_type, entity_id = payload.get("entity_type"), payload.get("entity_id")
+    if entity_type and entity_id is not None:
+        return f"{entity_type}:{entity_id}"
+    return ""
+
+
+async def emit(event_type: str, payload: dict[str, Any], *, db: AsyncSession | None = None) -> None:
     """Emit an event, calling all registered handlers.
 
     Handlers are called with (event_type, payload).
     Errors in individual handlers are logged but do not prevent other handlers from running.
+
+    With ``EVENT_BUS_DURABLE`` and a ``db`` session, durable handlers are
+    queued in the event outbox within that session's transaction instead of
+    being awaited here.
     """
     handlers = _handlers.get(event_type, [])
+    queue_durable = db is not None and settings.EVENT_BUS_DURABLE
+    queued: list[Callable] = []
     for handler in handlers:
+        if queue_durable and _is_durable(handler):
+            queued.append(handler)
+            continue
         try:
             await handler(event_type, payload)
         except Exception as e:
             logger.error("Event handler error for %s: %s", event_type, e)
+    if queued and db is not None:
+        # Round-trip through JSON so inline and outbox deliveries see the same shape.
+        stored = json.loads(json.dumps(payload, default=str))
+        now = datetime.now(UTC)
+        key = _ordering_key(payload)
+        db.add_all([
+            EventOutbox(
+                event_type=event_type,
+                handler=handler_name(handler),
+                ordering_key=key,
+                payload=stored,
+                next_attempt_at=now,
+                created_at=now,
+            )
+            for handler in queued
+        ])
+        await db.flush()
+        # Wake the dispatcher as soon as the rows are visible, not on its next poll.
+        from src.events.dispatcher import notify_dispatcher
+        event.listen(db.sync_session, "after_commit", notify_dispatcher, once=True)
 
 
 def clear_handlers() -> None:
     """Clear all registered handlers. Useful for testing."""
     _handlers.clear()
+    _durable_handlers.clear()
 
 
 def get_handlers(event_type: str) -> list[Callable]:
@@ -16,6 +16,7 @@ from src.core.router_utils import (
     raise_forbidden,
     raise_not_found,
 )
+from src.core.share_permissions import shared_with_clause
 from src.filters.models import SavedFilter
 from src.filters.schemas import (
     AggregateRequest,
@@ -148,12 +149,10 @@ def _apply_owner_scope(query, model, data_scope: DataScope):
         raise_forbidden(
             "This entity type cannot be aggregated by non-privileged users"
         )
-    shared_ids = data_scope.get_shared_ids(model.__tablename__)
-    if shared_ids:
-        return query.where(
-            or_(model.owner_id == data_scope.owner_id, model.id.in_(shared_ids))
-        )
-    return query.where(model.owner_id == data_scope.owner_id)
+    shared = data_scope.shared_scope(model.__tablename__)
+    return query.where(
+        or_(model.owner_id == data_scope.owner_id, shared_with_clause(model.id, shared))
+    )
 
 
 def _apply_default_visibility_scope(query, model):
@@ -3,7 +3,7 @@
 import csv
 import io
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator
 from datetime import datetime
 from difflib import SequenceMatcher
 from typing import Any, Literal
@@ -35,6 +35,10 @@ MergeStrategy = Literal["preserve_existing", "overwrite_all"]
 ALLOWED_MATCH_KEYS: tuple[str, ...] = ("none", "email", "phone", "name_plus_company")
 ALLOWED_MERGE_STRATEGIES: tuple[str, ...] = ("preserve_existing", "overwrite_all")
 
+# Rows fetched per server-side cursor round trip during export; each batch
+# becomes one CSV chunk on the wire.
+EXPORT_BATCH_SIZE = 1000
+
 # Fields the import pipeline must never overwrite on an existing row — the
 # AuditableMixin owns created_at / created_by_id, and ownership is set by
 # explicit reassign flows, never by an upload.
@@ -138,25 +142,44 @@ class CSVHandler:
     # ------------------------------------------------------------------
 
     async def export_contacts(self, user_id: int | None = None) -> str:
-        query = select(Contact)
-        if user_id:
-            query = query.where(Contact.owner_id == user_id)
-        result = await self.db.execute(query)
-        return self._to_csv(result.scalars().all(), self.CONTACT_FIELDS)
+        return await self._export_to_string("contacts", user_id)
 
     async def export_companies(self, user_id: int | None = None) -> str:
-        query = select(Company)
-        if user_id:
-            query = query.where(Company.owner_id == user_id)
-        result = await self.db.execute(query)
-        return self._to_csv(result.scalars().all(), self.COMPANY_FIELDS)
+        return await self._export_to_string("companies", user_id)
 
     async def export_leads(self, user_id: int | None = None) -> str:
-        query = select(Lead)
+        return await self._export_to_string("leads", user_id)
+
+    async def iter_export_chunks(
+        self,
+        entity_type: str,
+        user_id: int | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[str]:
+        """Yield the export CSV as text chunks: the header, then one per batch.
+
+        Selects only the exported columns and reads them through a
+        server-side cursor, so memory stays flat however many rows match.
+        """
+        model = self._get_model(entity_type)
+        fields = self._get_fields(entity_type)
+        query = select(*(getattr(model, field) for field in fields))
         if user_id:
-            query = query.where(Lead.owner_id == user_id)
-        result = await self.db.execute(query)
-        return self._to_csv(result.scalars().all(), self.LEAD_FIELDS)
+            query = query.where(model.owner_id == user_id)
+        query = query.order_by(model.id).execution_options(yield_per=batch_size)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        yield self._drain(buffer)
+
+        result = await self.db.stream(query)
+        async for rows in result.partitions():
+            writer.writerows([self._export_cell(value) for value in row] for row in rows)
+            yield self._drain(buffer)
+
+    async def _export_to_string(self, entity_type: str, user_id: int | None) -> str:
+        return "".join([chunk async for chunk in self.iter_export_chunks(entity_type, user_id)])
 
     # ------------------------------------------------------------------
     # Import
@@ -500,23 +523,21 @@ class CSVHandler:
             return "'" + value
         return value
 
-    def _to_csv(self, entities: Sequence[Any], fields: list[str]) -> str:
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=fields)
-        writer.writeheader()
-        for entity in entities:
-            row = {}
-            for field in fields:
-                value = getattr(entity, field, None)
-                if value is not None:
-                    if isinstance(value, datetime):
-                        value = value.isoformat()
-                cell = value or ""
-                if isinstance(cell, str):
-                    cell = self._sanitize_csv_value(cell)
-                row[field] = cell
-            writer.writerow(row)
-        return output.getvalue()
+    @classmethod
+    def _export_cell(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        cell = value or ""
+        if isinstance(cell, str):
+            cell = cls._sanitize_csv_value(cell)
+        return cell
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
 
     async def _get_existing_names(self, entity_class: type) -> set[str]:
         if not hasattr(entity_class, "name"):
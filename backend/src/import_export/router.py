@@ -2,6 +2,10 @@
 
 import io
 import json
+import logging
+import zlib
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
@@ -21,6 +25,8 @@ from src.import_export.csv_handler import (
 )
 from src.roles.service import RoleService
 
+logger = logging.getLogger(__name__)
+
 MAX_CSV_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
 
@@ -118,23 +124,62 @@ class BulkDeleteRequest(BaseModel):
 
 
 # Export endpoints
+def _export_response(entity_type: str, owner_id: int | None, compress: bool) -> StreamingResponse:
+    """Stream an entity export as CSV (or gzipped CSV) from a server-side cursor.
+
+    Bytes start flowing after the first batch; neither the rows nor the
+    CSV text are ever held in memory whole. The body is sent after the
+    request's session has been closed, so the cursor runs on its own.
+    """
+
+    async def generate() -> AsyncIterator[bytes]:
+        from src.database import async_session_maker
+
+        # wbits=31 -> gzip container, so the download opens with any gunzip.
+        compressor = zlib.compressobj(wbits=31) if compress else None
+
+        def encode(text: str) -> bytes:
+            data = text.encode("utf-8")
+            return compressor.compress(data) if compressor else data
+
+        # Headers are already sent once the cursor is open; a mid-stream
+        # failure must not leave a clean-looking partial file.
+        try:
+            async with async_session_maker() as session:
+                handler = CSVHandler(session)
+                async for chunk in handler.iter_export_chunks(entity_type, user_id=owner_id):
+                    data = encode(chunk)
+                    if data:
+                        yield data
+        except Exception as exc:  # noqa: BLE001 - need to surface any cursor error
+            logger.exception("%s CSV export failed mid-stream", entity_type)
+            yield encode(
+                f"\n# EXPORT TRUNCATED at {datetime.now(UTC).isoformat()} — "
+                f"{type(exc).__name__}: retry the export.\n"
+            )
+        if compressor:
+            yield compressor.flush()
+
+    filename = f"{entity_type}_export.csv" + (".gz" if compress else "")
+    return StreamingResponse(
+        generate(),
+        media_type="application/gzip" if compress else "text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Cache-Control": "no-store",
+        },
+    )
+
+
 @router.get("/export/contacts")
 async def export_contacts(
     current_user: CurrentUser,
     db: DBSession,
     data_scope: Annotated[DataScope, Depends(get_data_scope)],
+    gzip: bool = False,
 ):
     """Export contacts as CSV (respects role-based data scoping)."""
-    handler = CSVHandler(db)
-    csv_content = await handler.export_contacts(user_id=data_scope.owner_id)
-
-    return StreamingResponse(
-        io.StringIO(csv_content),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=contacts_export.csv"
-        },
-    )
+    return _export_response("contacts", data_scope.owner_id, gzip)
 
 
 @router.get("/export/companies")
@@ -142,18 +187,10 @@ async def export_companies(
     current_user: CurrentUser,
     db: DBSession,
     data_scope: Annotated[DataScope, Depends(get_data_scope)],
+    gzip: bool = False,
 ):
     """Export companies as CSV (respects role-based data scoping)."""
-    handler = CSVHandler(db)
-    csv_content = await handler.export_companies(user_id=data_scope.owner_id)
-
-    return StreamingResponse(
-        io.StringIO(csv_content),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=companies_export.csv"
-        },
-    )
+    return _export_response("companies", data_scope.owner_id, gzip)
 
 
 @router.get("/export/leads")
@@ -161,18 +198,10 @@ async def export_leads(
     current_user: CurrentUser,
     db: DBSession,
     data_scope: Annotated[DataScope, Depends(get_data_scope)],
+    gzip: bool = False,
 ):
     """Export leads as CSV (respects role-based data scoping)."""
-    handler = CSVHandler(db)
-    csv_content = await handler.export_leads(user_id=data_scope.owner_id)
-
-    return StreamingResponse(
-        io.StringIO(csv_content),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=leads_export.csv"
-        },
-    )
+    return _export_response("leads", data_scope.owner_id, gzip)
 
 
 # Import endpoints
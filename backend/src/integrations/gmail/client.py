@@ -10,6 +10,7 @@ from email.utils import getaddresses, parsedate_to_datetime
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.integrations.gmail.inline_images import store_inline_image
 from src.integrations.gmail.models import GmailConnection
 
 logger = logging.getLogger(__name__)
@@ -45,12 +46,12 @@ class GmailClient:
         if self._own_http:
             await self._http.aclose()
 
-    async def _refresh_if_needed(self) -> None:
+    async def _refresh_if_needed(self, min_valid: timedelta = timedelta(0)) -> None:
         now = datetime.now(UTC)
         expiry = self._conn.token_expiry
         if expiry is not None and expiry.tzinfo is None:
             expiry = expiry.replace(tzinfo=UTC)
-        if expiry is not None and expiry > now:
+        if expiry is not None and expiry > now + min_valid:
             return
         if not self._conn.refresh_token:
             return
@@ -87,6 +88,15 @@ class GmailClient:
         self._db.add(self._conn)
         await self._db.commit()
 
+    async def ensure_token(self, min_valid: timedelta) -> None:
+        """Refresh now unless the access token stays valid for ``min_valid``.
+
+        Call before fanning out concurrent requests: a refresh commits the
+        connection on the shared session, which must not happen from
+        several coroutines at once.
+        """
+        await self._refresh_if_needed(min_valid)
+
     def _auth_headers(self) -> dict:
         return {"Authorization": f"Bearer {self._conn.access_token}"}
 
@@ -174,26 +184,27 @@ class GmailClient:
 
         # Hydrate any inline image parts that Gmail returned without inline
         # data (attachment_id only). This happens for images above Gmail's
-        # ~2MB inline-embed threshold. After hydration, re-run CID substitution
-        # so the HTML body gets the data: URIs populated.
-        raw_attachments = _walk_attachments(data.get("payload", {}))
+        # ~2MB inline-embed threshold. Then swap the HTML's cid: refs for
+        # stored-image URLs so the browser can render them.
+        attachments = _walk_attachments(data.get("payload", {}))
         needs_hydration = any(
             a["attachment_id"] and not a["data"] and (a["mime_type"] or "").startswith("image/")
-            for a in raw_attachments
+            for a in attachments
         )
         if needs_hydration:
-            hydrated = await _hydrate_inline_attachments(self, message_id, raw_attachments)
-            if parsed.get("body_html"):
-                try:
-                    parsed["body_html"] = _inline_cid_images(
-                        parsed["body_html"], hydrated, gmail_msg_id=message_id,
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    logger.warning(
-                        "[gmail_get_message] post-hydration cid substitution failed "
-                        "gmail_msg_id=%s: %s",
-                        message_id, exc,
-                    )
+            attachments = await _hydrate_inline_attachments(self, message_id, attachments)
+        if parsed.get("body_html"):
+            # Falls back to the original HTML on any error — we'd rather
+            # show the surrounding text than nothing.
+            try:
+                parsed["body_html"] = await _embed_inline_images(
+                    parsed["body_html"], attachments, gmail_msg_id=message_id,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "[gmail_get_message] inline-cid substitution failed gmail_msg_id=%s: %s",
+                    message_id, exc,
+                )
 
         return parsed
 
@@ -233,32 +244,44 @@ class GmailClient:
                 out.append(addr)
         return out
 
+    async def list_message_page(
+        self, query: str, page_token: str | None = None
+    ) -> tuple[list[str], str | None, int]:
+        """One page (up to 500) of messages.list for ``query``.
+
+        Returns ``(message_ids, next_page_token, result_size_estimate)``;
+        ``next_page_token`` is None on the last page.
+        """
+        params: dict = {"q": query, "maxResults": 500}
+        if page_token:
+            params["pageToken"] = page_token
+        data = await self._get("users/me/messages", **params)
+        ids = [m["id"] for m in data.get("messages", []) if m.get("id")]
+        return ids, data.get("nextPageToken") or None, int(data.get("resultSizeEstimate") or 0)
+
     async def list_messages_since(self, start_date: "datetime") -> list[str]:
         """Return all Gmail message IDs after start_date via messages.list pagination.
 
         Uses the Gmail search query `after:YYYY/MM/DD` so only messages from
         start_date onward are included. Returns raw message IDs (not full messages).
         """
-        q = f"after:{start_date.strftime('%Y/%m/%d')}"
+        q = messages_after_query(start_date)
         ids: list[str] = []
         page_token: str | None = None
 
         while True:
-            params: dict = {"q": q, "maxResults": 500}
-            if page_token:
-                params["pageToken"] = page_token
-
-            data = await self._get("users/me/messages", **params)
-            for m in data.get("messages", []):
-                if m.get("id"):
-                    ids.append(m["id"])
-            page_token = data.get("nextPageToken")
+            page_ids, page_token, _ = await self.list_message_page(q, page_token)
+            ids.extend(page_ids)
             if not page_token:
                 break
 
         return ids
 
 
+def messages_after_query(start_date: datetime) -> str:
+    """Gmail search query for messages on or after ``start_date``'s day."""
+    return f"after:{start_date.strftime('%Y/%m/%d')}"
+
 
 def _parse_message(data: dict) -> dict:
     payload = data.get("payload", {})
@@ -267,24 +290,6 @@ def _parse_message(data: dict) -> dict:
     body_text, body_html = _extract_body(payload)
     attachments = _walk_attachments(payload)
 
-    # Substitute Content-ID references in the HTML body with inline data URIs
-    # so the browser can actually render embedded images. Without this, the
-    # canonical Gmail HTML email — which references its inline logo/photo
-    # attachments via <img src="cid:..."> — renders as broken-image icons
-    # in the EmailThread view. Falls back to the original HTML on any
-    # decode error (we'd rather show the surrounding text than nothing).
-    if body_html:
-        try:
-            body_html = _inline_cid_images(
-                body_html, attachments, gmail_msg_id=data.get("id"),
-            )
-        except Exception as exc:
-            logger.warning(
-                "[gmail_parse] inline-cid substitution failed for message %s: %s",
-                data.get("id"),
-                exc,
-            )
-
     date_str = headers.get("date", "")
     parsed_date = _parse_date(date_str)
 
@@ -294,8 +299,8 @@ def _parse_message(data: dict) -> dict:
     to_email = _first_address(to_header)
 
     # Strip the inline-only image data from the persisted attachment list
-    # — once it's substituted into the HTML body we don't need to keep a
-    # second copy on the row. Non-inline attachments (cid is None) keep
+    # — get_message stores it and points the HTML body at it, so we don't
+    # need a second copy on the row. Non-inline attachments (cid is None) keep
     # their metadata so a future "download attachment" UI has what it
     # needs to fetch from Gmail on demand.
     attachments_meta = [
@@ -369,8 +374,8 @@ async def _hydrate_inline_attachments(
     Decoded-bytes cap: Gmail's declared ``body.size`` is *advisory*
     (GUI uploads can mis-report). Re-checking the actual decoded
     byte length after fetch keeps a 5 MB image from sneaking past
-    the declared cap and bloating the inbound_emails row before
-    ``_inline_cid_images`` silently drops it.
+    the declared cap and being stored before ``_inline_image_payloads``
+    silently drops it.
     """
     # Single up-front refresh; all the concurrent get_attachment calls
     # below skip _refresh_if_needed because the token expiry is now
@@ -550,33 +555,25 @@ _CID_SRC_RE_UNQUOTED = re.compile(
 )
 
 
-def _inline_cid_images(
-    html: str,
+def _inline_image_payloads(
     attachments: list[dict],
     *,
     gmail_msg_id: str | None = None,
-) -> str:
-    """Replace ``<img src="cid:...">`` with embedded ``data:`` URIs.
+) -> dict[str, tuple[str, bytes]]:
+    """Decoded inline images keyed by lowercased Content-ID.
 
-    Only inline images whose payload is already in the message (``data``
-    field set, image/* mime type, under the size cap) are substituted.
-    Everything else stays as ``cid:...`` — those references still won't
-    render, but at least the HTML structure is preserved and the broken-
-    image icon is honest.
-
-    Handles both quoted and unquoted ``src=cid:`` syntaxes — Outlook on
-    Windows and some Apple Mail variants emit the unquoted form, which
-    a quoted-only matcher would silently leave broken.
+    Only parts whose payload is already in the message (``data`` field
+    set, image/* mime type, under the size cap) are returned; everything
+    else stays a ``cid:...`` reference — it still won't render, but at
+    least the HTML structure is preserved and the broken-image icon is
+    honest.
 
     ``gmail_msg_id`` is woven into the per-cid log lines so an operator
     chasing "Giancarlo's logo is broken on email X" can grep prod logs
     by message id instead of paging through every duplicate
     ``image001.png@…`` warning across the tenant.
     """
-    if not html or not attachments:
-        return html
-
-    cid_to_data_uri: dict[str, str] = {}
+    payloads: dict[str, tuple[str, bytes]] = {}
     for att in attachments:
         cid = att.get("cid")
         mime = att.get("mime_type") or ""
@@ -596,7 +593,6 @@ def _inline_cid_images(
             continue
         if len(decoded) > _MAX_INLINE_IMAGE_BYTES:
             continue
-        std_b64 = base64.b64encode(decoded).decode("ascii")
         key = cid.lower()
         # RFC 2392 forbids duplicate Content-IDs but real senders do it.
         # Last-wins keeps the existing behavior; warning level (not info)
@@ -604,21 +600,34 @@ def _inline_cid_images(
         # "wrong logo" report comes in. gmail_msg_id is the correlation
         # key — without it, ``image001.png@…`` collisions across the
         # tenant make the line useless to grep.
-        if key in cid_to_data_uri:
+        if key in payloads:
             logger.warning(
                 "[inline_cid] duplicate cid gmail_msg_id=%s cid=%s — last-wins",
                 gmail_msg_id, cid,
             )
-        cid_to_data_uri[key] = f"data:{mime};base64,{std_b64}"
+        payloads[key] = (mime, decoded)
+    return payloads
+
 
-    if not cid_to_data_uri:
+def _data_uri(mime: str, content: bytes) -> str:
+    return f"data:{mime};base64,{base64.b64encode(content).decode('ascii')}"
+
+
+def _substitute_cids(html: str, cid_to_src: dict[str, str]) -> str:
+    """Rewrite ``src`` / ``background`` ``cid:`` refs found in ``cid_to_src``.
+
+    Handles both quoted and unquoted ``src=cid:`` syntaxes — Outlook on
+    Windows and some Apple Mail variants emit the unquoted form, which
+    a quoted-only matcher would silently leave broken.
+    """
+    if not cid_to_src:
         return html
 
     def replace_quoted(match: re.Match[str]) -> str:
         attr = match.group(1)
         quote = match.group(2)
         cid = match.group(3).strip().lower()
-        uri = cid_to_data_uri.get(cid)
+        uri = cid_to_src.get(cid)
         if not uri:
             return match.group(0)
         return f"{attr}={quote}{uri}{quote}"
@@ -626,12 +635,11 @@ def _inline_cid_images(
     def replace_unquoted(match: re.Match[str]) -> str:
         attr = match.group(1)
         cid = match.group(2).strip().lower()
-        uri = cid_to_data_uri.get(cid)
+        uri = cid_to_src.get(cid)
         if not uri:
             return match.group(0)
         # Re-emit as quoted form so downstream HTML stays well-formed
-        # even if the substituted data: URI contains an attribute-
-        # boundary char.
+        # even if the substituted URI contains an attribute-boundary char.
         return f'{attr}="{uri}"'
 
     html = _CID_SRC_RE_QUOTED.sub(replace_quoted, html)
@@ -639,6 +647,29 @@ def _inline_cid_images(
     return html
 
 
+async def _embed_inline_images(
+    html: str,
+    attachments: list[dict],
+    *,
+    gmail_msg_id: str | None = None,
+) -> str:
+    """Point ``<img src="cid:...">`` refs at their stored images.
+
+    Each image is written once to content-addressed storage (see
+    ``inline_images``) and referenced by URL, so the row carries a short
+    link instead of the image bytes. Types that aren't stored, and any
+    image whose write fails, fall back to an embedded ``data:`` URI.
+    """
+    if not html or not attachments:
+        return html
+    payloads = _inline_image_payloads(attachments, gmail_msg_id=gmail_msg_id)
+    cid_to_src: dict[str, str] = {}
+    for cid, (mime, content) in payloads.items():
+        url = await store_inline_image(content, mime, gmail_msg_id=gmail_msg_id)
+        cid_to_src[cid] = url or _data_uri(mime, content)
+    return _substitute_cids(html, cid_to_src)
+
+
 def _decode_body(part: dict) -> str | None:
     raw = part.get("body", {}).get("data", "")
     if not raw:
@@ -0,0 +1,207 @@
+"""Content-addressed storage for images embedded in synced Gmail bodies.
+
+Inline ``cid:`` images used to be inlined into ``body_html`` as base64
+``data:`` URIs, so every inbox, search and thread query dragged up to a few
+MB of image bytes per row through Postgres and the ORM. They are now written
+once to object storage (R2, or ``uploads/email_inline/`` without R2 creds)
+under their SHA-256, and the HTML references
+``/api/integrations/gmail/inline-images/<sha256>.<ext>``. The same signature
+logo on a thousand emails is one object.
+
+Only the raster types in ``INLINE_SAFE_MIME_TYPES`` are stored — those are
+the only ones the serving route will render inline. Anything else (BMP,
+TIFF, SVG…) keeps its ``data:`` URI, as does any image whose write fails, so
+a storage outage degrades to the old behavior instead of a broken image.
+
+``<img>`` requests carry no bearer token, so the stored URL alone is not
+enough to fetch an image: email responses rewrite it to a signed URL
+(:func:`sign_inline_image_urls`) whose HMAC covers the name and an expiry,
+and the route rejects anything unsigned or expired. A body copied or
+forwarded out of the app stops loading images within
+``INLINE_IMAGE_URL_TTL_SECONDS``. Expiries are rounded to that window so
+re-rendering a thread reuses the browser's cached image.
+
+Storage calls are synchronous boto / disk calls so
+``scripts/migrate_inline_images.py`` can reuse them; async callers go
+through :func:`store_inline_image`.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import re
+import time
+import uuid
+from pathlib import Path
+
+from src.attachments.object_storage import _get_bucket_name, _get_r2_client
+from src.attachments.service import UPLOAD_DIR, _use_object_storage
+from src.config import settings
+from src.core.constants import CACHE_IMMUTABLE_ASSETS_MAX_AGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+INLINE_IMAGE_URL_PREFIX = "/api/integrations/gmail/inline-images/"
+
+# ``uploads/email_inline`` — sibling of the AttachmentService entity dirs.
+INLINE_IMAGE_DIR = UPLOAD_DIR / "email_inline"
+
+INLINE_IMAGE_EXTENSIONS: dict[str, str] = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+INLINE_IMAGE_MIME_TYPES: dict[str, str] = {
+    ext: mime for mime, ext in INLINE_IMAGE_EXTENSIONS.items()
+}
+
+INLINE_IMAGE_NAME_RE = re.compile(r"^[0-9a-f]{64}\.(png|jpg|gif|webp)$")
+# A stored (unsigned) image URL inside an email body.
+INLINE_IMAGE_URL_RE = re.compile(
+    re.escape(INLINE_IMAGE_URL_PREFIX) + r"([0-9a-f]{64}\.(?:png|jpg|gif|webp))(?![?\w.])"
+)
+
+# Signed URLs stay valid for one to two of these windows.
+INLINE_IMAGE_URL_TTL_SECONDS = 3600
+
+# Content-addressed, so the bytes behind a name never change; private because
+# the images come from users' mail and must not sit in shared caches.
+INLINE_IMAGE_CACHE_CONTROL = f"private, max-age={CACHE_IMMUTABLE_ASSETS_MAX_AGE_SECONDS}, immutable"
+
+# Names known to be stored, so a signature logo seen on every message costs
+# one HEAD per process instead of one per email. Cleared when full.
+_STORED_CACHE_LIMIT = 10_000
+_stored: set[str] = set()
+
+
+def inline_image_name(content: bytes, mime_type: str) -> str | None:
+    """``<sha256>.<ext>`` for a storable image, or None for other types."""
+    ext = INLINE_IMAGE_EXTENSIONS.get(mime_type.lower())
+    if ext is None:
+        return None
+    return f"{hashlib.sha256(content).hexdigest()}.{ext}"
+
+
+def inline_image_key(name: str) -> str:
+    """Object key (R2) / path under INLINE_IMAGE_DIR (disk) for ``name``."""
+    return f"email_inline/{name[:2]}/{name}"
+
+
+def inline_image_path(name: str) -> Path:
+    return INLINE_IMAGE_DIR / name[:2] / name
+
+
+def _url_signature(name: str, expires: int) -> str:
+    digest = hmac.new(
+        settings.SECRET_KEY.encode("utf-8"),
+        f"inline-image:{name}:{expires}".encode("ascii"),
+        hashlib.sha256,
+    ).digest()
+    return base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+
+def signed_inline_image_url(name: str, *, now: float | None = None) -> str:
+    """Servable URL for a stored image, valid until the end of the next TTL window."""
+    window = int(now if now is not None else time.time()) // INLINE_IMAGE_URL_TTL_SECONDS
+    expires = (window + 2) * INLINE_IMAGE_URL_TTL_SECONDS
+    return f"{INLINE_IMAGE_URL_PREFIX}{name}?expires={expires}&sig={_url_signature(name, expires)}"
+
+
+def sign_inline_image_urls(html: str | None) -> str | None:
+    """``html`` with every stored inline image URL replaced by a signed one."""
+    if not html or INLINE_IMAGE_URL_PREFIX not in html:
+        return html
+    now = time.time()
+    return INLINE_IMAGE_URL_RE.sub(
+        lambda match: signed_inline_image_url(match.group(1), now=now), html
+    )
+
+
+def verify_inline_image_url(name: str, expires: int, sig: str) -> bool:
+    """Whether ``sig`` signs ``name`` until ``expires`` and that is still ahead."""
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(sig, _url_signature(name, expires))
+
+
+def _object_stored(client, key: str) -> bool:
+    from botocore.exceptions import ClientError
+
+    try:
+        client.head_object(Bucket=_get_bucket_name(), Key=key)
+    except ClientError as exc:
+        response = getattr(exc, "response", None) or {}
+        err = response.get("Error", {}) if isinstance(response, dict) else {}
+        if err.get("Code") in ("NoSuchKey", "404", "NotFound"):
+            return False
+        raise
+    return True
+
+
+def store_inline_image_sync(content: bytes, mime_type: str) -> str | None:
+    """Write the image once under its digest and return its URL.
+
+    Returns None when the type is not storable. Storage errors propagate.
+    Re-writing an existing name is harmless (same bytes, same key), so two
+    workers racing on the same logo need no coordination.
+    """
+    name = inline_image_name(content, mime_type)
+    if name is None:
+        return None
+    if name not in _stored:
+        if _use_object_storage():
+            client = _get_r2_client()
+            key = inline_image_key(name)
+            if not _object_stored(client, key):
+                client.put_object(
+                    Bucket=_get_bucket_name(),
+                    Key=key,
+                    Body=content,
+                    ContentType=INLINE_IMAGE_MIME_TYPES[name.rsplit(".", 1)[1]],
+                    CacheControl=INLINE_IMAGE_CACHE_CONTROL,
+                )
+        else:
+            path = inline_image_path(name)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{name}.{uuid.uuid4().hex}.tmp")
+                tmp.write_bytes(content)
+                tmp.replace(path)
+        if len(_stored) >= _STORED_CACHE_LIMIT:
+            _stored.clear()
+        _stored.add(name)
+    return INLINE_IMAGE_URL_PREFIX + name
+
+
+def read_inline_image_sync(name: str) -> bytes:
+    """Bytes of a stored image. Raises if it is missing."""
+    if _use_object_storage():
+        response = _get_r2_client().get_object(
+            Bucket=_get_bucket_name(), Key=inline_image_key(name)
+        )
+        return response["Body"].read()
+    return inline_image_path(name).read_bytes()
+
+
+async def store_inline_image(
+    content: bytes,
+    mime_type: str,
+    *,
+    gmail_msg_id: str | None = None,
+) -> str | None:
+    """Async :func:`store_inline_image_sync` that never raises.
+
+    Returns None (caller keeps the ``data:`` URI) for unstorable types and
+    on any storage failure.
+    """
+    try:
+        return await asyncio.to_thread(store_inline_image_sync, content, mime_type)
+    except Exception as exc:  # noqa: BLE001 — fall back to embedding
+        logger.warning(
+            "[inline_image] store failed gmail_msg_id=%s mime=%s bytes=%d: %s",
+            gmail_msg_id, mime_type, len(content), exc,
+        )
+        return None
@@ -116,6 +116,11 @@ class GmailBackfillState(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Resume point: the listing window's start and the messages.list page
+    # still to process. page_token stays set after a failed or interrupted
+    # run and is cleared once the last page is committed.
+    window_start: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    page_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
 
 class GmailSyncState(Base):
@@ -136,6 +141,16 @@ class GmailSyncState(Base):
     )
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     failure_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Per-account cadence, maintained by GmailSyncWorker.sync_account: the
+    # scheduler syncs the account once next_sync_at has passed.
+    next_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    sync_interval_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_activity_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_sync_duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -145,3 +160,7 @@ class GmailSyncState(Base):
         onupdate=func.now(),
         nullable=False,
     )
+
+    __table_args__ = (
+        Index("ix_gmail_sync_state_next_sync_at", "next_sync_at"),
+    )
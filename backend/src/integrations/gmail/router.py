@@ -4,6 +4,7 @@ import asyncio
 import hmac as _hmac
 import logging
 import secrets
+import time
 from datetime import UTC
 from typing import Annotated
 
@@ -293,7 +294,7 @@ async def gmail_backfill(
 
     # Atomically claim the slot here, before launching the task — otherwise
     # two concurrent POSTs both see status != 'running' and spawn duplicate
-    # workers, racing through _process_message on the same message ids.
+    # workers, racing through _ingest_messages on the same message ids.
     state.status = "running"
     await db.commit()
 
@@ -625,7 +626,7 @@ async def gmail_rehydrate_inline_images(
     _admin: Annotated[object, Depends(get_current_superuser)],
 ) -> GmailRehydrateInlineImagesResponse:
     """Admin-only: re-fetch existing inbound emails whose body_html still
-    contains ``cid:`` references and rewrite them to embedded data: URIs.
+    contains ``cid:`` references and rewrite them to stored inline images.
 
     Background: until PR-NEXT, the Gmail sync pipeline only extracted
     text bodies and ignored attachments — so any HTML email with an
@@ -641,8 +642,8 @@ async def gmail_rehydrate_inline_images(
          received on (matches the row's ``to_email`` against
          GmailConnection.email).
       3. Refetch the full message via Gmail's messages.get.
-      4. Re-parse — the new ``_parse_message`` runs the cid→data:
-         substitution and returns rewritten body_html plus
+      4. Re-parse — ``get_message`` stores the inline images, points
+         the cid: refs at them and returns rewritten body_html plus
          attachments metadata.
       5. UPDATE the row only if body_html actually changed.
 
@@ -865,3 +866,63 @@ async def gmail_disconnect(
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="No Gmail connection found")
     await db.commit()
     return {"disconnected": True}
+
+
+@router.get("/inline-images/{name}")
+async def gmail_inline_image(name: str, expires: int = 0, sig: str = ""):
+    """Serve an inline image stored by the Gmail sync (see ``inline_images``).
+
+    No bearer token: ``<img>`` requests from the thread view cannot send
+    one. Instead the URL must carry the expiring HMAC that email responses
+    add (``sign_inline_image_urls``); a missing, forged or lapsed
+    signature is a 403. Only the raster types the sync stores are served,
+    always with their own content type and ``nosniff``.
+    """
+    from fastapi.responses import FileResponse, RedirectResponse
+
+    from src.attachments.object_storage import get_download_url
+    from src.attachments.service import _use_object_storage
+    from src.integrations.gmail.inline_images import (
+        INLINE_IMAGE_MIME_TYPES,
+        INLINE_IMAGE_NAME_RE,
+        inline_image_key,
+        inline_image_path,
+        verify_inline_image_url,
+    )
+
+    if not INLINE_IMAGE_NAME_RE.match(name):
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Image not found")
+    if not verify_inline_image_url(name, expires, sig):
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN, detail="Image link is invalid or has expired"
+        )
+    mime_type = INLINE_IMAGE_MIME_TYPES[name.rsplit(".", 1)[1]]
+    # Never let a cached copy outlive the signed URL that fetched it.
+    max_age = max(0, expires - int(time.time()))
+
+    if _use_object_storage():
+        url = await get_download_url(
+            inline_image_key(name),
+            filename=name,
+            content_type=mime_type,
+            disposition="inline",
+        )
+        # The presigned URL lives an hour; let the browser reuse the
+        # redirect for most of that instead of re-signing per render.
+        return RedirectResponse(
+            url=url,
+            status_code=307,
+            headers={"Cache-Control": f"private, max-age={min(3000, max_age)}"},
+        )
+
+    path = inline_image_path(name)
+    if not path.exists():
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Image not found")
+    return FileResponse(
+        path=str(path),
+        media_type=mime_type,
+        headers={
+            "X-Content-Type-Options": "nosniff",
+            "Cache-Control": f"private, max-age={max_age}, immutable",
+        },
+    )
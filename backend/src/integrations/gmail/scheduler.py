@@ -1,26 +1,244 @@
-"""Gmail sync scheduler hook.
+"""Per-account Gmail sync scheduling.
 
-The project uses a consolidated APScheduler tick in backend/src/core/scheduler.py.
-Call schedule_gmail_sync(scheduler) from there (or from start_scheduler) to register
-the gmail sync job at the same 90-second cadence.
+``core/scheduler.py`` calls :func:`_sync_gmail_accounts` every
+``GMAIL_SYNC_TICK_SECONDS``. Each tick claims as many of the non-revoked
+connections whose ``GmailSyncState.next_sync_at`` has passed (or that were
+never synced) as this process has free slots under
+``GMAIL_SYNC_CONCURRENCY``, and starts their syncs as background tasks.
+Accounts left unclaimed stay due for the next tick, or for another process.
+``GmailSyncWorker.sync_account`` then sets each account's next poll from
+what it found, so busy mailboxes are polled often and idle ones back off.
 
-If you prefer to wire it inline, just add:
-    await _sync_gmail_accounts()
-inside _background_tick in core/scheduler.py.
+A tick only claims and spawns, so it returns in milliseconds: a slow
+mailbox holds one slot instead of delaying every other account, and the
+job's ``coalesce=True`` no longer drops anyone's poll.
 """
 
+import asyncio
 import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler  # pyright: ignore[reportMissingImports]
 from apscheduler.triggers.interval import IntervalTrigger  # pyright: ignore[reportMissingImports]
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.database as _db
+from src.config import settings
+from src.integrations.gmail.models import GmailConnection, GmailSyncState
 
 logger = logging.getLogger(__name__)
 
+# A claimed account is not claimed again — by this or another process —
+# until its sync sets the real next poll or this lease runs out.
+_CLAIM_LEASE = timedelta(minutes=10)
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+async def claim_due_connections(
+    db: AsyncSession,
+    now: datetime,
+    *,
+    exclude: set[int] | None = None,
+    limit: int | None = None,
+) -> list[GmailConnection]:
+    """Up to ``limit`` non-revoked connections due for a sync, oldest due first.
+
+    Due accounts are leased by pushing ``next_sync_at`` out with one
+    ``UPDATE … RETURNING`` that re-checks the due condition, so two
+    processes ticking together never sync the same mailbox twice.
+    Connections without a sync-state row are returned unclaimed; their
+    first sync creates it.
+    """
+    due = or_(GmailSyncState.next_sync_at.is_(None), GmailSyncState.next_sync_at <= now)
+    query = (
+        select(GmailConnection, GmailSyncState.id)
+        .outerjoin(GmailSyncState, GmailSyncState.user_id == GmailConnection.user_id)
+        .where(
+            GmailConnection.revoked_at.is_(None),
+            or_(GmailSyncState.id.is_(None), due),
+        )
+        .order_by(GmailSyncState.next_sync_at.asc().nulls_first(), GmailConnection.id)
+    )
+    if exclude:
+        query = query.where(GmailConnection.user_id.not_in(exclude))
+    if limit is not None:
+        query = query.limit(limit)
+    rows = (await db.execute(query)).all()
+
+    with_state = [conn.user_id for conn, state_id in rows if state_id is not None]
+    claimed: set[int] = set()
+    if with_state:
+        result = await db.execute(
+            update(GmailSyncState)
+            .where(GmailSyncState.user_id.in_(with_state), due)
+            .values(next_sync_at=now + _CLAIM_LEASE)
+            .returning(GmailSyncState.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = set(result.scalars())
+        await db.commit()
+    return [conn for conn, state_id in rows if state_id is None or conn.user_id in claimed]
+
+
+async def sync_lag(db: AsyncSession, now: datetime | None = None) -> list[dict[str, Any]]:
+    """Per-account sync health for every non-revoked connection.
+
+    ``lag_seconds`` is how long ago the account was last synced — an upper
+    bound on how stale its replies in the CRM can be. ``overdue_seconds`` is
+    how far past its scheduled poll it is; above a tick or two it means the
+    concurrency cap is saturated.
+    """
+    now = now or datetime.now(UTC)
+    result = await db.execute(
+        select(
+            GmailConnection.user_id,
+            GmailConnection.email,
+            GmailSyncState.last_synced_at,
+            GmailSyncState.next_sync_at,
+            GmailSyncState.sync_interval_seconds,
+            GmailSyncState.last_sync_duration_ms,
+            GmailSyncState.last_activity_at,
+            GmailSyncState.failure_count,
+        )
+        .outerjoin(GmailSyncState, GmailSyncState.user_id == GmailConnection.user_id)
+        .where(GmailConnection.revoked_at.is_(None))
+        .order_by(GmailConnection.user_id)
+    )
+    accounts = []
+    for row in result.all():
+        last_synced_at = _aware(row.last_synced_at)
+        next_sync_at = _aware(row.next_sync_at)
+        accounts.append({
+            "user_id": row.user_id,
+            "email": row.email,
+            "last_synced_at": last_synced_at,
+            "next_sync_at": next_sync_at,
+            "lag_seconds": (
+                round((now - last_synced_at).total_seconds(), 1) if last_synced_at else None
+            ),
+            "overdue_seconds": (
+                round(max(0.0, (now - next_sync_at).total_seconds()), 1) if next_sync_at else None
+            ),
+            "interval_seconds": row.sync_interval_seconds,
+            "last_duration_ms": row.last_sync_duration_ms,
+            "last_activity_at": _aware(row.last_activity_at),
+            "failure_count": row.failure_count or 0,
+        })
+    return accounts
+
+
+class GmailSyncScheduler:
+    """Runs due Gmail account syncs concurrently under a process-wide cap."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+        *,
+        concurrency: int | None = None,
+    ):
+        self._session_maker = session_maker
+        self.concurrency = max(1, concurrency or settings.GMAIL_SYNC_CONCURRENCY)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight: dict[int, asyncio.Task] = {}
+        self._started = 0
+        self._failed = 0
+
+    def _sessions(self) -> async_sessionmaker[AsyncSession]:
+        # Resolved lazily so test fixtures that swap src.database's maker apply.
+        return self._session_maker or _db.async_session_maker
+
+    async def tick(self, now: datetime | None = None) -> int:
+        """Start syncs for due accounts, up to the free concurrency slots.
+
+        Only as many accounts are claimed (and leased) as can start right
+        away, like ``OutboxDispatcher._run``; the rest wait for a later
+        tick instead of sitting on a lease behind the semaphore.
+        Returns the number of syncs started; does not wait for them.
+        """
+        free = self.concurrency - len(self._in_flight)
+        if free <= 0:
+            return 0
+        now = now or datetime.now(UTC)
+        async with self._sessions()() as db:
+            connections = await claim_due_connections(
+                db, now, exclude=set(self._in_flight), limit=free
+            )
+        for connection in connections:
+            self._start(connection)
+        return len(connections)
+
+    async def run_all(self) -> None:
+        """Sync every non-revoked account now, ignoring cadence, and wait."""
+        async with self._sessions()() as db:
+            result = await db.execute(
+                select(GmailConnection).where(GmailConnection.revoked_at.is_(None))
+            )
+            connections = result.scalars().all()
+        for connection in connections:
+            if connection.user_id not in self._in_flight:
+                self._start(connection)
+        await self.wait_idle()
+
+    async def wait_idle(self) -> None:
+        """Wait until no account sync is running."""
+        while self._in_flight:
+            await asyncio.gather(*list(self._in_flight.values()), return_exceptions=True)
+
+    def _start(self, connection: GmailConnection) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        user_id = connection.user_id
+        task = asyncio.create_task(self._sync_one(connection))
+        self._in_flight[user_id] = task
+        task.add_done_callback(lambda _task: self._in_flight.pop(user_id, None))
+        self._started += 1
+
+    async def _sync_one(self, connection: GmailConnection) -> None:
+        from src.integrations.gmail.sync import GmailSyncWorker
+
+        assert self._semaphore is not None
+        async with self._semaphore:
+            try:
+                async with self._sessions()() as db:
+                    await GmailSyncWorker.sync_account(connection, db)
+            except Exception as exc:
+                # sync_account has already recorded the failure and pushed
+                # the account's next poll out; one mailbox must not take
+                # the scheduler down.
+                self._failed += 1
+                logger.error("[gmail_sync] user_id=%s error: %s", connection.user_id, exc)
+
+    def syncing_user_ids(self) -> set[int]:
+        return set(self._in_flight)
+
+    def stats(self) -> dict[str, Any]:
+        """In-process counters: the cap, running syncs, and totals since start."""
+        return {
+            "concurrency": self.concurrency,
+            "in_flight": len(self._in_flight),
+            "started": self._started,
+            "failed": self._failed,
+        }
+
+
+# Process-wide scheduler; its semaphore is created on first use, inside the loop.
+gmail_sync_scheduler = GmailSyncScheduler()
+
+
+def get_gmail_sync_scheduler() -> GmailSyncScheduler:
+    return gmail_sync_scheduler
+
 
 async def _sync_gmail_accounts() -> None:
-    from src.integrations.gmail.sync import GmailSyncWorker
     try:
-        await GmailSyncWorker.sync_all_active()
+        await get_gmail_sync_scheduler().tick()
     except Exception as exc:
         logger.error("[gmail_sync] tick error: %s", exc)
 
@@ -29,10 +247,10 @@ def schedule_gmail_sync(scheduler: AsyncIOScheduler) -> None:
     """Add the gmail_sync job to an existing APScheduler instance."""
     scheduler.add_job(
         _sync_gmail_accounts,
-        trigger=IntervalTrigger(seconds=90),
+        trigger=IntervalTrigger(seconds=settings.GMAIL_SYNC_TICK_SECONDS),
         id="gmail_sync",
         replace_existing=True,
         coalesce=True,
         max_instances=1,
     )
-    logger.info("Gmail sync job registered (every 90s)")
+    logger.info("Gmail sync job registered (tick every %ss)", settings.GMAIL_SYNC_TICK_SECONDS)
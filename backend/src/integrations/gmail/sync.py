@@ -3,13 +3,21 @@
 import asyncio
 import logging
 import re
+import time
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select
+import httpx
+from sqlalchemy import select, union
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.integrations.gmail.client import GmailAuthError, GmailClient, GmailMessageNotFound
+from src.config import settings
+from src.integrations.gmail.client import (
+    GmailAuthError,
+    GmailClient,
+    GmailMessageNotFound,
+    messages_after_query,
+)
 from src.integrations.gmail.models import GmailBackfillState, GmailConnection, GmailSyncState
 
 # Strips HTML tags so a body_html-only message produces a readable snippet
@@ -32,13 +40,19 @@ def _strip_html_to_text(html: str) -> str:
     no_tags = _HTML_TAG_RE.sub(" ", html)
     return _WHITESPACE_RE.sub(" ", no_tags).strip()
 
-# Backfill loop is deliberately sequential (per-message awaits in a for-
-# loop) so we don't bombard Gmail's per-account rate limits. Removed a
-# module-level Semaphore that was process-wide and shared across users —
-# under the sequential loop it never throttled anything, but if anyone
-# ever switches to asyncio.gather() it would silently serialize across
-# tenants. If concurrency comes back, instantiate the Semaphore inside
-# `backfill()` so the limit is per-invocation.
+# Sync and backfill fetch at most this many messages per connection at
+# once. The Semaphore is created per batch, never at module level, so one
+# user's sync can't throttle another's.
+GMAIL_FETCH_CONCURRENCY = 10
+
+# Forward sync hands new message ids to _ingest_messages in batches of this
+# size, committing after each.
+_SYNC_BATCH_SIZE = 500
+
+# Before a batch's concurrent fetches, refresh the access token if it
+# expires within this margin — a refresh commits on the shared session,
+# which must not happen from several fetches at once.
+_FETCH_TOKEN_MARGIN = timedelta(minutes=10)
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +60,16 @@ logger = logging.getLogger(__name__)
 class GmailSyncWorker:
 
     @staticmethod
-    async def sync_account(connection: GmailConnection, db: AsyncSession) -> None:
-        """Sync one Gmail account forward from its last known historyId."""
+    async def sync_account(connection: GmailConnection, db: AsyncSession) -> int:
+        """Sync one Gmail account forward from its last known historyId.
+
+        New messages are fetched concurrently and stored in batches. Also
+        sets the account's next poll (see ``_schedule_next``). Returns the
+        number of new message ids Gmail reported.
+        """
         state = await _get_or_create_state(connection, db)
         client = GmailClient(connection, db)
+        started = time.perf_counter()
 
         try:
             if state.last_history_id is None:
@@ -59,48 +79,45 @@ class GmailSyncWorker:
                 state.last_synced_at = datetime.now(UTC)
                 state.failure_count = 0
                 state.last_error = None
+                _schedule_next(state, started)
                 db.add(state)
                 await db.commit()
-                return
+                return 0
 
             history_records = await client.list_history_since(state.last_history_id)
             max_history_id = state.last_history_id
 
+            msg_ids: list[str] = []
             for record in history_records:
                 record_id = str(record.get("id", ""))
                 if record_id and record_id > max_history_id:
                     max_history_id = record_id
 
                 for added in record.get("messagesAdded", []):
-                    msg_meta = added.get("message", {})
-                    msg_id = msg_meta.get("id")
-                    if not msg_id:
-                        continue
-                    try:
-                        await _process_message(msg_id, connection, client, db)
-                    except GmailMessageNotFound:
-                        logger.info(
-                            "[gmail_sync] user_id=%s message_id=%s skipped: message no longer available",
-                            connection.user_id, msg_id,
-                        )
-                    except GmailAuthError:
-                        # Token was revoked mid-sync. Let it propagate to
-                        # the outer handler so the connection flips to
-                        # revoked_at — otherwise the UI keeps reading
-                        # "Connected" while every poll silently fails 401.
-                        raise
-                    except Exception as exc:
-                        logger.error(
-                            "[gmail_sync] user_id=%s message_id=%s error: %s",
-                            connection.user_id, msg_id, exc,
-                        )
+                    msg_id = added.get("message", {}).get("id")
+                    if msg_id:
+                        msg_ids.append(msg_id)
+            # A message can appear in several history records.
+            msg_ids = list(dict.fromkeys(msg_ids))
+
+            for i in range(0, len(msg_ids), _SYNC_BATCH_SIZE):
+                # GmailAuthError propagates to the handler below so the
+                # connection flips to revoked_at — otherwise the UI keeps
+                # reading "Connected" while every poll silently fails 401.
+                await _ingest_messages(
+                    msg_ids[i:i + _SYNC_BATCH_SIZE], connection, client, db,
+                    require_contact_link=False, log_tag="gmail_sync",
+                )
+                await db.commit()
 
             state.last_history_id = max_history_id
             state.last_synced_at = datetime.now(UTC)
             state.failure_count = 0
             state.last_error = None
+            _schedule_next(state, started, new_messages=len(msg_ids))
             db.add(state)
             await db.commit()
+            return len(msg_ids)
 
         except GmailAuthError as exc:
             # Google revoked / invalidated the credential. Flip the
@@ -117,6 +134,7 @@ class GmailSyncWorker:
         except Exception as exc:
             state.failure_count += 1
             state.last_error = str(exc)[:500]
+            _schedule_next(state, started, failed=True)
             db.add(state)
             await db.commit()
             raise
@@ -125,79 +143,94 @@ class GmailSyncWorker:
     async def backfill(connection: GmailConnection, db: AsyncSession, days: int = 365) -> None:
         """Backfill historical Gmail messages for a connection.
 
-        Walks messages.list since (now - days), calls _process_message for each
-        so thread-linking, contact matching, and entity resolution behave
-        identically to the forward-going sync. Idempotent: skips messages
-        whose gmail_message_id is already stored (checked via _is_duplicate on
-        the RFC Message-ID header after fetching the full message).
-
-        Throttled to at most 10 concurrent get_message calls. A small sleep
-        between pages avoids bursting the Gmail API quota.
+        Works through messages.list (since now - days) one page of up to
+        500 ids at a time, in stages:
+
+        1. ids already stored as an InboundEmail are dropped with one
+           ``IN`` lookup;
+        2. the rest are fetched concurrently, at most
+           ``GMAIL_FETCH_CONCURRENCY`` get_message calls in flight;
+        3. messages whose RFC Message-ID is already stored are dropped
+           with one lookup, and the others go through the same storage as
+           forward sync (thread-linking, contact matching, entity
+           resolution), contact-scoped;
+        4. the page's rows and the progress on GmailBackfillState are
+           committed together.
+
+        Resumable: a run that fails or is interrupted leaves
+        ``page_token`` on the state, and the next run over the same or a
+        narrower window continues from that page. Messages.list returns
+        newest first, so the pages already done cover the narrower window.
         """
         days = min(days, 3650)
-        start_date = datetime.now(UTC) - timedelta(days=days)
+        now = datetime.now(UTC)
+        start_date = now - timedelta(days=days)
 
         state = await _get_or_create_backfill_state(connection.user_id, db)
+        window_start = state.window_start
+        if window_start is not None and window_start.tzinfo is None:
+            window_start = window_start.replace(tzinfo=UTC)
+        resume = (
+            state.page_token is not None
+            and window_start is not None
+            and window_start.date() <= start_date.date()
+        )
+        if not resume:
+            state.window_start = start_date
+            state.page_token = None
+            state.processed_count = 0
+            state.total_count = 0
         state.status = "running"
-        state.started_at = datetime.now(UTC)
+        state.started_at = now
         state.finished_at = None
         state.error = None
-        state.processed_count = 0
-        state.total_count = 0
         db.add(state)
         await db.commit()
 
         try:
             async with GmailClient(connection, db) as client:
-                msg_ids = await client.list_messages_since(start_date)
-                state.total_count = len(msg_ids)
-                db.add(state)
-                await db.commit()
-
-                async def _fetch_one(msg_id: str) -> None:
+                query = messages_after_query(state.window_start)
+                page_token = state.page_token
+                while True:
                     try:
-                        # Backfill is contact-scoped: only persist messages that
-                        # link to a known contact (see _process_message docstring).
-                        await _process_message(
-                            msg_id, connection, client, db,
-                            require_contact_link=True,
+                        msg_ids, next_token, estimate = await client.list_message_page(
+                            query, page_token
                         )
-                    except GmailMessageNotFound:
+                    except httpx.HTTPStatusError as exc:
+                        if not (resume and page_token and exc.response.status_code == 400):
+                            raise
+                        # Gmail no longer accepts the saved page token;
+                        # start the window over — stored ids are skipped
+                        # cheaply by the first stage.
                         logger.info(
-                            "[gmail_backfill] user_id=%s message_id=%s skipped: message no longer available",
-                            connection.user_id, msg_id,
-                        )
-                    except GmailAuthError:
-                        raise
-                    except IntegrityError:
-                        # A racing forward-sync (or rerun) already wrote
-                        # this message under the unique constraint on
-                        # InboundEmail.resend_email_id ('gmail:<id>').
-                        # Treat as idempotent: rollback the failed insert
-                        # and move on so progress count stays accurate.
-                        await db.rollback()
-                        logger.debug(
-                            "[gmail_backfill] user_id=%s message_id=%s already stored (race), skipping",
-                            connection.user_id, msg_id,
-                        )
-                    except Exception as exc:
-                        logger.warning(
-                            "[gmail_backfill] user_id=%s message_id=%s error: %s",
-                            connection.user_id, msg_id, exc,
+                            "[gmail_backfill] user_id=%s resume token rejected, restarting window",
+                            connection.user_id,
                         )
+                        resume, page_token = False, None
+                        state.processed_count = 0
+                        state.total_count = 0
+                        continue
 
-                for i, msg_id in enumerate(msg_ids):
-                    await _fetch_one(msg_id)
-                    state.processed_count = i + 1
-                    # Flush progress to DB every 50 messages so the UI stays live.
-                    if (i + 1) % 50 == 0:
-                        db.add(state)
-                        await db.commit()
-                    # Yield to event loop briefly between pages of 500
-                    if (i + 1) % 500 == 0:
-                        await asyncio.sleep(0.1)
+                    if state.total_count == 0:
+                        state.total_count = estimate
+                    await _ingest_messages(
+                        msg_ids, connection, client, db,
+                        require_contact_link=True, log_tag="gmail_backfill",
+                    )
+                    state.processed_count += len(msg_ids)
+                    state.total_count = max(state.total_count, state.processed_count)
+                    state.page_token = next_token
+                    db.add(state)
+                    await db.commit()
+
+                    if not next_token:
+                        break
+                    page_token = next_token
+                    # Brief pause between pages avoids bursting the Gmail quota.
+                    await asyncio.sleep(0.1)
 
             state.status = "complete"
+            state.total_count = state.processed_count
             state.finished_at = datetime.now(UTC)
             db.add(state)
             await db.commit()
@@ -221,23 +254,14 @@ class GmailSyncWorker:
 
     @staticmethod
     async def sync_all_active() -> None:
-        """Iterate all non-revoked GmailConnections and sync each."""
-        import src.database as db_module
+        """Sync every non-revoked GmailConnection now, regardless of cadence.
 
-        async with db_module.async_session_maker() as db:
-            result = await db.execute(
-                select(GmailConnection).where(GmailConnection.revoked_at.is_(None))
-            )
-            connections = result.scalars().all()
+        The scheduler uses ``GmailSyncScheduler.tick`` instead, which only
+        syncs accounts that are due.
+        """
+        from src.integrations.gmail.scheduler import GmailSyncScheduler
 
-        for conn in connections:
-            try:
-                async with db_module.async_session_maker() as db:
-                    await GmailSyncWorker.sync_account(conn, db)
-            except Exception as exc:
-                logger.error(
-                    "[gmail_sync_all] user_id=%s error: %s", conn.user_id, exc
-                )
+        await GmailSyncScheduler().run_all()
 
 
 # ------------------------------------------------------------------
@@ -258,6 +282,39 @@ async def _get_or_create_backfill_state(
     return state
 
 
+def _schedule_next(
+    state: GmailSyncState,
+    started: float,
+    *,
+    new_messages: int = 0,
+    failed: bool = False,
+) -> None:
+    """Record how the sync went and when the account should be polled next.
+
+    New mail resets the interval to GMAIL_SYNC_MIN_INTERVAL_SECONDS; every
+    idle poll doubles it, up to GMAIL_SYNC_MAX_INTERVAL_SECONDS. Failures
+    back off from the maximum, doubling per consecutive failure up to
+    GMAIL_SYNC_FAILURE_MAX_SECONDS. ``started`` is the sync's
+    ``time.perf_counter()`` start.
+    """
+    now = datetime.now(UTC)
+    low = settings.GMAIL_SYNC_MIN_INTERVAL_SECONDS
+    high = max(low, settings.GMAIL_SYNC_MAX_INTERVAL_SECONDS)
+    if failed:
+        interval = min(
+            settings.GMAIL_SYNC_FAILURE_MAX_SECONDS,
+            high * 2 ** min(max(state.failure_count - 1, 0), 10),
+        )
+    elif new_messages:
+        interval = low
+        state.last_activity_at = now
+    else:
+        interval = min(high, max(low, (state.sync_interval_seconds or low) * 2))
+    state.sync_interval_seconds = interval
+    state.next_sync_at = now + timedelta(seconds=interval)
+    state.last_sync_duration_ms = int((time.perf_counter() - started) * 1000)
+
+
 async def _get_or_create_state(
     connection: GmailConnection, db: AsyncSession
 ) -> GmailSyncState:
@@ -272,31 +329,137 @@ async def _get_or_create_state(
     return state
 
 
-async def _is_duplicate(message_id: str, db: AsyncSession) -> bool:
-    """Return True if message_id already exists in email_queue or inbound_emails."""
-    from src.email.models import EmailQueue, InboundEmail
+async def _ingest_messages(
+    msg_ids: list[str],
+    connection: GmailConnection,
+    client: GmailClient,
+    db: AsyncSession,
+    *,
+    require_contact_link: bool,
+    log_tag: str,
+) -> None:
+    """Fetch and store a batch of Gmail ids; the caller commits.
 
-    eq = await db.execute(
-        select(EmailQueue.id).where(EmailQueue.message_id == message_id).limit(1)
-    )
-    if eq.scalar_one_or_none() is not None:
-        return True
+    Ids already stored as an InboundEmail are dropped with one lookup, the
+    rest fetched concurrently, and messages whose RFC Message-ID is
+    already stored dropped with a second lookup before storage.
+    """
+    stored = await _stored_gmail_ids(msg_ids, db)
+    pending = [msg_id for msg_id in msg_ids if msg_id not in stored]
+    if not pending:
+        return
 
-    ib = await db.execute(
-        select(InboundEmail.id).where(InboundEmail.message_id == message_id).limit(1)
+    messages = await _fetch_messages(pending, connection, client, log_tag=log_tag)
+    seen = await _stored_rfc_message_ids(
+        [msg["message_id"] for msg in messages if msg["message_id"]], db
     )
-    return ib.scalar_one_or_none() is not None
+    for msg in messages:
+        rfc_message_id = msg["message_id"]
+        if rfc_message_id:
+            if rfc_message_id in seen:
+                continue
+            seen.add(rfc_message_id)
+        try:
+            # Savepoint per message: a failure rolls back only this
+            # message, not the rest of the batch awaiting its commit.
+            async with db.begin_nested():
+                await _store_message(
+                    msg, connection, db, require_contact_link=require_contact_link
+                )
+        except IntegrityError:
+            # A racing sync already wrote this message under the unique
+            # constraint on InboundEmail.resend_email_id.
+            logger.debug(
+                "[%s] user_id=%s message_id=%s already stored (race), skipping",
+                log_tag, connection.user_id, msg["raw_payload"].get("id"),
+            )
+        except Exception as exc:
+            logger.warning(
+                "[%s] user_id=%s message_id=%s error: %s",
+                log_tag, connection.user_id, msg["raw_payload"].get("id"), exc,
+            )
 
 
-async def _process_message(
-    msg_id: str,
+async def _fetch_messages(
+    msg_ids: list[str],
     connection: GmailConnection,
     client: GmailClient,
+    *,
+    log_tag: str,
+) -> list[dict]:
+    """get_message for each id, at most GMAIL_FETCH_CONCURRENCY at once.
+
+    Keeps the order of ``msg_ids``; messages that vanished or failed to
+    fetch are logged and left out. GmailAuthError cancels the rest and
+    propagates.
+    """
+    await client.ensure_token(_FETCH_TOKEN_MARGIN)
+    semaphore = asyncio.Semaphore(GMAIL_FETCH_CONCURRENCY)
+
+    async def _fetch_one(msg_id: str) -> dict | None:
+        async with semaphore:
+            try:
+                return await client.get_message(msg_id)
+            except GmailMessageNotFound:
+                logger.info(
+                    "[%s] user_id=%s message_id=%s skipped: message no longer available",
+                    log_tag, connection.user_id, msg_id,
+                )
+            except GmailAuthError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "[%s] user_id=%s message_id=%s error: %s",
+                    log_tag, connection.user_id, msg_id, exc,
+                )
+            return None
+
+    tasks = [asyncio.create_task(_fetch_one(msg_id)) for msg_id in msg_ids]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return [msg for msg in results if msg is not None]
+
+
+async def _stored_gmail_ids(msg_ids: list[str], db: AsyncSession) -> set[str]:
+    """Gmail ids among ``msg_ids`` already stored as an InboundEmail."""
+    from src.email.models import InboundEmail
+
+    if not msg_ids:
+        return set()
+    result = await db.execute(
+        select(InboundEmail.resend_email_id).where(
+            InboundEmail.resend_email_id.in_([f"gmail:{msg_id}" for msg_id in msg_ids])
+        )
+    )
+    return {value.removeprefix("gmail:") for value in result.scalars()}
+
+
+async def _stored_rfc_message_ids(message_ids: list[str], db: AsyncSession) -> set[str]:
+    """RFC Message-IDs among ``message_ids`` already in email_queue or inbound_emails."""
+    from src.email.models import EmailQueue, InboundEmail
+
+    if not message_ids:
+        return set()
+    result = await db.execute(union(
+        select(EmailQueue.message_id).where(EmailQueue.message_id.in_(message_ids)),
+        select(InboundEmail.message_id).where(InboundEmail.message_id.in_(message_ids)),
+    ))
+    return set(result.scalars())
+
+
+async def _store_message(
+    msg: dict,
+    connection: GmailConnection,
     db: AsyncSession,
     *,
     require_contact_link: bool = False,
 ) -> None:
-    """Fetch + persist a single Gmail message.
+    """Persist a fetched message as sent (from one of our addresses) or inbound.
 
     ``require_contact_link=True`` (used by backfill) drops messages whose
     addresses don't map to any existing contact AND whose thread has no
@@ -304,12 +467,6 @@ async def _process_message(
     everything — contacts may be created later and a re-resolver pass
     can backfill the link.
     """
-    msg = await client.get_message(msg_id)
-    rfc_message_id = msg["message_id"]
-
-    if rfc_message_id and await _is_duplicate(rfc_message_id, db):
-        return
-
     from_addr = msg["from"]
     received_at: datetime = msg["date"] or datetime.now(UTC)
 
@@ -472,7 +629,7 @@ async def _store_inbound(
         participant_emails=recipients,
         # Non-inline attachments (filenames + sizes + Gmail attachment_id
         # so a future "download" UI can fetch them on demand). Inline
-        # images that already got embedded into body_html as data URIs
+        # images that body_html already points at (stored by get_message)
         # ARE included here too, marked is_inline=True, so the metadata
         # is symmetric and audit-traceable.
         attachments={"items": msg.get("attachments") or []} if msg.get("attachments") else None,
@@ -483,10 +640,10 @@ async def _store_inbound(
     # Notify users who are actual participants (To/CC) when an inbound reply
     # lands. Routing by Contact.owner_id would ping whoever imported the
     # contact even when they're not on the thread — a privacy leak.
-    # Wrapped in per-user SAVEPOINTs so a failure on one recipient cannot
-    # poison the parent transaction and silently destroy the InboundEmail row
-    # we just flushed (without the savepoint an exception leaves the session
-    # in ROLLBACK_REQUIRED state and the outer commit fails with
+    # Wrapped in a SAVEPOINT so a failed fan-out cannot poison the parent
+    # transaction and silently destroy the InboundEmail row we just flushed
+    # (without the savepoint an exception leaves the session in
+    # ROLLBACK_REQUIRED state and the outer commit fails with
     # PendingRollbackError). Pass ``from_header`` so the display name reaches
     # the notification surface.
     if (
@@ -495,34 +652,35 @@ async def _store_inbound(
         and msg.get("in_reply_to")
     ):
         from src.email.participants import find_user_ids_by_addresses
-        from src.notifications.service import notify_on_email_reply_received
+        from src.notifications.service import notify_email_reply_recipients
 
         recipient_user_ids = await find_user_ids_by_addresses(db, recipients)
+        if not recipient_user_ids:
+            return
         sender_name = _parse_name_from(msg.get("from_header") or msg.get("from") or "")
         snippet = (
             msg.get("body_text")
             or _strip_html_to_text(msg.get("body_html") or "")
             or ""
         )
-        for user_id in recipient_user_ids:
-            try:
-                async with db.begin_nested():
-                    await notify_on_email_reply_received(
-                        db=db,
-                        recipient_user_id=user_id,
-                        contact_id=entity_id,
-                        sender_email=from_addr,
-                        sender_name=sender_name,
-                        subject_line=msg.get("subject") or "",
-                        snippet=snippet,
-                        participant_emails=recipients,
-                    )
-            except Exception:
-                logger.exception(
-                    "notify_on_email_reply_received failed for user %s inbound %s",
-                    user_id,
-                    row.id,
+        try:
+            async with db.begin_nested():
+                await notify_email_reply_recipients(
+                    db,
+                    recipient_user_ids=recipient_user_ids,
+                    contact_id=entity_id,
+                    sender_email=from_addr,
+                    sender_name=sender_name,
+                    subject_line=msg.get("subject") or "",
+                    snippet=snippet,
+                    participant_emails=recipients,
                 )
+        except Exception:
+            logger.exception(
+                "notify_email_reply_recipients failed for users %s inbound %s",
+                recipient_user_ids,
+                row.id,
+            )
 
 
 def _parse_name_from(addr_header: str) -> str:
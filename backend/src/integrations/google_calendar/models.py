@@ -25,6 +25,10 @@ class GoogleCalendarCredential(Base):
     calendar_id: Mapped[str] = mapped_column(String(255), default="primary")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Google's nextSyncToken from the last pull; later pulls fetch only the
+    # events changed since. full_synced_at is the last full window pass.
+    sync_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    full_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -3,11 +3,20 @@
 Handles OAuth2 flow, event creation, and two-way sync between
 CRM activities and Google Calendar events.
 
+Pulls from Google are incremental: a full pass over the next
+``CALENDAR_SYNC_HORIZON_DAYS`` stores Google's ``nextSyncToken`` on the
+credential, and later pulls send only that token, so Google returns just
+the events changed since — an unchanged calendar costs one empty request.
+The window pass is repeated every ``CALENDAR_FULL_RESYNC_INTERVAL`` so
+events that drift into the horizon without being edited still arrive.
+
 Requires GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET in env.
 """
 
 import logging
-from datetime import UTC, datetime, timedelta
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, time, timedelta
 from typing import Any
 from urllib.parse import urlencode
 
@@ -30,6 +39,9 @@ SCOPES = "https://www.googleapis.com/auth/calendar"
 GOOGLE_CALENDAR_PAGE_SIZE = 2500
 CALENDAR_SYNC_HORIZON_DAYS = 90
 CALENDAR_SYNC_LOCK_NAMESPACE = 100_001
+CALENDAR_FULL_RESYNC_INTERVAL = timedelta(days=1)
+# Users the scheduler syncs at once (see core/scheduler.py).
+CALENDAR_SYNC_CONCURRENCY = 4
 
 # Token-endpoint error codes that mean the refresh token is permanently
 # unusable. Per RFC 6749 + Google's OAuth docs, these are the only
@@ -63,11 +75,49 @@ class GoogleCalendarAuthError(Exception):
     """
 
 
+class _SyncTokenExpired(Exception):
+    """Google answered 410 Gone: the stored sync token must be dropped."""
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _event_time(value: dict | None) -> datetime | None:
+    """A Google ``start`` / ``end`` object as an aware datetime."""
+    if not value:
+        return None
+    if "dateTime" in value:
+        return _aware(datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00")))
+    if "date" in value:
+        return datetime.combine(date.fromisoformat(value["date"]), time.min, tzinfo=UTC)
+    return None
+
+
+def _overlaps(event: dict, window_start: datetime, window_end: datetime) -> bool:
+    """Same test Google applies for ``timeMin`` / ``timeMax``."""
+    start = _event_time(event.get("start"))
+    end = _event_time(event.get("end")) or start
+    return start is not None and start < window_end and end is not None and end > window_start
+
+
 class GoogleCalendarService:
     """Service for Google Calendar OAuth and event sync."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, http: httpx.AsyncClient | None = None):
         self.db = db
+        self._http = http
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """The shared client passed in (scheduler runs), or a short-lived one."""
+        if self._http is not None:
+            yield self._http
+            return
+        async with httpx.AsyncClient() as client:
+            yield client
 
     def get_authorization_url(self, redirect_uri: str, state: str | None = None, login_hint: str | None = None) -> str:
         """Build the Google OAuth2 authorization URL."""
@@ -90,7 +140,7 @@ class GoogleCalendarService:
         client_id = getattr(settings, "GOOGLE_CLIENT_ID", "")
         client_secret = getattr(settings, "GOOGLE_CLIENT_SECRET", "")
 
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(GOOGLE_TOKEN_URL, data={
                 "code": code,
                 "client_id": client_id,
@@ -117,7 +167,7 @@ class GoogleCalendarService:
         client_id = getattr(settings, "GOOGLE_CLIENT_ID", "")
         client_secret = getattr(settings, "GOOGLE_CLIENT_SECRET", "")
 
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(GOOGLE_TOKEN_URL, data={
                 "client_id": client_id,
                 "client_secret": client_secret,
@@ -272,7 +322,7 @@ class GoogleCalendarService:
         token = await self._get_valid_token(credential)
         event_body = self._activity_to_event(activity)
 
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 f"{GOOGLE_CALENDAR_API}/calendars/{credential.calendar_id}/events",
                 json=event_body,
@@ -323,70 +373,178 @@ class GoogleCalendarService:
 
         token = await self._get_valid_token(credential)
         now = datetime.now(UTC)
-        time_min_iso = now.isoformat()
-        time_max_iso = (now + timedelta(days=CALENDAR_SYNC_HORIZON_DAYS)).isoformat()
-
-        created = []
-        page_token: str | None = None
+        window = (now, now + timedelta(days=CALENDAR_SYNC_HORIZON_DAYS))
+        full_synced_at = _aware(credential.full_synced_at)
+        full = (
+            not credential.sync_token
+            or full_synced_at is None
+            or full_synced_at <= now - CALENDAR_FULL_RESYNC_INTERVAL
+        )
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                params = {
-                    "maxResults": GOOGLE_CALENDAR_PAGE_SIZE,
-                    "orderBy": "updated",
-                    "singleEvents": True,
-                    "timeMin": time_min_iso,
-                    "timeMax": time_max_iso,
-                }
-                if page_token:
-                    params["pageToken"] = page_token
-
-                response = await client.get(
-                    f"{GOOGLE_CALENDAR_API}/calendars/{credential.calendar_id}/events",
-                    params=params,
-                    headers={"Authorization": f"Bearer {token}"},
-                )
-                response.raise_for_status()
-                events_data = response.json()
-
-                for event in events_data.get("items", []):
-                    existing = await self.db.execute(
-                        select(CalendarSyncEvent).where(
-                            CalendarSyncEvent.user_id == user_id,
-                            CalendarSyncEvent.google_event_id == event["id"],
-                        )
+        created: list[dict[str, Any]] = []
+        next_token: str | None = None
+        async with self._http_client() as client:
+            if not full:
+                try:
+                    next_token = await self._pull_events(
+                        client, credential, token, {"syncToken": credential.sync_token},
+                        window, created,
                     )
-                    if existing.scalar_one_or_none():
-                        continue
-
-                    activity = self._event_to_activity(event, user_id)
-                    self.db.add(activity)
-                    await self.db.flush()
-
-                    sync_event = CalendarSyncEvent(
-                        user_id=user_id,
-                        activity_id=activity.id,
-                        google_event_id=event["id"],
-                        google_calendar_id=credential.calendar_id,
-                        sync_direction="google_to_crm",
+                except _SyncTokenExpired:
+                    logger.info(
+                        "Calendar sync token expired for user_id=%s, running a full sync",
+                        user_id,
                     )
-                    self.db.add(sync_event)
-                    created.append({
-                        "activity_id": activity.id,
-                        "google_event_id": event["id"],
-                        "summary": event.get("summary"),
-                    })
-
-                await self.db.commit()
-
-                page_token = events_data.get("nextPageToken")
-                if not page_token:
-                    break
+                    full = True
+            if full:
+                # timeMax caps singleEvents expansion of open-ended
+                # recurring events; the sync token Google returns still
+                # reports later changes to any event.
+                next_token = await self._pull_events(
+                    client, credential, token,
+                    {"timeMin": window[0].isoformat(), "timeMax": window[1].isoformat()},
+                    window, created,
+                )
+                credential.full_synced_at = now
 
+        # No token (Google omitted it) means the next pull is a full pass.
+        credential.sync_token = next_token
         credential.last_synced_at = datetime.now(UTC)
         await self.db.commit()
         return created
 
+    async def _pull_events(
+        self,
+        client: httpx.AsyncClient,
+        credential: GoogleCalendarCredential,
+        token: str,
+        query: dict[str, Any],
+        window: tuple[datetime, datetime],
+        created: list[dict[str, Any]],
+    ) -> str | None:
+        """Page through events.list for ``query``, applying each page.
+
+        Commits after every page. Returns the ``nextSyncToken`` from the
+        last page. Raises ``_SyncTokenExpired`` on 410 Gone.
+        """
+        page_token: str | None = None
+        while True:
+            # No orderBy: Google won't issue a sync token for ordered lists.
+            params: dict[str, Any] = {
+                "maxResults": GOOGLE_CALENDAR_PAGE_SIZE,
+                "singleEvents": True,
+                **query,
+            }
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = await client.get(
+                f"{GOOGLE_CALENDAR_API}/calendars/{credential.calendar_id}/events",
+                params=params,
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            if response.status_code == 410:
+                raise _SyncTokenExpired()
+            response.raise_for_status()
+            events_data = response.json()
+
+            created.extend(
+                await self._apply_event_page(credential, events_data.get("items", []), window)
+            )
+            await self.db.commit()
+
+            page_token = events_data.get("nextPageToken")
+            if not page_token:
+                return events_data.get("nextSyncToken")
+
+    async def _apply_event_page(
+        self,
+        credential: GoogleCalendarCredential,
+        events: list[dict],
+        window: tuple[datetime, datetime],
+    ) -> list[dict[str, Any]]:
+        """Mirror one page of Google events into activities.
+
+        Existing sync rows for the whole page are loaded with one query.
+        New events inside the horizon become activities, inserted
+        together; events Google reports updated since their row was
+        synced rewrite the activity; cancelled ones remove it. Only rows
+        this sync created (``google_to_crm``) are changed — events pushed
+        from the CRM are left alone.
+        """
+        user_id = credential.user_id
+        by_id = {event["id"]: event for event in events if event.get("id")}
+        if not by_id:
+            return []
+
+        result = await self.db.execute(
+            select(CalendarSyncEvent).where(
+                CalendarSyncEvent.user_id == user_id,
+                CalendarSyncEvent.google_event_id.in_(list(by_id)),
+            )
+        )
+        existing = {row.google_event_id: row for row in result.scalars()}
+
+        new_events: list[dict] = []
+        changed: dict[int, tuple[CalendarSyncEvent, dict]] = {}
+        for event_id, event in by_id.items():
+            cancelled = event.get("status") == "cancelled"
+            row = existing.get(event_id)
+            if row is None:
+                if not cancelled and _overlaps(event, *window):
+                    new_events.append(event)
+                continue
+            if row.sync_direction != "google_to_crm" or row.activity_id is None:
+                continue
+            updated_at = _event_time({"dateTime": event["updated"]}) if event.get("updated") else None
+            if cancelled or (updated_at and updated_at > _aware(row.last_synced_at)):
+                changed[row.activity_id] = (row, event)
+
+        if changed:
+            now = datetime.now(UTC)
+            activities = await self.db.execute(
+                select(Activity).where(Activity.id.in_(list(changed)))
+            )
+            for activity in activities.scalars():
+                row, event = changed[activity.id]
+                if event.get("status") == "cancelled":
+                    await self.db.delete(activity)
+                    await self.db.delete(row)
+                    continue
+                for field, value in self._event_fields(event).items():
+                    setattr(activity, field, value)
+                row.last_synced_at = now
+
+        if not new_events:
+            await self.db.flush()
+            return []
+
+        # One flush inserts every new activity (batched INSERT … RETURNING),
+        # the second their sync rows.
+        activities_new = [self._event_to_activity(event, user_id) for event in new_events]
+        self.db.add_all(activities_new)
+        await self.db.flush()
+        pairs = list(zip(activities_new, new_events, strict=True))
+        self.db.add_all([
+            CalendarSyncEvent(
+                user_id=user_id,
+                activity_id=activity.id,
+                google_event_id=event["id"],
+                google_calendar_id=credential.calendar_id,
+                sync_direction="google_to_crm",
+            )
+            for activity, event in pairs
+        ])
+        await self.db.flush()
+        return [
+            {
+                "activity_id": activity.id,
+                "google_event_id": event["id"],
+                "summary": event.get("summary"),
+            }
+            for activity, event in pairs
+        ]
+
     async def _upsert_credential(self, user_id: int, token_data: dict) -> GoogleCalendarCredential:
         """Create or update Google Calendar credentials for a user."""
         existing = await self.get_credential(user_id)
@@ -400,6 +558,10 @@ class GoogleCalendarService:
                 existing.refresh_token = token_data["refresh_token"]
             existing.token_expiry = expiry
             existing.is_active = True
+            # A reconnect may be a different Google account; its events
+            # start from a full pass.
+            existing.sync_token = None
+            existing.full_synced_at = None
             await self.db.flush()
             return existing
 
@@ -428,8 +590,8 @@ class GoogleCalendarService:
             event["end"] = {"dateTime": now}
         return event
 
-    def _event_to_activity(self, event: dict, user_id: int) -> Activity:
-        """Convert a Google Calendar event to a CRM activity."""
+    def _event_fields(self, event: dict) -> dict[str, Any]:
+        """Activity columns mirrored from a Google event."""
         due_date = None
         scheduled_at = None
         start = event.get("start", {})
@@ -438,19 +600,24 @@ class GoogleCalendarService:
             due_date = scheduled_at.date()
         elif "date" in start:
             due_date = datetime.strptime(start["date"], "%Y-%m-%d").date()
+        return {
+            "subject": event.get("summary", "Google Calendar Event"),
+            "description": event.get("description", ""),
+            "scheduled_at": scheduled_at,
+            "due_date": due_date,
+        }
 
+    def _event_to_activity(self, event: dict, user_id: int) -> Activity:
+        """Convert a Google Calendar event to a CRM activity."""
         # Google events aren't tied to a CRM entity; link them to the owning user
         # so the polymorphic (entity_type, entity_id) NOT NULL columns are satisfied.
         return Activity(
             activity_type="meeting",
-            subject=event.get("summary", "Google Calendar Event"),
-            description=event.get("description", ""),
             entity_type=ENTITY_TYPE_USERS,
             entity_id=user_id,
-            scheduled_at=scheduled_at,
-            due_date=due_date,
             is_completed=False,
             priority="normal",
             owner_id=user_id,
             assigned_to_id=user_id,
+            **self._event_fields(event),
         )
@@ -12,9 +12,12 @@ in :mod:`src.integrations.mailchimp.service`.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
-from typing import Any
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 import httpx
 
@@ -22,6 +25,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
 
+# Mailchimp's batch list-member endpoint accepts at most 500 members per
+# call, and an API key may hold at most 10 simultaneous connections.
+BATCH_MEMBER_LIMIT = 500
+DEFAULT_BATCH_CONCURRENCY = 4
+
+T = TypeVar("T")
+
 
 class MailchimpError(Exception):
     """Raised when Mailchimp returns a non-2xx response."""
@@ -33,6 +43,55 @@ class MailchimpError(Exception):
         super().__init__(f"Mailchimp HTTP {status_code}: {detail}")
 
 
+def is_compliance_error(message: str | None) -> bool:
+    """True when Mailchimp refused a member because of their compliance state.
+
+    Previously-unsubscribed, cleaned and under-review addresses cannot be
+    (re)subscribed through the API; Mailchimp reports that as "Member In
+    Compliance State" on single-member calls and as "... is in a compliance
+    state ..." in batch-response errors.
+    """
+    return "compliance" in (message or "").lower()
+
+
+def is_existing_member_error(error: dict[str, Any]) -> bool:
+    """True when a batch add was refused because the address is already a member.
+
+    :meth:`MailchimpClient.batch_upsert_members` never updates existing
+    members, so Mailchimp reports each one as ``ERROR_CONTACT_EXISTS`` ("...
+    is already a list member ...") and leaves their status alone.
+    """
+    if error.get("error_code") == "ERROR_CONTACT_EXISTS":
+        return True
+    return "already a list member" in str(error.get("error") or "").lower()
+
+
+@dataclass
+class MemberSyncResult:
+    """Outcome of :meth:`MailchimpClient.sync_members`, by email address.
+
+    ``synced`` keeps the caller's order and spelling. ``skipped`` holds
+    compliance-state refusals; ``failed`` maps any other per-member error
+    to Mailchimp's message.
+    """
+
+    synced: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+async def _gather_or_cancel(coros: list[Awaitable[T]]) -> list[T]:
+    """Run ``coros`` concurrently; on the first failure cancel the rest and raise."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def split_api_key(api_key: str) -> tuple[str, str]:
     """Return ``(api_key, server_prefix)`` from a raw Mailchimp key.
 
@@ -160,6 +219,128 @@ class MailchimpClient:
             json=payload,
         )
 
+    async def update_member_merge_fields(
+        self,
+        list_id: str,
+        email: str,
+        merge_fields: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Refresh an existing member's merge fields, leaving their status alone.
+
+        A ``PATCH`` without ``status`` cannot resubscribe anyone; Mailchimp
+        answers 404 when the address is not a member.
+        """
+        return await self._request(
+            "PATCH",
+            f"/lists/{list_id}/members/{subscriber_hash(email)}",
+            json={"merge_fields": merge_fields},
+        )
+
+    async def batch_upsert_members(
+        self,
+        list_id: str,
+        members: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Add up to :data:`BATCH_MEMBER_LIMIT` new members in one call.
+
+        Each entry needs ``email_address`` and ``status``. The call is sent
+        with ``update_existing: false``, so like ``status_if_new`` in
+        :meth:`upsert_member` the status only applies to new addresses: an
+        existing member, including one who unsubscribed or was cleaned, is
+        left as it is. Per-member failures do not fail the request:
+        Mailchimp lists them under ``errors`` (``email_address``, ``error``,
+        ``error_code``) next to ``new_members``; existing members show up
+        there as ``ERROR_CONTACT_EXISTS`` (see
+        :meth:`update_member_merge_fields` for refreshing them).
+        """
+        if len(members) > BATCH_MEMBER_LIMIT:
+            raise ValueError(
+                f"Mailchimp batch accepts at most {BATCH_MEMBER_LIMIT} members, got {len(members)}"
+            )
+        return await self._request(
+            "POST",
+            f"/lists/{list_id}",
+            json={"members": members, "update_existing": False},
+        )
+
+    async def sync_members(
+        self,
+        list_id: str,
+        members: list[dict[str, Any]],
+        *,
+        chunk_size: int = BATCH_MEMBER_LIMIT,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> MemberSyncResult:
+        """Push ``members`` into the audience in concurrent batch calls.
+
+        ``members`` are split into chunks of ``chunk_size`` and at most
+        ``concurrency`` batch requests are in flight at once. Entries
+        without a ``status`` are added as ``subscribed``. Existing members
+        keep their status, so nobody who unsubscribed or was cleaned is
+        resubscribed; they count as synced, and Mailchimp's own status
+        decides whether a campaign reaches them. Their ``merge_fields``
+        (FNAME / LNAME) are still refreshed, one status-free ``PATCH``
+        each under the same concurrency limit; a refused refresh is
+        logged and the member stays synced. Addresses Mailchimp refuses
+        to add because of their compliance state land in
+        :attr:`MemberSyncResult.skipped`.
+
+        A request-level failure (auth, quota, 5xx) raises
+        :class:`MailchimpError` after cancelling the chunks still running —
+        a partial sync must not be mistaken for the whole audience.
+        """
+        chunk_size = max(1, min(chunk_size, BATCH_MEMBER_LIMIT))
+        payload = [{"status": "subscribed", **member} for member in members]
+        chunks = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+        # Per call, not module-level: a shared semaphore would throttle
+        # every tenant's sync against the same limit.
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _send(chunk: list[dict[str, Any]]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.batch_upsert_members(list_id, chunk)
+
+        async def _refresh(member: dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    await self.update_member_merge_fields(
+                        list_id, member["email_address"], member["merge_fields"]
+                    )
+                except MailchimpError as exc:
+                    logger.warning(
+                        "mailchimp merge field refresh failed email=%s: %s",
+                        member["email_address"],
+                        exc,
+                    )
+
+        responses = await _gather_or_cancel([_send(chunk) for chunk in chunks])
+
+        result = MemberSyncResult()
+        to_refresh: list[dict[str, Any]] = []
+        for chunk, response in zip(chunks, responses, strict=True):
+            errors: dict[str, str] = {}
+            already_members: set[str] = set()
+            for error in response.get("errors") or []:
+                email = str(error.get("email_address") or "").strip().lower()
+                if is_existing_member_error(error):
+                    already_members.add(email)
+                else:
+                    errors[email] = str(error.get("error") or "")
+            for member in chunk:
+                email = member["email_address"]
+                message = errors.get(email.strip().lower())
+                if message is None:
+                    result.synced.append(email)
+                    if member.get("merge_fields") and email.strip().lower() in already_members:
+                        to_refresh.append(member)
+                elif is_compliance_error(message):
+                    result.skipped.append(email)
+                else:
+                    result.failed[email] = message
+
+        await _gather_or_cancel([_refresh(member) for member in to_refresh])
+        return result
+
     async def get_member(self, list_id: str, email: str) -> dict[str, Any]:
         return await self._request(
             "GET", f"/lists/{list_id}/members/{subscriber_hash(email)}"
@@ -208,7 +389,7 @@ class MailchimpClient:
         audience.
 
         ``emails`` must already exist in the audience (use
-        :meth:`upsert_member` first); Mailchimp silently drops any
+        :meth:`sync_members` first); Mailchimp silently drops any
         email that isn't a list member.
         """
         return await self._request(
@@ -7,8 +7,8 @@ rules the CRM needs:
   so an invalid key fails fast at the UI rather than later during a
   campaign send.
 * ``send_campaign_step`` is the entry point used by the campaign worker
-  when ``Campaign.send_via == "mailchimp"``. It upserts every member's
-  email into the audience, creates a regular Mailchimp campaign, sets
+  when ``Campaign.send_via == "mailchimp"``. It pushes every member's
+  email into the audience with concurrent batch calls, creates a regular Mailchimp campaign, sets
   the rendered HTML, and triggers the send. The Mailchimp campaign id
   is persisted on the CRM ``Campaign`` row so we can later fetch its
   report.
@@ -29,7 +29,8 @@ from datetime import UTC, datetime
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.campaigns.models import Campaign, CampaignMember, EmailTemplate
+from src.campaigns.models import Campaign, EmailTemplate
+from src.campaigns.recipients import mark_recipients_sent, resolve_campaign_recipients
 from src.email.branded_templates import (
     TenantBrandingHelper,
     render_campaign_wrapper,
@@ -37,7 +38,6 @@ from src.email.branded_templates import (
 from src.email.service import render_template
 from src.integrations.mailchimp.client import (
     MailchimpClient,
-    MailchimpError,
     split_api_key,
 )
 from src.integrations.mailchimp.models import MailchimpConnection
@@ -303,39 +303,6 @@ class MailchimpService:
 
     # --- Campaign send -------------------------------------------
 
-    async def _resolve_member_emails(
-        self, campaign_id: int
-    ) -> list[tuple[str, str | None, str | None]]:
-        """Return ``(email, first_name, last_name)`` for every campaign member."""
-        from src.contacts.models import Contact
-        from src.leads.models import Lead
-
-        result = await self.db.execute(
-            select(CampaignMember).where(CampaignMember.campaign_id == campaign_id)
-        )
-        members = list(result.scalars().all())
-
-        out: list[tuple[str, str | None, str | None]] = []
-        for member in members:
-            if member.member_type in ("contact", "contacts"):
-                row = await self.db.execute(
-                    select(Contact.email, Contact.first_name, Contact.last_name).where(
-                        Contact.id == member.member_id
-                    )
-                )
-            elif member.member_type in ("lead", "leads"):
-                row = await self.db.execute(
-                    select(Lead.email, Lead.first_name, Lead.last_name).where(
-                        Lead.id == member.member_id
-                    )
-                )
-            else:
-                continue
-            data = row.first()
-            if data and data[0]:
-                out.append((data[0], data[1], data[2]))
-        return out
-
     async def send_campaign_step(
         self,
         *,
@@ -403,7 +370,7 @@ class MailchimpService:
                 "skipped": "already_sent",
             }
 
-        members = await self._resolve_member_emails(campaign.id)
+        members = await resolve_campaign_recipients(self.db, campaign.id)
         if not members:
             # Fail-closed: never hand a Mailchimp send off without a
             # bounded recipient set. Previously this would have created
@@ -414,48 +381,53 @@ class MailchimpService:
                 "no members resolved to email addresses"
             )
 
+        audience_members: list[dict] = []
+        for member in members:
+            merge: dict[str, str] = {}
+            if member.first_name:
+                merge["FNAME"] = member.first_name
+            if member.last_name:
+                merge["LNAME"] = member.last_name
+            entry: dict = {"email_address": member.email}
+            if merge:
+                entry["merge_fields"] = merge
+            audience_members.append(entry)
+
         async with await self._client(conn) as mc:
-            upserted_emails: list[str] = []
-            for email, first_name, last_name in members:
-                merge: dict[str, str] = {}
-                if first_name:
-                    merge["FNAME"] = first_name
-                if last_name:
-                    merge["LNAME"] = last_name
-                try:
-                    await mc.upsert_member(
-                        conn.default_audience_id,
-                        email,
-                        merge_fields=merge or None,
-                    )
-                    upserted_emails.append(email)
-                except MailchimpError as exc:
-                    # Mailchimp returns 400 with title="Member In
-                    # Compliance State" for previously-unsubscribed or
-                    # hard-bounced addresses. That's expected and we
-                    # skip. Auth, quota, and unknown-shape failures
-                    # mean the bulk send won't reach the right audience
-                    # — re-raise so the worker marks the step failed
-                    # instead of silently mailing a stale snapshot.
-                    if exc.status_code == 400 and isinstance(exc.body, dict) and (
-                        "compliance" in str(exc.body.get("title", "")).lower()
-                    ):
-                        logger.warning(
-                            "mailchimp upsert skipped (compliance) email=%s body=%s",
-                            email,
-                            exc.body,
-                        )
-                        continue
-                    raise
+            # Batch list-member calls, several in flight at once. A
+            # request-level failure (auth, quota, unknown shape) raises
+            # out of sync_members — the send must not go ahead against a
+            # stale audience snapshot, so the worker marks the step
+            # failed. Existing audience members are never updated, so an
+            # unsubscribed or cleaned contact keeps that status. Per-member
+            # errors come back in the result instead: compliance-state
+            # addresses Mailchimp refuses to add are expected and skipped;
+            # anything else is logged and the member stays pending.
+            sync = await mc.sync_members(conn.default_audience_id, audience_members)
+            if sync.skipped:
+                logger.warning(
+                    "mailchimp sync skipped %d member(s) in compliance state campaign=%s",
+                    len(sync.skipped),
+                    campaign.id,
+                )
+            for email, error in sync.failed.items():
+                logger.error(
+                    "mailchimp sync rejected member campaign=%s email=%s error=%s",
+                    campaign.id,
+                    email,
+                    error,
+                )
+            upserted_emails = sync.synced
 
             if not upserted_emails:
-                # Every member hit compliance — nothing to send. Bail
+                # Every member was refused — nothing to send. Bail
                 # before creating a segment + campaign that would have
                 # no recipients (and which Mailchimp may then refuse
                 # to send, or worse fall back to the whole audience).
                 raise ValueError(
                     f"Cannot send Mailchimp campaign {campaign.id}: "
-                    "all members are in compliance state (unsubscribed/bounced)"
+                    "no member could be added to the audience "
+                    "(all unsubscribed/bounced or rejected)"
                 )
 
             # Per-send static segment: limits the Mailchimp campaign to
@@ -526,24 +498,17 @@ class MailchimpService:
             await mc.send_campaign(mc_campaign_id)
 
         # Count only the emails that actually made it into the segment.
-        # Compliance-state skips were filtered above, so upserted_emails
+        # Skipped and rejected members were filtered above, so upserted_emails
         # is the authoritative recipient set for this send.
         campaign.num_sent = (campaign.num_sent or 0) + len(upserted_emails)
 
-        now = datetime.now(UTC)
-        member_result = await self.db.execute(
-            select(CampaignMember).where(CampaignMember.campaign_id == campaign.id)
-        )
         emails_sent = set(upserted_emails)
-        for member in member_result.scalars().all():
-            from src.email.service import EmailService
-
-            email_service = EmailService(self.db)
-            member_email = await email_service.get_member_email(member)
-            if member_email and member_email in emails_sent:
-                member.status = "sent"
-                member.sent_at = now
-
+        await mark_recipients_sent(
+            self.db,
+            campaign.id,
+            datetime.now(UTC),
+            skipped_emails={m.email for m in members if m.email not in emails_sent},
+        )
         await self.db.flush()
         return {
             "mailchimp_campaign_id": mc_campaign_id,
@@ -0,0 +1,136 @@
+"""Paged queries behind the lead Kanban board.
+
+The board never loads a stage's full lead list. Column totals come from
+one ``GROUP BY pipeline_stage_id`` and the first cards of every column
+from one ``row_number()`` window over ``(score desc, id desc)`` that
+selects card columns only (plus the owner's name via an outer join), so
+the first paint costs two queries however large the pipeline is. Each
+column then pages on its own through a keyset cursor on ``(score, id)``,
+served by ``ix_leads_stage_score``.
+"""
+
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import User
+from src.core.cursors import decode_keyset_cursor, encode_keyset_cursor
+from src.leads.models import Lead
+from src.leads.schemas import KanbanLead
+
+KANBAN_CARDS_PER_STAGE = 25
+KANBAN_MAX_PAGE_SIZE = 100
+
+
+def _card_columns() -> tuple[Any, ...]:
+    return (
+        Lead.id,
+        Lead.first_name,
+        Lead.last_name,
+        Lead.email,
+        Lead.company_name,
+        Lead.score,
+        Lead.owner_id,
+        Lead.pipeline_stage_id,
+        User.full_name.label("owner_name"),
+    )
+
+
+def _card(row: Any) -> KanbanLead:
+    # Mirrors Lead.full_name without loading the ORM object.
+    name = " ".join(p for p in (row.first_name, row.last_name) if p)
+    return KanbanLead(
+        id=row.id,
+        first_name=row.first_name,
+        last_name=row.last_name,
+        full_name=name or row.company_name or "",
+        email=row.email,
+        company_name=row.company_name,
+        score=row.score,
+        owner_id=row.owner_id,
+        owner_name=row.owner_name,
+    )
+
+
+def _page(rows: list[Any], limit: int) -> tuple[list[KanbanLead], str | None]:
+    """Cards for the first ``limit`` rows; a cursor if a further row exists."""
+    cards = [_card(row) for row in rows[:limit]]
+    if len(rows) <= limit:
+        return cards, None
+    last = rows[limit - 1]
+    return cards, encode_keyset_cursor(last.score, last.id)
+
+
+async def count_leads_by_stage(
+    db: AsyncSession, stage_ids: list[int], visibility: list[Any]
+) -> dict[int, int]:
+    """Visible lead totals per stage, from a single ``GROUP BY``."""
+    result = await db.execute(
+        select(Lead.pipeline_stage_id, func.count())
+        .where(Lead.pipeline_stage_id.in_(stage_ids), *visibility)
+        .group_by(Lead.pipeline_stage_id)
+    )
+    return {stage_id: int(count) for stage_id, count in result.all()}
+
+
+async def first_cards_by_stage(
+    db: AsyncSession,
+    stage_ids: list[int],
+    visibility: list[Any],
+    per_stage: int = KANBAN_CARDS_PER_STAGE,
+) -> dict[int, tuple[list[KanbanLead], str | None]]:
+    """Top ``per_stage`` cards of every stage plus each column's next cursor.
+
+    One window-function query ranks each stage's visible leads and keeps
+    ``per_stage + 1`` of them; the extra row only signals that the column
+    has more.
+    """
+    ranked = (
+        select(
+            Lead.id.label("lead_id"),
+            func.row_number().over(
+                partition_by=Lead.pipeline_stage_id,
+                order_by=(Lead.score.desc(), Lead.id.desc()),
+            ).label("rank"),
+        )
+        .where(Lead.pipeline_stage_id.in_(stage_ids), *visibility)
+        .subquery()
+    )
+    result = await db.execute(
+        select(*_card_columns())
+        .join(ranked, ranked.c.lead_id == Lead.id)
+        .outerjoin(User, User.id == Lead.owner_id)
+        .where(ranked.c.rank <= per_stage + 1)
+        .order_by(Lead.pipeline_stage_id, Lead.score.desc(), Lead.id.desc())
+    )
+    rows_by_stage: dict[int, list[Any]] = {stage_id: [] for stage_id in stage_ids}
+    for row in result.all():
+        rows_by_stage[row.pipeline_stage_id].append(row)
+    return {
+        stage_id: _page(rows, per_stage) for stage_id, rows in rows_by_stage.items()
+    }
+
+
+async def stage_cards_page(
+    db: AsyncSession,
+    stage_id: int,
+    visibility: list[Any],
+    cursor: str | None = None,
+    limit: int = KANBAN_CARDS_PER_STAGE,
+) -> tuple[list[KanbanLead], str | None]:
+    """One column's cards after ``cursor``. Raises ValueError on a bad cursor."""
+    query = (
+        select(*_card_columns())
+        .outerjoin(User, User.id == Lead.owner_id)
+        .where(Lead.pipeline_stage_id == stage_id, *visibility)
+    )
+    if cursor:
+        score, lead_id = decode_keyset_cursor(cursor, (int, int))
+        query = query.where(
+            or_(Lead.score < score, and_(Lead.score == score, Lead.id < lead_id))
+        )
+    result = await db.execute(
+        query.order_by(Lead.score.desc(), Lead.id.desc()).limit(limit + 1)
+    )
+    return _page(list(result.all()), limit)
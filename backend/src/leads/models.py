@@ -3,11 +3,12 @@
 import enum
 from typing import Optional
 
-from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text, event, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.mixins.auditable import AuditableMixin
 from src.database import Base
+from src.dedup.keys import sync_dedup_keys
 
 
 class LeadStatus(str, enum.Enum):
@@ -42,6 +43,9 @@ class Lead(Base, AuditableMixin):
     phone: Mapped[str | None] = mapped_column(String(50))
     mobile: Mapped[str | None] = mapped_column(String(50))
 
+    # Duplicate-detection key, maintained by sync_dedup_keys (src.dedup.keys)
+    phone_normalized: Mapped[str | None] = mapped_column(String(50), index=True)
+
     # Professional info
     job_title: Mapped[str | None] = mapped_column(String(100))
     company_name: Mapped[str | None] = mapped_column(String(255))
@@ -124,9 +128,16 @@ class Lead(Base, AuditableMixin):
 
     __table_args__ = (
         Index("ix_leads_owner_created", "owner_id", "created_at"),
+        # Kanban columns page on (score desc, id desc) within a stage (migration 069).
+        Index("ix_leads_stage_score", "pipeline_stage_id", "score", "id"),
+        Index("ix_leads_email_lower", func.lower(email)),
     )
 
     @property
     def full_name(self) -> str:
         name = " ".join(p for p in (self.first_name, self.last_name) if p)
         return name or self.company_name or ""
+
+
+event.listen(Lead, "before_insert", sync_dedup_keys)
+event.listen(Lead, "before_update", sync_dedup_keys)
@@ -25,6 +25,7 @@ from src.core.cache import (
 from src.core.client_ip import get_client_ip
 from src.core.constants import ENTITY_TYPE_LEADS, EntityNames, ErrorMessages, HTTPStatus
 from src.core.data_scope import DataScope, check_record_access_or_shared, get_data_scope
+from src.core.http_errors import value_error_as_400
 from src.core.permissions import require_manager_or_above, require_permission
 from src.core.router_utils import (
     CurrentUser,
@@ -42,13 +43,21 @@ from src.core.share_permissions import (
     get_writable_shared_entity_ids,
     require_owner_or_manager_access,
     require_record_write_access,
+    shared_with_clause,
 )
-from src.events.service import LEAD_CREATED, LEAD_UPDATED, emit
+from src.events.service import LEAD_CREATED, LEAD_DELETED, LEAD_UPDATED, emit
 from src.leads.conversion import LeadConverter
+from src.leads.kanban import (
+    KANBAN_CARDS_PER_STAGE,
+    KANBAN_MAX_PAGE_SIZE,
+    count_leads_by_stage,
+    first_cards_by_stage,
+    stage_cards_page,
+)
 from src.leads.models import Lead
 from src.leads.schemas import (
     ConversionResponse,
-    KanbanLead,
+    KanbanLeadColumnPage,
     KanbanLeadStage,
     LeadConvertToContactRequest,
     LeadCreate,
@@ -249,11 +258,7 @@ async def list_leads(
     """
     service = LeadService(db)
 
-    assignee_ids = (
-        await service.get_assignee_entity_ids(current_user.id)
-        if data_scope.is_scoped
-        else None
-    )
+    assignee_ids = service.assignee_scope(current_user.id) if data_scope.is_scoped else None
 
     leads, total = await service.get_list(
         page=page,
@@ -265,7 +270,7 @@ async def list_leads(
         min_score=min_score,
         tag_ids=parse_tag_ids(tag_ids),
         filters=parse_json_filters(filters),
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_LEADS),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_LEADS),
         assignee_entity_ids=assignee_ids,
         order_by=order_by,
         order_dir=order_dir,
@@ -317,7 +322,7 @@ async def create_lead(
         "entity_type": "lead",
         "user_id": current_user.id,
         "data": {"first_name": lead.first_name, "last_name": lead.last_name, "email": lead.email, "status": lead.status},
-    })
+    }, db=db)
 
     if lead.owner_id and lead.owner_id != current_user.id:
         await notify_on_assignment(db, lead.owner_id, "leads", lead.id, lead.full_name)
@@ -374,28 +379,28 @@ async def backfill_lead_pipeline_stages(
             ),
         )
 
-    result = await db.execute(
+    from src.dashboard.rollups import mark_dirty
+
+    lead_ids = (await db.execute(
         update(Lead)
         .where(Lead.pipeline_stage_id.is_(None))
         .values(pipeline_stage_id=first_stage.id)
-    )
+        .returning(Lead.id)
+    )).scalars().all()
+    await mark_dirty(db, "lead", lead_ids)
     await db.commit()
 
     return {
         "stage_id": first_stage.id,
         "stage_name": first_stage.name,
-        "updated": result.rowcount,
+        "updated": len(lead_ids),
     }
 
 
-@router.get("/kanban", response_model=LeadKanbanResponse)
-async def get_lead_kanban(
-    current_user: CurrentUser,
-    db: DBSession,
-    data_scope: Annotated[DataScope, Depends(get_data_scope)],
-    owner_id: int | None = None,
-):
-    """Get Kanban board view of lead pipeline.
+def _kanban_visibility(
+    current_user: User, data_scope: DataScope, owner_id: int | None
+) -> list:
+    """WHERE clauses limiting the kanban to the leads the caller may see.
 
     Sales reps can only see their own pipeline; admin/manager can pass
     owner_id to view another user's kanban. Spoofed owner_id from a
@@ -414,6 +419,30 @@ async def get_lead_kanban(
     else:
         resolved_owner_id = effective_owner_id(data_scope, owner_id) or current_user.id
 
+    if not resolved_owner_id:
+        return []
+    if data_scope.can_see_all():
+        return [Lead.owner_id == resolved_owner_id]
+    shared = data_scope.shared_scope(ENTITY_TYPE_LEADS)
+    return [or_(Lead.owner_id == resolved_owner_id, shared_with_clause(Lead.id, shared))]
+
+
+@router.get("/kanban", response_model=LeadKanbanResponse)
+async def get_lead_kanban(
+    current_user: CurrentUser,
+    db: DBSession,
+    data_scope: Annotated[DataScope, Depends(get_data_scope)],
+    owner_id: int | None = None,
+    per_stage: int = Query(KANBAN_CARDS_PER_STAGE, ge=1, le=KANBAN_MAX_PAGE_SIZE),
+):
+    """Get Kanban board view of lead pipeline.
+
+    Each column carries its full visible ``count`` but only the first
+    ``per_stage`` cards (highest score first); ``next_cursor`` feeds
+    ``GET /kanban/stages/{stage_id}`` to load the rest.
+    """
+    visibility = _kanban_visibility(current_user, data_scope, owner_id)
+
     # Get all active lead pipeline stages
     stages_result = await db.execute(
         select(PipelineStage)
@@ -429,64 +458,17 @@ async def get_lead_kanban(
             message="No lead pipeline stages configured. Run the seed script or contact admin.",
         )
 
-    # Pull every visible lead in one query, then group by stage in Python.
-    # Lets us build the owner-id → full_name map from a single follow-up
-    # User query instead of N (one per stage) or doing the .map() inside
-    # each loop iteration.
-    #
     # New leads start with pipeline_stage_id=NULL (off-kanban) per
     # Lorenzo's 2026-05-14 call — they only appear once an admin moves
     # them into Discovery via the quick-edit. Won-stage leads stay in
     # the Won column for visibility even after Contact auto-conversion.
-    leads_query = select(Lead).where(
-        Lead.pipeline_stage_id.in_([s.id for s in stages]),
-    )
-    if resolved_owner_id:
-        if data_scope.can_see_all():
-            leads_query = leads_query.where(Lead.owner_id == resolved_owner_id)
-        else:
-            visible_lead_filters = [Lead.owner_id == resolved_owner_id]
-            shared_ids = data_scope.get_shared_ids(ENTITY_TYPE_LEADS)
-            if shared_ids:
-                visible_lead_filters.append(Lead.id.in_(shared_ids))
-            leads_query = leads_query.where(or_(*visible_lead_filters))
-    leads_query = leads_query.order_by(Lead.score.desc())
-    leads_result = await db.execute(leads_query)
-    all_leads = list(leads_result.scalars().all())
-
-    owner_ids = {lead.owner_id for lead in all_leads if lead.owner_id is not None}
-    if owner_ids:
-        owners_result = await db.execute(
-            select(User.id, User.full_name).where(User.id.in_(owner_ids))
-        )
-        owner_name_by_id: dict[int, str] = {
-            row.id: row.full_name for row in owners_result.all()
-        }
-    else:
-        owner_name_by_id = {}
-
-    leads_by_stage: dict[int, list[Lead]] = {s.id: [] for s in stages}
-    for lead in all_leads:
-        leads_by_stage[lead.pipeline_stage_id].append(lead)
+    stage_ids = [s.id for s in stages]
+    counts = await count_leads_by_stage(db, stage_ids, visibility)
+    pages = await first_cards_by_stage(db, stage_ids, visibility, per_stage)
 
     kanban_stages = []
     for stage in stages:
-        leads = leads_by_stage[stage.id]
-        kanban_leads = [
-            KanbanLead(
-                id=lead.id,
-                first_name=lead.first_name,
-                last_name=lead.last_name,
-                full_name=lead.full_name,
-                email=lead.email,
-                company_name=lead.company_name,
-                score=lead.score,
-                owner_id=lead.owner_id,
-                owner_name=owner_name_by_id.get(lead.owner_id) if lead.owner_id else None,
-            )
-            for lead in leads
-        ]
-
+        cards, next_cursor = pages[stage.id]
         kanban_stages.append(
             KanbanLeadStage(
                 stage_id=stage.id,
@@ -495,14 +477,33 @@ async def get_lead_kanban(
                 probability=stage.probability,
                 is_won=stage.is_won,
                 is_lost=stage.is_lost,
-                leads=kanban_leads,
-                count=len(kanban_leads),
+                leads=cards,
+                count=counts.get(stage.id, 0),
+                next_cursor=next_cursor,
             )
         )
 
     return LeadKanbanResponse(stages=kanban_stages)
 
 
+@router.get("/kanban/stages/{stage_id}", response_model=KanbanLeadColumnPage)
+async def get_lead_kanban_column(
+    stage_id: int,
+    current_user: CurrentUser,
+    db: DBSession,
+    data_scope: Annotated[DataScope, Depends(get_data_scope)],
+    owner_id: int | None = None,
+    cursor: str | None = None,
+    limit: int = Query(KANBAN_CARDS_PER_STAGE, ge=1, le=KANBAN_MAX_PAGE_SIZE),
+):
+    """Load the next page of one kanban column, after ``cursor``."""
+    stage = await _resolve_lead_stage(db, stage_id)
+    visibility = _kanban_visibility(current_user, data_scope, owner_id)
+    with value_error_as_400():
+        cards, next_cursor = await stage_cards_page(db, stage.id, visibility, cursor, limit)
+    return KanbanLeadColumnPage(stage_id=stage.id, leads=cards, next_cursor=next_cursor)
+
+
 @router.post("/send-campaign")
 async def send_campaign(
     request_data: SendCampaignRequest,
@@ -617,9 +618,9 @@ async def get_lead(
     """Get a lead by ID."""
     service = LeadService(db)
     lead = await get_entity_or_404(service, lead_id, EntityNames.LEAD)
-    check_record_access_or_shared(
-        lead, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_LEADS),
+    await check_record_access_or_shared(
+        db, lead, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_LEADS),
     )
     return await _build_lead_response(service, lead)
 
@@ -711,7 +712,7 @@ async def update_lead(
         "entity_type": "lead",
         "user_id": current_user.id,
         "data": {"first_name": updated_lead.first_name, "last_name": updated_lead.last_name, "email": updated_lead.email, "status": updated_lead.status},
-    })
+    }, db=db)
 
     if updated_lead.owner_id and updated_lead.owner_id != old_owner_id:
         await notify_on_assignment(db, updated_lead.owner_id, "leads", updated_lead.id, updated_lead.full_name)
@@ -746,6 +747,13 @@ async def delete_lead(
 
     await service.delete(lead)
 
+    await emit(LEAD_DELETED, {
+        "entity_id": lead_id,
+        "entity_type": "lead",
+        "user_id": current_user.id,
+        "data": {},
+    }, db=db)
+
 
 # Conversion endpoints
 @router.post("/{lead_id}/convert/contact", response_model=ConversionResponse)
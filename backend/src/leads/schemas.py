@@ -191,7 +191,9 @@ class KanbanLeadStage(BaseModel):
     is_won: bool
     is_lost: bool
     leads: list[KanbanLead]
+    # Total visible leads in the stage; ``leads`` holds only the first page.
     count: int
+    next_cursor: str | None = None
 
 
 class LeadKanbanResponse(BaseModel):
@@ -199,6 +201,12 @@ class LeadKanbanResponse(BaseModel):
     message: str | None = None
 
 
+class KanbanLeadColumnPage(BaseModel):
+    stage_id: int
+    leads: list[KanbanLead]
+    next_cursor: str | None = None
+
+
 class MoveLeadRequest(BaseModel):
     new_stage_id: int
 
@@ -9,7 +9,8 @@ from sqlalchemy.orm import selectinload
 from src.assignment.service import AssignmentDecision, AssignmentService
 from src.core.base_service import CRUDService, TaggableServiceMixin
 from src.core.constants import DEFAULT_PAGE_SIZE, ENTITY_TYPE_LEADS
-from src.core.filtering import apply_filters_to_query, build_token_search
+from src.core.filtering import apply_filters_to_query, build_search_rank, build_token_search
+from src.core.share_permissions import SharedScope, shared_with_clause
 from src.core.sorting import build_order_clauses
 from src.leads.models import Lead, LeadSource
 from src.leads.schemas import LeadCreate, LeadSourceCreate, LeadSourceUpdate, LeadUpdate
@@ -79,8 +80,8 @@ class LeadService(
         min_score: int | None = None,
         tag_ids: list[int] | None = None,
         filters: dict[str, Any] | None = None,
-        shared_entity_ids: list[int] | None = None,
-        assignee_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
+        assignee_entity_ids: SharedScope | None = None,
         order_by: str | None = None,
         order_dir: str | None = None,
     ) -> tuple[list[Lead], int]:
@@ -90,7 +91,7 @@ class LeadService(
         user plus any records in ``shared_entity_ids`` or
         ``assignee_entity_ids``. ``assignee_entity_ids`` is a distinct
         parameter so callers that bypass DataScope can OR in just the
-        assignee shares without rebuilding the full shared-entity map.
+        assignee shares (see ``assignee_scope``).
         """
         # Outer-join LeadSource + PipelineStage so the allowlisted `source`
         # and `stage` ORDER BY clauses (see LEAD_SORTABLE_FIELDS) can
@@ -107,10 +108,13 @@ class LeadService(
         if filters:
             query = apply_filters_to_query(query, Lead, filters)
 
+        search_columns = (Lead.first_name, Lead.last_name, Lead.email, Lead.company_name)
+        default_order = [Lead.score.desc(), Lead.id.desc()]
         if search:
-            search_condition = build_token_search(search, Lead.first_name, Lead.last_name, Lead.email, Lead.company_name)
+            search_condition = build_token_search(search, *search_columns)
             if search_condition is not None:
                 query = query.where(search_condition)
+                default_order.insert(0, build_search_rank(search, *search_columns).desc())
 
         # Hide dedup-merged tombstones by default. Callers that want to
         # inspect merged rows can still pass ``status="merged"``.
@@ -124,10 +128,10 @@ class LeadService(
 
         if owner_id is not None:
             or_clauses = [Lead.owner_id == owner_id]
-            if shared_entity_ids:
-                or_clauses.append(Lead.id.in_(shared_entity_ids))
-            if assignee_entity_ids:
-                or_clauses.append(Lead.id.in_(assignee_entity_ids))
+            if shared_entity_ids is not None:
+                or_clauses.append(shared_with_clause(Lead.id, shared_entity_ids))
+            if assignee_entity_ids is not None:
+                or_clauses.append(shared_with_clause(Lead.id, assignee_entity_ids))
             query = query.where(or_(*or_clauses))
         else:
             query = self.apply_owner_filter(query, owner_id, shared_entity_ids)
@@ -142,22 +146,13 @@ class LeadService(
             LEAD_SORTABLE_FIELDS,
             order_by,
             order_dir,
-            default=[Lead.score.desc(), Lead.id.desc()],
+            default=default_order,
         )
         return await self.paginate_query(query, page, page_size, order_by=order_clauses)
 
-    async def get_assignee_entity_ids(self, user_id: int) -> list[int]:
-        """Return lead IDs where this user holds an 'assignee' share."""
-        from src.core.models import EntityShare
-
-        result = await self.db.execute(
-            select(EntityShare.entity_id).where(
-                EntityShare.shared_with_user_id == user_id,
-                EntityShare.entity_type == ENTITY_TYPE_LEADS,
-                EntityShare.permission_level == "assignee",
-            )
-        )
-        return list(result.scalars().all())
+    def assignee_scope(self, user_id: int) -> SharedScope:
+        """The leads this user holds an 'assignee' share on."""
+        return SharedScope(user_id=user_id, entity_type=ENTITY_TYPE_LEADS, permissions=("assignee",))
 
     async def create(self, data: LeadCreate, user_id: int) -> Lead:
         """Create a new lead with auto-scoring.
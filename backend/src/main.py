@@ -7,7 +7,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -28,6 +28,12 @@ from src.comments.router import router as comments_router
 from src.companies.router import router as companies_router
 from src.config import settings
 from src.contacts.router import router as contacts_router
+from src.core.cache import (
+    app_cache,
+    build_cache_backend,
+    configure_cache_backend,
+    flush_cache_invalidations,
+)
 from src.core.constants import CACHE_IMMUTABLE_ASSETS_MAX_AGE_SECONDS
 from src.core.me_router import router as me_router
 from src.core.migrations import _run_production_migrations
@@ -39,6 +45,7 @@ from src.dashboard.router import router as dashboard_router
 from src.database import engine
 from src.dedup.router import router as dedup_router
 from src.email.router import router as email_router
+from src.events.dispatcher import start_event_dispatcher, stop_event_dispatcher
 from src.expenses.router import router as expenses_router
 from src.filters.router import router as filters_router
 from src.import_export.router import router as import_export_router
@@ -50,6 +57,7 @@ from src.marketing.admin_router import router as marketing_admin_router
 from src.marketing.router import router as marketing_router
 from src.meta.router import router as meta_router
 from src.notes.router import router as notes_router
+from src.notifications.realtime import get_notification_hub
 from src.notifications.router import router as notifications_router
 from src.onboarding.bundle_router import router as onboarding_bundle_router
 from src.onboarding.download_router import (
@@ -64,6 +72,7 @@ from src.proposals.router import router as proposals_router
 from src.reports.router import router as reports_router
 from src.roles.router import router as roles_router
 from src.settings.router import router as settings_router
+from src.webhooks.delivery import close_delivery_engine
 from src.webhooks.router import router as webhooks_router
 from src.whitelabel.middleware import TenantMiddleware
 from src.whitelabel.router import router as whitelabel_router
@@ -79,6 +88,8 @@ async def _init_database():
         async with engine.begin() as conn:
             # pgvector DB extension retained — AI tables preserved for future re-enable (PR #281).
             await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            # pg_trgm backs similarity() search ranking; its GIN indexes come from migration 066.
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
         skip_create_all = os.environ.get("SKIP_CREATE_ALL", "").lower() in ("true", "1")
         if not skip_create_all:
@@ -163,13 +174,28 @@ async def lifespan(app: FastAPI):
                 "BACKEND_CORS_ORIGINS may not contain '*' in production (DEBUG=False). "
                 "Set an explicit list of allowed origins."
             )
+    await configure_cache_backend(
+        build_cache_backend(
+            settings.CACHE_BACKEND,
+            settings.CACHE_REDIS_URL,
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            max_bytes=settings.CACHE_MAX_BYTES,
+        )
+    )
+    # Unread-count changes made on other workers arrive on the cache channel.
+    app_cache.backend.add_listener(get_notification_hub().on_broadcast)
     asyncio.create_task(_init_database())
     start_scheduler()
+    if settings.EVENT_BUS_DURABLE:
+        start_event_dispatcher()
 
     yield
 
     print("Shutting down CRM application...")
     stop_scheduler()
+    await stop_event_dispatcher()
+    await close_delivery_engine()
+    await app_cache.backend.close()
     await engine.dispose()
 
 
@@ -202,6 +228,18 @@ app.add_middleware(
 # Tenant resolution middleware (runs after CORS)
 app.add_middleware(TenantMiddleware)
 
+
+@app.middleware("http")
+async def await_cache_invalidations(request: Request, call_next):
+    """Hold each response until the cache invalidations it scheduled are published.
+
+    The client's next request then sees fresh data, whichever worker serves it.
+    """
+    response = await call_next(request)
+    await flush_cache_invalidations()
+    return response
+
+
 # Include routers - they already have /api prefix in their definitions
 app.include_router(auth_router)
 app.include_router(contacts_router)
@@ -289,7 +327,7 @@ for _evt in [
     PROPOSAL_SENT, PROPOSAL_ACCEPTED, PROPOSAL_REJECTED,
     PAYMENT_RECEIVED,
 ]:
-    event_on(_evt, webhook_event_handler)
+    event_on(_evt, webhook_event_handler, durable=True)
 
 # Register notification event handler for key events
 for _evt in [
@@ -297,7 +335,7 @@ for _evt in [
     PROPOSAL_SENT, PROPOSAL_REJECTED,
     PAYMENT_RECEIVED,
 ]:
-    event_on(_evt, notification_event_handler)
+    event_on(_evt, notification_event_handler, durable=True)
 
 
 # Static files for production - serve frontend if dist exists
@@ -371,6 +409,7 @@ async def reseed_demo_data(current_user: CurrentUser):
     from src.companies.models import Company
     from src.contacts.models import Contact
     from src.core.models import EntityTag, Note
+    from src.dashboard.rollups import mark_dirty
     from src.database import async_session_maker
     from src.leads.models import Lead
     from src.opportunities.models import Opportunity
@@ -395,11 +434,20 @@ async def reseed_demo_data(current_user: CurrentUser):
                 delete(EntityTag).where(and_(EntityTag.entity_type == etype, EntityTag.entity_id.in_(demo_ids_q)))
             )
         await session.execute(delete(Note).where(Note.created_by_id == demo_id))
-        await session.execute(delete(Activity).where(Activity.owner_id == demo_id))
-        await session.execute(delete(Opportunity).where(Opportunity.owner_id == demo_id))
+        deleted_ids = (await session.execute(
+            delete(Activity).where(Activity.owner_id == demo_id).returning(Activity.id)
+        )).scalars().all()
+        await mark_dirty(session, "activity", deleted_ids)
+        deleted_ids = (await session.execute(
+            delete(Opportunity).where(Opportunity.owner_id == demo_id).returning(Opportunity.id)
+        )).scalars().all()
+        await mark_dirty(session, "opportunity", deleted_ids)
         await session.execute(delete(Contact).where(Contact.owner_id == demo_id))
         await session.execute(delete(Company).where(Company.owner_id == demo_id))
-        await session.execute(delete(Lead).where(Lead.owner_id == demo_id))
+        deleted_ids = (await session.execute(
+            delete(Lead).where(Lead.owner_id == demo_id).returning(Lead.id)
+        )).scalars().all()
+        await mark_dirty(session, "lead", deleted_ids)
         await session.execute(delete(Campaign).where(Campaign.owner_id == demo_id))
 
         # Delete the demo user so seed_database will recreate everything
@@ -97,15 +97,11 @@ async def get_or_compute(
     ``compute`` is a zero-arg coroutine factory (a ``lambda`` / ``partial``) so the
     expensive aggregation only runs on a miss. Unlike the ``@cached`` decorator
     this caches **any** non-``None`` result including empty-but-valid payloads
-    (an empty period is a real answer, not a miss).
+    (an empty period is a real answer, not a miss). Concurrent misses on one
+    cold key share a single ``compute()`` — N dashboard tabs opening at once
+    cost one aggregation, not N.
     """
-    cached = await app_cache.get(key)
-    if cached is not None:
-        return cached
-    value = await compute()
-    if value is not None:
-        await app_cache.set(key, value, ttl=ttl)
-    return value
+    return await app_cache.get_or_set(key, compute, ttl=ttl)
 
 
 async def invalidate(company_id: int) -> int:
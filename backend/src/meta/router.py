@@ -39,9 +39,9 @@ async def _require_company_access(
     company = result.scalar_one_or_none()
     if company is None:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Company not found")
-    check_record_access_or_shared(
-        company, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_COMPANIES),
+    await check_record_access_or_shared(
+        db, company, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_COMPANIES),
         entity_type=ENTITY_TYPE_COMPANIES,
     )
     return company
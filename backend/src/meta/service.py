@@ -537,7 +537,7 @@ class MetaService:
                 "email": lead.email,
                 "status": lead.status,
             },
-        })
+        }, db=self.db)
 
         if lead.owner_id and lead.owner_id != actor_id:
             await notify_on_assignment(
@@ -1,7 +1,5 @@
 """Note service layer."""
 
-import html
-
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -119,9 +117,12 @@ class NoteService:
         }
 
     async def _process_mentions(self, note: Note, author_id: int) -> None:
-        """Parse @mentions from note content and create notifications + emails."""
-        from src.email.service import EmailService
-        from src.notifications.service import NotificationService
+        """Parse @mentions from note content and notify every mentioned user.
+
+        All mentioned users are resolved in one query and notified in one
+        dispatch; their emails are queued for background delivery.
+        """
+        from src.notifications.dispatcher import NotificationDraft, dispatch_notifications
 
         usernames = parse_mentions(note.content)
         if not usernames:
@@ -136,49 +137,39 @@ class NoteService:
         )
         author_tenant_ids = [row[0] for row in author_tenant_rows.all()]
 
-        for username in usernames:
-            full_name = username.replace('.', ' ')
-            # Normalize whitespace: collapse double spaces to single (works on SQLite + PostgreSQL)
-            name_filter = (
-                func.lower(func.replace(func.trim(User.full_name), '  ', ' '))
-                == func.lower(full_name)
+        # Normalize whitespace: collapse double spaces to single (works on SQLite + PostgreSQL)
+        normalized_name = func.lower(func.replace(func.trim(User.full_name), '  ', ' '))
+        wanted = {username.replace('.', ' ') for username in usernames}
+        user_query = (
+            select(normalized_name.label("name"), User.id, User.email)
+            .where(normalized_name.in_([func.lower(name) for name in wanted]))
+            .order_by(User.id)
+        )
+        if author_tenant_ids:
+            user_query = (
+                user_query
+                .join(TenantUser, TenantUser.user_id == User.id)
+                .where(TenantUser.tenant_id.in_(author_tenant_ids))
             )
-            if author_tenant_ids:
-                user_query = (
-                    select(User)
-                    .join(TenantUser, TenantUser.user_id == User.id)
-                    .where(name_filter)
-                    .where(TenantUser.tenant_id.in_(author_tenant_ids))
-                    .limit(1)
-                )
-            else:
-                user_query = select(User).where(name_filter)
-            user_result = await self.db.execute(user_query)
-            mentioned_user = user_result.scalars().first()
-            if not mentioned_user or mentioned_user.id == author_id:
-                continue
-
-            notif_service = NotificationService(self.db)
-            await notif_service.create_notification(
-                user_id=mentioned_user.id,
+        # First user per mentioned name, as the per-name lookup used to pick.
+        mentioned: dict[str, tuple[int, str | None]] = {}
+        for name, user_id, email in (await self.db.execute(user_query)).all():
+            mentioned.setdefault(name, (user_id, email))
+
+        drafts = {
+            user_id: NotificationDraft(
                 type="mention",
                 title="You were mentioned in a note",
                 message=f"You were mentioned in a note: {note.content[:100]}",
                 entity_type=note.entity_type,
                 entity_id=note.entity_id,
+                email_context={"content": note.content} if email else None,
+                email_sender_id=author_id,
             )
-
-            if mentioned_user.email:
-                email_service = EmailService(self.db)
-                safe_content = html.escape(note.content)
-                await email_service.queue_email(
-                    to_email=mentioned_user.email,
-                    subject="You were mentioned in a note",
-                    body=f"<p>You were mentioned in a note:</p><blockquote>{safe_content}</blockquote>",
-                    sent_by_id=author_id,
-                    entity_type=note.entity_type,
-                    entity_id=note.entity_id,
-                )
+            for user_id, email in mentioned.values()
+            if user_id != author_id
+        }
+        await dispatch_notifications(self.db, "note_mention", drafts, gated=False)
 
     async def update(self, note: Note, data: NoteUpdate, user_id: int) -> dict:
         if data.content is not None:
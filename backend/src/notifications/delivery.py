@@ -0,0 +1,261 @@
+"""Background sender for deferred notification emails.
+
+Drains ``notification_emails`` rows whose ``deliver_after`` has passed.
+Due rows are claimed with ``FOR UPDATE SKIP LOCKED`` on Postgres and
+leased by pushing ``deliver_after`` out ``DELIVERY_CLAIM_SECONDS``; the
+claim commits before anything is sent, so no row lock is held while Gmail
+is called, and overlapping runs (or several app processes) never send a
+row twice. Each email and its rows' new status then commit together in a
+short transaction of their own. A run that dies mid-batch leaves its
+unsent rows pending, to be picked up again once the lease lapses.
+
+Recipients' addresses come from one query per batch, and branding is
+loaded once per recipient. A recipient's due ``digest`` rows are merged
+into a single email; other rows each get their own.
+
+The job runs every ``NOTIFICATION_EMAIL_FLUSH_SECONDS``, and a request
+that queues an email due now wakes it once it commits
+(:func:`wake_after_commit`), so instant emails don't wait for the interval.
+
+Sending goes through ``EmailService.queue_email``, which keeps its own
+``email_queue`` retry machinery for Gmail failures; a row here is only
+marked ``failed`` when rendering or queuing raises.
+"""
+
+import asyncio
+import html
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from itertools import groupby
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.auth.models import User
+from src.email.branded_templates import (
+    TenantBrandingHelper,
+    render_branded_email,
+    render_email_reply_email,
+    render_lead_assigned_email,
+    render_mention_email,
+    render_proposal_signed_email,
+    render_task_due_email,
+)
+from src.notifications.models import (
+    NOTIFICATION_EMAIL_FAILED,
+    NOTIFICATION_EMAIL_PENDING,
+    NOTIFICATION_EMAIL_SENT,
+    NOTIFICATION_EMAIL_SKIPPED,
+    NotificationEmail,
+)
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_BATCH_SIZE = 200
+# How long a claimed row is left alone before another run may retry it.
+DELIVERY_CLAIM_SECONDS = 300
+
+# session.info flag: this session queued an email that is due now.
+_WAKE_KEY = "notification_email_wake"
+
+
+def wake_delivery_job() -> None:
+    """Run the delivery job now rather than at its next interval."""
+    from src.core.scheduler import scheduler
+
+    if not scheduler.running:
+        return
+    job = scheduler.get_job("notification_emails")
+    if job is not None:
+        job.modify(next_run_time=datetime.now(UTC))
+
+
+def wake_after_commit(db: AsyncSession) -> None:
+    """Wake the delivery job once ``db`` commits; a rollback cancels it.
+
+    The wake is best-effort: it is scheduled on the running loop rather
+    than run inside ``commit()``, and a failure is only logged — the
+    interval run still sends the email.
+    """
+    session = db.sync_session
+    session.info[_WAKE_KEY] = True
+    if not event.contains(session, "after_commit", _wake_pending):
+        event.listen(session, "after_commit", _wake_pending)
+        event.listen(session, "after_rollback", _drop_wake)
+
+
+def _wake_pending(session: Session) -> None:
+    # after_commit also fires when a savepoint is released; the rows are
+    # not visible to the job until the outermost transaction commits.
+    if session.in_nested_transaction() or not session.info.pop(_WAKE_KEY, False):
+        return
+    try:
+        asyncio.get_running_loop().call_soon(_wake_quietly)
+    except RuntimeError:
+        logger.debug("No running loop to wake the notification email job from")
+
+
+def _wake_quietly() -> None:
+    try:
+        wake_delivery_job()
+    except Exception as exc:
+        logger.warning("Could not wake the notification email job: %s", exc)
+
+
+def _drop_wake(session: Session) -> None:
+    session.info.pop(_WAKE_KEY, None)
+
+
+def _render_note_mention_email(branding: dict, data: dict) -> tuple[str, str]:
+    """Plain (unbranded) email for @mentions in notes."""
+    safe_content = html.escape(data.get("content") or "")
+    return (
+        "You were mentioned in a note",
+        f"<p>You were mentioned in a note:</p><blockquote>{safe_content}</blockquote>",
+    )
+
+
+EMAIL_RENDERERS: dict[str, Callable[[dict, dict], tuple[str, str]]] = {
+    "lead_assigned": render_lead_assigned_email,
+    "mention": render_mention_email,
+    "task_due": render_task_due_email,
+    "email_reply_received": render_email_reply_email,
+    "proposal_signed": render_proposal_signed_email,
+    "note_mention": _render_note_mention_email,
+}
+
+
+def _render_one(branding: dict, row: NotificationEmail) -> tuple[str, str]:
+    return EMAIL_RENDERERS[row.event_type](branding, row.context or {})
+
+
+def _render_digest(branding: dict, rows: list[NotificationEmail]) -> tuple[str, str]:
+    items = []
+    for row in rows:
+        subject = html.escape(_render_one(branding, row)[0])
+        if row.link:
+            subject = f'<a href="{html.escape(row.link, quote=True)}">{subject}</a>'
+        items.append(f"<li style=\"margin:0 0 8px;\">{subject}</li>")
+    subject = f"You have {len(rows)} new notifications"
+    body = render_branded_email(
+        branding=branding,
+        subject=subject,
+        headline="While you were away",
+        body_html=f"<ul style=\"padding-left:20px;\">{''.join(items)}</ul>",
+    )
+    return subject, body
+
+
+class NotificationDeliveryService:
+    """Renders and sends due ``notification_emails`` rows."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _claim_due(self, now: datetime, limit: int) -> list[NotificationEmail]:
+        """Lease up to ``limit`` due rows, commit the lease, and return them."""
+        query = (
+            select(NotificationEmail.id)
+            .where(
+                NotificationEmail.status == NOTIFICATION_EMAIL_PENDING,
+                NotificationEmail.deliver_after <= now,
+            )
+            .order_by(NotificationEmail.user_id, NotificationEmail.id)
+            .limit(limit)
+        )
+        if self.db.bind.dialect.name == "postgresql":
+            query = query.with_for_update(skip_locked=True)
+        ids = list((await self.db.execute(query)).scalars().all())
+        if not ids:
+            return []
+        await self.db.execute(
+            update(NotificationEmail)
+            .where(NotificationEmail.id.in_(ids))
+            .values(deliver_after=now + timedelta(seconds=DELIVERY_CLAIM_SECONDS))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        result = await self.db.execute(
+            select(NotificationEmail)
+            .where(NotificationEmail.id.in_(ids))
+            .order_by(NotificationEmail.user_id, NotificationEmail.id)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def _send(
+        self, rows: list[NotificationEmail], branding: dict, to_email: str
+    ) -> None:
+        from src.email.service import EmailService
+
+        if len(rows) == 1:
+            subject, body = _render_one(branding, rows[0])
+        else:
+            subject, body = _render_digest(branding, rows)
+        first = rows[0]
+        async with self.db.begin_nested():
+            await EmailService(self.db).queue_email(
+                to_email=to_email,
+                subject=subject,
+                body=body,
+                sent_by_id=first.sent_by_id or first.user_id,
+                entity_type=first.entity_type if len(rows) == 1 else None,
+                entity_id=first.entity_id if len(rows) == 1 else None,
+            )
+
+    async def deliver_due_emails(self, limit: int = DELIVERY_BATCH_SIZE) -> int:
+        """Send every due row (up to ``limit``). Returns emails sent."""
+        now = datetime.now(UTC)
+        rows = await self._claim_due(now, limit)
+        if not rows:
+            return 0
+
+        user_ids = {row.user_id for row in rows}
+        result = await self.db.execute(
+            select(User.id, User.email).where(User.id.in_(user_ids))
+        )
+        addresses = {user_id: email for user_id, email in result.all() if email}
+
+        sent = 0
+        for user_id, group in groupby(rows, key=lambda row: row.user_id):
+            user_rows = list(group)
+            to_email = addresses.get(user_id)
+            if not to_email:
+                logger.debug("notif email skipped: user_id=%s has no email", user_id)
+                for row in user_rows:
+                    row.status = NOTIFICATION_EMAIL_SKIPPED
+                await self.db.commit()
+                continue
+
+            branding = await TenantBrandingHelper.get_branding_for_user(self.db, user_id)
+            messages = [[row] for row in user_rows if not row.digest]
+            digest_rows = [row for row in user_rows if row.digest]
+            if digest_rows:
+                messages.append(digest_rows)
+
+            for covered in messages:
+                try:
+                    await self._send(covered, branding, to_email)
+                except Exception as exc:
+                    # A failure here means the user gets no email despite
+                    # the matrix gate saying they should — alarm on it.
+                    logger.error(
+                        "notification_email_dispatch_failed user_id=%s rows=%s",
+                        user_id, [row.id for row in covered],
+                        exc_info=True,
+                    )
+                    status, error = NOTIFICATION_EMAIL_FAILED, str(exc)[:500]
+                else:
+                    status, error = NOTIFICATION_EMAIL_SENT, None
+                    sent += 1
+                for row in covered:
+                    row.attempts += 1
+                    row.status = status
+                    row.last_error = error
+                    if error is None:
+                        row.sent_at = now
+                await self.db.commit()
+
+        return sent
@@ -0,0 +1,138 @@
+"""Batched notification fan-out.
+
+``dispatch_notifications`` delivers one event to any number of recipients
+at a fixed query cost: one ``load_recipient_contexts`` query resolves every
+recipient's prefs, timezone and address, and the in-app ``notifications``
+rows and deferred ``notification_emails`` rows are written with one bulk
+``INSERT`` per table. The bulk insert bypasses the ORM hooks, so it
+records the recipients' unread-count changes itself.
+
+Emails are never sent here. Each allowed email becomes a
+``NotificationEmail`` row scheduled by ``notification_gate.email_schedule``
+and is rendered and sent later by ``NotificationDeliveryService``, so the
+triggering request does no branding lookups and never waits on Gmail. When
+an email is due now, the delivery job is woken as soon as the request
+commits.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.account.notification_gate import (
+    email_schedule,
+    load_recipient_contexts,
+    resolve_channels,
+)
+from src.notifications.delivery import wake_after_commit
+from src.notifications.models import Notification, NotificationEmail
+from src.notifications.realtime import record_unread_change
+
+
+@dataclass(frozen=True)
+class NotificationDraft:
+    """What one recipient should receive for an event.
+
+    ``email_context`` is the data dict for the event's branded renderer
+    (see ``delivery.EMAIL_RENDERERS``); ``None`` means in-app only.
+    ``email_link`` is the deep link listed for this item in a digest.
+    ``email_sender_id`` picks the Gmail account the email is sent
+    through; it defaults to the recipient.
+    """
+
+    type: str
+    title: str
+    message: str
+    entity_type: str | None = None
+    entity_id: int | None = None
+    email_context: dict | None = None
+    email_link: str | None = None
+    email_sender_id: int | None = None
+
+
+def _email_values(
+    user_id: int,
+    event_type: str,
+    draft: NotificationDraft,
+    deliver_after: datetime,
+    digest: bool,
+) -> dict:
+    return {
+        "user_id": user_id,
+        "sent_by_id": draft.email_sender_id,
+        "event_type": event_type,
+        "context": draft.email_context,
+        "link": draft.email_link,
+        "entity_type": draft.entity_type,
+        "entity_id": draft.entity_id,
+        "deliver_after": deliver_after,
+        "digest": digest,
+    }
+
+
+async def dispatch_notifications(
+    db: AsyncSession,
+    event_type: str,
+    drafts: Mapping[int, NotificationDraft],
+    *,
+    gated: bool = True,
+    now: datetime | None = None,
+) -> dict[int, Notification]:
+    """Write in-app notifications and queue emails for ``drafts``.
+
+    ``drafts`` maps recipient user id to what they should receive.
+    ``event_type`` is the matrix key the recipients' prefs are checked
+    against, and names the email renderer. ``gated=False`` skips the
+    prefs lookup entirely: every recipient gets the in-app row and any
+    email goes out immediately (used by flows that predate the matrix).
+
+    Returns the created notifications keyed by recipient; recipients
+    whose in-app channel is off are absent.
+    """
+    if not drafts:
+        return {}
+    now = now or datetime.now(UTC)
+    contexts = await load_recipient_contexts(db, drafts) if gated else {}
+
+    in_app_rows: list[dict] = []
+    email_rows: list[dict] = []
+    for user_id, draft in drafts.items():
+        if gated:
+            ctx = contexts.get(user_id)
+            if ctx is None:
+                continue
+            in_app_allowed, email_allowed = resolve_channels(ctx, event_type, now)
+            email_allowed = email_allowed and ctx.email is not None
+        else:
+            ctx = None
+            in_app_allowed, email_allowed = True, True
+
+        if in_app_allowed:
+            in_app_rows.append({
+                "user_id": user_id,
+                "type": draft.type,
+                "title": draft.title,
+                "message": draft.message,
+                "entity_type": draft.entity_type,
+                "entity_id": draft.entity_id,
+            })
+        if email_allowed and draft.email_context is not None:
+            deliver_after, digest = email_schedule(ctx, now) if ctx else (now, False)
+            email_rows.append(_email_values(user_id, event_type, draft, deliver_after, digest))
+
+    # ORM bulk INSERTs: one statement per table however many recipients
+    # (the unit of work would insert row by row on SQLite).
+    notifications: dict[int, Notification] = {}
+    if in_app_rows:
+        result = await db.scalars(insert(Notification).returning(Notification), in_app_rows)
+        notifications = {notif.user_id: notif for notif in result.all()}
+        for user_id in notifications:
+            record_unread_change(db, user_id, 1)
+    if email_rows:
+        await db.execute(insert(NotificationEmail), email_rows)
+        if any(row["deliver_after"] <= now for row in email_rows):
+            wake_after_commit(db)
+    return notifications
@@ -42,9 +42,9 @@ async def notification_event_handler(event_type: str, payload: dict[str, Any]) -
     """Handle CRM events by creating in-app notifications.
 
     Registered with the event emitter for the events listed in main.py.
-    On unrecoverable error, we log with full context (entity_id, user_id,
-    traceback) so the operator can correlate a missing notification back
-    to the originating event without grepping the request id by hand.
+    On error, we log with full context (entity_id, user_id, traceback) so
+    the operator can correlate a missing notification back to the
+    originating event, then re-raise so the outbox dispatcher retries it.
     """
     async with _db.async_session_maker() as session:
         try:
@@ -69,6 +69,7 @@ async def notification_event_handler(event_type: str, payload: dict[str, Any]) -
                 exc_info=True,
             )
             await session.rollback()
+            raise
 
 
 async def _gate(session, event_type: str, recipient_id: int) -> bool:
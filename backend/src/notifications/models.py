@@ -1,12 +1,29 @@
-"""Notification model for in-app notifications."""
+"""Notification models: in-app notifications and their deferred emails."""
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    inspect,
+)
+from sqlalchemy.orm import Mapped, mapped_column, object_session
 
 from src.database import Base
 
+NOTIFICATION_EMAIL_PENDING = "pending"
+NOTIFICATION_EMAIL_SENT = "sent"
+NOTIFICATION_EMAIL_FAILED = "failed"
+NOTIFICATION_EMAIL_SKIPPED = "skipped"
+
 
 class Notification(Base):
     """In-app notification for users."""
@@ -38,5 +55,80 @@ class Notification(Base):
 
     __table_args__ = (
         Index("ix_notifications_user_read", "user_id", "is_read"),
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
         Index("ix_notifications_entity", "entity_type", "entity_id"),
     )
+
+
+class NotificationEmail(Base):
+    """
+    A notification email waiting to be rendered and sent.
+
+    Written by ``src.notifications.dispatcher`` in the triggering request's
+    transaction and drained by ``NotificationDeliveryService``, so requests
+    never wait on branding lookups or Gmail. ``context`` is the data dict
+    for the event's branded renderer. ``digest`` rows due at the same time
+    for the same user are merged into one message.
+    """
+    __tablename__ = "notification_emails"
+    __table_args__ = (
+        Index("ix_notification_emails_status_deliver_after", "status", "deliver_after"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    # Gmail account the email goes out through; the recipient when unset.
+    sent_by_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL")
+    )
+
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    context: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    link: Mapped[str | None] = mapped_column(String(500))
+    entity_type: Mapped[str | None] = mapped_column(String(50))
+    entity_id: Mapped[int | None] = mapped_column(Integer)
+
+    deliver_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    digest: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+
+    status: Mapped[str] = mapped_column(
+        String(20), default=NOTIFICATION_EMAIL_PENDING, nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
+# Keep src.notifications.realtime's unread counts in step with ORM writes.
+# Bulk statements bypass these hooks and record their own changes.
+def _record_unread(target: Notification, change: int) -> None:
+    from src.notifications.realtime import record_unread_change
+
+    record_unread_change(object_session(target), target.user_id, change)
+
+
+def _count_inserted(_mapper, _connection, target: Notification) -> None:
+    if not target.is_read:
+        _record_unread(target, 1)
+
+
+def _count_read_toggle(_mapper, _connection, target: Notification) -> None:
+    history = inspect(target).attrs.is_read.history
+    if history.deleted and bool(history.deleted[0]) != bool(target.is_read):
+        _record_unread(target, -1 if target.is_read else 1)
+
+
+def _count_deleted(_mapper, _connection, target: Notification) -> None:
+    if not target.is_read:
+        _record_unread(target, -1)
+
+
+event.listen(Notification, "after_insert", _count_inserted)
+event.listen(Notification, "after_update", _count_read_toggle)
+event.listen(Notification, "after_delete", _count_deleted)
@@ -0,0 +1,259 @@
+"""Pushed unread counts for the notification bell.
+
+The bell used to poll ``/unread-count`` every 30 seconds — a ``COUNT(*)``
+per open tab whether anything had changed or not. Each process now keeps
+its users' unread counts in memory (:class:`NotificationHub`) and pushes
+every change to the tabs streaming ``GET /api/notifications/stream``
+(Server-Sent Events), so an idle tab costs an open connection and a
+keepalive comment, not queries.
+
+A count is loaded with one ``COUNT`` the first time it is needed and is
+then moved by the writes themselves: ORM inserts, updates and deletes of
+``Notification`` are seen by the mapper hooks in ``models``, and the bulk
+statements (dispatcher fan-out, mark-all-read, delete-all) call
+:func:`record_unread_change` with the number of unread rows they touched.
+Changes are always deltas, never "now zero", so a notification committed
+alongside a mark-all-read is still counted. They wait on the session and
+are applied only after it commits, so a rolled-back write never moves a
+badge.
+
+With a shared cache backend (``CACHE_BACKEND=redis``) every applied
+change is also published on the backend's invalidation channel, so the
+other workers move their copy and push to their own streams. Counts are
+recounted once older than ``NOTIFICATION_UNREAD_TTL_SECONDS``, which
+bounds drift from raw SQL writes or a missed broadcast.
+
+Without one (the default ``memory`` backend) a worker never hears about
+writes made on another, so counts are trusted only for
+``NOTIFICATION_UNREAD_LOCAL_TTL_SECONDS`` and open streams recount on
+their keepalive: a multi-worker deploy without Redis converges within
+about that long instead of ten minutes, at roughly the cost of the old
+polling.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+import src.database as _db
+from src.config import settings
+from src.core.cache import app_cache
+from src.notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+# Broadcast format: ``notifications:<origin>:<user_id>:<delta>``, where the
+# delta is a signed integer.
+BROADCAST_PREFIX = "notifications:"
+
+# session.info key holding the changes a session will apply on commit.
+_PENDING_KEY = "notification_unread_changes"
+
+
+async def count_unread(db: AsyncSession, user_id: int) -> int:
+    result = await db.execute(
+        select(func.count()).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False,
+        )
+    )
+    return result.scalar() or 0
+
+
+def _sync_session(db: AsyncSession | Session) -> Session:
+    return db.sync_session if isinstance(db, AsyncSession) else db
+
+
+def _has_pending(db: AsyncSession | Session, user_id: int) -> bool:
+    pending = _sync_session(db).info.get(_PENDING_KEY)
+    return bool(pending) and any(uid == user_id for uid, _ in pending)
+
+
+def record_unread_change(
+    db: AsyncSession | Session | None, user_id: int, change: int
+) -> None:
+    """Apply ``change`` to ``user_id``'s count once ``db`` commits."""
+    if db is None:
+        return
+    session = _sync_session(db)
+    session.info.setdefault(_PENDING_KEY, []).append((user_id, change))
+    if not event.contains(session, "after_commit", _apply_pending):
+        event.listen(session, "after_commit", _apply_pending)
+        event.listen(session, "after_rollback", _drop_pending)
+
+
+def _apply_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        hub = get_notification_hub()
+        for user_id, change in pending:
+            hub.apply(user_id, change)
+
+
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+class NotificationHub:
+    """Per-process unread counts and the streams waiting on them."""
+
+    def __init__(self, *, ttl_seconds: int | None = None, local_ttl_seconds: int | None = None):
+        self._ttl_seconds = ttl_seconds
+        self._local_ttl_seconds = local_ttl_seconds
+        # Identifies this process's broadcasts so it skips its own.
+        self.origin = uuid.uuid4().hex
+        self._counts: dict[int, tuple[int, float]] = {}
+        # Bumped by every applied change, so a COUNT that raced a write is
+        # returned but not cached.
+        self._versions: dict[int, int] = {}
+        self._streams: dict[int, set[asyncio.Queue[int]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._hits = 0
+        self._loads = 0
+        self._pushes = 0
+
+    @property
+    def shared(self) -> bool:
+        """Whether changes reach the other workers (a shared cache backend)."""
+        return app_cache.backend.shared
+
+    @property
+    def ttl_seconds(self) -> int:
+        """How long a loaded count is trusted before it is recounted."""
+        if self.shared:
+            return self._ttl_seconds or settings.NOTIFICATION_UNREAD_TTL_SECONDS
+        return self._local_ttl_seconds or settings.NOTIFICATION_UNREAD_LOCAL_TTL_SECONDS
+
+    def _cached(self, user_id: int) -> int | None:
+        entry = self._counts.get(user_id)
+        if entry is None:
+            return None
+        count, loaded_at = entry
+        if time.monotonic() - loaded_at > self.ttl_seconds:
+            del self._counts[user_id]
+            return None
+        return count
+
+    async def unread_count(self, user_id: int, db: AsyncSession | None = None) -> int:
+        """``user_id``'s unread count, from memory when known.
+
+        Without ``db`` a count that has to be loaded is read on a session
+        of its own.
+        """
+        cached = self._cached(user_id)
+        if cached is not None:
+            self._hits += 1
+            return cached
+        self._loads += 1
+        version = self._versions.get(user_id, 0)
+        if db is None:
+            async with _db.async_session_maker() as session:
+                count = await count_unread(session, user_id)
+        else:
+            count = await count_unread(db, user_id)
+        # Uncommitted changes in ``db`` are already in this COUNT and would
+        # be applied again on commit.
+        if self._versions.get(user_id, 0) == version and (db is None or not _has_pending(db, user_id)):
+            self._counts[user_id] = (count, time.monotonic())
+        return count
+
+    def apply(self, user_id: int, change: int, *, broadcast: bool = True) -> None:
+        """Move ``user_id``'s count by a committed change and push it."""
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+        count = self._cached(user_id)
+        if count is not None:
+            count = max(0, count + change)
+            self._counts[user_id] = (count, self._counts[user_id][1])
+        if user_id in self._streams:
+            if count is None:
+                self._spawn(self._reload_and_push(user_id))
+            else:
+                self._push(user_id, count)
+        if broadcast and self.shared:
+            self._spawn(self._broadcast(user_id, change))
+
+    def on_broadcast(self, message: str) -> None:
+        """Cache-backend listener: apply another worker's change."""
+        if not message.startswith(BROADCAST_PREFIX):
+            return
+        try:
+            origin, user_id, change = message[len(BROADCAST_PREFIX):].split(":")
+            parsed = int(change)
+            if origin != self.origin:
+                self.apply(int(user_id), parsed, broadcast=False)
+        except ValueError:
+            logger.warning("[notifications] ignoring malformed broadcast %r", message)
+
+    async def _broadcast(self, user_id: int, change: int) -> None:
+        try:
+            await app_cache.backend.publish(f"{BROADCAST_PREFIX}{self.origin}:{user_id}:{change}")
+        except Exception:
+            logger.exception("[notifications] failed to broadcast unread change for user %s", user_id)
+
+    async def _reload_and_push(self, user_id: int) -> None:
+        try:
+            count = await self.unread_count(user_id)
+        except Exception:
+            logger.exception("[notifications] failed to reload unread count for user %s", user_id)
+            return
+        self._push(user_id, count)
+
+    def _spawn(self, coro: Any) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            # No loop (sync scripts): nobody is streaming from this process.
+            coro.close()
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _push(self, user_id: int, count: int) -> None:
+        for queue in self._streams.get(user_id, ()):
+            # A stream only needs the latest count; replace one not yet sent.
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(count)
+            self._pushes += 1
+
+    def subscribe(self, user_id: int) -> asyncio.Queue[int]:
+        queue: asyncio.Queue[int] = asyncio.Queue(maxsize=1)
+        self._streams.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue[int]) -> None:
+        streams = self._streams.get(user_id)
+        if streams is not None:
+            streams.discard(queue)
+            if not streams:
+                del self._streams[user_id]
+
+    def clear(self) -> None:
+        """Forget every cached count (tests)."""
+        self._counts.clear()
+        self._versions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """In-process counters: cached users, open streams, and totals since start."""
+        return {
+            "cached_users": len(self._counts),
+            "streaming_users": len(self._streams),
+            "streams": sum(len(queues) for queues in self._streams.values()),
+            "hits": self._hits,
+            "loads": self._loads,
+            "pushes": self._pushes,
+        }
+
+
+# Process-wide hub; it only touches the event loop once a stream subscribes.
+notification_hub = NotificationHub()
+
+
+def get_notification_hub() -> NotificationHub:
+    return notification_hub
@@ -1,10 +1,18 @@
 """Notification API routes."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from src.config import settings
 from src.core.constants import HTTPStatus
 from src.core.entity_links import fill_entity_labels
+from src.core.http_errors import value_error_as_400
 from src.core.router_utils import CurrentUser, DBSession, calculate_pages
+from src.notifications.realtime import get_notification_hub
 from src.notifications.schemas import (
     NotificationListResponse,
     NotificationResponse,
@@ -22,15 +30,18 @@ async def list_notifications(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     unread_only: bool = Query(False),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
 ):
     """List notifications for the current user."""
     service = NotificationService(db)
-    items, total = await service.get_list(
-        user_id=current_user.id,
-        page=page,
-        page_size=page_size,
-        unread_only=unread_only,
-    )
+    with value_error_as_400():
+        items, total, next_cursor = await service.get_list(
+            user_id=current_user.id,
+            page=page,
+            page_size=page_size,
+            unread_only=unread_only,
+            cursor=cursor,
+        )
 
     # Resolve (entity_type, entity_id) → label + link in one batched pass
     # so the bell can render an EntityLink chip without each row firing
@@ -56,7 +67,8 @@ async def list_notifications(
         total=total,
         page=page,
         page_size=page_size,
-        pages=calculate_pages(total, page_size),
+        pages=calculate_pages(total, page_size) if total is not None else None,
+        next_cursor=next_cursor,
     )
 
 
@@ -71,6 +83,59 @@ async def get_unread_count(
     return UnreadCountResponse(count=count)
 
 
+def _unread_event(count: int) -> str:
+    return f"event: unread\ndata: {json.dumps({'count': count})}\n\n"
+
+
+@router.get("/stream")
+async def stream_notifications(current_user: CurrentUser):
+    """Server-Sent Events: the unread count now, then each time it changes.
+
+    Replaces polling ``/unread-count``. Counts come from the in-memory hub,
+    so an idle stream costs a keepalive comment, not a query. Without a
+    shared cache backend, writes on other workers never reach this one's
+    hub, so each keepalive rereads the count (a query at most once per
+    short local TTL) and sends it if it moved. A count that has to be
+    loaded uses a short-lived session of its own rather than the
+    request's, which must not stay checked out for the life of the stream.
+    """
+    hub = get_notification_hub()
+    user_id = current_user.id
+    # Subscribe before reading so a change landing in between is not lost.
+    queue = hub.subscribe(user_id)
+    try:
+        count = await hub.unread_count(user_id)
+    except BaseException:
+        hub.unsubscribe(user_id, queue)
+        raise
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            yield "retry: 5000\n\n"
+            yield _unread_event(count)
+            sent = count
+            while True:
+                try:
+                    latest = await asyncio.wait_for(
+                        queue.get(), timeout=settings.NOTIFICATION_STREAM_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    latest = sent if hub.shared else await hub.unread_count(user_id)
+                    if latest == sent:
+                        yield ": keepalive\n\n"
+                        continue
+                yield _unread_event(latest)
+                sent = latest
+        finally:
+            hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_read(
     notification_id: int,
@@ -29,10 +29,12 @@ class NotificationResponse(BaseModel):
 class NotificationListResponse(BaseModel):
     """Paginated list of notifications."""
     items: list[NotificationResponse]
-    total: int
+    # Reported on the first request only (no cursor).
+    total: int | None = None
     page: int
     page_size: int
-    pages: int
+    pages: int | None = None
+    next_cursor: str | None = None
 
 
 class UnreadCountResponse(BaseModel):
@@ -1,15 +1,29 @@
-"""Notification service layer."""
+"""Notification service layer.
+
+The ``notify_*`` helpers build a :class:`NotificationDraft` per recipient
+and hand them to :func:`dispatch_notifications`, which gates, writes the
+in-app rows and queues the emails for every recipient at a fixed query
+cost. The ``notify_mentions`` / ``notify_email_reply_recipients`` batch
+forms take many recipients at once; the singular helpers wrap them.
+
+Unread counts come from ``src.notifications.realtime``, which keeps them in
+memory and pushes changes to the bell's stream.
+"""
 
 import logging
+from collections.abc import Iterable
+from datetime import datetime
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.account.notification_gate import gate_event
 from src.auth.models import User
 from src.config import settings
 from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.cursors import decode_keyset_cursor, encode_keyset_cursor
+from src.notifications.dispatcher import NotificationDraft, dispatch_notifications
 from src.notifications.models import Notification
+from src.notifications.realtime import get_notification_hub, record_unread_change
 
 logger = logging.getLogger(__name__)
 
@@ -31,71 +45,6 @@ def _deep_link(entity_type: str, entity_id: int, *, suffix: str = "") -> str:
     return f"{_frontend_url()}{segment}/{entity_id}{suffix}"
 
 
-async def _user_email(db: AsyncSession, user_id: int) -> str | None:
-    """Look up an authenticated user's primary email.
-
-    Returns ``None`` when the user is missing or has no email — the
-    caller treats that as "skip the email send" without raising, since
-    the in-app notification has already been written.
-    """
-    user = await db.get(User, user_id)
-    if not user or not user.email:
-        return None
-    return user.email
-
-
-async def _queue_notification_email(
-    db: AsyncSession,
-    *,
-    user_id: int,
-    event_type: str,
-    subject: str,
-    body_html: str,
-    entity_type: str | None,
-    entity_id: int | None,
-) -> None:
-    """Best-effort email send for a matrix-gated notification event.
-
-    Caller is expected to have already checked
-    :func:`should_send_email`; this helper resolves the user's email,
-    enqueues the message via :class:`EmailService`, and swallows transport
-    failures with a warning so the in-app notification stays delivered.
-    ``sent_by_id`` is the recipient — outbound rows are visible to the
-    recipient on their email log without leaking through participant
-    overlap to anyone else.
-    """
-    to_email = await _user_email(db, user_id)
-    if not to_email:
-        logger.debug(
-            "notif email skipped: user_id=%s has no email (event=%s)",
-            user_id, event_type,
-        )
-        return
-    try:
-        from src.email.service import EmailService
-
-        email_service = EmailService(db)
-        await email_service.queue_email(
-            to_email=to_email,
-            subject=subject,
-            body=body_html,
-            sent_by_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-        )
-    except Exception:
-        # Bumped to ERROR (was WARNING): a failure here means the user
-        # gets no email despite the matrix gate saying they should.
-        # That covers both transport failures (Gmail outage) and
-        # programming errors (TypeError on EmailQueue, AttributeError
-        # from a future field rename). Either deserves a real alarm.
-        logger.error(
-            "notification_email_dispatch_failed user_id=%s event=%s",
-            user_id, event_type,
-            exc_info=True,
-        )
-
-
 class NotificationService:
     """Service for notification CRUD operations."""
 
@@ -137,31 +86,56 @@ class NotificationService:
         page: int = 1,
         page_size: int = DEFAULT_PAGE_SIZE,
         unread_only: bool = False,
-    ) -> tuple[list[Notification], int]:
-        """Get paginated notifications for a user."""
+        cursor: str | None = None,
+    ) -> tuple[list[Notification], int | None, str | None]:
+        """Get a user's notifications, newest first.
+
+        Returns ``(items, total, next_cursor)``. Follow ``next_cursor`` for
+        later pages (keyset on ``(created_at, id)``); ``page`` remains as an
+        OFFSET fallback. ``total`` is only reported without a cursor, and
+        for ``unread_only`` it is the in-memory unread count.
+
+        Raises:
+            ValueError: ``cursor`` is not one this method issued.
+        """
         filters = [Notification.user_id == user_id]
         if unread_only:
             filters.append(Notification.is_read == False)
 
-        # Count
-        count_query = select(func.count()).select_from(
-            select(Notification.id).where(*filters).subquery()
-        )
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        total = None
+        if cursor is None:
+            if unread_only:
+                total = await get_notification_hub().unread_count(user_id, self.db)
+            else:
+                count_query = select(func.count()).where(*filters)
+                total = (await self.db.execute(count_query)).scalar() or 0
 
-        # Fetch
         query = (
             select(Notification)
             .where(*filters)
-            .order_by(Notification.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
-        result = await self.db.execute(query)
+            .order_by(Notification.created_at.desc(), Notification.id.desc())
+        )
+        if cursor:
+            created_at, notification_id = decode_keyset_cursor(cursor, (datetime, int))
+            query = query.where(
+                or_(
+                    Notification.created_at < created_at,
+                    and_(
+                        Notification.created_at == created_at,
+                        Notification.id < notification_id,
+                    ),
+                )
+            )
+        else:
+            query = query.offset((page - 1) * page_size)
+        result = await self.db.execute(query.limit(page_size + 1))
         items = list(result.scalars().all())
 
-        return items, total
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            next_cursor = encode_keyset_cursor(items[-1].created_at, items[-1].id)
+        return items, total, next_cursor
 
     async def mark_read(self, notification_id: int, user_id: int) -> Notification | None:
         """Mark a notification as read."""
@@ -182,17 +156,14 @@ class NotificationService:
         )
         result = await self.db.execute(stmt)
         await self.db.flush()
+        # Only the rows this statement read: a notification inserted
+        # concurrently stays unread and keeps its +1.
+        record_unread_change(self.db, user_id, -result.rowcount)
         return result.rowcount
 
     async def get_unread_count(self, user_id: int) -> int:
-        """Get count of unread notifications for a user."""
-        result = await self.db.execute(
-            select(func.count()).where(
-                Notification.user_id == user_id,
-                Notification.is_read == False,
-            )
-        )
-        return result.scalar() or 0
+        """Get count of unread notifications for a user (in memory once loaded)."""
+        return await get_notification_hub().unread_count(user_id, self.db)
 
     async def delete_notification(self, notification_id: int, user_id: int) -> bool:
         """Delete a single notification. Returns True if deleted."""
@@ -205,10 +176,15 @@ class NotificationService:
 
     async def delete_all_notifications(self, user_id: int) -> int:
         """Delete all notifications for a user. Returns count deleted."""
-        stmt = delete(Notification).where(Notification.user_id == user_id)
-        result = await self.db.execute(stmt)
+        stmt = (
+            delete(Notification)
+            .where(Notification.user_id == user_id)
+            .returning(Notification.is_read)
+        )
+        was_read = (await self.db.execute(stmt)).scalars().all()
         await self.db.flush()
-        return result.rowcount
+        record_unread_change(self.db, user_id, -was_read.count(False))
+        return len(was_read)
 
 
 async def notify_on_assignment(
@@ -230,47 +206,24 @@ async def notify_on_assignment(
     with whatever metadata is available, including just the entity
     name).
     """
-    notif: Notification | None = None
-    in_app_allowed, email_allowed = await gate_event(db, user_id, "lead_assigned")
-    if in_app_allowed:
-        service = NotificationService(db)
-        notif = await service.create_notification(
-            user_id=user_id,
-            type="assignment",
-            title=f"{entity_type.rstrip('s').capitalize()} assigned to you",
-            message=f"You have been assigned {entity_name}",
-            entity_type=entity_type,
-            entity_id=entity_id,
-        )
-
-    if email_allowed:
-        from src.email.branded_templates import (
-            TenantBrandingHelper,
-            render_lead_assigned_email,
-        )
-
-        branding = await TenantBrandingHelper.get_branding_for_user(db, user_id)
-        deep_link = _deep_link(entity_type, entity_id)
-        subject, body = render_lead_assigned_email(
-            branding,
-            {
-                "lead_full_name": entity_name,
-                "lead_email": entity_email or "",
-                "lead_company_name": entity_company or "",
-                "lead_url": deep_link,
-                "assigner_name": assigner_name or "",
-            },
-        )
-        await _queue_notification_email(
-            db,
-            user_id=user_id,
-            event_type="lead_assigned",
-            subject=subject,
-            body_html=body,
-            entity_type=entity_type,
-            entity_id=entity_id,
-        )
-    return notif
+    deep_link = _deep_link(entity_type, entity_id)
+    draft = NotificationDraft(
+        type="assignment",
+        title=f"{entity_type.rstrip('s').capitalize()} assigned to you",
+        message=f"You have been assigned {entity_name}",
+        entity_type=entity_type,
+        entity_id=entity_id,
+        email_context={
+            "lead_full_name": entity_name,
+            "lead_email": entity_email or "",
+            "lead_company_name": entity_company or "",
+            "lead_url": deep_link,
+            "assigner_name": assigner_name or "",
+        },
+        email_link=deep_link,
+    )
+    created = await dispatch_notifications(db, "lead_assigned", {user_id: draft})
+    return created.get(user_id)
 
 
 async def notify_on_stage_change(
@@ -291,76 +244,73 @@ async def notify_on_stage_change(
     would create a confusing asymmetry. When the UI gains a stage-
     change toggle, gate both paths together.
     """
-    service = NotificationService(db)
-    return await service.create_notification(
-        user_id=user_id,
+    draft = NotificationDraft(
         type="stage_change",
         title=f"Stage changed: {entity_name}",
         message=f"Moved from {old_stage} to {new_stage}",
         entity_type=entity_type,
         entity_id=entity_id,
     )
+    created = await dispatch_notifications(db, "stage_change", {user_id: draft}, gated=False)
+    return created.get(user_id)
 
 
-async def notify_on_mention(
+async def notify_mentions(
     db: AsyncSession,
-    mentioned_user_id: int,
+    mentioned_user_ids: Iterable[int],
     author_name: str,
     entity_type: str,
     entity_id: int,
     content_snippet: str,
     *,
     entity_label: str | None = None,
-) -> Notification | None:
-    """Create a notification when a user is @mentioned.
+) -> dict[int, Notification]:
+    """Notify every @mentioned user of one comment in a single dispatch.
 
     ``entity_label`` is the human-readable name of the host entity
     (e.g. "Acme - Q3 Renewal" for an opportunity); when provided it
     flows into the email subject and body for context. Falls back to
     the entity_type slug when absent.
     """
-    notif: Notification | None = None
-    in_app_allowed, email_allowed = await gate_event(db, mentioned_user_id, "mention")
-    if in_app_allowed:
-        service = NotificationService(db)
-        notif = await service.create_notification(
-            user_id=mentioned_user_id,
-            type="mention",
-            title=f"{author_name} mentioned you",
-            message=content_snippet[:200],
-            entity_type=entity_type,
-            entity_id=entity_id,
-        )
+    deep_link = _deep_link(entity_type, entity_id)
+    draft = NotificationDraft(
+        type="mention",
+        title=f"{author_name} mentioned you",
+        message=content_snippet[:200],
+        entity_type=entity_type,
+        entity_id=entity_id,
+        email_context={
+            "author_name": author_name,
+            "entity_label": entity_label or entity_type.rstrip("s"),
+            "entity_url": deep_link,
+            "content_snippet": content_snippet,
+        },
+        email_link=deep_link,
+    )
+    return await dispatch_notifications(
+        db, "mention", dict.fromkeys(mentioned_user_ids, draft)
+    )
 
-    if email_allowed:
-        from src.email.branded_templates import (
-            TenantBrandingHelper,
-            render_mention_email,
-        )
 
-        branding = await TenantBrandingHelper.get_branding_for_user(
-            db, mentioned_user_id,
-        )
-        deep_link = _deep_link(entity_type, entity_id)
-        subject, body = render_mention_email(
-            branding,
-            {
-                "author_name": author_name,
-                "entity_label": entity_label or entity_type.rstrip("s"),
-                "entity_url": deep_link,
-                "content_snippet": content_snippet,
-            },
-        )
-        await _queue_notification_email(
-            db,
-            user_id=mentioned_user_id,
-            event_type="mention",
-            subject=subject,
-            body_html=body,
-            entity_type=entity_type,
-            entity_id=entity_id,
-        )
-    return notif
+async def notify_on_mention(
+    db: AsyncSession,
+    mentioned_user_id: int,
+    author_name: str,
+    entity_type: str,
+    entity_id: int,
+    content_snippet: str,
+    *,
+    entity_label: str | None = None,
+) -> Notification | None:
+    """Create a notification when a user is @mentioned.
+
+    Single-recipient form of :func:`notify_mentions`.
+    """
+    created = await notify_mentions(
+        db, [mentioned_user_id], author_name, entity_type, entity_id,
+        content_snippet, entity_label=entity_label,
+    )
+    return created.get(mentioned_user_id)
 
 
 async def notify_on_activity_due(
@@ -378,139 +328,125 @@ async def notify_on_activity_due(
     email body when provided. Older callers that pass only the legacy
     arguments still get the in-app notification and a slimmer email.
     """
-    notif: Notification | None = None
-    in_app_allowed, email_allowed = await gate_event(db, user_id, "task_due")
-    if in_app_allowed:
-        service = NotificationService(db)
-        notif = await service.create_notification(
-            user_id=user_id,
-            type="activity_due",
-            title="Activity due",
-            message=f'Activity "{activity_subject}" is due soon',
-            entity_type="activities",
-            entity_id=activity_id,
-        )
-
-    if email_allowed:
-        from src.email.branded_templates import (
-            TenantBrandingHelper,
-            render_task_due_email,
-        )
-
-        branding = await TenantBrandingHelper.get_branding_for_user(db, user_id)
-        deep_link = _deep_link("activities", activity_id)
-        subject, body = render_task_due_email(
-            branding,
-            {
-                "activity_subject": activity_subject,
-                "activity_due_at": activity_due_at or "",
-                "activity_url": deep_link,
-                "entity_label": entity_label or "",
-            },
-        )
-        await _queue_notification_email(
-            db,
-            user_id=user_id,
-            event_type="task_due",
-            subject=subject,
-            body_html=body,
-            entity_type="activities",
-            entity_id=activity_id,
-        )
-    return notif
+    deep_link = _deep_link("activities", activity_id)
+    draft = NotificationDraft(
+        type="activity_due",
+        title="Activity due",
+        message=f'Activity "{activity_subject}" is due soon',
+        entity_type="activities",
+        entity_id=activity_id,
+        email_context={
+            "activity_subject": activity_subject,
+            "activity_due_at": activity_due_at or "",
+            "activity_url": deep_link,
+            "entity_label": entity_label or "",
+        },
+        email_link=deep_link,
+    )
+    created = await dispatch_notifications(db, "task_due", {user_id: draft})
+    return created.get(user_id)
 
 
-async def notify_on_email_reply_received(
+async def notify_email_reply_recipients(
     db: AsyncSession,
     *,
-    recipient_user_id: int,
+    recipient_user_ids: Iterable[int],
     contact_id: int,
     sender_email: str,
     sender_name: str | None,
     subject_line: str,
     snippet: str,
     participant_emails: list[str] | None = None,
-) -> Notification | None:
-    """Notify a participant user when an inbound email reply lands.
+) -> dict[int, Notification]:
+    """Notify participant users when an inbound email reply lands.
 
     Fired by the Gmail sync worker after :func:`_store_inbound`
     successfully links an inbound message to a CRM contact AND the
     inbound carries a literal ``In-Reply-To`` header (so this is a
     reply to a thread the CRM is on, not arbitrary cold inbound).
 
+    When ``participant_emails`` is given, a recipient is only notified
+    if one of their active Gmail addresses (primary or alias) is on the
+    message; every recipient's addresses come from one query.
+
     The deep link points at the contact detail page's email tab; the
     front-end will scroll to the latest message.
     """
+    recipient_user_ids = list(dict.fromkeys(recipient_user_ids))
     if participant_emails is not None:
-        from src.email.participants import get_user_connection_emails
+        from src.email.participants import get_connection_emails_by_user
 
         if not participant_emails:
             logger.debug(
-                "notify_on_email_reply_received: participant_emails is empty for user %s — skipping",
-                recipient_user_id,
-            )
-            return None
-        user_addrs = set(await get_user_connection_emails(db, recipient_user_id))
-        if not user_addrs:
-            logger.debug(
-                "notify_on_email_reply_received: user %s has no active Gmail connection — skipping",
-                recipient_user_id,
+                "notify_email_reply_recipients: participant_emails is empty for users %s — skipping",
+                recipient_user_ids,
             )
-            return None
-        if not user_addrs.intersection(a.lower() for a in participant_emails):
-            logger.warning(
-                "notify_on_email_reply_received: user %s connection emails do not overlap participant_emails — skipping",
-                recipient_user_id,
-            )
-            return None
-
-    notif: Notification | None = None
-    in_app_allowed, email_allowed = await gate_event(
-        db, recipient_user_id, "email_reply_received"
+            return {}
+        participants = {a.lower() for a in participant_emails}
+        connection_emails = await get_connection_emails_by_user(db, recipient_user_ids)
+        allowed = []
+        for user_id in recipient_user_ids:
+            user_addrs = connection_emails.get(user_id)
+            if not user_addrs:
+                logger.debug(
+                    "notify_email_reply_recipients: user %s has no active Gmail connection — skipping",
+                    user_id,
+                )
+            elif not user_addrs & participants:
+                logger.warning(
+                    "notify_email_reply_recipients: user %s connection emails do not overlap participant_emails — skipping",
+                    user_id,
+                )
+            else:
+                allowed.append(user_id)
+        recipient_user_ids = allowed
+
+    display_name = sender_name or sender_email or "A contact"
+    truncated = snippet[:200] if snippet else ""
+    deep_link = _deep_link("contacts", contact_id, suffix="?tab=emails")
+    draft = NotificationDraft(
+        type="email_reply",
+        title=f"Reply from {display_name}",
+        message=f'"{subject_line}" — {truncated}' if truncated else f'"{subject_line}"',
+        entity_type="contacts",
+        entity_id=contact_id,
+        email_context={
+            "sender_email": sender_email,
+            "sender_name": sender_name or "",
+            "subject_line": subject_line,
+            "snippet": snippet,
+            "thread_url": deep_link,
+        },
+        email_link=deep_link,
+    )
+    return await dispatch_notifications(
+        db, "email_reply_received", dict.fromkeys(recipient_user_ids, draft)
     )
-    if in_app_allowed:
-        service = NotificationService(db)
-        display_name = sender_name or sender_email or "A contact"
-        truncated = snippet[:200] if snippet else ""
-        notif = await service.create_notification(
-            user_id=recipient_user_id,
-            type="email_reply",
-            title=f"Reply from {display_name}",
-            message=f'"{subject_line}" — {truncated}' if truncated else f'"{subject_line}"',
-            entity_type="contacts",
-            entity_id=contact_id,
-        )
 
-    if email_allowed:
-        from src.email.branded_templates import (
-            TenantBrandingHelper,
-            render_email_reply_email,
-        )
 
-        branding = await TenantBrandingHelper.get_branding_for_user(
-            db, recipient_user_id,
-        )
-        deep_link = _deep_link("contacts", contact_id, suffix="?tab=emails")
-        subject, body = render_email_reply_email(
-            branding,
-            {
-                "sender_email": sender_email,
-                "sender_name": sender_name or "",
-                "subject_line": subject_line,
-                "snippet": snippet,
-                "thread_url": deep_link,
-            },
-        )
-        await _queue_notification_email(
-            db,
-            user_id=recipient_user_id,
-            event_type="email_reply_received",
-            subject=subject,
-            body_html=body,
-            entity_type="contacts",
-            entity_id=contact_id,
-        )
-    return notif
+async def notify_on_email_reply_received(
+    db: AsyncSession,
+    *,
+    recipient_user_id: int,
+    contact_id: int,
+    sender_email: str,
+    sender_name: str | None,
+    subject_line: str,
+    snippet: str,
+    participant_emails: list[str] | None = None,
+) -> Notification | None:
+    """Single-recipient form of :func:`notify_email_reply_recipients`."""
+    created = await notify_email_reply_recipients(
+        db,
+        recipient_user_ids=[recipient_user_id],
+        contact_id=contact_id,
+        sender_email=sender_email,
+        sender_name=sender_name,
+        subject_line=subject_line,
+        snippet=snippet,
+        participant_emails=participant_emails,
+    )
+    return created.get(recipient_user_id)
 
 
 async def notify_on_proposal_signed(
@@ -528,46 +464,23 @@ async def notify_on_proposal_signed(
     which mails the signer their PDF — this is the matrix-gated
     in-app + email notification to the internal owner.
     """
-    notif: Notification | None = None
-    in_app_allowed, email_allowed = await gate_event(db, owner_id, "proposal_signed")
-    if in_app_allowed:
-        service = NotificationService(db)
-        notif = await service.create_notification(
-            user_id=owner_id,
-            type="proposal_signed",
-            title="Proposal signed",
-            message=f'"{proposal_title}" was signed by {signer_name or "the client"}',
-            entity_type="proposals",
-            entity_id=proposal_id,
-        )
-
-    if email_allowed:
-        from src.email.branded_templates import (
-            TenantBrandingHelper,
-            render_proposal_signed_email,
-        )
-
-        branding = await TenantBrandingHelper.get_branding_for_user(db, owner_id)
-        deep_link = _deep_link("proposals", proposal_id)
-        subject, body = render_proposal_signed_email(
-            branding,
-            {
-                "proposal_title": proposal_title,
-                "signer_name": signer_name or "",
-                "signed_at": signed_at or "",
-                "proposal_url": deep_link,
-            },
-        )
-        await _queue_notification_email(
-            db,
-            user_id=owner_id,
-            event_type="proposal_signed",
-            subject=subject,
-            body_html=body,
-            entity_type="proposals",
-            entity_id=proposal_id,
-        )
-    return notif
+    deep_link = _deep_link("proposals", proposal_id)
+    draft = NotificationDraft(
+        type="proposal_signed",
+        title="Proposal signed",
+        message=f'"{proposal_title}" was signed by {signer_name or "the client"}',
+        entity_type="proposals",
+        entity_id=proposal_id,
+        email_context={
+            "proposal_title": proposal_title,
+            "signer_name": signer_name or "",
+            "signed_at": signed_at or "",
+            "proposal_url": deep_link,
+        },
+        email_link=deep_link,
+    )
+    created = await dispatch_notifications(db, "proposal_signed", {owner_id: draft})
+    return created.get(owner_id)
 
 
 async def notify_on_contract_signed(
@@ -595,86 +508,60 @@ async def notify_on_contract_signed(
         "delete this function entirely."
     )
     # Unreachable; kept as a paper trail for what the function used to do.
-    notif: Notification | None = None
-    in_app_allowed, email_allowed = await gate_event(db, owner_id, "contract_signed")
-    if in_app_allowed:
-        service = NotificationService(db)
-        notif = await service.create_notification(
-            user_id=owner_id,
-            type="contract_signed",
-            title="Contract signed",
-            message=f'"{contract_title}" was signed by {signer_name or "the client"}',
-            entity_type="contracts",
-            entity_id=contract_id,
-        )
-
-    if email_allowed:
-        from src.email.branded_templates import (
-            TenantBrandingHelper,
-            render_contract_signed_email,
-        )
-
-        branding = await TenantBrandingHelper.get_branding_for_user(db, owner_id)
-        deep_link = _deep_link("contracts", contract_id)
-        subject, body = render_contract_signed_email(
-            branding,
-            {
-                "audience": "owner",
-                # Use the preferred key so this dead branch stays
-                # consistent with the two live callers (proposals
-                # _send_signed_copy + dead contracts/service). If
-                # someone ever deletes the RuntimeError guard at
-                # line 591 to re-enable this path, the renderer's
-                # back-compat fallback would still accept the old
-                # key — but matching the preferred name keeps the
-                # contract honest.
-                "document_title": contract_title,
-                "signer_name": signer_name or "",
-                "signed_at": signed_at or "",
-                "contract_url": deep_link,
-            },
-        )
-        await _queue_notification_email(
-            db,
-            user_id=owner_id,
-            event_type="contract_signed",
-            subject=subject,
-            body_html=body,
-            entity_type="contracts",
-            entity_id=contract_id,
-        )
-    return notif
+    # Re-enabling it also needs a "contract_signed" entry in
+    # ``delivery.EMAIL_RENDERERS`` (render_contract_signed_email).
+    deep_link = _deep_link("contracts", contract_id)
+    draft = NotificationDraft(
+        type="contract_signed",
+        title="Contract signed",
+        message=f'"{contract_title}" was signed by {signer_name or "the client"}',
+        entity_type="contracts",
+        entity_id=contract_id,
+        email_context={
+            "audience": "owner",
+            # Preferred key, consistent with the two live callers
+            # (proposals _send_signed_copy + dead contracts/service).
+            "document_title": contract_title,
+            "signer_name": signer_name or "",
+            "signed_at": signed_at or "",
+            "contract_url": deep_link,
+        },
+        email_link=deep_link,
+    )
+    created = await dispatch_notifications(db, "contract_signed", {owner_id: draft})
+    return created.get(owner_id)
 
 
 async def notify_admins_of_pending_user(db: AsyncSession, user: User) -> None:
     """Notify every active admin that a new user is awaiting approval.
 
-    Best-effort: a failure to create a single notification is logged and
-    swallowed so it can't abort the sign-up transaction (which would
+    Best-effort: the fan-out runs in a SAVEPOINT and a failure is logged
+    and swallowed so it can't abort the sign-up transaction (which would
     silently rollback the newly-created user row and leave the requester
     stuck in a retry loop).
     """
     result = await db.execute(
-        select(User).where(
+        select(User.id).where(
             (User.is_superuser == True) | (User.role == "admin"),
             User.is_active == True,
         )
     )
-    admins = result.scalars().all()
-    service = NotificationService(db)
-    for admin in admins:
-        try:
-            await service.create_notification(
-                user_id=admin.id,
-                type="pending_approval",
-                title="New access request",
-                message=f"New access request: {user.full_name} ({user.email})",
-                entity_type="users",
-                entity_id=user.id,
-            )
-        except Exception:
-            logger.exception(
-                "Failed to notify admin %s of pending user %s",
-                admin.id,
-                user.id,
+    admin_ids = list(result.scalars().all())
+    draft = NotificationDraft(
+        type="pending_approval",
+        title="New access request",
+        message=f"New access request: {user.full_name} ({user.email})",
+        entity_type="users",
+        entity_id=user.id,
+    )
+    try:
+        async with db.begin_nested():
+            await dispatch_notifications(
+                db, "pending_approval", dict.fromkeys(admin_ids, draft), gated=False
             )
+    except Exception:
+        logger.exception(
+            "Failed to notify admins %s of pending user %s",
+            admin_ids,
+            user.id,
+        )
@@ -25,7 +25,7 @@ from src.onboarding.public_helpers import (
     _ensure_aware,
     _now,
     find_document_or_404,
-    read_pdf_or_http,
+    stream_pdf_or_http,
 )
 
 download_router = APIRouter(
@@ -100,10 +100,9 @@ async def download_document(
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="Document not found."
         )
-    content = await read_pdf_or_http(attachment.file_path)
-    return Response(
-        content=content,
-        media_type="application/pdf",
+    return await stream_pdf_or_http(
+        request,
+        attachment.file_path,
         headers={
             **NO_STORE_HEADERS,
             # Always a PDF download — ensure a ``.pdf`` filename even for form
@@ -10,7 +10,7 @@ import base64
 import binascii
 from typing import TypeVar
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, Response
 from pydantic import BaseModel, ValidationError
 
 from src.core.constants import HTTPStatus
@@ -258,18 +258,31 @@ def find_document_or_404(documents, doc_id: int):
     return doc
 
 
-async def read_pdf_or_http(path: str) -> bytes:
-    """Read a stored PDF, mapping storage errors to 404/503 (never an opaque 500).
+async def stream_pdf_or_http(
+    request: Request, path: str, *, headers: dict[str, str]
+) -> Response:
+    """Stream a stored PDF, mapping storage errors to 404/503 (never an opaque 500).
 
     Shared by the session-gated document view and the completion-download
     proxy — both need the identical FileNotFoundError→404 / RuntimeError→503
-    translation that ``onboarding.storage.read_bytes`` already normalizes for
-    R2 and disk.
+    translation that ``onboarding.storage.open_stream`` already normalizes
+    for R2 and disk. The body is read in bounded chunks as the client
+    consumes it; ``Range`` / ``If-None-Match`` get a 206 / 304, and
+    ``headers`` (no-store, disposition) go on every outcome.
     """
+    from src.attachments.streaming import stream_file_response
     from src.onboarding import storage
 
     try:
-        return await storage.read_bytes(path)
+        return await stream_file_response(
+            storage.open_stream(
+                path,
+                range_header=request.headers.get("range"),
+                if_none_match=request.headers.get("if-none-match"),
+            ),
+            media_type="application/pdf",
+            headers=headers,
+        )
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="Document file missing."
@@ -10,6 +10,7 @@ can't set ``Cache-Control``/``Referrer-Policy``).
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import Response
 
+from src.attachments.streaming import discard_response
 from src.core.client_ip import get_client_ip
 from src.core.constants import HTTPStatus
 from src.core.rate_limit import limiter
@@ -42,9 +43,9 @@ from src.onboarding.public_helpers import (
     load_packet_for_public,
     parse_body_within_caps,
     public_status_message,
-    read_pdf_or_http,
     require_session,
     resolve_public_branding,
+    stream_pdf_or_http,
 )
 from src.onboarding.uploads import (
     delete_document_upload,
@@ -173,29 +174,37 @@ async def get_public_document_pdf(
             status_code=HTTPStatus.NOT_FOUND,
             detail="This document has no PDF to view.",
         )
-    content = await read_pdf_or_http(doc.pdf_path)
-
-    # Record the view AFTER bytes are confirmed; first view → opened.
-    is_first = await record_packet_document_view(
-        db,
-        packet_document_id=doc.id,
-        token=token,
-        ip_address=get_client_ip(request),
-        user_agent=request.headers.get("user-agent"),
-    )
-    if is_first:
-        packet.first_opened_at = packet.first_opened_at or _utc_now()
-        if packet.status == "active":
-            packet.status = "opened"
-    await db.flush()
-    return Response(
-        content=content,
-        media_type="application/pdf",
+    response = await stream_pdf_or_http(
+        request,
+        doc.pdf_path,
         headers={
             **NO_STORE_HEADERS,
             "Content-Disposition": f'inline; filename="{doc.original_filename}"',
         },
     )
+    if response.status_code >= 400:
+        return response  # 416: nothing was served, so nothing was viewed
+
+    # Record the view AFTER the file is opened; first view → opened. It is
+    # committed here, not by the session dependency, so that a failure
+    # closes the open stream instead of dropping the response with it.
+    try:
+        is_first = await record_packet_document_view(
+            db,
+            packet_document_id=doc.id,
+            token=token,
+            ip_address=get_client_ip(request),
+            user_agent=request.headers.get("user-agent"),
+        )
+        if is_first:
+            packet.first_opened_at = packet.first_opened_at or _utc_now()
+            if packet.status == "active":
+                packet.status = "opened"
+        await db.commit()
+    except BaseException:
+        await discard_response(response)
+        raise
+    return response
 
 
 @router.post("/{token}/documents/{doc_id}/viewed", response_model=ViewedResult)
@@ -10,6 +10,7 @@ Storage ref conventions (stored in ``OnboardingTemplate.pdf_path``):
   * disk → path relative to ``uploads/`` (mirrors AttachmentService)
 """
 
+import asyncio
 from pathlib import Path
 
 from botocore.exceptions import BotoCoreError, ClientError
@@ -18,9 +19,11 @@ from src.attachments.object_storage import (
     delete_object,
     download_object_bytes,
     object_exists,
+    open_object_stream,
     upload_file_bytes,
 )
 from src.attachments.service import _use_object_storage
+from src.attachments.streaming import FileStream, open_file_stream
 
 _OBJ_PREFIX = "obj://"
 
@@ -94,6 +97,43 @@ async def read_bytes(ref: str) -> bytes:
         raise RuntimeError("storage unavailable") from exc
 
 
+async def open_stream(
+    ref: str,
+    *,
+    range_header: str | None = None,
+    if_none_match: str | None = None,
+) -> FileStream:
+    """Open a stored ref for a streamed download (see ``attachments.streaming``).
+
+    Errors are normalized exactly as in ``read_bytes``: missing →
+    ``FileNotFoundError``, any other storage failure → ``RuntimeError``.
+    ``NotModified`` / ``RangeNotSatisfiable`` pass through.
+    """
+    if ref.startswith(_OBJ_PREFIX):
+        key = ref[len(_OBJ_PREFIX) :]
+        try:
+            return await open_object_stream(
+                key, range_header=range_header, if_none_match=if_none_match
+            )
+        except ClientError as exc:
+            if _client_error_code(exc) in ("NoSuchKey", "404", "NotFound"):
+                raise FileNotFoundError(f"object not found: {key}") from exc
+            raise RuntimeError("object storage unavailable") from exc
+        except BotoCoreError as exc:
+            raise RuntimeError("object storage unavailable") from exc
+    try:
+        return await asyncio.to_thread(
+            open_file_stream,
+            _UPLOADS_ROOT / ref,
+            range_header=range_header,
+            if_none_match=if_none_match,
+        )
+    except FileNotFoundError:
+        raise
+    except OSError as exc:
+        raise RuntimeError("storage unavailable") from exc
+
+
 async def serve(ref: str) -> bytes:
     """Phase 1: proxy the bytes (callers wrap in a Response)."""
     return await read_bytes(ref)
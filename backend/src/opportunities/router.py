@@ -38,6 +38,7 @@ from src.core.router_utils import (
 )
 from src.events.service import (
     OPPORTUNITY_CREATED,
+    OPPORTUNITY_DELETED,
     OPPORTUNITY_STAGE_CHANGED,
     OPPORTUNITY_UPDATED,
     emit,
@@ -289,11 +290,7 @@ async def list_opportunities(
     """List opportunities with pagination and filters."""
     service = OpportunityService(db)
 
-    assignee_ids = (
-        await service.get_assignee_entity_ids(current_user.id)
-        if data_scope.is_scoped
-        else None
-    )
+    assignee_ids = service.assignee_scope(current_user.id) if data_scope.is_scoped else None
 
     opportunities, total = await service.get_list(
         page=page,
@@ -305,7 +302,7 @@ async def list_opportunities(
         owner_id=effective_owner_id(data_scope, owner_id),
         tag_ids=parse_tag_ids(tag_ids),
         filters=parse_json_filters(filters),
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_OPPORTUNITIES),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_OPPORTUNITIES),
         assignee_entity_ids=assignee_ids,
     )
 
@@ -354,7 +351,7 @@ async def create_opportunity(
         "entity_type": "opportunity",
         "user_id": current_user.id,
         "data": {"name": opportunity.name, "amount": opportunity.amount, "pipeline_stage_id": opportunity.pipeline_stage_id},
-    })
+    }, db=db)
 
     if opportunity.owner_id and opportunity.owner_id != current_user.id:
         await notify_on_assignment(db, opportunity.owner_id, "opportunities", opportunity.id, opportunity.name)
@@ -374,9 +371,9 @@ async def get_opportunity(
     opportunity = await get_entity_or_404(
         service, opportunity_id, EntityNames.OPPORTUNITY
     )
-    check_record_access_or_shared(
-        opportunity, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_OPPORTUNITIES),
+    await check_record_access_or_shared(
+        db, opportunity, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_OPPORTUNITIES),
     )
     return await _build_opportunity_response(service, opportunity)
 
@@ -413,7 +410,7 @@ async def update_opportunity(
         "entity_type": "opportunity",
         "user_id": current_user.id,
         "data": {"name": updated_opp.name, "amount": updated_opp.amount, "pipeline_stage_id": updated_opp.pipeline_stage_id},
-    })
+    }, db=db)
 
     if updated_opp.pipeline_stage_id != old_stage_id:
         await emit(OPPORTUNITY_STAGE_CHANGED, {
@@ -421,7 +418,7 @@ async def update_opportunity(
             "entity_type": "opportunity",
             "user_id": current_user.id,
             "data": {"name": updated_opp.name, "old_stage_id": old_stage_id, "new_stage_id": updated_opp.pipeline_stage_id},
-        })
+        }, db=db)
 
         new_stage_name = updated_opp.pipeline_stage.name if updated_opp.pipeline_stage else str(updated_opp.pipeline_stage_id)
         notify_user = updated_opp.owner_id or current_user.id
@@ -451,3 +448,10 @@ async def delete_opportunity(
     await audit_entity_delete(db, "opportunity", opportunity.id, current_user.id, ip_address)
 
     await service.delete(opportunity)
+
+    await emit(OPPORTUNITY_DELETED, {
+        "entity_id": opportunity_id,
+        "entity_type": "opportunity",
+        "user_id": current_user.id,
+        "data": {},
+    }, db=db)
@@ -8,6 +8,7 @@ from sqlalchemy.orm import selectinload
 from src.core.base_service import BaseService, CRUDService, TaggableServiceMixin
 from src.core.constants import DEFAULT_PAGE_SIZE, ENTITY_TYPE_OPPORTUNITIES
 from src.core.filtering import apply_filters_to_query, build_token_search
+from src.core.share_permissions import SharedScope, shared_with_clause
 from src.opportunities.models import Opportunity, PipelineStage
 from src.opportunities.schemas import (
     OpportunityCreate,
@@ -45,8 +46,8 @@ class OpportunityService(
         owner_id: int | None = None,
         tag_ids: list[int] | None = None,
         filters: dict[str, Any] | None = None,
-        shared_entity_ids: list[int] | None = None,
-        assignee_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
+        assignee_entity_ids: SharedScope | None = None,
     ) -> tuple[list[Opportunity], int]:
         """Get paginated list of opportunities with filters.
 
@@ -54,7 +55,7 @@ class OpportunityService(
         user plus any records in ``shared_entity_ids`` or
         ``assignee_entity_ids``. ``assignee_entity_ids`` is a distinct
         parameter so callers that bypass DataScope can OR in just the
-        assignee shares without rebuilding the full shared-entity map.
+        assignee shares (see ``assignee_scope``).
         """
         query = (
             select(Opportunity)
@@ -84,10 +85,10 @@ class OpportunityService(
 
         if owner_id is not None:
             or_clauses = [Opportunity.owner_id == owner_id]
-            if shared_entity_ids:
-                or_clauses.append(Opportunity.id.in_(shared_entity_ids))
-            if assignee_entity_ids:
-                or_clauses.append(Opportunity.id.in_(assignee_entity_ids))
+            if shared_entity_ids is not None:
+                or_clauses.append(shared_with_clause(Opportunity.id, shared_entity_ids))
+            if assignee_entity_ids is not None:
+                or_clauses.append(shared_with_clause(Opportunity.id, assignee_entity_ids))
             query = query.where(or_(*or_clauses))
         else:
             # No owner filter — fall back to base helper which is a no-op when
@@ -99,18 +100,9 @@ class OpportunityService(
 
         return await self.paginate_query(query, page, page_size)
 
-    async def get_assignee_entity_ids(self, user_id: int) -> list[int]:
-        """Return opportunity IDs where this user holds an 'assignee' share."""
-        from src.core.models import EntityShare
-
-        result = await self.db.execute(
-            select(EntityShare.entity_id).where(
-                EntityShare.shared_with_user_id == user_id,
-                EntityShare.entity_type == ENTITY_TYPE_OPPORTUNITIES,
-                EntityShare.permission_level == "assignee",
-            )
-        )
-        return list(result.scalars().all())
+    def assignee_scope(self, user_id: int) -> SharedScope:
+        """The opportunities this user holds an 'assignee' share on."""
+        return SharedScope(user_id=user_id, entity_type=ENTITY_TYPE_OPPORTUNITIES, permissions=("assignee",))
 
 
 
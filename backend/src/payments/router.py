@@ -52,7 +52,7 @@ async def list_payments(
         contact_id=contact_id,
         company_id=company_id,
         owner_id=effective_owner_id,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PAYMENTS),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PAYMENTS),
         search=search,
         order_by=order_by,
         order_dir=order_dir,
@@ -172,7 +172,7 @@ async def stripe_webhook(request: Request, db: DBSession):
                 "quote_id": payment_ctx.get("quote_id"),
                 "opportunity_id": payment_ctx.get("opportunity_id"),
             },
-        })
+        }, db=db)
 
     return result
 
@@ -195,9 +195,9 @@ async def download_invoice(
 
     service = PaymentService(db)
     payment = await get_entity_or_404(service, payment_id, EntityNames.PAYMENT)
-    check_record_access_or_shared(
-        payment, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PAYMENTS),
+    await check_record_access_or_shared(
+        db, payment, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PAYMENTS),
     )
 
     try:
@@ -227,9 +227,9 @@ async def send_receipt(
     """Manually resend receipt email for a payment."""
     service = PaymentService(db)
     payment = await get_entity_or_404(service, payment_id, EntityNames.PAYMENT)
-    check_record_access_or_shared(
-        payment, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PAYMENTS),
+    await check_record_access_or_shared(
+        db, payment, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PAYMENTS),
     )
 
     # Pre-flight: webhook-fired receipts skip this (they call the service
@@ -258,9 +258,9 @@ async def send_invoice(
     """Resend the invoice email (with the rendered PDF attached)."""
     service = PaymentService(db)
     payment = await get_entity_or_404(service, payment_id, EntityNames.PAYMENT)
-    check_record_access_or_shared(
-        payment, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PAYMENTS),
+    await check_record_access_or_shared(
+        db, payment, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PAYMENTS),
     )
 
     with value_error_as_400():
@@ -292,9 +292,9 @@ async def get_payment(
     """Get a payment by ID."""
     service = PaymentService(db)
     payment = await get_entity_or_404(service, payment_id, EntityNames.PAYMENT)
-    check_record_access_or_shared(
-        payment, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PAYMENTS),
+    await check_record_access_or_shared(
+        db, payment, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PAYMENTS),
     )
     await service.attach_proposals([payment])
     return PaymentResponse.model_validate(payment)
@@ -14,6 +14,7 @@ from sqlalchemy.orm import selectinload
 from src.config import settings
 from src.core.base_service import CRUDService
 from src.core.constants import DEFAULT_PAGE_SIZE
+from src.core.share_permissions import SharedScope, shared_with_clause
 from src.core.sorting import build_order_clauses
 from src.email.types import EmailAttachment
 from src.payments.amounts import to_stripe_minor_units as _to_stripe_amount
@@ -220,7 +221,7 @@ class PaymentService(CRUDService[Payment, PaymentCreate, PaymentUpdate]):
         contact_id: int | None = None,
         company_id: int | None = None,
         owner_id: int | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
         search: str | None = None,
         order_by: str | None = None,
         order_dir: str | None = None,
@@ -271,9 +272,9 @@ class PaymentService(CRUDService[Payment, PaymentCreate, PaymentUpdate]):
             )
 
         if owner_id:
-            if shared_entity_ids:
+            if shared_entity_ids is not None:
                 query = query.where(
-                    or_(Payment.owner_id == owner_id, Payment.id.in_(shared_entity_ids))
+                    or_(Payment.owner_id == owner_id, shared_with_clause(Payment.id, shared_entity_ids))
                 )
             else:
                 query = query.where(Payment.owner_id == owner_id)
@@ -14,6 +14,7 @@ from src.activities.models import Activity
 from src.attachments.models import Attachment
 from src.attachments.schemas import AttachmentListResponse, AttachmentResponse
 from src.attachments.service import AttachmentService
+from src.attachments.streaming import discard_response
 from src.audit.utils import (
     audit_entity_create,
     audit_entity_delete,
@@ -195,7 +196,7 @@ async def list_proposals(
         opportunity_id=opportunity_id,
         quote_id=quote_id,
         owner_id=effective_owner_id,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
         order_by=order_by,
         order_dir=order_dir,
         include_bundle_options=include_bundle_options,
@@ -264,7 +265,7 @@ async def get_proposal_bundle(
     bundle = await service.get_bundle(bundle_id)
     if bundle is None:
         raise_not_found("Proposal bundle")
-    _check_bundle_read_access(bundle, current_user, data_scope)
+    await _check_bundle_read_access(db, bundle, current_user, data_scope)
     return ProposalBundleResponse.model_validate(bundle)
 
 
@@ -328,7 +329,7 @@ async def send_proposal_bundle(
         "entity_type": "proposal_bundle",
         "user_id": current_user.id,
         "data": {"bundle_number": bundle.bundle_number, "status": bundle.status},
-    })
+    }, db=db)
 
     return ProposalBundleResponse.model_validate(bundle)
 
@@ -515,9 +516,9 @@ async def create_proposal_from_template(
     contact = contact_result.scalar_one_or_none()
     if not contact:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Contact not found")
-    check_record_access_or_shared(
-        contact, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTACTS),
+    await check_record_access_or_shared(
+        db, contact, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTACTS),
     )
 
     # Fetch company if provided
@@ -530,9 +531,9 @@ async def create_proposal_from_template(
         company = company_result.scalar_one_or_none()
         if not company:
             raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Company not found")
-        check_record_access_or_shared(
-            company, current_user, data_scope.role_name,
-            shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_COMPANIES),
+        await check_record_access_or_shared(
+            db, company, current_user, data_scope.role_name,
+            shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_COMPANIES),
         )
 
     # Build merge variables
@@ -618,6 +619,58 @@ async def _signing_document_or_404(
     return document
 
 
+async def _stream_r2_pdf(
+    request: Request,
+    key: str,
+    *,
+    missing_detail: str,
+    label: str,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Stream a PDF stored in R2, honouring ``Range`` / ``If-None-Match``.
+
+    The bytes are proxied in bounded chunks (``attachments.streaming``)
+    rather than read whole, so a large signed copy doesn't sit in worker
+    memory. A missing object (NoSuchKey / 404) is a 404 with
+    ``missing_detail``; any other storage failure is a 503.
+    """
+    from botocore.exceptions import ClientError
+
+    from src.attachments.object_storage import open_object_stream
+    from src.attachments.streaming import stream_file_response
+
+    try:
+        return await stream_file_response(
+            open_object_stream(
+                key,
+                range_header=request.headers.get("range"),
+                if_none_match=request.headers.get("if-none-match"),
+            ),
+            media_type="application/pdf",
+            headers=headers,
+        )
+    except ClientError as exc:
+        response = getattr(exc, "response", None) or {}
+        err = response.get("Error", {}) if isinstance(response, dict) else {}
+        code = err.get("Code", "")
+        if code in ("NoSuchKey", "404", "NotFound"):
+            logger.warning("R2 object missing for %s (key=%r): %s", label, key, code)
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND, detail=missing_detail,
+            ) from exc
+        logger.exception("R2 ClientError fetching %s (code=%s)", label, code)
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            detail="File storage temporarily unavailable — try again later",
+        ) from exc
+    except Exception as exc:
+        logger.exception("Unexpected error fetching %s", label)
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            detail="File storage temporarily unavailable — try again later",
+        ) from exc
+
+
 async def _unviewed_public_document_count(
     db: DBSession,
     *,
@@ -772,7 +825,8 @@ def _require_bundle_write_access(bundle, current_user: User) -> None:
         check_ownership(proposal, current_user, EntityNames.PROPOSAL)
 
 
-def _check_bundle_read_access(
+async def _check_bundle_read_access(
+    db: DBSession,
     bundle,
     current_user: User,
     data_scope: DataScope,
@@ -781,10 +835,12 @@ def _check_bundle_read_access(
         return
     if current_user.id in {bundle.owner_id, bundle.created_by_id}:
         return
-    shared_proposal_ids = set(data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS))
-    for proposal in bundle.proposals or []:
-        if proposal.owner_id == current_user.id or proposal.id in shared_proposal_ids:
-            return
+    proposals = bundle.proposals or []
+    if any(proposal.owner_id == current_user.id for proposal in proposals):
+        return
+    shared = data_scope.shared_scope(ENTITY_TYPE_PROPOSALS)
+    if await shared.includes(db, *(proposal.id for proposal in proposals)):
+        return
     raise HTTPException(status_code=HTTPStatus.FORBIDDEN, detail="Access denied")
 
 
@@ -803,9 +859,9 @@ async def _check_proposal_reference_access(
         contact = await db.get(Contact, contact_id)
         if contact is None:
             raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Contact not found")
-        check_record_access_or_shared(
-            contact, current_user, data_scope.role_name,
-            shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_CONTACTS),
+        await check_record_access_or_shared(
+            db, contact, current_user, data_scope.role_name,
+            shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_CONTACTS),
         )
 
     company_id = data.get("company_id")
@@ -813,9 +869,9 @@ async def _check_proposal_reference_access(
         company = await db.get(Company, company_id)
         if company is None:
             raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Company not found")
-        check_record_access_or_shared(
-            company, current_user, data_scope.role_name,
-            shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_COMPANIES),
+        await check_record_access_or_shared(
+            db, company, current_user, data_scope.role_name,
+            shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_COMPANIES),
         )
 
 
@@ -874,9 +930,9 @@ async def list_proposal_attachments(
     """Staff list of attachments for a proposal."""
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
 
     att_service = AttachmentService(db)
@@ -1052,10 +1108,6 @@ async def download_public_proposal_signing_document(
     """
     import hmac as _hmac
 
-    from botocore.exceptions import ClientError
-
-    from src.attachments.object_storage import download_object_bytes
-
     service = ProposalService(db)
     proposal = await service.get_public_proposal(token)
     if not proposal or not _hmac.compare_digest(proposal.public_token or "", token):
@@ -1068,57 +1120,36 @@ async def download_public_proposal_signing_document(
             detail="Signing document not found",
         )
 
-    try:
-        content = await download_object_bytes(document.pdf_path)
-    except ClientError as exc:
-        response = getattr(exc, "response", None) or {}
-        err = response.get("Error", {}) if isinstance(response, dict) else {}
-        code = err.get("Code", "")
-        if code in ("NoSuchKey", "404", "NotFound"):
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Signing document file missing from storage",
-            ) from exc
-        logger.exception(
-            "R2 ClientError fetching public signing document %s for proposal %s",
-            document_id,
-            proposal.id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    except Exception as exc:
-        logger.exception(
-            "Unexpected error fetching public signing document %s for proposal %s",
-            document_id,
-            proposal.id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-
-    # Record the view AFTER the bytes are confirmed deliverable. If R2
-    # fails or the proposal is missing the underlying object, we don't
-    # want to claim the signer "viewed" a document they never received.
-    ip_address = get_client_ip(request)
-    user_agent = request.headers.get("user-agent")
-    await record_signing_document_view(
-        db,
-        document_id=document.id,
-        token=token,
-        ip_address=ip_address,
-        user_agent=user_agent,
-    )
-
-    return Response(
-        content=content,
-        media_type="application/pdf",
+    response = await _stream_r2_pdf(
+        request,
+        document.pdf_path,
+        missing_detail="Signing document file missing from storage",
+        label=f"public signing document {document_id} of proposal {proposal.id}",
         headers={
             "Content-Disposition": f'inline; filename="{document.original_filename}"',
         },
     )
+    if response.status_code >= 400:
+        return response  # 416: nothing was served, so nothing was viewed
+
+    # Record the view AFTER the object is confirmed deliverable. If R2
+    # fails or the proposal is missing the underlying object, we don't
+    # want to claim the signer "viewed" a document they never received.
+    # The object is open from here on, so the view is committed before
+    # returning and a failure closes the stream rather than leaking it.
+    try:
+        await record_signing_document_view(
+            db,
+            document_id=document.id,
+            token=token,
+            ip_address=get_client_ip(request),
+            user_agent=request.headers.get("user-agent"),
+        )
+        await db.commit()
+    except BaseException:
+        await discard_response(response)
+        raise
+    return response
 
 
 @router.get("/public/{token}", response_model=ProposalPublicResponse)
@@ -1299,6 +1330,8 @@ async def accept_proposal_public(
     # AFTER the never-raises trigger, which may have rolled the session back).
     await db.commit()
 
+    # Events here are emitted inline (no db=): the accept is already committed
+    # and the trigger below may roll the session back, taking outbox rows with it.
     # Sibling rejections in a bundle: emit PROPOSAL_REJECTED per option that
     # was flipped to rejected by _mark_bundle_accepted, so the owner's
     # notifications matrix + reporting reflect the full picture (not just
@@ -1383,7 +1416,7 @@ async def reject_proposal_public(
             "rejected_via": "public",
             "reason": reject_data.reason,
         },
-    })
+    }, db=db)
 
     branding_data = await service.get_branding_for_proposal(proposal)
     response = ProposalPublicResponse.model_validate(proposal)
@@ -1405,9 +1438,9 @@ async def list_signing_documents(
     """List PDFs on this proposal that need explicit signature placement."""
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     return [
         ProposalSigningDocumentResponse.model_validate(doc)
@@ -1505,46 +1538,19 @@ async def download_signing_document_pdf(
     data_scope: Annotated[DataScope, Depends(get_data_scope)],
 ):
     """Stream the source PDF for placement preview."""
-    from botocore.exceptions import ClientError
-
-    from src.attachments.object_storage import download_object_bytes
-
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     document = await _signing_document_or_404(service, proposal_id, document_id)
-    try:
-        content = await download_object_bytes(document.pdf_path)
-    except ClientError as exc:
-        response = getattr(exc, "response", None) or {}
-        err = response.get("Error", {}) if isinstance(response, dict) else {}
-        code = err.get("Code", "")
-        if code in ("NoSuchKey", "404", "NotFound"):
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Signing document file missing from storage",
-            ) from exc
-        logger.exception(
-            "R2 ClientError fetching signing document %s for proposal %s",
-            document_id, proposal_id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    except Exception as exc:
-        logger.exception(
-            "Unexpected error fetching signing document %s for proposal %s",
-            document_id, proposal_id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    return Response(content=content, media_type="application/pdf")
+    return await _stream_r2_pdf(
+        request,
+        document.pdf_path,
+        missing_detail="Signing document file missing from storage",
+        label=f"signing document {document_id} of proposal {proposal_id}",
+    )
 
 
 @router.get("/{proposal_id}/signing-documents/{document_id}/signed-pdf")
@@ -1558,15 +1564,11 @@ async def download_signing_document_signed_pdf(
     data_scope: Annotated[DataScope, Depends(get_data_scope)],
 ):
     """Stream one signed copy PDF after the public signer accepts."""
-    from botocore.exceptions import ClientError
-
-    from src.attachments.object_storage import download_object_bytes
-
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     document = await _signing_document_or_404(service, proposal_id, document_id)
     if not document.signed_pdf_path:
@@ -1574,35 +1576,12 @@ async def download_signing_document_signed_pdf(
             status_code=HTTPStatus.NOT_FOUND,
             detail="No signed PDF on file for this document",
         )
-    try:
-        content = await download_object_bytes(document.signed_pdf_path)
-    except ClientError as exc:
-        response = getattr(exc, "response", None) or {}
-        err = response.get("Error", {}) if isinstance(response, dict) else {}
-        code = err.get("Code", "")
-        if code in ("NoSuchKey", "404", "NotFound"):
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Signed PDF file missing from storage — re-stamp to regenerate",
-            ) from exc
-        logger.exception(
-            "R2 ClientError fetching signed document %s for proposal %s",
-            document_id, proposal_id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    except Exception as exc:
-        logger.exception(
-            "Unexpected error fetching signed document %s for proposal %s",
-            document_id, proposal_id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    return Response(content=content, media_type="application/pdf")
+    return await _stream_r2_pdf(
+        request,
+        document.signed_pdf_path,
+        missing_detail="Signed PDF file missing from storage — re-stamp to regenerate",
+        label=f"signed document {document_id} of proposal {proposal_id}",
+    )
 
 
 @router.post(
@@ -1665,54 +1644,23 @@ async def download_master_contract(
     Other ClientError + unexpected exceptions stay as 503 — a hint to
     check R2 config + retry once the platform is healthy.
     """
-    from botocore.exceptions import ClientError
-
-    from src.attachments.object_storage import download_object_bytes
-
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     if not proposal.master_contract_pdf_path:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="No master contract on file",
         )
-    try:
-        content = await download_object_bytes(proposal.master_contract_pdf_path)
-    except ClientError as exc:
-        response = getattr(exc, "response", None) or {}
-        err = response.get("Error", {}) if isinstance(response, dict) else {}
-        code = err.get("Code", "")
-        if code in ("NoSuchKey", "404", "NotFound"):
-            logger.warning(
-                "Master contract object missing for proposal %s (key=%r): %s",
-                proposal_id, proposal.master_contract_pdf_path, code,
-            )
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Master contract file missing from storage",
-            ) from exc
-        logger.exception(
-            "R2 ClientError fetching master contract for proposal %s (code=%s)",
-            proposal_id, code,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    except Exception as exc:
-        logger.exception(
-            "Unexpected error fetching master contract for proposal %s",
-            proposal_id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    return Response(content=content, media_type="application/pdf")
+    return await _stream_r2_pdf(
+        request,
+        proposal.master_contract_pdf_path,
+        missing_detail="Master contract file missing from storage",
+        label=f"master contract of proposal {proposal_id}",
+    )
 
 
 @router.get("/{proposal_id}/signed-pdf")
@@ -1732,54 +1680,23 @@ async def download_signed_pdf(
     the master-contract endpoint's R2 failure mapping so a missing
     object surfaces a clear 404 instead of a 503.
     """
-    from botocore.exceptions import ClientError
-
-    from src.attachments.object_storage import download_object_bytes
-
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     if not proposal.signed_pdf_path:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="No signed PDF on file",
         )
-    try:
-        content = await download_object_bytes(proposal.signed_pdf_path)
-    except ClientError as exc:
-        response = getattr(exc, "response", None) or {}
-        err = response.get("Error", {}) if isinstance(response, dict) else {}
-        code = err.get("Code", "")
-        if code in ("NoSuchKey", "404", "NotFound"):
-            logger.warning(
-                "Signed PDF object missing for proposal %s (key=%r): %s",
-                proposal_id, proposal.signed_pdf_path, code,
-            )
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Signed PDF file missing from storage — re-stamp to regenerate",
-            ) from exc
-        logger.exception(
-            "R2 ClientError fetching signed PDF for proposal %s (code=%s)",
-            proposal_id, code,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    except Exception as exc:
-        logger.exception(
-            "Unexpected error fetching signed PDF for proposal %s",
-            proposal_id,
-        )
-        raise HTTPException(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            detail="File storage temporarily unavailable — try again later",
-        ) from exc
-    return Response(content=content, media_type="application/pdf")
+    return await _stream_r2_pdf(
+        request,
+        proposal.signed_pdf_path,
+        missing_detail="Signed PDF file missing from storage — re-stamp to regenerate",
+        label=f"signed PDF of proposal {proposal_id}",
+    )
 
 
 @router.get("/{proposal_id}", response_model=ProposalResponse)
@@ -1792,9 +1709,9 @@ async def get_proposal(
     """Get a proposal by ID."""
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     return ProposalResponse.model_validate(proposal)
 
@@ -1880,7 +1797,7 @@ async def send_proposal(
         "entity_type": "proposal",
         "user_id": current_user.id,
         "data": {"proposal_number": proposal.proposal_number, "status": proposal.status},
-    })
+    }, db=db)
 
     return ProposalResponse.model_validate(proposal)
 
@@ -1949,9 +1866,9 @@ async def get_proposal_signature_image(
     """
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
     if proposal.signature_image is None:
         raise HTTPException(
@@ -2050,7 +1967,7 @@ async def accept_proposal(
     # Commit the accept (+ the manual-accept audit) BEFORE the best-effort
     # Phase-3 trigger so the trigger can never roll it back, and a genuine
     # commit failure surfaces instead of being swallowed by the never-raises
-    # trigger.
+    # trigger. PROPOSAL_ACCEPTED below is emitted inline for the same reason.
     await db.commit()
 
     if proposal.owner_id and proposal.owner_id != current_user.id:
@@ -2134,9 +2051,9 @@ async def duplicate_proposal(
     """
     service = ProposalService(db)
     proposal = await get_entity_or_404(service, proposal_id, EntityNames.PROPOSAL)
-    check_record_access_or_shared(
-        proposal, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_PROPOSALS),
+    await check_record_access_or_shared(
+        db, proposal, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_PROPOSALS),
     )
 
     clone_data = ProposalCreate(
@@ -2195,6 +2112,6 @@ async def reject_proposal(
         "entity_type": "proposal",
         "user_id": proposal.owner_id,
         "data": {"proposal_number": proposal.proposal_number, "status": proposal.status},
-    })
+    }, db=db)
 
     return ProposalResponse.model_validate(proposal)
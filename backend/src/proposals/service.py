@@ -33,6 +33,7 @@ from src.core.base_service import BaseService, CRUDService, StatusTransitionMixi
 from src.core.constants import DEFAULT_PAGE_SIZE
 from src.core.filtering import build_token_search
 from src.core.opportunity_guards import assert_opportunity_active
+from src.core.share_permissions import SharedScope, shared_with_clause
 from src.core.sorting import build_order_clauses
 from src.core.url_safety import UnsafeUrlError, validate_public_url
 from src.email.branded_templates import (
@@ -349,7 +350,7 @@ class ProposalService(StatusTransitionMixin, CRUDService[Proposal, ProposalCreat
         opportunity_id: int | None = None,
         quote_id: int | None = None,
         owner_id: int | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
         order_by: str | None = None,
         order_dir: str | None = None,
         include_bundle_options: bool = False,
@@ -424,9 +425,9 @@ class ProposalService(StatusTransitionMixin, CRUDService[Proposal, ProposalCreat
             query = query.where(Proposal.quote_id == quote_id)
 
         if owner_id:
-            if shared_entity_ids:
+            if shared_entity_ids is not None:
                 query = query.where(
-                    or_(Proposal.owner_id == owner_id, Proposal.id.in_(shared_entity_ids))
+                    or_(Proposal.owner_id == owner_id, shared_with_clause(Proposal.id, shared_entity_ids))
                 )
             else:
                 query = query.where(Proposal.owner_id == owner_id)
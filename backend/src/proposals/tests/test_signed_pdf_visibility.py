@@ -7,6 +7,7 @@ exercising the capture path instead of silently flipping to success.
 
 from __future__ import annotations
 
+import io
 import os
 import secrets
 import sys
@@ -380,19 +381,62 @@ class TestRestampEndpoint:
         assert resp.status_code == 400
 
 
+class _FakeR2Client:
+    """Just enough of boto's S3 client for ``open_object_stream``.
+
+    Honours ``Range`` / ``IfNoneMatch`` the way R2 does, or raises
+    ``error`` from every call.
+    """
+
+    ETAG = '"r2-etag"'
+
+    def __init__(self, objects: dict[str, bytes] | None = None, error: Exception | None = None):
+        self.objects = objects or {}
+        self.error = error
+
+    def get_object(self, *, Bucket, Key, Range=None, IfNoneMatch=None):
+        if self.error is not None:
+            raise self.error
+        content = self.objects[Key]
+        if IfNoneMatch == self.ETAG:
+            raise ClientError(
+                {
+                    "Error": {"Code": "304", "Message": "Not Modified"},
+                    "ResponseMetadata": {"HTTPHeaders": {"etag": self.ETAG}},
+                },
+                "GetObject",
+            )
+        response = {"ETag": self.ETAG}
+        if Range is not None:
+            first, last = Range.removeprefix("bytes=").split("-")
+            start, stop = int(first), min(int(last), len(content) - 1)
+            response["ContentRange"] = f"bytes {start}-{stop}/{len(content)}"
+            content = content[start : stop + 1]
+        response["ContentLength"] = len(content)
+        response["Body"] = io.BytesIO(content)
+        return response
+
+
 class TestSignedPdfDownload:
     """``GET /api/proposals/{id}/signed-pdf`` failure mapping.
 
     Mirrors ``download_master_contract``'s R2 error contract:
     * 404 when ``signed_pdf_path`` is null or the R2 object is gone.
     * 503 on transient R2 / unexpected failures.
-    * 200 + ``application/pdf`` body on the happy path.
+    * 200 + ``application/pdf`` body on the happy path, streamed with
+      ``Range`` (206) and ``If-None-Match`` (304) support.
 
-    The endpoint imports ``download_object_bytes`` inside the function
-    body, so patching the module attribute on
-    ``src.attachments.object_storage`` is what actually takes effect.
+    ``open_object_stream`` builds its client through
+    ``src.attachments.object_storage._get_r2_client``, so patching that
+    module attribute is what actually takes effect.
     """
 
+    @staticmethod
+    def _patch_r2(monkeypatch: pytest.MonkeyPatch, fake: _FakeR2Client) -> None:
+        monkeypatch.setattr(
+            "src.attachments.object_storage._get_r2_client", lambda: fake
+        )
+
     async def test_returns_404_when_signed_pdf_path_null(
         self, client: AsyncClient, db_session: AsyncSession
     ):
@@ -419,14 +463,8 @@ class TestSignedPdfDownload:
         await db_session.commit()
 
         expected = b"%PDF-1.7\n...signed bytes..."
-
-        async def fake_download(key: str) -> bytes:
-            assert key == "proposals/9/signed.pdf"
-            return expected
-
-        monkeypatch.setattr(
-            "src.attachments.object_storage.download_object_bytes",
-            fake_download,
+        self._patch_r2(
+            monkeypatch, _FakeR2Client({"proposals/9/signed.pdf": expected})
         )
 
         resp = await client.get(
@@ -435,8 +473,42 @@ class TestSignedPdfDownload:
         )
         assert resp.status_code == 200
         assert resp.headers["content-type"] == "application/pdf"
+        assert resp.headers["accept-ranges"] == "bytes"
+        assert resp.headers["etag"] == _FakeR2Client.ETAG
         assert resp.content == expected
 
+    async def test_range_and_if_none_match(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        user = await _make_user(db_session)
+        proposal = await _make_proposal(db_session, user)
+        proposal.signed_pdf_path = "proposals/9/signed.pdf"
+        await db_session.commit()
+
+        expected = b"%PDF-1.7\n...signed bytes..."
+        self._patch_r2(
+            monkeypatch, _FakeR2Client({"proposals/9/signed.pdf": expected})
+        )
+
+        partial = await client.get(
+            f"/api/proposals/{proposal.id}/signed-pdf",
+            headers={**_auth_headers(user), "Range": "bytes=0-7"},
+        )
+        assert partial.status_code == 206
+        assert partial.headers["content-range"] == f"bytes 0-7/{len(expected)}"
+        assert partial.content == expected[:8]
+
+        cached = await client.get(
+            f"/api/proposals/{proposal.id}/signed-pdf",
+            headers={**_auth_headers(user), "If-None-Match": _FakeR2Client.ETAG},
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == _FakeR2Client.ETAG
+        assert cached.content == b""
+
     @pytest.mark.parametrize("r2_code", ["NoSuchKey", "404", "NotFound"])
     async def test_returns_404_when_r2_object_missing(
         self,
@@ -450,15 +522,14 @@ class TestSignedPdfDownload:
         proposal.signed_pdf_path = "proposals/9/missing.pdf"
         await db_session.commit()
 
-        async def fake_download(key: str) -> bytes:
-            raise ClientError(
-                {"Error": {"Code": r2_code, "Message": "gone"}},
-                "GetObject",
-            )
-
-        monkeypatch.setattr(
-            "src.attachments.object_storage.download_object_bytes",
-            fake_download,
+        self._patch_r2(
+            monkeypatch,
+            _FakeR2Client(
+                error=ClientError(
+                    {"Error": {"Code": r2_code, "Message": "gone"}},
+                    "GetObject",
+                )
+            ),
         )
 
         resp = await client.get(
@@ -479,15 +550,14 @@ class TestSignedPdfDownload:
         proposal.signed_pdf_path = "proposals/9/signed.pdf"
         await db_session.commit()
 
-        async def fake_download(key: str) -> bytes:
-            raise ClientError(
-                {"Error": {"Code": "InternalError", "Message": "boom"}},
-                "GetObject",
-            )
-
-        monkeypatch.setattr(
-            "src.attachments.object_storage.download_object_bytes",
-            fake_download,
+        self._patch_r2(
+            monkeypatch,
+            _FakeR2Client(
+                error=ClientError(
+                    {"Error": {"Code": "InternalError", "Message": "boom"}},
+                    "GetObject",
+                )
+            ),
         )
 
         resp = await client.get(
@@ -507,12 +577,8 @@ class TestSignedPdfDownload:
         proposal.signed_pdf_path = "proposals/9/signed.pdf"
         await db_session.commit()
 
-        async def fake_download(key: str) -> bytes:
-            raise RuntimeError("network kaput")
-
-        monkeypatch.setattr(
-            "src.attachments.object_storage.download_object_bytes",
-            fake_download,
+        self._patch_r2(
+            monkeypatch, _FakeR2Client(error=RuntimeError("network kaput"))
         )
 
         resp = await client.get(
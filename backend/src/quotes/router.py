@@ -94,7 +94,7 @@ async def list_quotes(
         company_id=company_id,
         opportunity_id=opportunity_id,
         owner_id=effective_owner_id,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_QUOTES),
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_QUOTES),
         order_by=order_by,
         order_dir=order_dir,
     )
@@ -321,7 +321,7 @@ async def reject_quote_public(
             "rejected_via": "public",
             "reason": reject_data.reason,
         },
-    })
+    }, db=db)
 
     return _build_branded_response(await service.get_branding_for_quote(quote), quote)
 
@@ -338,9 +338,9 @@ async def get_quote(
     """Get a quote by ID with line items."""
     service = QuoteService(db)
     quote = await get_entity_or_404(service, quote_id, EntityNames.QUOTE)
-    check_record_access_or_shared(
-        quote, current_user, data_scope.role_name,
-        shared_entity_ids=data_scope.get_shared_ids(ENTITY_TYPE_QUOTES),
+    await check_record_access_or_shared(
+        db, quote, current_user, data_scope.role_name,
+        shared_entity_ids=data_scope.shared_scope(ENTITY_TYPE_QUOTES),
     )
     return QuoteResponse.model_validate(quote)
 
@@ -422,7 +422,7 @@ async def send_quote(
             "entity_type": "quote",
             "user_id": current_user.id,
             "data": {"quote_number": quote.quote_number, "status": quote.status},
-        })
+        }, db=db)
 
     return QuoteResponse.model_validate(quote)
 
@@ -472,7 +472,7 @@ async def accept_quote(
         "entity_type": "quote",
         "user_id": current_user.id,
         "data": {"quote_number": quote.quote_number, "status": quote.status},
-    })
+    }, db=db)
 
     return QuoteResponse.model_validate(quote)
 
@@ -497,7 +497,7 @@ async def reject_quote(
         "entity_type": "quote",
         "user_id": quote.owner_id,
         "data": {"quote_number": quote.quote_number, "status": quote.status},
-    })
+    }, db=db)
 
     return QuoteResponse.model_validate(quote)
 
@@ -13,6 +13,7 @@ from src.core.base_service import BaseService, CRUDService, StatusTransitionMixi
 from src.core.constants import DEFAULT_PAGE_SIZE
 from src.core.filtering import build_token_search
 from src.core.opportunity_guards import assert_opportunity_active
+from src.core.share_permissions import SharedScope, shared_with_clause
 from src.core.sorting import build_order_clauses
 from src.email.branded_templates import TenantBrandingHelper, render_quote_email
 from src.email.pdf_render import render_html_to_pdf
@@ -134,7 +135,7 @@ class QuoteService(StatusTransitionMixin, CRUDService[Quote, QuoteCreate, QuoteU
         company_id: int | None = None,
         opportunity_id: int | None = None,
         owner_id: int | None = None,
-        shared_entity_ids: list[int] | None = None,
+        shared_entity_ids: SharedScope | None = None,
         order_by: str | None = None,
         order_dir: str | None = None,
     ) -> tuple[list[Quote], int]:
@@ -167,9 +168,9 @@ class QuoteService(StatusTransitionMixin, CRUDService[Quote, QuoteCreate, QuoteU
             query = query.where(Quote.opportunity_id == opportunity_id)
 
         if owner_id:
-            if shared_entity_ids:
+            if shared_entity_ids is not None:
                 query = query.where(
-                    or_(Quote.owner_id == owner_id, Quote.id.in_(shared_entity_ids))
+                    or_(Quote.owner_id == owner_id, shared_with_clause(Quote.id, shared_entity_ids))
                 )
             else:
                 query = query.where(Quote.owner_id == owner_id)
@@ -0,0 +1,180 @@
+"""Webhook delivery engine — pooled HTTP, bounded fan-out, circuit breakers.
+
+One process-wide :class:`WebhookDeliveryEngine` owns a keep-alive
+``httpx.AsyncClient``, so repeat deliveries to the same host reuse warm
+connections instead of paying a TCP + TLS handshake per POST. A semaphore
+caps in-flight requests, and each endpoint URL has a :class:`CircuitBreaker`:
+after ``WEBHOOK_BREAKER_THRESHOLD`` consecutive retryable failures the URL is
+skipped (no request, no timeout wait) until the reset window lets one probe
+through.
+
+The engine only does HTTP; recording attempts on ``WebhookDelivery`` and
+scheduling retries is ``WebhookService``'s job. Breaker state is per process.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+import httpx
+
+from src.config import settings
+
+# Worth retrying: the endpoint is down, overloaded or rate limiting us.
+# Other 4xx responses mean the request itself was rejected.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class AttemptResult:
+    """Outcome of one POST to a webhook endpoint."""
+
+    status_code: int | None = None
+    error: str | None = None
+    retryable: bool = False
+    # Seconds the endpoint asked us to wait (Retry-After, or an open breaker).
+    retry_after: float | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one endpoint (closed → open → half-open)."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self._probing or self.remaining() == 0 else "open"
+
+    def remaining(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self._probing or self.remaining() > 0:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    raw = response.headers.get("Retry-After", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else None
+    except ValueError:
+        return None
+
+
+class WebhookDeliveryEngine:
+    """Shared connection pool plus per-endpoint breakers for webhook POSTs."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        failure_threshold: int | None = None,
+        reset_seconds: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.max_concurrency = max_concurrency or settings.WEBHOOK_MAX_CONCURRENCY
+        self.timeout = timeout or settings.WEBHOOK_TIMEOUT_SECONDS
+        self.failure_threshold = failure_threshold or settings.WEBHOOK_BREAKER_THRESHOLD
+        self.reset_seconds = reset_seconds or settings.WEBHOOK_BREAKER_RESET_SECONDS
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=min(5.0, self.timeout)),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=30.0,
+                ),
+                follow_redirects=False,
+                transport=self._transport,
+            )
+        return self._client
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(url)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_seconds)
+            self._breakers[url] = breaker
+        return breaker
+
+    async def post(self, url: str, body: bytes, headers: dict[str, str]) -> AttemptResult:
+        """POST ``body`` to ``url`` unless its breaker is open. Never raises."""
+        breaker = self.breaker(url)
+        if not breaker.allow():
+            return AttemptResult(
+                error="Circuit open: endpoint is failing, delivery deferred",
+                retryable=True,
+                retry_after=breaker.remaining() or self.reset_seconds,
+            )
+
+        async with self._semaphore:
+            try:
+                response = await self._http().post(url, content=body, headers=headers)
+            except (httpx.HTTPError, httpx.InvalidURL) as exc:
+                result = AttemptResult(error=f"{type(exc).__name__}: {exc}", retryable=True)
+            else:
+                result = AttemptResult(status_code=response.status_code)
+                if response.status_code >= 400:
+                    result.error = response.text[:1000] or f"HTTP {response.status_code}"
+                    result.retryable = response.status_code in RETRYABLE_STATUS_CODES
+                    result.retry_after = _retry_after(response)
+
+        # A non-retryable 4xx still proves the endpoint is up.
+        if result.ok or not result.retryable:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return result
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Process-wide engine; its HTTP client is opened on first use and closed
+# from the app lifespan.
+_engine = WebhookDeliveryEngine()
+
+
+def get_delivery_engine() -> WebhookDeliveryEngine:
+    return _engine
+
+
+async def close_delivery_engine() -> None:
+    await _engine.aclose()
@@ -1,6 +1,8 @@
 """Webhook event handler - delivers webhooks when CRM events occur."""
 
+import asyncio
 import logging
+from datetime import UTC, datetime
 from typing import Any
 
 from src.webhooks.service import WebhookService
@@ -8,9 +10,45 @@ from src.webhooks.service import WebhookService
 logger = logging.getLogger(__name__)
 
 
+class _RetrySweeper:
+    """One timer per process, armed for the earliest pending retry.
+
+    Retries that a restart drops are picked up by the scheduler's
+    background tick.
+    """
+
+    def __init__(self) -> None:
+        self.timer: asyncio.TimerHandle | None = None
+        self.sweeps: set[asyncio.Task] = set()
+
+    def schedule(self, due: datetime) -> None:
+        if due.tzinfo is None:
+            due = due.replace(tzinfo=UTC)
+        loop = asyncio.get_running_loop()
+        when = loop.time() + max(0.0, (due - datetime.now(UTC)).total_seconds())
+        if self.timer is not None and not self.timer.cancelled():
+            if self.timer.when() <= when:
+                return
+            self.timer.cancel()
+        self.timer = loop.call_at(when, self._start)
+
+    def _start(self) -> None:
+        self.timer = None
+        task = asyncio.create_task(retry_webhook_deliveries())
+        self.sweeps.add(task)
+        task.add_done_callback(self.sweeps.discard)
+
+
+_retry_sweeper = _RetrySweeper()
+
+
 async def webhook_event_handler(event_type: str, payload: dict[str, Any]) -> None:
     """Handle CRM events by delivering to subscribed webhooks.
 
+    All subscribers are posted to concurrently through the shared delivery
+    engine, so one slow endpoint does not hold up the others. Errors are
+    logged and re-raised: as a durable handler its outbox row is retried
+    with backoff by the dispatcher (``emit`` logs them for inline calls).
     Imports async_session_maker lazily so test fixtures that swap the
     session maker on src.database take effect for this handler too.
     """
@@ -20,21 +58,47 @@ async def webhook_event_handler(event_type: str, payload: dict[str, Any]) -> Non
         try:
             service = WebhookService(session)
             webhooks = await service.get_active_webhooks_for_event(event_type)
-
-            for webhook in webhooks:
-                try:
-                    await service.deliver_webhook(
-                        webhook,
-                        event_type,
-                        {"event": event_type, "data": payload},
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Failed to deliver webhook %s for event %s: %s",
-                        webhook.id, event_type, e,
-                    )
-
+            deliveries = []
+            if webhooks:
+                deliveries = await service.deliver_to_webhooks(
+                    webhooks,
+                    event_type,
+                    {"event": event_type, "data": payload},
+                )
+            # Always end the transaction with a commit: closing the session
+            # mid-transaction rolls back, which would discard the caller's
+            # flushed writes wherever the connection is shared (StaticPool).
             await session.commit()
         except Exception as e:
             logger.error("Webhook event handler error for %s: %s", event_type, e)
             await session.rollback()
+            raise
+
+    retry_times = [d.next_retry_at for d in deliveries if d.status == "retry" and d.next_retry_at]
+    if retry_times:
+        schedule_retry_sweep(min(retry_times))
+
+
+async def retry_webhook_deliveries() -> int:
+    """Re-send deliveries whose backoff has elapsed and re-arm the timer."""
+    from src.database import async_session_maker
+
+    async with async_session_maker() as session:
+        service = WebhookService(session)
+        try:
+            retried = await service.process_retries()
+            next_due = await service.next_retry_due()
+            await session.commit()
+        except Exception:
+            logger.exception("Webhook retry sweep failed")
+            await session.rollback()
+            return 0
+
+    if next_due is not None:
+        schedule_retry_sweep(next_due)
+    return retried
+
+
+def schedule_retry_sweep(due: datetime) -> None:
+    """Run :func:`retry_webhook_deliveries` at ``due`` unless a sweep is already armed sooner."""
+    _retry_sweeper.schedule(due)
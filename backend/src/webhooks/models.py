@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -37,9 +37,29 @@ class Webhook(Base):
     )
 
 
+class WebhookEventSubscription(Base):
+    """One (event type, webhook) pair from ``Webhook.events``.
+
+    Kept in step with the JSON list by ``WebhookService`` so the per-event
+    lookup is an index seek instead of loading every active webhook.
+    """
+    __tablename__ = "webhook_event_subscriptions"
+
+    event_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+    webhook_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("webhooks.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+
 class WebhookDelivery(Base):
-    """Record of a webhook delivery attempt."""
+    """Record of a webhook delivery and its retry attempts."""
     __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        Index("ix_webhook_deliveries_status_next_retry", "status", "next_retry_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -52,9 +72,12 @@ class WebhookDelivery(Base):
 
     event_type: Mapped[str] = mapped_column(String(100), nullable=False)
     payload: Mapped[dict | None] = mapped_column(JSON)
-    status: Mapped[str] = mapped_column(String(20), nullable=False)  # success, failed
+    # pending, success, retry (awaiting next_retry_at), failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
     response_code: Mapped[int | None] = mapped_column(Integer)
     error: Mapped[str | None] = mapped_column(Text)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    next_retry_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     attempted_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -137,5 +137,5 @@ async def test_webhook(
         },
     }
 
-    delivery = await service.deliver_webhook(webhook, "webhook.test", test_payload)
+    delivery = await service.deliver_webhook(webhook, "webhook.test", test_payload, retry=False)
     return WebhookDeliveryResponse.model_validate(delivery)
@@ -44,6 +44,8 @@ class WebhookDeliveryResponse(BaseModel):
     status: str
     response_code: int | None = None
     error: str | None = None
+    attempts: int = 0
+    next_retry_at: datetime | None = None
     attempted_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
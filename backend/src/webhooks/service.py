@@ -1,21 +1,31 @@
 """Webhook service layer for CRUD and delivery."""
 
+import asyncio
 import hashlib
 import hmac
 import json
 import logging
+import random
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-import httpx
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
 
+from src.config import settings
 from src.core.base_service import BaseService
 from src.core.constants import DEFAULT_PAGE_SIZE
-from src.webhooks.models import Webhook, WebhookDelivery
+from src.webhooks.delivery import AttemptResult, get_delivery_engine
+from src.webhooks.models import Webhook, WebhookDelivery, WebhookEventSubscription
 from src.webhooks.schemas import WebhookCreate, WebhookUpdate
 
 logger = logging.getLogger(__name__)
 
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+# How long a sweep's claim on a due delivery lasts before another sweep may
+# take it (well above the request timeout).
+RETRY_CLAIM_SECONDS = 300
+
 
 def compute_signature(payload_bytes: bytes, secret: str) -> str:
     """Compute HMAC-SHA256 signature for webhook payload."""
@@ -26,6 +36,15 @@ def compute_signature(payload_bytes: bytes, secret: str) -> str:
     ).hexdigest()
 
 
+def retry_delay(attempts: int, retry_after: float | None = None) -> float:
+    """Seconds before retry ``attempts + 1``: doubled per attempt, jittered, capped."""
+    ceiling = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_MAX_SECONDS))
+    return delay
+
+
 class WebhookService(BaseService[Webhook]):
     """Service for Webhook CRUD and delivery operations."""
 
@@ -79,6 +98,7 @@ class WebhookService(BaseService[Webhook]):
         webhook = Webhook(**data.model_dump(), created_by_id=user_id)
         self.db.add(webhook)
         await self.db.flush()
+        await self._sync_subscriptions(webhook)
         await self.db.refresh(webhook)
         return webhook
 
@@ -96,9 +116,23 @@ class WebhookService(BaseService[Webhook]):
         for field, value in update_data.items():
             setattr(webhook, field, value)
         await self.db.flush()
+        if "events" in update_data:
+            await self._sync_subscriptions(webhook)
         await self.db.refresh(webhook)
         return webhook
 
+    async def _sync_subscriptions(self, webhook: Webhook) -> None:
+        """Rewrite the webhook's rows in the event-subscription index."""
+        await self.db.execute(
+            delete(WebhookEventSubscription)
+            .where(WebhookEventSubscription.webhook_id == webhook.id)
+        )
+        self.db.add_all(
+            WebhookEventSubscription(event_type=event_type, webhook_id=webhook.id)
+            for event_type in dict.fromkeys(webhook.events or [])
+        )
+        await self.db.flush()
+
     async def delete_webhook(self, webhook: Webhook) -> None:
         await self.db.delete(webhook)
         await self.db.flush()
@@ -128,47 +162,154 @@ class WebhookService(BaseService[Webhook]):
         webhook: Webhook,
         event_type: str,
         payload: dict[str, Any],
+        *,
+        retry: bool = True,
     ) -> WebhookDelivery:
         """Deliver a webhook: POST payload to webhook URL with signature header."""
+        [delivery] = await self.deliver_to_webhooks([webhook], event_type, payload, retry=retry)
+        return delivery
+
+    async def deliver_to_webhooks(
+        self,
+        webhooks: list[Webhook],
+        event_type: str,
+        payload: dict[str, Any],
+        *,
+        retry: bool = True,
+    ) -> list[WebhookDelivery]:
+        """POST one event to several webhooks concurrently and log each attempt.
+
+        Requests go out in parallel through the shared delivery engine (no
+        session use while they are in flight); the results are then recorded
+        as ``WebhookDelivery`` rows. Retryable failures are left in ``retry``
+        status with ``next_retry_at`` set when ``retry`` is true.
+        """
         payload_bytes = json.dumps(payload, default=str).encode("utf-8")
+        engine = get_delivery_engine()
+        results = await asyncio.gather(*(
+            engine.post(webhook.url, payload_bytes, self._headers(webhook.secret, payload_bytes))
+            for webhook in webhooks
+        ))
 
-        headers = {"Content-Type": "application/json"}
-        if webhook.secret:
-            signature = compute_signature(payload_bytes, webhook.secret)
-            headers["X-Webhook-Signature"] = signature
-
-        delivery = WebhookDelivery(
-            webhook_id=webhook.id,
-            event_type=event_type,
-            payload=payload,
-            status="pending",
+        deliveries = []
+        for webhook, result in zip(webhooks, results, strict=True):
+            delivery = WebhookDelivery(
+                webhook_id=webhook.id,
+                event_type=event_type,
+                payload=payload,
+                status="pending",
+                attempts=0,
+            )
+            self._record_attempt(delivery, result, retry=retry)
+            self.db.add(delivery)
+            deliveries.append(delivery)
+        await self.db.flush()
+        for delivery in deliveries:
+            await self.db.refresh(delivery)
+        return deliveries
+
+    async def process_retries(self, limit: int = 200) -> int:
+        """Re-send deliveries whose backoff has elapsed. Returns the count retried.
+
+        Commits the session twice, so run it on a session of its own. The due
+        rows are claimed first: ``next_retry_at`` moves out by
+        ``RETRY_CLAIM_SECONDS`` and the claim commits, so other workers'
+        sweeps skip them and a crash only delays them. The requests then go
+        out with no transaction or row lock open, and the results are
+        recorded in a second short transaction.
+        """
+        now = datetime.now(UTC)
+        query = (
+            select(
+                WebhookDelivery.id, WebhookDelivery.payload,
+                Webhook.url, Webhook.secret, Webhook.is_active,
+            )
+            .join(Webhook, Webhook.id == WebhookDelivery.webhook_id)
+            .where(
+                WebhookDelivery.status == "retry",
+                WebhookDelivery.next_retry_at <= now,
+            )
+            .order_by(WebhookDelivery.next_retry_at)
+            .limit(limit)
+        )
+        if self.db.bind is not None and self.db.bind.dialect.name == "postgresql":
+            # Each worker process runs its own sweep; skip rows another is claiming.
+            query = query.with_for_update(skip_locked=True, of=WebhookDelivery)
+        due = (await self.db.execute(query)).all()
+        if not due:
+            return 0
+        ids = [row.id for row in due]
+        await self.db.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(ids))
+            .values(next_retry_at=now + timedelta(seconds=RETRY_CLAIM_SECONDS))
         )
+        await self.db.commit()
 
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    webhook.url,
-                    content=payload_bytes,
-                    headers=headers,
-                )
-                delivery.response_code = response.status_code
-                delivery.status = "success" if response.status_code < 400 else "failed"
-                if response.status_code >= 400:
-                    delivery.error = response.text[:1000]
-        except Exception as e:
-            delivery.status = "failed"
-            delivery.error = str(e)[:1000]
+        engine = get_delivery_engine()
 
-        self.db.add(delivery)
-        await self.db.flush()
-        await self.db.refresh(delivery)
-        return delivery
+        async def _resend(row) -> AttemptResult:
+            if not row.is_active:
+                return AttemptResult(error="Webhook disabled before retry")
+            body = json.dumps(row.payload, default=str).encode("utf-8")
+            return await engine.post(row.url, body, self._headers(row.secret, body))
+
+        results = await asyncio.gather(*(_resend(row) for row in due))
+        deliveries = {
+            delivery.id: delivery
+            for delivery in (await self.db.execute(
+                select(WebhookDelivery).where(WebhookDelivery.id.in_(ids))
+            )).scalars()
+        }
+        for row, attempt in zip(due, results, strict=True):
+            delivery = deliveries.get(row.id)
+            if delivery is not None:  # deleted with its webhook meanwhile
+                self._record_attempt(delivery, attempt, retry=True)
+        await self.db.commit()
+        return len(due)
+
+    async def next_retry_due(self) -> datetime | None:
+        """When the earliest pending retry is due, if any."""
+        result = await self.db.execute(
+            select(func.min(WebhookDelivery.next_retry_at)).where(WebhookDelivery.status == "retry")
+        )
+        return result.scalar()
+
+    @staticmethod
+    def _headers(secret: str | None, payload_bytes: bytes) -> dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if secret:
+            headers["X-Webhook-Signature"] = compute_signature(payload_bytes, secret)
+        return headers
+
+    @staticmethod
+    def _record_attempt(delivery: WebhookDelivery, result: AttemptResult, *, retry: bool) -> None:
+        now = datetime.now(UTC)
+        delivery.attempts = (delivery.attempts or 0) + 1
+        delivery.attempted_at = now
+        delivery.response_code = result.status_code
+        delivery.next_retry_at = None
+        if result.ok:
+            delivery.status = "success"
+            delivery.error = None
+            return
+        delivery.error = (result.error or "")[:1000]
+        if retry and result.retryable and delivery.attempts < settings.WEBHOOK_MAX_ATTEMPTS:
+            delivery.status = "retry"
+            delivery.next_retry_at = now + timedelta(
+                seconds=retry_delay(delivery.attempts, result.retry_after)
+            )
+        else:
+            delivery.status = "failed"
 
     async def get_active_webhooks_for_event(self, event_type: str) -> list[Webhook]:
         """Get all active webhooks that subscribe to a given event type."""
         result = await self.db.execute(
-            select(Webhook).where(Webhook.is_active == True)
+            select(Webhook)
+            .join(WebhookEventSubscription, WebhookEventSubscription.webhook_id == Webhook.id)
+            .where(
+                WebhookEventSubscription.event_type == event_type,
+                Webhook.is_active.is_(True),
+            )
         )
-        webhooks = list(result.scalars().all())
-        # Filter by event subscription (JSON list contains the event type)
-        return [w for w in webhooks if event_type in (w.events or [])]
+        return list(result.scalars().all())
@@ -45,7 +45,7 @@ export const getAdminAuditFeed = async (
 };
 
 export const getAdminAuditSummary = async (
-  filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'entity_id'> = {}
+  filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'cursor' | 'entity_id'> = {}
 ): Promise<AdminAuditSummaryResponse> => {
   const response = await apiClient.get<AdminAuditSummaryResponse>(
     `${ADMIN_AUDIT_BASE}/summary`,
@@ -66,7 +66,7 @@ export const getAdminAuditUserDetail = async (
 };
 
 export const exportAdminAuditCsv = async (
-  filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size'> = {}
+  filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'cursor'> = {}
 ): Promise<Blob> => {
   const response = await apiClient.get(
     `${ADMIN_AUDIT_BASE}/export.csv`,
@@ -76,7 +76,17 @@ export interface DedupClustersResponse {
   entity_type: DedupEntityType;
   key: DedupClusterKey;
   clusters: DedupCluster[];
-  skipped_no_key: number;
+  next_cursor: string | null;
+  // Totals are only reported on the first page (no cursor).
+  skipped_no_key: number | null;
+  total_clusters: number | null;
+  total_redundant: number | null;
+}
+
+export interface DedupClustersParams {
+  cursor?: string | null;
+  limit?: number;
+  refresh?: boolean;
 }
 
 export type MergeClusterFailureCode =
@@ -101,9 +111,16 @@ export interface MergeClusterResponse {
 export const listDuplicateClusters = async (
   entityType: DedupEntityType,
   key: DedupClusterKey,
+  { cursor, limit, refresh }: DedupClustersParams = {},
 ): Promise<DedupClustersResponse> => {
   const response = await apiClient.get<DedupClustersResponse>(`${BASE}/clusters`, {
-    params: { entity_type: entityType, key },
+    params: {
+      entity_type: entityType,
+      key,
+      ...(cursor ? { cursor } : {}),
+      ...(limit ? { limit } : {}),
+      ...(refresh ? { refresh: true } : {}),
+    },
   });
   return response.data;
 };
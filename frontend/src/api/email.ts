@@ -77,6 +77,9 @@ export interface EmailSearchResult {
   kind: 'sent' | 'received';
   subject: string;
   snippet: string;
+  /** [start, end) offsets of matched words within `snippet`. */
+  highlights: [number, number][];
+  rank: number;
   from_email: string | null;
   to_email: string;
   sent_at: string | null;
@@ -87,10 +90,13 @@ export interface EmailSearchResult {
 
 export interface EmailSearchResponse {
   items: EmailSearchResult[];
-  total: number;
+  /** Only on the first page (no cursor); a lower bound when `total_capped`. */
+  total: number | null;
+  total_capped: boolean;
   page: number;
   page_size: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null;
 }
 
 export const getVolumeStats = async (): Promise<VolumeStats> => {
@@ -123,6 +129,7 @@ export const emailApi = {
     page_size?: number;
     entity_type?: string;
     entity_id?: number;
+    cursor?: string;
   }) =>
     apiClient.get<EmailSearchResponse>('/api/email/search', { params }).then((r) => r.data),
 };
@@ -17,6 +17,7 @@ import type {
   ConversionResponse,
   PipelineStage,
   LeadKanbanResponse,
+  KanbanLeadColumnPage,
   MoveLeadRequest,
   MoveLeadResponse,
 } from '../types';
@@ -158,6 +159,21 @@ export const getLeadKanban = async (ownerId?: number): Promise<LeadKanbanRespons
   return response.data;
 };
 
+/**
+ * Load the next page of one Kanban column
+ */
+export const getLeadKanbanColumn = async (
+  stageId: number,
+  cursor: string,
+  ownerId?: number
+): Promise<KanbanLeadColumnPage> => {
+  const response = await apiClient.get<KanbanLeadColumnPage>(
+    `${LEADS_BASE}/kanban/stages/${stageId}`,
+    { params: ownerId ? { cursor, owner_id: ownerId } : { cursor } }
+  );
+  return response.data;
+};
+
 /**
  * Move a lead to a different pipeline stage
  */
@@ -209,6 +225,7 @@ export const leadsApi = {
   // Pipeline / Kanban
   getLeadPipelineStages,
   getLeadKanban,
+  getLeadKanbanColumn,
   moveLeadStage,
   // Email Campaigns
   sendCampaign,
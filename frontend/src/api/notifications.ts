@@ -2,7 +2,7 @@
  * Notifications API client
  */
 
-import { apiClient } from './client';
+import { apiClient, getToken } from './client';
 
 export interface NotificationItem {
   id: number;
@@ -22,23 +22,72 @@ export interface NotificationItem {
 
 export interface NotificationListResponse {
   items: NotificationItem[];
-  total: number;
+  /** Only reported when no cursor is sent. */
+  total: number | null;
   page: number;
   page_size: number;
-  pages: number;
+  pages: number | null;
+  /** Pass as `cursor` to fetch the next page; null on the last page. */
+  next_cursor: string | null;
 }
 
 export interface UnreadCountResponse {
   count: number;
 }
 
+/**
+ * Read the unread-count stream (Server-Sent Events) until it ends.
+ *
+ * Uses fetch rather than EventSource, which cannot send the bearer token.
+ * Calls `onCount` with the current count and again on every change.
+ * Resolves when the server closes the stream; rejects on a non-OK response,
+ * a network error, or when `signal` aborts.
+ */
+const streamUnreadCount = async (
+  onCount: (count: number) => void,
+  signal: AbortSignal,
+): Promise<void> => {
+  const token = getToken();
+  const baseUrl = apiClient.defaults.baseURL || '';
+  const response = await fetch(`${baseUrl}/api/notifications/stream`, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+    signal,
+  });
+  if (!response.ok || !response.body) throw new Error('Notification stream failed');
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf('\n\n');
+      const lines = message.split('\n');
+      if (!lines.includes('event: unread')) continue;
+      const data = lines.find((line) => line.startsWith('data: '));
+      if (data) onCount((JSON.parse(data.slice(6)) as UnreadCountResponse).count);
+    }
+  }
+};
+
 export const notificationsApi = {
-  list: (params?: { page?: number; page_size?: number; unread_only?: boolean }) =>
+  list: (params?: {
+    page?: number;
+    page_size?: number;
+    unread_only?: boolean;
+    cursor?: string;
+  }) =>
     apiClient.get<NotificationListResponse>('/api/notifications', { params }).then((r) => r.data),
 
   getUnreadCount: () =>
     apiClient.get<UnreadCountResponse>('/api/notifications/unread-count').then((r) => r.data),
 
+  streamUnreadCount,
+
   markRead: (id: number) =>
     apiClient.put<NotificationItem>(`/api/notifications/${id}/read`).then((r) => r.data),
 
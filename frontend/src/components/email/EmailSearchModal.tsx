@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useRef, useState } from 'react';
+import { useCallback, useEffect, useRef, useState, type ReactNode } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { MagnifyingGlassIcon } from '@heroicons/react/24/outline';
 import { emailApi, type EmailSearchResult } from '../../api/email';
@@ -6,6 +6,22 @@ import { Spinner } from '../ui';
 import { Modal } from '../ui/Modal';
 import { formatDateTime } from '../../utils/formatters';
 
+function HighlightedSnippet({ text, highlights }: { text: string; highlights: [number, number][] }) {
+  const parts: ReactNode[] = [];
+  let pos = 0;
+  highlights.forEach(([start, end], i) => {
+    if (start > pos) parts.push(text.slice(pos, start));
+    parts.push(
+      <mark key={i} className="bg-yellow-100 text-inherit dark:bg-yellow-900/50 rounded-sm">
+        {text.slice(start, end)}
+      </mark>,
+    );
+    pos = end;
+  });
+  if (pos < text.length) parts.push(text.slice(pos));
+  return <>{parts}</>;
+}
+
 interface EmailSearchModalProps {
   isOpen: boolean;
   onClose: () => void;
@@ -19,6 +35,7 @@ export function EmailSearchModal({ isOpen, onClose, entityType, entityId }: Emai
   const [scopedToEntity, setScopedToEntity] = useState(Boolean(entityType && entityId));
   const [results, setResults] = useState<EmailSearchResult[]>([]);
   const [total, setTotal] = useState(0);
+  const [totalCapped, setTotalCapped] = useState(false);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const debounceRef = useRef<ReturnType<typeof setTimeout> | null>(null);
@@ -42,7 +59,8 @@ export function EmailSearchModal({ isOpen, onClose, entityType, entityId }: Emai
         }
         const data = await emailApi.search(params);
         setResults(data.items);
-        setTotal(data.total);
+        setTotal(data.total ?? data.items.length);
+        setTotalCapped(data.total_capped);
       } catch {
         setError('Search failed. Please try again.');
       } finally {
@@ -156,7 +174,8 @@ export function EmailSearchModal({ isOpen, onClose, entityType, entityId }: Emai
         {results.length > 0 && (
           <>
             <p className="px-4 py-2 text-xs text-gray-400 dark:text-gray-500 border-b border-gray-100 dark:border-gray-700">
-              {total} result{total !== 1 ? 's' : ''}
+              {total}
+              {totalCapped ? '+' : ''} result{total !== 1 ? 's' : ''}
               {total > 25 ? ' (showing first 25)' : ''}
             </p>
             <ul role="listbox">
@@ -191,7 +210,7 @@ export function EmailSearchModal({ isOpen, onClose, entityType, entityId }: Emai
                         </p>
                         {item.snippet && (
                           <p className="text-xs text-gray-400 dark:text-gray-500 truncate mt-0.5">
-                            {item.snippet}
+                            <HighlightedSnippet text={item.snippet} highlights={item.highlights} />
                           </p>
                         )}
                       </div>
@@ -51,10 +51,13 @@ function looksLikeHtml(value: string): boolean {
 // is ours, but inbound is hostile; deny iframes, embeds, JS-bearing
 // attrs, and inline `style` (history of CSS exfil bugs in mail clients).
 //
-// data: URIs on `<img>` are permitted by DOMPurify's default
-// DEFAULT_DATA_URI_TAGS set (img, audio, video, source, image, track),
-// so the inline-image substitution in the Gmail sync pipeline
-// (client.py::_inline_cid_images) is rendered without further config.
+// The Gmail sync points inline `cid:` images at same-origin
+// /api/integrations/gmail/inline-images/<sha256> URLs
+// (client.py::_embed_inline_images), which the API hands out with an
+// expiring signature (inline_images.py); types it doesn't store stay as
+// data: URIs, which DOMPurify's default DEFAULT_DATA_URI_TAGS set
+// (img, audio, video, source, image, track) permits on `<img>`. Both
+// render without further config.
 // USE_PROFILES.html doesn't load the svg profile, so `<svg>` and
 // `<image>` are stripped entirely — no SVG-script-execution surface.
 const EMAIL_HTML_PURIFY_CONFIG = {
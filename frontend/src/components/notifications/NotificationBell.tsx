@@ -5,6 +5,7 @@ import { Transition } from '@headlessui/react';
 import {
   useNotifications,
   useUnreadCount,
+  useNotificationStream,
   useMarkNotificationRead,
   useMarkAllNotificationsRead,
   useDeleteNotification,
@@ -34,6 +35,7 @@ export function NotificationBell() {
   const buttonRef = useRef<HTMLButtonElement>(null);
   const navigate = useNavigate();
 
+  useNotificationStream();
   const { data: unreadData } = useUnreadCount();
   const { data: notificationsData, isLoading } = useNotifications({
     page: 1,
@@ -95,9 +95,12 @@ const feedFixture = {
     },
   ],
   total: 1,
+  total_capped: false,
+  total_estimated: false,
   page: 1,
   page_size: 50,
   pages: 1,
+  next_cursor: null,
 };
 
 const userDetailFixture = {
@@ -265,6 +268,52 @@ describe('AdminAuditPage', () => {
     });
   });
 
+  it('pages the feed with next_cursor and keeps the first-page total', async () => {
+    const captured = installAuditHandlers();
+    server.use(
+      http.get('*/api/admin/audit/feed', ({ request }) => {
+        const url = new URL(request.url);
+        captured.feed.push(url);
+        if (url.searchParams.get('cursor') === 'cursor-2') {
+          return HttpResponse.json({
+            ...feedFixture,
+            total: null,
+            pages: null,
+            next_cursor: null,
+          });
+        }
+        return HttpResponse.json({
+          ...feedFixture,
+          total: 48000,
+          total_estimated: true,
+          pages: 960,
+          next_cursor: 'cursor-2',
+        });
+      }),
+    );
+    renderWithProviders(<AdminAuditPage />);
+
+    await waitFor(() => {
+      expect(screen.getByText(/about 48,000 matching audit events/i)).toBeInTheDocument();
+    });
+    expect(captured.feed[0].searchParams.has('cursor')).toBe(false);
+
+    fireEvent.click(screen.getByRole('button', { name: /^next$/i }));
+
+    await waitFor(() => {
+      expect(captured.feed.at(-1)?.searchParams.get('cursor')).toBe('cursor-2');
+    });
+    await waitFor(() => {
+      expect(screen.getByRole('button', { name: /^next$/i })).toBeDisabled();
+    });
+    expect(screen.getByText(/about 48,000 matching audit events/i)).toBeInTheDocument();
+
+    fireEvent.click(screen.getByRole('button', { name: /^previous$/i }));
+    await waitFor(() => {
+      expect(screen.getByRole('button', { name: /^previous$/i })).toBeDisabled();
+    });
+  });
+
   it('exports the visible feed and labels the row count', async () => {
     installAuditHandlers();
     const originalCreateObjectURL = URL.createObjectURL;
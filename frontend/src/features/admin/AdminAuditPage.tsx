@@ -17,7 +17,6 @@ import { Card } from '../../components/ui/Card';
 import { EntityLink } from '../../components/ui/EntityLink';
 import { normalizeEntityType } from '../../components/ui/EntityLink.utils';
 import { Input } from '../../components/ui/Input';
-import { PaginationBar } from '../../components/ui/Pagination';
 import { Select } from '../../components/ui/Select';
 import { Spinner } from '../../components/ui/Spinner';
 import { Table, type Column } from '../../components/ui/Table';
@@ -53,18 +52,39 @@ const TABS: { id: TabId; name: string }[] = [
 
 const PAGE_SIZE = 50;
 
+/** Feed total from the latest cursor-less page. Cursor pages don't
+ *  recount, so the page keeps the first page's figure while paging. */
+interface FeedTotal {
+  total: number;
+  capped: boolean;
+  estimated: boolean;
+}
+
+function feedTotalOf(feed: AdminAuditFeedResponse): FeedTotal | null {
+  if (feed.total == null) return null;
+  return { total: feed.total, capped: feed.total_capped, estimated: feed.total_estimated };
+}
+
+/** "1,234", "about 48,000" (planner estimate) or "1,000+" (lower bound). */
+function formatFeedTotal(feedTotal: FeedTotal | null): string {
+  if (!feedTotal) return '0';
+  const n = feedTotal.total.toLocaleString();
+  if (feedTotal.estimated) return `about ${n}`;
+  return feedTotal.capped ? `${n}+` : n;
+}
+
 /** Replaces a 3-deep nested ternary in the header — the count label is
  *  per-tab so the JSX stays the same shape regardless of which tab is
  *  active. */
 function tabCountLabel(
   activeTab: TabId,
-  feed: AdminAuditFeedResponse | undefined,
+  feedTotal: FeedTotal | null,
   summary: AdminAuditSummaryResponse | undefined,
 ): string {
   const fmt = (n: number) => n.toLocaleString();
   switch (activeTab) {
     case 'feed':
-      return `${fmt(feed?.total ?? 0)} matching audit events`;
+      return `${formatFeedTotal(feedTotal)} matching audit events`;
     case 'users':
       return `${fmt(summary?.users.length ?? 0)} reps`;
     case 'entities':
@@ -554,6 +574,49 @@ function EntityDetailDrawer({
   );
 }
 
+// Previous / Next over the feed's keyset cursors. There is no jump-to-page:
+// later pages are only reachable through the cursor of the one before.
+function FeedPager({
+  page,
+  pageSize,
+  visible,
+  feedTotal,
+  onPrevious,
+  onNext,
+}: {
+  page: number;
+  pageSize: number;
+  visible: number;
+  feedTotal: FeedTotal | null;
+  onPrevious: () => void;
+  onNext?: () => void;
+}) {
+  if (page === 1 && !onNext) return null;
+  const from = (page - 1) * pageSize + 1;
+  const to = from + visible - 1;
+  return (
+    <div className="flex items-center justify-between border-t border-gray-200 px-4 py-3 dark:border-gray-700 sm:px-6">
+      <p className="text-sm text-gray-700 dark:text-gray-300">
+        Showing <span className="font-medium">{from}</span> to{' '}
+        <span className="font-medium">{to}</span>
+        {feedTotal ? (
+          <>
+            {' '}of <span className="font-medium">{formatFeedTotal(feedTotal)}</span>
+          </>
+        ) : null}
+      </p>
+      <div className="flex gap-2">
+        <Button variant="secondary" size="sm" onClick={onPrevious} disabled={page <= 1}>
+          Previous
+        </Button>
+        <Button variant="secondary" size="sm" onClick={onNext} disabled={!onNext}>
+          Next
+        </Button>
+      </div>
+    </div>
+  );
+}
+
 // The audit feed auto-refetches every 120s (lowered from 30s to cut Neon
 // cost; see useAudit.ts). Admins acting on stale data could revoke a
 // session that was already restored, so surface the staleness explicitly.
@@ -602,7 +665,10 @@ export default function AdminAuditPage() {
   const isAdmin = user?.is_superuser || user?.role === 'admin';
 
   const [activeTab, setActiveTab] = useState<TabId>('feed');
-  const [page, setPage] = useState(1);
+  // Cursors of the pages after the first, in visiting order; the page
+  // number is the stack depth + 1 and "Previous" pops.
+  const [cursors, setCursors] = useState<string[]>([]);
+  const [feedTotal, setFeedTotal] = useState<FeedTotal | null>(null);
   const [startDate, setStartDate] = useState(isoDateDaysAgo(7));
   const [endDate, setEndDate] = useState(isoDateDaysAgo(0));
   const [userId, setUserId] = useState('');
@@ -631,11 +697,12 @@ export default function AdminAuditPage() {
     search: search || undefined,
   }), [startDate, endDate, userId, entityType, action, search]);
 
+  const page = cursors.length + 1;
   const feedFilters = useMemo(() => ({
     ...summaryFilters,
-    page,
+    cursor: cursors.at(-1),
     page_size: PAGE_SIZE,
-  }), [summaryFilters, page]);
+  }), [summaryFilters, cursors]);
 
   // Drawer queries reuse the dashboard filters minus entity_type
   // (the drawer is already scoped to one entity) and force first-page
@@ -656,6 +723,9 @@ export default function AdminAuditPage() {
     dataUpdatedAt: feedUpdatedAt,
     refetch: refetchFeed,
   } = useAdminAuditFeed(feedFilters);
+  useEffect(() => {
+    if (feed && feed.total != null) setFeedTotal(feedTotalOf(feed));
+  }, [feed]);
   const { data: selectedUserDetail, isLoading: userDetailLoading } =
     useAdminAuditUserDetail(selectedUser?.user_id ?? 0, detailFilters);
   const { data: selectedEntityDetail, isLoading: entityDetailLoading } =
@@ -665,7 +735,7 @@ export default function AdminAuditPage() {
       detailFilters
     );
 
-  const resetPage = () => setPage(1);
+  const resetPage = () => setCursors([]);
   const applyDatePreset = (days: number) => {
     setStartDate(isoDateDaysAgo(days));
     setEndDate(isoDateDaysAgo(0));
@@ -777,20 +847,20 @@ export default function AdminAuditPage() {
             leftIcon={<ArrowDownTrayIcon className="h-4 w-4" />}
             onClick={() =>
               downloadVisibleFeedCsv(feed?.items ?? [], {
-                page: feedFilters.page,
+                page,
                 pageSize: feedFilters.page_size,
-                totalRows: feed?.total ?? null,
+                totalRows: feedTotal?.total ?? null,
               })
             }
             disabled={!feed?.items.length}
             title={
-              feed?.total != null
-                ? `Exports the visible ${feed.items.length} row${feed.items.length === 1 ? '' : 's'} of ${feed.total} matching the current filter`
+              feed && feedTotal
+                ? `Exports the visible ${feed.items.length} row${feed.items.length === 1 ? '' : 's'} of ${formatFeedTotal(feedTotal)} matching the current filter`
                 : undefined
             }
           >
-            {feed?.total != null
-              ? `Export visible (${feed.items.length}/${feed.total})`
+            {feed && feedTotal
+              ? `Export visible (${feed.items.length}/${formatFeedTotal(feedTotal)})`
               : 'Export visible'}
           </Button>
           <Button
@@ -799,13 +869,13 @@ export default function AdminAuditPage() {
             onClick={() =>
               exportFullFilter(summaryFilters, setExportingFull, setExportError)
             }
-            disabled={exportingFull || !feed?.total}
+            disabled={exportingFull || !feedTotal?.total}
             title="Streams every audit row matching the current filter — for compliance pulls"
           >
             {exportingFull
               ? 'Exporting...'
-              : feed?.total != null
-                ? `Export filter (${feed.total.toLocaleString()})`
+              : feedTotal
+                ? `Export filter (${formatFeedTotal(feedTotal)})`
                 : 'Export filter'}
           </Button>
           <FeedStalenessBadge
@@ -953,7 +1023,7 @@ export default function AdminAuditPage() {
         <div className="flex flex-col gap-2 px-4 pt-2 sm:flex-row sm:items-center sm:justify-between" data-guide="admin-audit-tabs">
           <TabBar tabs={TABS} activeTab={activeTab} onTabChange={setActiveTab} />
           <p className="pb-2 text-xs text-gray-500 dark:text-gray-400 sm:pb-0">
-            {tabCountLabel(activeTab, feed, summary)}
+            {tabCountLabel(activeTab, feedTotal, summary)}
           </p>
         </div>
         <div className="p-4">
@@ -990,12 +1060,17 @@ export default function AdminAuditPage() {
           )}
         </div>
         {activeTab === 'feed' && feed ? (
-          <PaginationBar
-            page={feed.page}
-            pages={feed.pages}
-            total={feed.total}
+          <FeedPager
+            page={page}
             pageSize={feed.page_size}
-            onPageChange={setPage}
+            visible={feed.items.length}
+            feedTotal={feedTotal}
+            onPrevious={() => setCursors((stack) => stack.slice(0, -1))}
+            onNext={
+              feed.next_cursor
+                ? () => setCursors((stack) => [...stack, feed.next_cursor as string])
+                : undefined
+            }
           />
         ) : null}
       </Card>
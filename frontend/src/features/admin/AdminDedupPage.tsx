@@ -7,9 +7,9 @@
  * from prior imports.
  */
 
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { LockClosedIcon, ArrowPathIcon, UsersIcon } from '@heroicons/react/24/outline';
 
 import { Button } from '../../components/ui/Button';
@@ -191,9 +191,27 @@ export default function AdminDedupPage() {
   } | null>(null);
   const [lastFailures, setLastFailures] = useState<MergeClusterFailure[]>([]);
 
-  const { data, isLoading, isFetching, error } = useQuery({
+  // Set by the Refresh button so the next first-page fetch bypasses the
+  // server-side cluster cache.
+  const forceRefresh = useRef(false);
+
+  const {
+    data,
+    isLoading,
+    isFetching,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ['admin', 'dedup', 'clusters', entityType, key],
-    queryFn: () => listDuplicateClusters(entityType, key),
+    queryFn: ({ pageParam }) => {
+      const refresh = pageParam === null && forceRefresh.current;
+      if (pageParam === null) forceRefresh.current = false;
+      return listDuplicateClusters(entityType, key, { cursor: pageParam, refresh });
+    },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
     enabled: isAuthorized,
   });
 
@@ -250,9 +268,12 @@ export default function AdminDedupPage() {
     );
   }
 
-  const clusters = data?.clusters ?? [];
-  const skippedNoKey = data?.skipped_no_key ?? 0;
-  const totalDupes = clusters.reduce((sum, c) => sum + (c.member_count - 1), 0);
+  const clusters = data?.pages.flatMap((p) => p.clusters) ?? [];
+  const firstPage = data?.pages[0];
+  const skippedNoKey = firstPage?.skipped_no_key ?? 0;
+  const totalClusters = firstPage?.total_clusters ?? clusters.length;
+  const totalDupes =
+    firstPage?.total_redundant ?? clusters.reduce((sum, c) => sum + (c.member_count - 1), 0);
 
   return (
     <div className="space-y-6" data-guide="dedup-page">
@@ -289,7 +310,10 @@ export default function AdminDedupPage() {
         <Button
           variant="ghost"
           size="sm"
-          onClick={() => queryClient.invalidateQueries({ queryKey: ['admin', 'dedup', 'clusters'] })}
+          onClick={() => {
+            forceRefresh.current = true;
+            queryClient.resetQueries({ queryKey: ['admin', 'dedup', 'clusters'] });
+          }}
           leftIcon={<ArrowPathIcon className={`h-4 w-4 ${isFetching ? 'animate-spin' : ''}`} aria-hidden="true" />}
         >
           Refresh
@@ -297,7 +321,7 @@ export default function AdminDedupPage() {
         <div className="ml-auto text-sm text-gray-600 dark:text-gray-400" aria-live="polite">
           {isLoading ? null : (
             <>
-              <strong>{clusters.length}</strong> cluster{clusters.length !== 1 ? 's' : ''} &middot;{' '}
+              <strong>{totalClusters}</strong> cluster{totalClusters !== 1 ? 's' : ''} &middot;{' '}
               <strong>{totalDupes}</strong> redundant record{totalDupes !== 1 ? 's' : ''}
               {skippedNoKey > 0 && (
                 <>
@@ -375,6 +399,18 @@ export default function AdminDedupPage() {
             ))}
           </div>
         )}
+        {hasNextPage && (
+          <div className="mt-4 flex justify-center">
+            <Button
+              variant="secondary"
+              size="sm"
+              onClick={() => fetchNextPage()}
+              isLoading={isFetchingNextPage}
+            >
+              Load more clusters ({clusters.length} of {totalClusters} shown)
+            </Button>
+          </div>
+        )}
       </div>
 
       <ConfirmDialog
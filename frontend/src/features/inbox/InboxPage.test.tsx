@@ -71,6 +71,8 @@ const SEARCH_FIXTURES = [
     kind: 'received' as const,
     subject: 'RE: Quote follow-up',
     snippet: 'Sounds good, let us schedule a call.',
+    highlights: [] as [number, number][],
+    rank: 0.1,
     from_email: 'lead@acme.com',
     to_email: 'rep@linkcreative.com',
     sent_at: '2026-05-08T12:00:00Z',
@@ -103,9 +105,11 @@ beforeEach(() => {
   vi.mocked(emailApi.search).mockResolvedValue({
     items: SEARCH_FIXTURES,
     total: SEARCH_FIXTURES.length,
+    total_capped: false,
     page: 1,
     page_size: 25,
     pages: 1,
+    next_cursor: null,
   });
   vi.mocked(getVolumeStats).mockResolvedValue({
     sent_today: 12,
@@ -158,9 +162,11 @@ describe('InboxPage', () => {
     vi.mocked(emailApi.search).mockResolvedValueOnce({
       items: [],
       total: 0,
+      total_capped: false,
       page: 1,
       page_size: 25,
       pages: 0,
+      next_cursor: null,
     });
 
     renderPage();
@@ -193,9 +199,11 @@ describe('InboxPage', () => {
     vi.mocked(emailApi.list).mockResolvedValueOnce({
       items: [],
       total: 0,
+      total_capped: false,
       page: 1,
       page_size: 25,
       pages: 0,
+      next_cursor: null,
     });
 
     renderPage('/inbox?status=failed');
@@ -9,6 +9,7 @@ vi.mock('../../hooks/useLeads', async (importOriginal) => {
     ...actual,
     useLeadKanban: vi.fn(),
     useMoveLeadStage: vi.fn(),
+    useLoadMoreLeadKanban: vi.fn(),
   };
 });
 
@@ -26,12 +27,17 @@ vi.mock('../../utils/toast', () => ({
   showInfo: vi.fn(),
 }));
 
-import { useLeadKanban, useMoveLeadStage } from '../../hooks/useLeads';
+import {
+  useLeadKanban,
+  useLoadMoreLeadKanban,
+  useMoveLeadStage,
+} from '../../hooks/useLeads';
 import { useUsers } from '../../hooks/useAuth';
 import PipelinePage from './PipelinePage';
 import type { KanbanLeadStage } from '../../types';
 
 const mockMoveLeadMutate = vi.fn();
+const mockLoadMoreMutate = vi.fn();
 
 function makeLeadStage(
   stageId: number,
@@ -71,6 +77,10 @@ beforeEach(() => {
   vi.mocked(useMoveLeadStage).mockReturnValue({
     mutate: mockMoveLeadMutate,
   } as unknown as ReturnType<typeof useMoveLeadStage>);
+  vi.mocked(useLoadMoreLeadKanban).mockReturnValue({
+    mutate: mockLoadMoreMutate,
+    isPending: false,
+  } as unknown as ReturnType<typeof useLoadMoreLeadKanban>);
   vi.mocked(useUsers).mockReturnValue({
     data: [],
   } as unknown as ReturnType<typeof useUsers>);
@@ -164,6 +174,39 @@ describe('PipelinePage', () => {
     expect(screen.getByText(/1 of 2 match/i)).toBeInTheDocument();
   });
 
+  it('loads the next page of a column from its cursor', async () => {
+    vi.mocked(useLeadKanban).mockReturnValue({
+      data: {
+        stages: [
+          {
+            ...makeLeadStage(1, 'Discovery', [
+              { id: 10, full_name: 'Alice Acme', company_name: 'Acme' },
+            ]),
+            count: 40,
+            next_cursor: 'abc',
+          },
+          makeLeadStage(2, 'Proposal'),
+        ],
+      },
+      isLoading: false,
+      error: null,
+    } as unknown as ReturnType<typeof useLeadKanban>);
+
+    renderWithProviders(<PipelinePage />);
+    expect(screen.getByText(/40 leads on board/i)).toBeInTheDocument();
+
+    const user = userEvent.setup();
+    const buttons = screen.getAllByRole('button', { name: 'Load more' });
+    expect(buttons).toHaveLength(1);
+    await user.click(buttons[0]);
+
+    expect(mockLoadMoreMutate).toHaveBeenCalledWith({
+      stageId: 1,
+      cursor: 'abc',
+      ownerId: undefined,
+    });
+  });
+
   it('renders a Back to Leads link', () => {
     renderWithProviders(<PipelinePage />);
     expect(
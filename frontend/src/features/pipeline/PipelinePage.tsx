@@ -15,7 +15,11 @@ import {
   type CollisionDetection,
 } from '@dnd-kit/core';
 import { sortableKeyboardCoordinates } from '@dnd-kit/sortable';
-import { useLeadKanban, useMoveLeadStage } from '../../hooks/useLeads';
+import {
+  useLeadKanban,
+  useLoadMoreLeadKanban,
+  useMoveLeadStage,
+} from '../../hooks/useLeads';
 import { useUsers } from '../../hooks/useAuth';
 import { usePageTitle } from '../../hooks/usePageTitle';
 import { useAuthStore } from '../../store/authStore';
@@ -50,6 +54,7 @@ function PipelinePage() {
 
   const { data: kanban, isLoading, error } = useLeadKanban(ownerFilter);
   const moveLead = useMoveLeadStage();
+  const loadMore = useLoadMoreLeadKanban();
 
   const sensors = useSensors(
     useSensor(PointerSensor, { activationConstraint: { distance: 5 } }),
@@ -72,7 +77,8 @@ function PipelinePage() {
   // Apply the search filter in-memory so dragging keeps working —
   // every visible card still has a real backend stage. Counts are
   // recomputed off the filtered list so column headers reflect what
-  // the user can actually see.
+  // the user can actually see. Only loaded pages are searched; a
+  // column's "Load more" pulls further cards into the filter.
   const { stages, totalCount, filteredCount } = useMemo(() => {
     const rawStages = kanban?.stages ?? [];
     const totalCount = rawStages.reduce((sum, s) => sum + (s.count ?? 0), 0);
@@ -298,6 +304,17 @@ function PipelinePage() {
                 key={stage.stage_id}
                 stage={stage}
                 isDragging={isDragging}
+                isLoadingMore={
+                  loadMore.isPending &&
+                  loadMore.variables?.stageId === stage.stage_id
+                }
+                onLoadMore={(cursor) =>
+                  loadMore.mutate({
+                    stageId: stage.stage_id,
+                    cursor,
+                    ownerId: ownerFilter,
+                  })
+                }
               />
             ))}
           </div>
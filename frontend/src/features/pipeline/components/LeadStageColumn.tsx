@@ -8,13 +8,22 @@ import { SortableLeadCard } from './SortableLeadCard';
 interface LeadStageColumnProps {
   stage: KanbanLeadStage;
   isDragging: boolean;
+  // The board ships the first page of each column; this fetches the
+  // page after `stage.next_cursor`.
+  onLoadMore?: (cursor: string) => void;
+  isLoadingMore?: boolean;
 }
 
 // Link Creative brand gold. Used for the active-drop ring so the user
 // has a clear, on-brand affordance for "this column is the drop target".
 const BRAND_GOLD = '#D4A574';
 
-export function LeadStageColumn({ stage, isDragging }: LeadStageColumnProps) {
+export function LeadStageColumn({
+  stage,
+  isDragging,
+  onLoadMore,
+  isLoadingMore = false,
+}: LeadStageColumnProps) {
   const columnDragIds = stage.leads.map((l) =>
     encodeLeadDragId(l.id, stage.stage_id),
   );
@@ -78,6 +87,16 @@ export function LeadStageColumn({ stage, isDragging }: LeadStageColumnProps) {
                 {isOver ? 'Drop here' : 'Drop leads here'}
               </p>
             )}
+            {stage.next_cursor && onLoadMore && (
+              <button
+                type="button"
+                onClick={() => onLoadMore(stage.next_cursor as string)}
+                disabled={isLoadingMore}
+                className="w-full text-xs font-medium text-gray-600 dark:text-gray-300 hover:text-gray-900 dark:hover:text-gray-100 py-2 rounded-md hover:bg-gray-100 dark:hover:bg-gray-800 disabled:opacity-50"
+              >
+                {isLoadingMore ? 'Loading…' : 'Load more'}
+              </button>
+            )}
           </div>
         </SortableContext>
       </div>
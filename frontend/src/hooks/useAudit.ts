@@ -19,7 +19,7 @@ export const auditKeys = {
   admin: () => [...auditKeys.all, 'admin'] as const,
   adminFeed: (filters: AdminAuditFeedFilters) =>
     [...auditKeys.admin(), 'feed', filters] as const,
-  adminSummary: (filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'entity_id'>) =>
+  adminSummary: (filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'cursor' | 'entity_id'>) =>
     [...auditKeys.admin(), 'summary', filters] as const,
   adminUser: (userId: number, filters: AdminAuditFeedFilters) =>
     [...auditKeys.admin(), 'user', userId, filters] as const,
@@ -60,7 +60,7 @@ export function useAdminAuditFeed(filters: AdminAuditFeedFilters) {
     queryFn: () => auditApi.getAdminAuditFeed(filters),
     ...CACHE_TIMES.REALTIME,
     // 2 minutes, not 30s. Audit feed is one of the heavier admin queries
-    // (audit_logs joined to users, JSON `changes` cast for search). 30s
+    // (audit_logs joined to users plus a capped count). 30s
     // polling from a single open admin tab was ~2,880 queries/day per
     // admin — Neon compute was the bottleneck, not freshness. The page
     // has an explicit Refresh button for "I need it now" cases.
@@ -70,7 +70,7 @@ export function useAdminAuditFeed(filters: AdminAuditFeedFilters) {
 }
 
 export function useAdminAuditSummary(
-  filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'entity_id'>
+  filters: Omit<AdminAuditFeedFilters, 'page' | 'page_size' | 'cursor' | 'entity_id'>
 ) {
   const isAdmin = useIsAdmin();
   return useAuthQuery({
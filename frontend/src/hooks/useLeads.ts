@@ -165,6 +165,47 @@ export function useLeadKanban(ownerId?: number) {
   });
 }
 
+/**
+ * Append the next page of one Kanban column to the cached board.
+ */
+export function useLoadMoreLeadKanban() {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: ({
+      stageId,
+      cursor,
+      ownerId,
+    }: {
+      stageId: number;
+      cursor: string;
+      ownerId?: number;
+    }) => leadsApi.getLeadKanbanColumn(stageId, cursor, ownerId),
+    onSuccess: (page, { ownerId }) => {
+      queryClient.setQueryData<LeadKanbanResponse>(
+        leadPipelineKeys.kanban(ownerId),
+        (board) =>
+          board && {
+            ...board,
+            stages: board.stages.map((stage) => {
+              if (stage.stage_id !== page.stage_id) return stage;
+              // Skip cards already shown (e.g. just dragged in).
+              const shown = new Set(stage.leads.map((l) => l.id));
+              return {
+                ...stage,
+                leads: [...stage.leads, ...page.leads.filter((l) => !shown.has(l.id))],
+                next_cursor: page.next_cursor,
+              };
+            }),
+          },
+      );
+    },
+    onError: () => {
+      showError('Failed to load more leads');
+    },
+  });
+}
+
 export function useMoveLeadStage() {
   const queryClient = useQueryClient();
 
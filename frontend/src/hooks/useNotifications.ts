@@ -1,7 +1,11 @@
 /**
- * React Query hooks for notifications with 30-second polling.
+ * React Query hooks for notifications.
+ *
+ * The unread count is pushed by the server (useNotificationStream) rather
+ * than polled, so an idle tab makes no requests.
  */
 
+import { useEffect } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { notificationsApi } from '../api/notifications';
 import { CACHE_TIMES } from '../config/queryConfig';
@@ -12,6 +16,9 @@ export const notificationKeys = {
   unreadCount: ['notifications', 'unread-count'] as const,
 };
 
+const STREAM_RETRY_MIN_MS = 5 * 1000;
+const STREAM_RETRY_MAX_MS = 60 * 1000;
+
 export function useNotifications(params?: {
   page?: number;
   page_size?: number;
@@ -29,11 +36,52 @@ export function useUnreadCount() {
     queryKey: notificationKeys.unreadCount,
     queryFn: () => notificationsApi.getUnreadCount(),
     ...CACHE_TIMES.REALTIME,
-    refetchInterval: 30 * 1000,
-    refetchIntervalInBackground: false,
   });
 }
 
+/**
+ * Keep the unread count current from the server's notification stream.
+ *
+ * Writes each pushed count into the unreadCount query and refetches the
+ * list when the count goes up. Reconnects with backoff when the stream
+ * drops. Mount once (the bell does).
+ */
+export function useNotificationStream() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const controller = new AbortController();
+    let retryMs = STREAM_RETRY_MIN_MS;
+    let timer: ReturnType<typeof setTimeout> | undefined;
+
+    const onCount = (count: number) => {
+      retryMs = STREAM_RETRY_MIN_MS;
+      const previous = queryClient.getQueryData<{ count: number }>(notificationKeys.unreadCount);
+      queryClient.setQueryData(notificationKeys.unreadCount, { count });
+      if (previous === undefined || count > previous.count) {
+        queryClient.invalidateQueries({ queryKey: [...notificationKeys.all, 'list'] });
+      }
+    };
+
+    const connect = () => {
+      notificationsApi
+        .streamUnreadCount(onCount, controller.signal)
+        .catch(() => undefined)
+        .finally(() => {
+          if (controller.signal.aborted) return;
+          timer = setTimeout(connect, retryMs);
+          retryMs = Math.min(retryMs * 2, STREAM_RETRY_MAX_MS);
+        });
+    };
+    connect();
+
+    return () => {
+      controller.abort();
+      if (timer) clearTimeout(timer);
+    };
+  }, [queryClient]);
+}
+
 export function useMarkNotificationRead() {
   const queryClient = useQueryClient();
   return useMutation({
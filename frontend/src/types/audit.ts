@@ -74,6 +74,8 @@ export interface CommentFilters {
 export interface AdminAuditFeedFilters {
   page?: number;
   page_size?: number;
+  /** `next_cursor` from the previous page; takes precedence over `page`. */
+  cursor?: string;
   start_date?: string;
   end_date?: string;
   user_id?: number;
@@ -87,10 +89,15 @@ export type AdminAuditFeedItem = AuditLogEntry;
 
 export interface AdminAuditFeedResponse {
   items: AdminAuditFeedItem[];
-  total: number;
+  /** Only on cursor-less requests. `total_estimated` marks a planner
+   *  estimate, `total_capped` a lower bound. */
+  total: number | null;
+  total_capped: boolean;
+  total_estimated: boolean;
   page: number;
   page_size: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null;
 }
 
 export interface AdminAuditTotals {
@@ -162,13 +162,21 @@ export interface KanbanLeadStage {
   is_won: boolean;
   is_lost: boolean;
   leads: KanbanLead[];
+  // Total visible leads in the stage; `leads` holds the pages loaded so far.
   count: number;
+  next_cursor?: string | null;
 }
 
 export interface LeadKanbanResponse {
   stages: KanbanLeadStage[];
 }
 
+export interface KanbanLeadColumnPage {
+  stage_id: number;
+  leads: KanbanLead[];
+  next_cursor?: string | null;
+}
+
 export interface MoveLeadRequest {
   new_stage_id: number;
 }
@@ -264,12 +264,17 @@ def clear_user_cache():
     from src.core.cache import invalidate_all_caches
     invalidate_all_caches()
 
+    # Clear in-memory unread notification counts (user ids repeat across tests)
+    from src.notifications.realtime import get_notification_hub
+    get_notification_hub().clear()
+
     yield
 
     _user_cache.clear()
     _dashboard_cache.clear()
     _scope_cache.clear()
     invalidate_all_caches()
+    get_notification_hub().clear()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -15,9 +15,17 @@ from src.contacts.models import Contact
 from src.email.models import EmailQueue, InboundEmail
 from src.integrations.gmail.models import GmailConnection
 from src.integrations.gmail.sync import _store_inbound
+from src.notifications.delivery import NotificationDeliveryService
 from src.notifications.models import Notification
 
 
+async def _sent_emails(db: AsyncSession, user_id: int) -> list[EmailQueue]:
+    """Drain the deferred notification emails, then the user's EmailQueue rows."""
+    await NotificationDeliveryService(db).deliver_due_emails()
+    result = await db.execute(select(EmailQueue).where(EmailQueue.sent_by_id == user_id))
+    return list(result.scalars().all())
+
+
 def _make_msg(
     *,
     from_: str,
@@ -109,9 +117,7 @@ class TestInboundReplyNotify:
         assert notif_rows[0].type == "email_reply"
         assert notif_rows[0].user_id == test_user.id
 
-        email_rows = (await db_session.execute(
-            select(EmailQueue).where(EmailQueue.sent_by_id == test_user.id)
-        )).scalars().all()
+        email_rows = await _sent_emails(db_session, test_user.id)
         assert len(email_rows) == 1
         assert email_rows[0].subject.startswith("Reply received —")
 
@@ -203,9 +209,7 @@ class TestInboundReplyNotify:
         )
         await db_session.flush()
 
-        email_rows = (await db_session.execute(
-            select(EmailQueue).where(EmailQueue.sent_by_id == test_user.id)
-        )).scalars().all()
+        email_rows = await _sent_emails(db_session, test_user.id)
         assert len(email_rows) == 1
         assert "Jane Big Client" in email_rows[0].body
 
@@ -238,7 +242,5 @@ class TestInboundReplyNotify:
         assert len(notif_rows) == 1
         assert notif_rows[0].type == "email_reply"
 
-        email_rows = (await db_session.execute(
-            select(EmailQueue).where(EmailQueue.sent_by_id == test_user.id)
-        )).scalars().all()
+        email_rows = await _sent_emails(db_session, test_user.id)
         assert len(email_rows) == 0
@@ -15,6 +15,7 @@ from src.auth.models import User
 from src.auth.security import get_password_hash
 from src.contacts.models import Contact
 from src.email.models import EmailQueue
+from src.notifications.delivery import NotificationDeliveryService
 from src.notifications.models import Notification
 
 
@@ -106,6 +107,7 @@ class TestNotesMentionNotifications:
         )
 
         assert response.status_code == 201
+        await NotificationDeliveryService(db_session).deliver_due_emails()
 
         # Verify email was queued
         result = await db_session.execute(
@@ -1,6 +1,8 @@
 """Integration tests for the email-gating side of the 6 notification dispatchers.
 
-Each test class exercises one dispatcher. We verify:
+Each test class exercises one dispatcher. Dispatchers only queue
+``notification_emails`` rows; ``_email_rows`` runs the background sender
+before reading ``email_queue``. We verify:
   - default prefs → EmailQueue row is created with the expected subject/recipient
   - per-event email disabled → no EmailQueue row
   - master email switch off → no EmailQueue row (first dispatcher only)
@@ -15,6 +17,7 @@ from src.account.schemas import NotificationPrefsUpdate
 from src.account.service import AccountPrefsService
 from src.auth.models import User
 from src.email.models import EmailQueue
+from src.notifications.delivery import NotificationDeliveryService
 from src.notifications.models import Notification
 from src.notifications.service import (
     notify_on_activity_due,
@@ -26,6 +29,7 @@ from src.notifications.service import (
 
 
 async def _email_rows(db: AsyncSession, user_id: int) -> list[EmailQueue]:
+    await NotificationDeliveryService(db).deliver_due_emails()
     result = await db.execute(
         select(EmailQueue).where(EmailQueue.sent_by_id == user_id)
     )
@@ -23,6 +23,7 @@ from src.account.models import UserNotificationPrefs
 from src.auth.models import User
 from src.contacts.models import Contact
 from src.email.models import EmailQueue
+from src.notifications.delivery import NotificationDeliveryService
 from src.notifications.models import Notification
 from src.proposals.models import Proposal
 from src.proposals.service import ProposalService
@@ -82,6 +83,17 @@ async def _accept(
         return accepted
 
 
+async def _proposal_emails(db: AsyncSession, proposal_id: int) -> list[EmailQueue]:
+    """Drain the deferred notification emails, then the proposal's EmailQueue rows."""
+    await NotificationDeliveryService(db).deliver_due_emails()
+    result = await db.execute(
+        select(EmailQueue)
+        .where(EmailQueue.entity_type == "proposals")
+        .where(EmailQueue.entity_id == proposal_id)
+    )
+    return list(result.scalars().all())
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -104,13 +116,7 @@ class TestProposalSignedEmails:
 
         await _accept(db_session, proposal)
 
-        rows = (
-            await db_session.execute(
-                select(EmailQueue)
-                .where(EmailQueue.entity_type == "proposals")
-                .where(EmailQueue.entity_id == proposal.id)
-            )
-        ).scalars().all()
+        rows = await _proposal_emails(db_session, proposal.id)
 
         subjects = {r.subject for r in rows}
 
@@ -144,13 +150,7 @@ class TestProposalSignedEmails:
 
         await _accept(db_session, proposal)
 
-        rows = (
-            await db_session.execute(
-                select(EmailQueue)
-                .where(EmailQueue.entity_type == "proposals")
-                .where(EmailQueue.entity_id == proposal.id)
-            )
-        ).scalars().all()
+        rows = await _proposal_emails(db_session, proposal.id)
 
         subjects = {r.subject for r in rows}
 
@@ -3,8 +3,8 @@
 Verifies that:
 - get_list returns records where the user is an assignee (via assignee_entity_ids).
 - get_list does NOT return records the user neither owns nor is assigned.
-- get_assignee_entity_ids returns only entity IDs with permission_level='assignee'.
-- View-only shares are excluded from get_assignee_entity_ids.
+- assignee_scope covers only shares with permission_level='assignee'.
+- View-only shares are excluded from assignee_scope.
 
 These tests use a real in-memory SQLite database; no mocks.
 """
@@ -247,11 +247,11 @@ class TestOpportunityMultiAssignee:
         opportunity_owned_by_a: Opportunity,
         assignee_share_b_on_opportunity: EntityShare,
     ):
-        """get_list returns the opportunity when assignee_entity_ids contains its ID."""
+        """get_list returns the opportunity when assignee_entity_ids covers it."""
         service = OpportunityService(db_session)
         items, total = await service.get_list(
             owner_id=user_b.id,
-            assignee_entity_ids=[opportunity_owned_by_a.id],
+            assignee_entity_ids=service.assignee_scope(user_b.id),
         )
         ids = [o.id for o in items]
         assert opportunity_owned_by_a.id in ids
@@ -277,30 +277,30 @@ class TestOpportunityMultiAssignee:
         assert total == 0
 
     @pytest.mark.asyncio
-    async def test_get_assignee_entity_ids_returns_assignee_opportunity(
+    async def test_assignee_scope_returns_assignee_opportunity(
         self,
         db_session: AsyncSession,
         user_b: User,
         opportunity_owned_by_a: Opportunity,
         assignee_share_b_on_opportunity: EntityShare,
     ):
-        """get_assignee_entity_ids returns the opportunity ID for user B."""
+        """assignee_scope includes the opportunity ID for user B."""
         service = OpportunityService(db_session)
-        result = await service.get_assignee_entity_ids(user_id=user_b.id)
-        assert opportunity_owned_by_a.id in result
+        scope = service.assignee_scope(user_id=user_b.id)
+        assert await scope.includes(db_session, opportunity_owned_by_a.id)
 
     @pytest.mark.asyncio
-    async def test_get_assignee_entity_ids_excludes_view_only_shares(
+    async def test_assignee_scope_excludes_view_only_shares(
         self,
         db_session: AsyncSession,
         user_c: User,
         opportunity_owned_by_a: Opportunity,
         view_share_c_on_opportunity: EntityShare,
     ):
-        """View-only share for user C does NOT appear in get_assignee_entity_ids."""
+        """View-only share for user C is NOT in assignee_scope."""
         service = OpportunityService(db_session)
-        result = await service.get_assignee_entity_ids(user_id=user_c.id)
-        assert opportunity_owned_by_a.id not in result
+        scope = service.assignee_scope(user_id=user_c.id)
+        assert not await scope.includes(db_session, opportunity_owned_by_a.id)
 
     @pytest.mark.asyncio
     async def test_get_list_via_shared_entity_ids_also_works(
@@ -310,27 +310,27 @@ class TestOpportunityMultiAssignee:
         opportunity_owned_by_a: Opportunity,
         assignee_share_b_on_opportunity: EntityShare,
     ):
-        """Backward-compat: assignee IDs passed as shared_entity_ids still surface the record."""
+        """The assignee scope passed as shared_entity_ids also surfaces the record."""
         service = OpportunityService(db_session)
         items, total = await service.get_list(
             owner_id=user_b.id,
-            shared_entity_ids=[opportunity_owned_by_a.id],
+            shared_entity_ids=service.assignee_scope(user_b.id),
             assignee_entity_ids=None,
         )
         ids = [o.id for o in items]
         assert opportunity_owned_by_a.id in ids
 
     @pytest.mark.asyncio
-    async def test_get_assignee_entity_ids_empty_for_no_shares(
+    async def test_assignee_scope_empty_for_no_shares(
         self,
         db_session: AsyncSession,
         user_b: User,
         opportunity_owned_by_a: Opportunity,
     ):
-        """When no shares exist, get_assignee_entity_ids returns an empty list."""
+        """When no shares exist, the assignee scope includes nothing."""
         service = OpportunityService(db_session)
-        result = await service.get_assignee_entity_ids(user_id=user_b.id)
-        assert result == []
+        scope = service.assignee_scope(user_id=user_b.id)
+        assert not await scope.includes(db_session, opportunity_owned_by_a.id)
 
 
 # ===========================================================================
@@ -348,11 +348,11 @@ class TestLeadMultiAssignee:
         lead_owned_by_a: Lead,
         assignee_share_b_on_lead: EntityShare,
     ):
-        """get_list returns the lead when assignee_entity_ids contains its ID."""
+        """get_list returns the lead when assignee_entity_ids covers it."""
         service = LeadService(db_session)
         items, total = await service.get_list(
             owner_id=user_b.id,
-            assignee_entity_ids=[lead_owned_by_a.id],
+            assignee_entity_ids=service.assignee_scope(user_b.id),
         )
         ids = [l.id for l in items]
         assert lead_owned_by_a.id in ids
@@ -378,30 +378,30 @@ class TestLeadMultiAssignee:
         assert total == 0
 
     @pytest.mark.asyncio
-    async def test_get_assignee_entity_ids_returns_assignee_lead(
+    async def test_assignee_scope_returns_assignee_lead(
         self,
         db_session: AsyncSession,
         user_b: User,
         lead_owned_by_a: Lead,
         assignee_share_b_on_lead: EntityShare,
     ):
-        """get_assignee_entity_ids returns the lead ID for user B."""
+        """assignee_scope includes the lead ID for user B."""
         service = LeadService(db_session)
-        result = await service.get_assignee_entity_ids(user_id=user_b.id)
-        assert lead_owned_by_a.id in result
+        scope = service.assignee_scope(user_id=user_b.id)
+        assert await scope.includes(db_session, lead_owned_by_a.id)
 
     @pytest.mark.asyncio
-    async def test_get_assignee_entity_ids_excludes_view_only_shares(
+    async def test_assignee_scope_excludes_view_only_shares(
         self,
         db_session: AsyncSession,
         user_c: User,
         lead_owned_by_a: Lead,
         view_share_c_on_lead: EntityShare,
     ):
-        """View-only share for user C does NOT appear in get_assignee_entity_ids."""
+        """View-only share for user C is NOT in assignee_scope."""
         service = LeadService(db_session)
-        result = await service.get_assignee_entity_ids(user_id=user_c.id)
-        assert lead_owned_by_a.id not in result
+        scope = service.assignee_scope(user_id=user_c.id)
+        assert not await scope.includes(db_session, lead_owned_by_a.id)
 
     @pytest.mark.asyncio
     async def test_get_list_via_shared_entity_ids_also_works(
@@ -411,24 +411,24 @@ class TestLeadMultiAssignee:
         lead_owned_by_a: Lead,
         assignee_share_b_on_lead: EntityShare,
     ):
-        """Backward-compat: assignee IDs passed as shared_entity_ids still surface the lead."""
+        """The assignee scope passed as shared_entity_ids also surfaces the lead."""
         service = LeadService(db_session)
         items, total = await service.get_list(
             owner_id=user_b.id,
-            shared_entity_ids=[lead_owned_by_a.id],
+            shared_entity_ids=service.assignee_scope(user_b.id),
             assignee_entity_ids=None,
         )
         ids = [l.id for l in items]
         assert lead_owned_by_a.id in ids
 
     @pytest.mark.asyncio
-    async def test_get_assignee_entity_ids_empty_for_no_shares(
+    async def test_assignee_scope_empty_for_no_shares(
         self,
         db_session: AsyncSession,
         user_b: User,
         lead_owned_by_a: Lead,
     ):
-        """When no shares exist, get_assignee_entity_ids returns an empty list."""
+        """When no shares exist, the assignee scope includes nothing."""
         service = LeadService(db_session)
-        result = await service.get_assignee_entity_ids(user_id=user_b.id)
-        assert result == []
+        scope = service.assignee_scope(user_id=user_b.id)
+        assert not await scope.includes(db_session, lead_owned_by_a.id)
@@ -620,7 +620,6 @@ class TestAdminBulkShare:
                 role_name="sales_rep",
                 owner_id=another_user.id,
                 is_scoped=True,
-                shared_entity_ids={"contacts": [skipped_contact.id]},
             ),
         )
 
@@ -147,8 +147,10 @@ class TestAdminUpdateUser:
         test_user: User,
     ):
         """Role changes must flush the 30s auth cache so new perms take effect immediately."""
+        import time
+
         from src.auth.dependencies import _user_cache
-        _user_cache[test_user.id] = test_user
+        _user_cache[test_user.id] = (test_user, time.monotonic())
 
         response = await client.patch(
             f"/api/admin/users/{test_user.id}",
@@ -1,15 +1,17 @@
 """Tests for admin audit dashboard and work session tracking."""
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.activities.models import Activity
-from src.audit.models import AuditLog, WorkSession
-from src.audit.service import WorkSessionService
+from src.audit.models import AuditDailyRollup, AuditLog, WorkSession
+from src.audit.rollups import AuditRollupService
+from src.audit.service import AuditService, WorkSessionService
 from src.auth.models import User
+from src.config import settings
 from src.contacts.models import Contact
 
 
@@ -88,6 +90,132 @@ class TestAdminAuditFeed:
         assert data["items"][0]["user_email"] == test_user.email
         assert data["items"][0]["action"] == "update"
 
+    @pytest.mark.asyncio
+    async def test_feed_pages_with_keyset_cursor(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_auth_headers: dict,
+        test_user: User,
+    ):
+        """next_cursor walks every row once, newest first; totals only on the first page."""
+        now = datetime(2026, 5, 18, 14, 0, tzinfo=UTC)
+        db_session.add_all([
+            AuditLog(
+                entity_type="contact",
+                entity_id=300 + i,
+                user_id=test_user.id,
+                action="update",
+                # Pairs share a timestamp so the id tiebreaker is exercised.
+                timestamp=now + timedelta(seconds=i // 2),
+            )
+            for i in range(7)
+        ])
+        await db_session.commit()
+
+        params = {"start_date": "2026-05-18", "end_date": "2026-05-18", "page_size": 3}
+        first = (await client.get(
+            "/api/admin/audit/feed", headers=admin_auth_headers, params=params
+        )).json()
+        assert first["total"] == 7
+        assert first["pages"] == 3
+        assert first["total_capped"] is False
+        assert first["total_estimated"] is False
+
+        seen = [item["entity_id"] for item in first["items"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = (await client.get(
+                "/api/admin/audit/feed",
+                headers=admin_auth_headers,
+                params={**params, "cursor": cursor},
+            )).json()
+            assert page["total"] is None
+            seen.extend(item["entity_id"] for item in page["items"])
+            cursor = page["next_cursor"]
+        assert seen == [306, 305, 304, 303, 302, 301, 300]
+
+    @pytest.mark.asyncio
+    async def test_feed_rejects_bad_cursor(
+        self,
+        client: AsyncClient,
+        admin_auth_headers: dict,
+    ):
+        response = await client.get(
+            "/api/admin/audit/feed",
+            headers=admin_auth_headers,
+            params={"cursor": "not-a-cursor"},
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_feed_search_uses_index_and_actor(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_admin_user: User,
+    ):
+        """Search matches indexed change values, entity ids and actor names."""
+        now = datetime(2026, 5, 18, 14, 0, tzinfo=UTC)
+        changed = AuditLog(
+            entity_type="contact",
+            entity_id=4242,
+            user_id=test_admin_user.id,
+            action="update",
+            changes=[{"field": "company", "old_value": "Acme", "new_value": "Globex Corp"}],
+            ip_address="10.1.2.3",
+            timestamp=now,
+        )
+        other = AuditLog(
+            entity_type="lead",
+            entity_id=7,
+            user_id=test_user.id,
+            action="create",
+            timestamp=now + timedelta(minutes=1),
+        )
+        db_session.add_all([changed, other])
+        await db_session.commit()
+        service = AuditService(db_session)
+
+        async def _ids(search: str) -> set[int]:
+            feed = await service.get_admin_feed(search=search, start_date=now.date())
+            return {item["id"] for item in feed["items"]}
+
+        assert await _ids("glob") == {changed.id}
+        assert await _ids("company acme") == {changed.id}
+        assert await _ids("4242") == {changed.id}
+        assert await _ids(test_user.full_name) == {other.id}
+        assert await _ids("globex nomatch") == set()
+
+        # Edits re-index the row.
+        changed.changes = [{"field": "company", "new_value": "Initech"}]
+        await db_session.commit()
+        assert await _ids("initech") == {changed.id}
+        assert await _ids("globex") == set()
+
+    @pytest.mark.asyncio
+    async def test_feed_total_is_capped(
+        self,
+        db_session: AsyncSession,
+        monkeypatch,
+    ):
+        """Past the count cap SQLite (no planner estimate) reports a lower bound."""
+        monkeypatch.setattr("src.audit.service.FEED_COUNT_CAP", 5)
+        now = datetime(2026, 5, 18, 14, 0, tzinfo=UTC)
+        db_session.add_all([
+            AuditLog(entity_type="contact", entity_id=i, action="update", timestamp=now)
+            for i in range(8)
+        ])
+        await db_session.commit()
+
+        feed = await AuditService(db_session).get_admin_feed(
+            start_date=now.date(), page_size=3
+        )
+        assert feed["total"] == 5
+        assert feed["total_capped"] is True
+        assert feed["total_estimated"] is False
+        assert len(feed["items"]) == 3
+
 
 class TestAdminAuditExport:
     @pytest.mark.asyncio
@@ -226,6 +354,106 @@ class TestAdminAuditSummary:
         assert contact_row["activity_count"] == 1
 
 
+    @pytest.mark.asyncio
+    async def test_summary_merges_type_variants_and_limits_entities(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        """Singular/plural entity types share one row; the top-N cut happens in SQL."""
+        now = datetime(2026, 5, 18, 15, 0, tzinfo=UTC)
+        db_session.add_all([
+            AuditLog(entity_type="proposal", entity_id=7, user_id=test_user.id,
+                     action="update", timestamp=now),
+            AuditLog(entity_type="proposals", entity_id=7, user_id=test_user.id,
+                     action="update", timestamp=now + timedelta(minutes=5)),
+            *(
+                AuditLog(entity_type="contacts", entity_id=100 + i, user_id=test_user.id,
+                         action="update", timestamp=now - timedelta(minutes=i + 1))
+                for i in range(30)
+            ),
+            AuditLog(entity_type="contacts", entity_id=500, user_id=test_user.id,
+                     action="delete", timestamp=now - timedelta(seconds=30)),
+        ])
+        await db_session.commit()
+
+        summary = await AuditService(db_session).get_admin_summary(
+            start_date=date(2026, 5, 18), end_date=date(2026, 5, 18), entity_limit=3,
+        )
+
+        assert summary["totals"]["audit_events"] == 33
+        assert [(row["entity_type"], row["entity_id"]) for row in summary["entities"]] == [
+            ("proposals", 7), ("contacts", 500), ("contacts", 100),
+        ]
+        proposal = summary["entities"][0]
+        assert proposal["audit_count"] == 2
+        assert proposal["last_touched_by_id"] == test_user.id
+        user_row = next(row for row in summary["users"] if row["user_id"] == test_user.id)
+        assert user_row["audit_events"] == 33
+        assert user_row["proposals_touched"] == 1
+        categories = sorted(event["category"] for event in summary["security"])
+        assert categories == ["delete", "high_volume_edits"]
+        assert summary["totals"]["security_events"] == 2
+
+    @pytest.mark.asyncio
+    async def test_summary_reads_closed_days_from_rollups(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_contact: Contact,
+        monkeypatch,
+    ):
+        """Rolled-up days come from audit_daily_rollups; later days stay live."""
+        day = date(2026, 5, 18)
+        noon = datetime(2026, 5, 18, 12, 0, tzinfo=UTC)
+        db_session.add_all([
+            WorkSession(user_id=test_user.id, entity_type="contact", entity_id=test_contact.id,
+                        started_at=noon, last_seen_at=noon + timedelta(minutes=3),
+                        duration_seconds=180),
+            Activity(activity_type="email", subject="Follow up", entity_type="contacts",
+                     entity_id=test_contact.id, owner_id=test_user.id,
+                     created_by_id=test_user.id, created_at=noon, updated_at=noon),
+            AuditLog(entity_type="contacts", entity_id=test_contact.id, user_id=test_user.id,
+                     action="update", timestamp=noon),
+        ])
+        await db_session.commit()
+
+        service = AuditService(db_session)
+        live = await service.get_admin_summary(start_date=day, end_date=day)
+
+        rolled = await AuditRollupService(db_session).roll_up_pending(today=day + timedelta(days=1))
+        await db_session.commit()
+        assert rolled >= 1
+        rollup_rows = (await db_session.execute(
+            select(AuditDailyRollup).where(AuditDailyRollup.day == day)
+        )).scalars().all()
+        assert len(rollup_rows) == 1
+        assert rollup_rows[0].entity_type == "contacts"
+
+        # Rows added to a rolled-up day are not seen until it is rebuilt,
+        # which proves the summary reads the rollup; the next day is live.
+        db_session.add_all([
+            AuditLog(entity_type="contacts", entity_id=test_contact.id, user_id=test_user.id,
+                     action="update", timestamp=noon + timedelta(hours=1)),
+            AuditLog(entity_type="contacts", entity_id=test_contact.id, user_id=test_user.id,
+                     action="update", timestamp=noon + timedelta(days=1)),
+        ])
+        await db_session.commit()
+        monkeypatch.setattr(settings, "AUDIT_ROLLUPS_ENABLED", True)
+
+        from_rollups = await service.get_admin_summary(start_date=day, end_date=day)
+        assert from_rollups["users"] == live["users"]
+        assert from_rollups["entities"] == live["entities"]
+        assert from_rollups["totals"]["activities"] == 1
+        assert from_rollups["totals"]["emails"] == 1
+
+        spanning = await service.get_admin_summary(
+            start_date=day, end_date=day + timedelta(days=1)
+        )
+        assert spanning["totals"]["audit_events"] == 2
+        assert spanning["totals"]["active_crm_seconds"] == 180
+
+
 class TestWorkSessions:
     @pytest.mark.asyncio
     async def test_heartbeat_merges_until_idle_timeout(
@@ -0,0 +1,177 @@
+"""Tests for the streamed download primitives in ``src.attachments.streaming``.
+
+Verifies:
+
+- ``Range`` parsing: single ranges only; anything else sends the whole file.
+- disk files open at the requested offset, with 304 / 416 outcomes raised
+  before any bytes are read.
+- the body is read at most ``STREAM_READ_AHEAD`` chunks ahead of the
+  consumer, and the file is closed when the consumer stops early.
+- a response that is never sent can still be discarded, closing its file.
+- a client that disconnects before the first chunk still closes the file,
+  and the file is never closed under a read still running in its thread.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from src.attachments import streaming
+from src.attachments.streaming import (
+    ByteRange,
+    FileStream,
+    NotModified,
+    RangeNotSatisfiable,
+    discard_response,
+    etag_matches,
+    open_file_stream,
+    parse_range,
+    stream_file_response,
+)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-99", ByteRange(0, 99)),
+        ("bytes=100-", ByteRange(100, None)),
+        ("bytes=-500", ByteRange(None, 500)),
+        (None, None),
+        ("bytes=0-1,5-9", None),
+        ("bytes=9-1", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header) == expected
+
+
+def test_byte_range_resolves_within_size():
+    assert ByteRange(None, 500).resolve(100) == (0, 99)
+    assert ByteRange(90, 200).resolve(100) == (90, 99)
+    with pytest.raises(RangeNotSatisfiable):
+        ByteRange(100, None).resolve(100)
+
+
+def test_etag_matches():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"a"')
+
+
+def test_open_file_stream_ranges_and_conditionals(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"0123456789")
+
+    stream = open_file_stream(path, range_header="bytes=2-5")
+    try:
+        assert (stream.start, stream.length, stream.size) == (2, 4, 10)
+        assert stream.read(4) == b"2345"
+    finally:
+        stream.close()
+
+    with pytest.raises(NotModified):
+        open_file_stream(path, if_none_match=stream.etag)
+    with pytest.raises(RangeNotSatisfiable):
+        open_file_stream(path, range_header="bytes=10-")
+
+
+async def test_chunks_read_ahead_is_bounded_and_closes_early(monkeypatch):
+    monkeypatch.setattr(streaming, "STREAM_CHUNK_SIZE", 1)
+    reads = 0
+    closed = False
+
+    def read(n: int) -> bytes:
+        nonlocal reads
+        reads += 1
+        return b"x" * n
+
+    def close() -> None:
+        nonlocal closed
+        closed = True
+
+    stream = FileStream(read=read, close=close, size=100, length=100, start=None, etag=None)
+    chunks = stream.chunks()
+    assert await anext(chunks) == b"x"
+    await asyncio.sleep(0.05)
+    # One chunk handed out, STREAM_READ_AHEAD queued, one read blocked on put.
+    assert reads <= streaming.STREAM_READ_AHEAD + 2
+    await chunks.aclose()
+    assert closed
+
+
+async def test_discard_closes_a_response_that_is_never_sent(tmp_path):
+    closed = False
+
+    def close() -> None:
+        nonlocal closed
+        closed = True
+
+    async def opening() -> FileStream:
+        return FileStream(read=bytes, close=close, size=10, length=10, start=None, etag=None)
+
+    response = await stream_file_response(opening(), media_type="application/pdf")
+    assert not closed
+    await discard_response(response)
+    assert closed
+
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"0123456789")
+    not_modified = await stream_file_response(
+        asyncio.to_thread(open_file_stream, path, if_none_match="*"),
+        media_type="application/pdf",
+    )
+    assert not_modified.status_code == 304
+    await discard_response(not_modified)
+
+
+async def test_disconnect_before_the_first_chunk_closes_the_file():
+    closed = False
+
+    def close() -> None:
+        nonlocal closed
+        closed = True
+
+    async def opening() -> FileStream:
+        return FileStream(read=bytes, close=close, size=10, length=10, start=None, etag=None)
+
+    response = await stream_file_response(opening(), media_type="application/pdf")
+
+    async def receive() -> dict:
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        await asyncio.Event().wait()  # the client never takes the headers
+
+    await response({"type": "http"}, receive, send)
+    assert closed
+
+
+async def test_close_waits_for_a_read_still_in_its_thread():
+    reading = threading.Event()
+    release = threading.Event()
+    events: list[str] = []
+
+    def read(size: int) -> bytes:
+        reading.set()
+        release.wait(5)
+        events.append("read done")
+        return b"x" * size
+
+    def close() -> None:
+        events.append("closed")
+
+    stream = FileStream(read=read, close=close, size=10, length=10, start=None, etag=None)
+    chunks = stream.chunks()
+    consumer = asyncio.create_task(anext(chunks))
+    await asyncio.to_thread(reading.wait, 5)
+
+    consumer.cancel()
+    await asyncio.sleep(0.05)
+    assert events == []  # still waiting on the read, not closing under it
+
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    assert events == ["read done", "closed"]
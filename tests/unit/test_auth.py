@@ -6,6 +6,7 @@ Tests for auth endpoints — password login removed, Google OAuth is the sole fl
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth.models import User
 from src.auth.security import get_password_hash, verify_password
@@ -68,6 +69,91 @@ class TestAuthGetMe:
         assert response.status_code == 401
 
 
+class TestAuthFastPath:
+    """Tests for the cached token/user resolution in get_current_user."""
+
+    @pytest.mark.asyncio
+    async def test_warm_request_skips_verification_and_lookup(
+        self, client: AsyncClient, test_user: User, auth_headers: dict, monkeypatch
+    ):
+        """Repeat requests reuse the verified token and the user snapshot."""
+        from src.auth import dependencies
+        from src.auth.service import AuthService
+
+        calls = {"decode": 0, "lookup": 0}
+        real_decode = dependencies.decode_token
+        real_lookup = AuthService.get_user_by_id
+
+        def counting_decode(token):
+            calls["decode"] += 1
+            return real_decode(token)
+
+        async def counting_lookup(self, user_id):
+            calls["lookup"] += 1
+            return await real_lookup(self, user_id)
+
+        monkeypatch.setattr(dependencies, "decode_token", counting_decode)
+        monkeypatch.setattr(AuthService, "get_user_by_id", counting_lookup)
+        dependencies._token_cache.clear()
+
+        for _ in range(3):
+            response = await client.get("/api/auth/me", headers=auth_headers)
+            assert response.status_code == 200
+        assert calls == {"decode": 1, "lookup": 1}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_ttl_is_short_without_a_shared_backend(
+        self, client: AsyncClient, test_user: User, auth_headers: dict, monkeypatch
+    ):
+        """Only a shared backend carries invalidations, so only it gets the longer TTL."""
+        import time
+
+        from src.auth import dependencies
+        from src.auth.service import AuthService
+        from src.core.cache import app_cache
+
+        lookups = 0
+        real_lookup = AuthService.get_user_by_id
+
+        async def counting_lookup(self, user_id):
+            nonlocal lookups
+            lookups += 1
+            return await real_lookup(self, user_id)
+
+        monkeypatch.setattr(AuthService, "get_user_by_id", counting_lookup)
+
+        def age_snapshot(seconds: int) -> None:
+            user, _loaded_at = dependencies._user_cache[test_user.id]
+            dependencies._user_cache[test_user.id] = (user, time.monotonic() - seconds)
+
+        assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 200
+        age_snapshot(45)
+        assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 200
+        assert lookups == 2
+
+        monkeypatch.setattr(app_cache.backend, "shared", True)
+        age_snapshot(45)
+        assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 200
+        assert lookups == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reloads_user(
+        self, client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers: dict
+    ):
+        """A deactivated user is rejected as soon as their snapshot is invalidated."""
+        from src.auth.dependencies import invalidate_user_cache
+
+        assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 200
+
+        await db_session.execute(
+            update(User).where(User.id == test_user.id).values(is_active=False)
+        )
+        await db_session.commit()
+        invalidate_user_cache(test_user.id)
+
+        assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 403
+
+
 class TestAuthUpdateMe:
     """Tests for update current user endpoint."""
 
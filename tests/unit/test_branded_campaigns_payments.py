@@ -222,6 +222,79 @@ class TestCampaignBrandedEmails:
         assert sent[0].entity_type == "lead"
         assert sent[0].entity_id == test_lead.id
 
+    @pytest.mark.asyncio
+    async def test_send_campaign_emails_batches_and_marks_members(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_contact: Contact,
+        test_lead: Lead,
+        monkeypatch,
+    ):
+        """Resolvable members each get one queued email across batches; the rest are skipped."""
+        monkeypatch.setattr("src.email.service.CAMPAIGN_QUEUE_BATCH_SIZE", 2)
+        from src.campaigns.service import CampaignService
+
+        campaign = Campaign(
+            name="Batch Campaign",
+            campaign_type="email",
+            status="active",
+            owner_id=test_user.id,
+            created_by_id=test_user.id,
+        )
+        db_session.add(campaign)
+        await db_session.flush()
+        template = EmailTemplate(
+            name="Batch Template",
+            subject_template="Hi",
+            body_template="<p>Batch body</p>",
+            created_by_id=test_user.id,
+        )
+        no_email = Contact(first_name="No", last_name="Email", owner_id=test_user.id)
+        extra = Contact(
+            first_name="Extra", last_name="Person", email="extra@example.com",
+            owner_id=test_user.id,
+        )
+        db_session.add_all([template, no_email, extra])
+        await db_session.flush()
+        members = [
+            CampaignMember(campaign_id=campaign.id, member_type=member_type, member_id=member_id)
+            for member_type, member_id in (
+                ("contact", test_contact.id),
+                ("leads", test_lead.id),
+                ("contact", no_email.id),
+                ("contacts", extra.id),
+                ("company", test_contact.id),
+                ("lead", 999_999),
+            )
+        ]
+        db_session.add_all(members)
+        await db_session.commit()
+
+        sent = await EmailService(db_session).send_campaign_emails(
+            campaign_id=campaign.id,
+            template_id=template.id,
+            sent_by_id=test_user.id,
+        )
+
+        assert [(e.to_email, e.entity_type, e.entity_id) for e in sent] == [
+            (test_contact.email, "contact", test_contact.id),
+            (test_lead.email, "leads", test_lead.id),
+            ("extra@example.com", "contacts", extra.id),
+        ]
+        for email, member in zip(sent, (members[0], members[1], members[3]), strict=True):
+            assert f"member_id={member.id}&amp;email={email.to_email}" in email.body
+
+        await CampaignService(db_session)._update_member_statuses(campaign.id, sent)
+        await db_session.commit()
+        statuses = dict((await db_session.execute(
+            select(CampaignMember.id, CampaignMember.status)
+            .where(CampaignMember.campaign_id == campaign.id)
+        )).all())
+        assert [statuses[m.id] for m in members] == [
+            "sent", "sent", "pending", "sent", "pending", "pending",
+        ]
+
     @pytest.mark.asyncio
     async def test_send_campaign_emails_with_tenant_branding(
         self,
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth.models import User
 from src.email.branded_templates import (
     TenantBrandingHelper,
+    campaign_wrapper_renderer,
     render_branded_email,
     render_campaign_wrapper,
     render_contract_expiring_email,
@@ -382,6 +383,19 @@ class TestRenderCampaignWrapper:
         assert "Unsubscribe" in html
         assert "https://app.acme.com/unsubscribe/abc123" in html
 
+    def test_renderer_matches_full_render_per_recipient(self):
+        """The render-once filler yields the same HTML as a full render."""
+        body = "<p>Campaign content</p>"
+        fill = campaign_wrapper_renderer(SAMPLE_BRANDING, body)
+        for url in (
+            "/api/campaigns/7/unsubscribe?member_id=1&email=a@example.com",
+            "/api/campaigns/7/unsubscribe?member_id=2&email=b+x@example.com",
+            "javascript:alert(1)",
+        ):
+            assert fill(url) == render_campaign_wrapper(
+                branding=SAMPLE_BRANDING, campaign_body=body, unsubscribe_url=url
+            )
+
 
 # ===================================================================
 # PDF generation tests
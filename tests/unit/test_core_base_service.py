@@ -5,6 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.contacts.models import Contact
 from src.contacts.schemas import ContactCreate, ContactUpdate
 from src.core.base_service import CRUDService
+from src.core.models import EntityShare
+from src.core.share_permissions import SharedScope
 
 # ---------------------------------------------------------------------------
 # Concrete service for tests
@@ -129,14 +131,59 @@ class TestApplyOwnerFilter:
     async def test_shared_entity_ids_include_extra_rows(self, db_session: AsyncSession):
         owned = await _seed(db_session, 1, owner_id=10)
         shared = await _seed(db_session, 2, owner_id=99)
+        db_session.add_all([
+            EntityShare(entity_type="contacts", entity_id=c.id,
+                        shared_with_user_id=10, shared_by_user_id=99, permission_level="view")
+            for c in shared
+        ])
+        await db_session.flush()
         svc = ContactService(db_session)
-        shared_ids = [c.id for c in shared]
+        shared_ids = SharedScope(user_id=10, entity_type="contacts")
         q = svc.apply_owner_filter(select(Contact), owner_id=10, shared_entity_ids=shared_ids)
         result = await db_session.execute(q)
         ids = {r.id for r in result.scalars().all()}
         assert owned[0].id in ids
         assert all(s.id in ids for s in shared)
 
+    async def test_shared_ids_filter_with_semi_join(self, db_session: AsyncSession):
+        owned = await _seed(db_session, 1, owner_id=10)
+        shared, _unshared, other = await _seed(db_session, 3, owner_id=99)
+        db_session.add_all([
+            EntityShare(entity_type="contacts", entity_id=shared.id,
+                        shared_with_user_id=10, shared_by_user_id=99, permission_level="view"),
+            # Historical singular entity_type rows still count.
+            EntityShare(entity_type="contact", entity_id=other.id,
+                        shared_with_user_id=10, shared_by_user_id=99, permission_level="edit"),
+        ])
+        await db_session.flush()
+        svc = ContactService(db_session)
+
+        shared_ids = SharedScope(user_id=10, entity_type="contacts")
+        q = svc.apply_owner_filter(select(Contact), owner_id=10, shared_entity_ids=shared_ids)
+        result = await db_session.execute(q)
+        assert {r.id for r in result.scalars().all()} == {owned[0].id, shared.id, other.id}
+
+    async def test_shared_scope_includes_reads_shares_live(self, db_session: AsyncSession):
+        (shared,) = await _seed(db_session, 1, owner_id=99)
+        scope = SharedScope(user_id=10, entity_type="contacts")
+        assert not await scope.includes(db_session, shared.id)
+        db_session.add(EntityShare(entity_type="contacts", entity_id=shared.id,
+                                   shared_with_user_id=10, shared_by_user_id=99, permission_level="view"))
+        await db_session.flush()
+        assert await scope.includes(db_session, shared.id)
+        assert await scope.includes(db_session, shared.id + 1000, shared.id)
+        assert not await scope.includes(db_session)
+
+    def test_semi_join_sql_is_the_same_for_every_user(self):
+        svc = ContactService(None)
+
+        def sql(user_id: int) -> str:
+            scope = SharedScope(user_id=user_id, entity_type="contacts")
+            return str(svc.apply_owner_filter(select(Contact), owner_id=user_id, shared_entity_ids=scope))
+
+        assert "IN (SELECT entity_shares.entity_id" in sql(10)
+        assert sql(10) == sql(50_000)
+
 
 # ---------------------------------------------------------------------------
 # TestBaseServiceGetMulti
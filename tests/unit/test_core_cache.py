@@ -1,9 +1,32 @@
-"""Unit tests for core/cache.py — TTLCache, cached decorator, and invalidation helpers."""
+"""Unit tests for core/cache.py — TTLCache, cached decorator, invalidation helpers and backends."""
 
+import asyncio
 import time
 
 import pytest
-from src.core.cache import TTLCache, app_cache, cached, invalidate_on_change
+from src.core import cache_backends
+from src.core.cache import (
+    SingleFlight,
+    TTLCache,
+    app_cache,
+    build_cache_backend,
+    cache_get,
+    cache_set,
+    cached,
+    cached_fetch,
+    configure_cache_backend,
+    flush_cache_invalidations,
+    get_cache,
+    invalidate_all_caches,
+    invalidate_cache,
+    invalidate_on_change,
+)
+from src.core.cache_backends import (
+    RESUBSCRIBED_MESSAGE,
+    InMemoryBackend,
+    LocalRedisStandIn,
+    RedisBackend,
+)
 
 # ---------------------------------------------------------------------------
 # TestTTLCache — basic get/set/delete behaviour
@@ -180,3 +203,305 @@ class TestInvalidateOnChange:
         await app_cache.set("pipeline_stages", {"stages": []})
         await invalidate_on_change("pipeline_stages")
         assert await app_cache.get("dashboard_overview") is None
+
+
+# ---------------------------------------------------------------------------
+# TestInMemoryBackend — bounded LRU, expiry wheel, prefix index
+# ---------------------------------------------------------------------------
+
+class TestInMemoryBackend:
+    async def test_entry_bound_evicts_least_recently_used(self):
+        cache = TTLCache(default_ttl=60, backend=InMemoryBackend(max_entries=3, shards=1))
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+        await cache.get("a")  # "a" is now recently used; "b" is the LRU entry
+        await cache.set("d", "d")
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "a"
+        assert await cache.get("d") == "d"
+        assert (await cache.stats())["evictions"] == 1
+
+    async def test_byte_bound_evicts(self):
+        backend = InMemoryBackend(max_entries=None, max_bytes=2_000, shards=1)
+        cache = TTLCache(default_ttl=60, backend=backend)
+        for i in range(10):
+            await cache.set(f"k{i}", "x" * 500)
+        stats = await cache.stats()
+        assert stats["tracked_bytes"] <= 2_000
+        assert stats["evictions"] > 0
+        assert await cache.get("k9") == "x" * 500
+
+    async def test_purge_uses_expiry_wheel(self, monkeypatch):
+        backend = InMemoryBackend(expiry_resolution=1.0)
+        cache = TTLCache(default_ttl=60, backend=backend)
+        await cache.set("short", 1, ttl=2)
+        await cache.set("long", 2, ttl=300)
+        real_time = time.time()
+        assert await backend.purge_expired(real_time + 1) == 0
+        assert await backend.purge_expired(real_time + 10) == 1
+        assert [k for k, _, _ in await backend.entries()] == ["long"]
+
+    async def test_reset_key_is_not_purged_by_its_old_slot(self):
+        backend = InMemoryBackend(expiry_resolution=1.0)
+        cache = TTLCache(default_ttl=60, backend=backend)
+        await cache.set("k", 1, ttl=2)
+        await cache.set("k", 2, ttl=300)
+        assert await backend.purge_expired(time.time() + 10) == 0
+        assert await cache.get("k") == 2
+
+    async def test_prefix_pattern_only_touches_indexed_keys(self):
+        cache = TTLCache(default_ttl=60, backend=InMemoryBackend())
+        await cache.set("mktg:42:overview:a", 1)
+        await cache.set("mktg:42:trend:b", 2)
+        await cache.set("mktg:420:overview:a", 3)
+        await cache.set("dashboard_overview", 4)
+        assert await cache.delete_pattern("mktg:42:*") == 2
+        assert await cache.get("mktg:420:overview:a") == 3
+        # Non-prefix patterns still work via the fallback scan.
+        assert await cache.delete_pattern("dashboard*") == 1
+
+    async def test_sweeper_removes_expired_entries_in_background(self):
+        backend = InMemoryBackend(expiry_resolution=0.01)
+        cache = TTLCache(default_ttl=60, backend=backend)
+        await cache.set("k", 1, ttl=0)
+        await backend.start()
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await backend.close()
+        assert await backend.entries() == []
+
+
+class TestSingleFlight:
+    @pytest.fixture(autouse=True)
+    async def reset_app_cache(self):
+        await app_cache.clear()
+        yield
+        await app_cache.clear()
+
+    async def test_concurrent_misses_share_one_call(self):
+        calls = 0
+        gate = asyncio.Event()
+
+        @cached("single_flight_test", ttl=60)
+        async def slow():
+            nonlocal calls
+            calls += 1
+            await gate.wait()
+            return {"ok": True}
+
+        tasks = [asyncio.create_task(slow()) for _ in range(10)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+        assert calls == 1
+        assert all(r == {"ok": True} for r in results)
+
+    async def test_leader_error_propagates_and_is_not_cached(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def boom():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(
+            flight.do("k", boom), flight.do("k", boom), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == 1
+        assert not flight.in_flight("k")
+
+    async def test_cancelled_leader_hands_off_to_waiter(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def never():
+            started.set()
+            await asyncio.Event().wait()
+
+        async def quick():
+            return "fresh"
+
+        leader = asyncio.create_task(flight.do("k", never))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("k", quick))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "fresh"
+
+
+# ---------------------------------------------------------------------------
+# TestSharedBackend — several "workers" over one Redis-protocol store
+# ---------------------------------------------------------------------------
+
+class TestSharedBackend:
+    @pytest.fixture(autouse=True)
+    async def workers(self):
+        """Two RedisBackend workers sharing one in-process stand-in server."""
+        server = LocalRedisStandIn()
+        self.worker_a = RedisBackend(server)
+        self.worker_b = RedisBackend(server)
+        await self.worker_a.start()
+        await self.worker_b.start()
+        yield
+        await self.worker_a.close()
+        await self.worker_b.close()
+
+    async def test_value_written_by_one_worker_is_read_by_another(self):
+        cache_a = TTLCache(default_ttl=60, backend=self.worker_a)
+        cache_b = TTLCache(default_ttl=60, backend=self.worker_b)
+        await cache_a.set("dashboard:7", {"total": 3})
+        assert await cache_b.get("dashboard:7") == {"total": 3}
+
+    async def test_delete_pattern_on_one_worker_clears_all(self):
+        cache_a = TTLCache(default_ttl=60, backend=self.worker_a)
+        cache_b = TTLCache(default_ttl=60, backend=self.worker_b)
+        await cache_a.set("mktg:42:overview", 1)
+        await cache_a.set("mktg:43:overview", 2)
+        assert await cache_b.delete_pattern("mktg:42:*") == 1
+        assert await cache_a.get("mktg:42:overview") is None
+        assert await cache_a.get("mktg:43:overview") == 2
+
+    async def test_expiry_is_enforced_across_workers(self, monkeypatch):
+        cache_a = TTLCache(default_ttl=60, backend=self.worker_a)
+        cache_b = TTLCache(default_ttl=60, backend=self.worker_b)
+        await cache_a.set("k", "v", ttl=5)
+        real_time = time.time()
+        monkeypatch.setattr(time, "time", lambda: real_time + 10)
+        assert await cache_b.get("k") is None
+
+    async def test_clear_only_touches_cache_namespace(self):
+        server = LocalRedisStandIn()
+        await server.set("other-service:key", b"keep")
+        cache = TTLCache(default_ttl=60, backend=RedisBackend(server))
+        await cache.set("a", 1)
+        assert await cache.clear() == 1
+        assert await server.get("other-service:key") == b"keep"
+
+    async def test_publish_reaches_every_worker(self):
+        seen_a: list[str] = []
+        seen_b: list[str] = []
+        self.worker_a.add_listener(seen_a.append)
+        self.worker_b.add_listener(seen_b.append)
+        await self.worker_a.publish("legacy:roles")
+        await asyncio.sleep(0)
+        assert seen_a == ["legacy:roles"]
+        assert seen_b == ["legacy:roles"]
+
+    async def test_subscriber_reconnects_after_a_dropped_connection(self, monkeypatch):
+        monkeypatch.setattr(cache_backends, "_RESUBSCRIBE_MIN_DELAY", 0)
+        server = _DroppingStandIn()
+        worker = RedisBackend(server)
+        seen: list[str] = []
+        worker.add_listener(seen.append)
+        await worker.start()
+        try:
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert server.pubsubs == 2
+            assert seen == [RESUBSCRIBED_MESSAGE]
+            await RedisBackend(server).publish("legacy:roles")
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert seen == [RESUBSCRIBED_MESSAGE, "legacy:roles"]
+        finally:
+            await worker.close()
+
+
+class _DroppingStandIn(LocalRedisStandIn):
+    """A stand-in whose first pub/sub connection drops as soon as it is read."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pubsubs = 0
+
+    def pubsub(self):
+        self.pubsubs += 1
+        pubsub = super().pubsub()
+        if self.pubsubs == 1:
+            async def dropped():
+                raise ConnectionError("connection reset")
+                yield
+
+            pubsub.listen = dropped
+        return pubsub
+
+
+class TestLegacyInvalidationFanOut:
+    @pytest.fixture(autouse=True)
+    async def shared_app_cache(self):
+        original = app_cache.backend
+        await configure_cache_backend(RedisBackend(LocalRedisStandIn()))
+        invalidate_all_caches()
+        yield
+        invalidate_all_caches()
+        await asyncio.sleep(0)
+        await app_cache.set_backend(original)
+
+    async def test_cached_fetch_warms_shared_store(self):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return ["stage"]
+
+        await cached_fetch("fanout_test", "k", fetch)
+        # Simulate a second worker: its process-local layer is cold.
+        get_cache("fanout_test").clear()
+        assert await cached_fetch("fanout_test", "k", fetch) == ["stage"]
+        assert calls == 1
+
+    async def test_invalidate_cache_drops_shared_and_local_copies(self):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await cached_fetch("fanout_test", "k", fetch)
+        invalidate_cache("fanout_test")
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert await app_cache.get("legacy:fanout_test:k") is None
+        assert await cached_fetch("fanout_test", "k", fetch) == 2
+
+    async def test_flush_waits_for_broadcasts_in_call_order(self, monkeypatch):
+        published: list[str] = []
+        original_publish = app_cache.backend.publish
+
+        async def slow_publish(message: str) -> None:
+            # The first broadcast is the slowest; it must still go out first.
+            await asyncio.sleep(0.01 if message.endswith("first") else 0)
+            published.append(message)
+            await original_publish(message)
+
+        monkeypatch.setattr(app_cache.backend, "publish", slow_publish)
+        invalidate_cache("fanout_first")
+        invalidate_cache("fanout_second")
+        await flush_cache_invalidations()
+        assert published == ["legacy:fanout_first", "legacy:fanout_second"]
+
+    async def test_resubscribe_drops_every_local_named_cache(self):
+        cache_set("fanout_test", "k", "maybe stale")
+        app_cache.backend._dispatch(RESUBSCRIBED_MESSAGE)
+        assert cache_get("fanout_test", "k") is None
+
+    async def test_remote_broadcast_clears_local_named_cache(self):
+        cache_set("fanout_test", "k", "stale")
+        await app_cache.backend.publish("legacy:fanout_test")
+        await asyncio.sleep(0)
+        assert cache_get("fanout_test", "k") is None
+
+
+def test_build_cache_backend_kinds():
+    assert isinstance(build_cache_backend("memory"), InMemoryBackend)
+    assert isinstance(build_cache_backend("local"), RedisBackend)
+    with pytest.raises(RuntimeError):
+        build_cache_backend("redis")
+    with pytest.raises(ValueError):
+        build_cache_backend("memcached")
@@ -0,0 +1,25 @@
+"""Unit tests for core/cursors.py — pure helpers, no async/db fixtures required."""
+
+from datetime import UTC, datetime
+
+import pytest
+from src.core.cursors import decode_keyset_cursor, encode_keyset_cursor
+
+
+class TestKeysetCursor:
+    def test_round_trips_mixed_values(self):
+        at = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+        cursor = encode_keyset_cursor(0.75, at, "Acme", 42)
+        assert "=" not in cursor
+        assert decode_keyset_cursor(cursor, (float, datetime, str, int)) == (0.75, at, "Acme", 42)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", "WzEsMiwzXQ"])
+    def test_rejects_garbage_and_wrong_arity(self, cursor):
+        # "W10" is [] and "WzEsMiwzXQ" is [1,2,3].
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_keyset_cursor(cursor, (int, int))
+
+    def test_rejects_values_of_the_wrong_type(self):
+        cursor = encode_keyset_cursor("yesterday", 1)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_keyset_cursor(cursor, (datetime, int))
@@ -11,6 +11,7 @@ from src.core.data_scope import (
     invalidate_scope_cache,
 )
 from src.core.models import EntityShare
+from src.core.share_permissions import SharedScope
 
 # ---------------------------------------------------------------------------
 # TestDataScope — dataclass behaviour
@@ -23,13 +24,11 @@ class TestDataScope:
             role_name="admin",
             owner_id=None,
             is_scoped=False,
-            shared_entity_ids={"contacts": [10, 11]},
         )
         assert scope.user_id == 1
         assert scope.role_name == "admin"
         assert scope.owner_id is None
         assert scope.is_scoped is False
-        assert scope.shared_entity_ids == {"contacts": [10, 11]}
 
     def test_scoped_true(self):
         scope = DataScope(user_id=42, role_name="sales_rep", owner_id=42, is_scoped=True)
@@ -43,14 +42,9 @@ class TestDataScope:
         assert scope.can_see_all() is True
         assert scope.get_accessible_owner_ids() is None
 
-    def test_get_shared_ids_returns_empty_when_missing(self):
+    def test_shared_scope_canonicalizes_entity_type(self):
         scope = DataScope(user_id=1, role_name="sales_rep", is_scoped=True)
-        assert scope.get_shared_ids("leads") == []
-
-    def test_get_shared_ids_returns_list(self):
-        scope = DataScope(user_id=1, role_name="sales_rep", is_scoped=True,
-                          shared_entity_ids={"leads": [5, 6]})
-        assert scope.get_shared_ids("leads") == [5, 6]
+        assert scope.shared_scope("lead") == SharedScope(user_id=1, entity_type="leads")
 
 
 # ---------------------------------------------------------------------------
@@ -178,7 +172,7 @@ class TestSharedEntities:
     async def test_sales_rep_with_shared_entities(
         self, db_session: AsyncSession, seed_roles, _sales_rep_user
     ):
-        """Shared EntityShare rows appear in scope.shared_entity_ids."""
+        """Shared EntityShare rows are included in the scope's shares."""
         share = EntityShare(
             entity_type="contacts",
             entity_id=77,
@@ -189,7 +183,7 @@ class TestSharedEntities:
         await db_session.commit()
 
         scope = await get_data_scope(_sales_rep_user, db_session)
-        assert 77 in scope.get_shared_ids("contacts")
+        assert await scope.shared_scope("contacts").includes(db_session, 77)
 
     async def test_singular_share_rows_are_canonicalized(
         self, db_session: AsyncSession, seed_roles, _sales_rep_user
@@ -205,12 +199,23 @@ class TestSharedEntities:
         await db_session.commit()
 
         scope = await get_data_scope(_sales_rep_user, db_session)
-        assert 88 in scope.get_shared_ids("leads")
-        assert 88 in scope.get_shared_ids("lead")
+        assert await scope.shared_scope("leads").includes(db_session, 88)
+        assert await scope.shared_scope("lead").includes(db_session, 88)
 
-    async def test_sales_rep_with_no_shares_has_empty_dict(
+    async def test_share_after_scope_is_cached_is_visible(
         self, db_session: AsyncSession, seed_roles, _sales_rep_user
     ):
-        """No EntityShare rows → shared_entity_ids is empty."""
+        """Shares are read live, so a cached scope sees a new share at once."""
         scope = await get_data_scope(_sales_rep_user, db_session)
-        assert scope.shared_entity_ids == {}
+        assert not await scope.shared_scope("contacts").includes(db_session, 99)
+
+        db_session.add(EntityShare(
+            entity_type="contacts",
+            entity_id=99,
+            shared_with_user_id=_sales_rep_user.id,
+            shared_by_user_id=_sales_rep_user.id,
+        ))
+        await db_session.commit()
+
+        assert await get_data_scope(_sales_rep_user, db_session) is scope
+        assert await scope.shared_scope("contacts").includes(db_session, 99)
@@ -11,6 +11,7 @@ from src.core.entity_access import (
     clear_entity_existence_cache,
     require_entity_access,
 )
+from src.core.models import EntityShare
 
 
 @pytest.fixture(autouse=True)
@@ -172,13 +173,12 @@ class TestRequireEntityAccess:
             is_scoped=False,
         )
 
-    def _scoped_scope(self, user_id: int, shared: dict | None = None) -> DataScope:
+    def _scoped_scope(self, user_id: int) -> DataScope:
         return DataScope(
             user_id=user_id,
             role_name="sales_rep",
             owner_id=user_id,
             is_scoped=True,
-            shared_entity_ids=shared or {},
         )
 
     async def test_admin_existing_entity_passes(
@@ -261,13 +261,17 @@ class TestRequireEntityAccess:
             created_by_id=test_user.id,
         )
         db_session.add(contact)
+        await db_session.flush()
+        db_session.add(EntityShare(
+            entity_type="contacts",
+            entity_id=contact.id,
+            shared_with_user_id=_sales_rep_user.id,
+            shared_by_user_id=test_user.id,
+        ))
         await db_session.commit()
         await db_session.refresh(contact)
 
-        scope = self._scoped_scope(
-            _sales_rep_user.id,
-            shared={"contacts": [contact.id]},
-        )
+        scope = self._scoped_scope(_sales_rep_user.id)
         await require_entity_access(
             db_session, "contact", contact.id, _sales_rep_user, scope
         )
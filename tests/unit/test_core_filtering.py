@@ -2,12 +2,14 @@
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ClauseElement
 from src.contacts.models import Contact
 from src.core.filtering import (
     apply_filter_condition,
     apply_filters_to_query,
+    build_search_rank,
     build_token_search,
     parse_filter_group,
 )
@@ -267,3 +269,92 @@ class TestBuildTokenSearch:
         assert len(rows) == 1
         assert rows[0].first_name == "John"
         assert rows[0].last_name == "Smith"
+
+    async def test_wildcards_in_tokens_match_literally(self, db_session: AsyncSession, test_user):
+        """A typed '%' or '_' must not act as a LIKE wildcard."""
+        db_session.add(_make_contact("Ann_Marie", "Lee"))
+        db_session.add(_make_contact("Annxmarie", "Lee"))
+        await db_session.flush()
+
+        for term in ("ann_m", "%"):
+            condition = build_token_search(term, Contact.first_name, Contact.last_name)
+            rows = (await db_session.execute(select(Contact).where(condition))).scalars().all()
+            assert [c.first_name for c in rows] == (["Ann_Marie"] if term == "ann_m" else [])
+
+    def test_model_ddl_does_not_need_pg_trgm(self):
+        """Trigram indexes come from migration 066 only, so create_all runs without the extension."""
+        from sqlalchemy.schema import CreateIndex
+        from src.database import Base
+
+        dialect = postgresql.dialect()
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                assert "gin_trgm_ops" not in str(CreateIndex(index).compile(dialect=dialect))
+
+
+# ---------------------------------------------------------------------------
+# TestBuildSearchRank — similarity ordering (pg_trgm on Postgres, fallback on SQLite)
+# ---------------------------------------------------------------------------
+
+class TestBuildSearchRank:
+    """Tests for build_search_rank."""
+
+    def test_empty_search_returns_none(self):
+        assert build_search_rank("  ", Contact.first_name) is None
+
+    def test_postgres_uses_trigram_similarity(self):
+        expr = build_search_rank("john  sm", Contact.first_name, Contact.last_name)
+        sql = str(expr.compile(dialect=postgresql.dialect()))
+        assert "greatest(" in sql
+        assert sql.count("similarity(") == 2
+
+    def test_single_column_skips_greatest(self):
+        sql = str(build_search_rank("john", Contact.first_name).compile(dialect=postgresql.dialect()))
+        assert "greatest" not in sql
+
+    async def test_exact_then_prefix_then_substring(self, db_session: AsyncSession, test_user):
+        db_session.add(_make_contact("Marijohn", "Doe"))
+        db_session.add(_make_contact("John", "Smith"))
+        db_session.add(_make_contact("Johnny", "Cash"))
+        db_session.add(_make_contact("Alice", "Brown"))
+        await db_session.flush()
+
+        columns = (Contact.first_name, Contact.last_name)
+        result = await db_session.execute(
+            select(Contact.first_name)
+            .where(build_token_search("john", *columns))
+            .order_by(build_search_rank("john", *columns).desc())
+        )
+        assert result.scalars().all() == ["John", "Johnny", "Marijohn"]
+
+
+class TestServiceSearchOrdering:
+    """Searched lists without an explicit sort lead with the best match."""
+
+    async def test_contacts_ranked_by_similarity(self, db_session: AsyncSession, test_user):
+        from src.contacts.service import ContactService
+
+        # Created in reverse order of relevance so created_at desc alone would fail.
+        for first in ("John", "Johnny", "Marijohn"):
+            db_session.add(_make_contact(first, "Doe"))
+            await db_session.flush()
+
+        items, total = await ContactService(db_session).get_list(search="john")
+        assert total == 3
+        assert [c.first_name for c in items] == ["John", "Johnny", "Marijohn"]
+
+        items, _ = await ContactService(db_session).get_list(
+            search="john", order_by="name", order_dir="desc"
+        )
+        assert [c.first_name for c in items] == ["Marijohn", "Johnny", "John"]
+
+    async def test_companies_ranked_by_similarity(self, db_session: AsyncSession, test_user):
+        from src.companies.models import Company
+        from src.companies.service import CompanyService
+
+        for name in ("Acme Rockets", "Acme"):
+            db_session.add(Company(name=name, status="prospect", owner_id=test_user.id))
+        await db_session.flush()
+
+        items, _ = await CompanyService(db_session).get_list(search="acme")
+        assert [c.name for c in items] == ["Acme", "Acme Rockets"]
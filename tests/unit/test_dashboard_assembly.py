@@ -0,0 +1,104 @@
+"""
+Concurrent dashboard assembly — run_dashboard_queries.
+
+Independent dashboard reads fan out onto their own pooled sessions with a
+bounded width, and fall back to the request session when the engine only has
+one shared connection (the in-memory SQLite test DB).
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.dashboard._utils import run_dashboard_queries
+
+
+@pytest.fixture
+async def file_engine(tmp_path):
+    """A file-backed SQLite engine with a real connection pool."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'dash.db'}")
+    yield engine
+    await engine.dispose()
+
+
+def _probe(seen: list, active: dict, delay: float = 0.05):
+    async def query(session: AsyncSession):
+        seen.append(session)
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        try:
+            await asyncio.sleep(delay)
+            return (await session.execute(text("SELECT 1"))).scalar()
+        finally:
+            active["now"] -= 1
+    return query
+
+
+class TestRunDashboardQueries:
+    async def test_fans_out_on_separate_sessions(self, file_engine):
+        """Each query runs on its own session, concurrently"""
+        seen: list = []
+        active = {"now": 0, "peak": 0}
+        async with async_sessionmaker(file_engine)() as request_db:
+            started = time.perf_counter()
+            results = await run_dashboard_queries(
+                request_db, [_probe(seen, active) for _ in range(6)], max_concurrency=6
+            )
+            elapsed = time.perf_counter() - started
+        assert results == [1] * 6
+        assert request_db not in seen
+        assert len({id(s) for s in seen}) == 6
+        assert active["peak"] > 1
+        assert elapsed < 6 * 0.05
+
+    async def test_fan_out_is_bounded(self, file_engine):
+        """No more than max_concurrency queries hold a session at once"""
+        active = {"now": 0, "peak": 0}
+        async with async_sessionmaker(file_engine)() as request_db:
+            await run_dashboard_queries(
+                request_db, [_probe([], active, 0.01) for _ in range(8)], max_concurrency=3
+            )
+        assert active["peak"] == 3
+
+    async def test_results_keep_query_order(self, file_engine):
+        """Results come back in submission order regardless of finish order"""
+        def _delayed(value, delay):
+            async def query(session):
+                await asyncio.sleep(delay)
+                return value
+            return query
+
+        async with async_sessionmaker(file_engine)() as request_db:
+            results = await run_dashboard_queries(
+                request_db, [_delayed("a", 0.03), _delayed("b", 0.0), _delayed("c", 0.01)]
+            )
+        assert results == ["a", "b", "c"]
+
+    async def test_failure_cancels_siblings(self, file_engine):
+        """One failing query fails the batch and cancels the rest"""
+        cancelled = asyncio.Event()
+
+        async def boom(session):
+            raise RuntimeError("chart failed")
+
+        async def slow(session):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async with async_sessionmaker(file_engine)() as request_db:
+            with pytest.raises(RuntimeError):
+                await run_dashboard_queries(request_db, [slow, boom], max_concurrency=2)
+        assert cancelled.is_set()
+
+    async def test_static_pool_runs_on_request_session(self, db_session: AsyncSession):
+        """Single-connection engines run sequentially on the request session"""
+        seen: list = []
+        active = {"now": 0, "peak": 0}
+        await run_dashboard_queries(db_session, [_probe(seen, active, 0) for _ in range(3)])
+        assert seen == [db_session] * 3
+        assert active["peak"] == 1
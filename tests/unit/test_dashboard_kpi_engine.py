@@ -0,0 +1,121 @@
+"""
+Batched KPI engine — NumberCardGenerator.get_all_kpis.
+
+The batched path must return exactly what the card-by-card reference path
+returns, for every scope (all owners / one owner / date window), while issuing
+one query per base table instead of one or two per card.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.activities.models import Activity
+from src.auth.models import User
+from src.companies.models import Company
+from src.contacts.models import Contact
+from src.dashboard.number_cards import NumberCardGenerator
+from src.leads.models import Lead
+from src.opportunities.models import Opportunity, PipelineStage
+
+
+@pytest.fixture
+async def seeded_book(
+    db_session: AsyncSession,
+    test_user: User,
+    test_superuser: User,
+    test_pipeline_stage: PipelineStage,
+    test_won_stage: PipelineStage,
+):
+    """A mixed book across two owners with rows inside and outside every window."""
+    now = datetime.now(UTC)
+    today = date.today()
+    old = now - timedelta(days=60)
+    for owner in (test_user, test_superuser):
+        for i, created in enumerate((now, now - timedelta(days=3), now - timedelta(days=10), old)):
+            db_session.add(Contact(
+                first_name=f"C{i}", last_name=owner.full_name, email=f"c{i}-{owner.id}@example.com",
+                status="active" if i != 2 else "inactive", owner_id=owner.id,
+                created_by_id=owner.id, created_at=created,
+            ))
+            db_session.add(Lead(
+                first_name=f"L{i}", last_name=owner.full_name, email=f"l{i}-{owner.id}@example.com",
+                status=("new", "contacted", "converted", "lost")[i],
+                owner_id=owner.id, created_by_id=owner.id, created_at=created,
+                pipeline_stage_id=test_pipeline_stage.id if i == 1 else None,
+            ))
+            db_session.add(Company(name=f"Co{i}-{owner.id}", owner_id=owner.id, created_at=created))
+        db_session.add_all([
+            Opportunity(
+                name="Open", pipeline_stage_id=test_pipeline_stage.id, amount=1000.0,
+                owner_id=owner.id, created_by_id=owner.id, created_at=old,
+            ),
+            Opportunity(
+                name="Won now", pipeline_stage_id=test_won_stage.id, amount=2500.0,
+                actual_close_date=today, owner_id=owner.id, created_by_id=owner.id,
+            ),
+            Opportunity(
+                name="Won before", pipeline_stage_id=test_won_stage.id, amount=400.0,
+                actual_close_date=today - timedelta(days=45), owner_id=owner.id,
+                created_by_id=owner.id, created_at=old,
+            ),
+            Activity(
+                activity_type="task", subject="Due", entity_type="contacts", entity_id=1,
+                due_date=today, is_completed=False, owner_id=owner.id,
+                assigned_to_id=owner.id, created_by_id=owner.id,
+            ),
+        ])
+    await db_session.commit()
+
+
+def _count_queries(engine):
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+class TestBatchedKPIs:
+    @pytest.mark.parametrize("scoped", [False, True])
+    async def test_matches_card_by_card_path(
+        self, db_session: AsyncSession, test_user: User, seeded_book, scoped: bool
+    ):
+        """Batched KPIs equal the sequential reference path"""
+        user_id = test_user.id if scoped else None
+        batched = await NumberCardGenerator(db_session, user_id=user_id).get_all_kpis()
+        sequential = await NumberCardGenerator(db_session, user_id=user_id).get_all_kpis_sequential()
+        assert batched == sequential
+        assert any(card["value"] for card in batched)
+
+    async def test_matches_with_date_window(
+        self, db_session: AsyncSession, test_user: User, seeded_book
+    ):
+        """Date-window filters apply to the same cards in both paths"""
+        kwargs = {
+            "user_id": test_user.id,
+            "date_from": date.today() - timedelta(days=7),
+            "date_to": date.today(),
+        }
+        batched = await NumberCardGenerator(db_session, **kwargs).get_all_kpis()
+        sequential = await NumberCardGenerator(db_session, **kwargs).get_all_kpis_sequential()
+        assert batched == sequential
+
+    async def test_one_query_per_base_table(
+        self, db_session: AsyncSession, test_engine, test_user: User, seeded_book
+    ):
+        """Batched path issues 5 queries; the card-by-card path issues 17"""
+        statements, stop = _count_queries(test_engine)
+        try:
+            await NumberCardGenerator(db_session, user_id=test_user.id).get_all_kpis()
+            batched_count = len(statements)
+            statements.clear()
+            await NumberCardGenerator(db_session, user_id=test_user.id).get_all_kpis_sequential()
+            sequential_count = len(statements)
+        finally:
+            stop()
+        assert batched_count == 5
+        assert sequential_count == 17
@@ -0,0 +1,275 @@
+"""
+Dashboard rollups — src.dashboard.rollups.
+
+Rollup-backed KPI cards and charts must match the base-table queries, and
+incremental refreshes (create / update / delete) must leave the rollups
+exactly where a full rebuild would.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+import src.database as db_module
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.activities.models import Activity
+from src.auth.models import User
+from src.config import settings
+from src.dashboard import rollups
+from src.dashboard.charts import ChartDataGenerator
+from src.dashboard.models import DashboardDailyRollup, DashboardRollupDirty, DashboardRollupSource
+from src.dashboard.number_cards import NumberCardGenerator
+from src.dashboard.rollups import DashboardRollupService
+from src.leads.models import Lead, LeadSource
+from src.opportunities.models import Opportunity, PipelineStage
+
+
+@pytest.fixture
+async def seeded_book(
+    db_session: AsyncSession,
+    test_user: User,
+    test_superuser: User,
+    test_pipeline_stage: PipelineStage,
+    test_won_stage: PipelineStage,
+    test_lead_source: LeadSource,
+):
+    """Leads, deals and activities across two owners and several days."""
+    now = datetime.now(UTC)
+    today = date.today()
+    for owner in (test_user, test_superuser):
+        for i, created in enumerate((now, now - timedelta(days=3), now - timedelta(days=10), now - timedelta(days=60))):
+            db_session.add(Lead(
+                first_name=f"L{i}", last_name=owner.full_name, email=f"l{i}-{owner.id}@example.com",
+                status=("new", "contacted", "converted", "lost")[i],
+                source_id=test_lead_source.id if i % 2 else None,
+                pipeline_stage_id=test_pipeline_stage.id if i == 1 else None,
+                owner_id=owner.id, created_by_id=owner.id, created_at=created,
+            ))
+            db_session.add(Activity(
+                activity_type=("call", "task", "meeting", "call")[i], subject=f"A{i}",
+                entity_type="contacts", entity_id=1, owner_id=owner.id,
+                created_by_id=owner.id, created_at=created,
+            ))
+        db_session.add_all([
+            Opportunity(
+                name="Open", pipeline_stage_id=test_pipeline_stage.id, amount=1000.0,
+                owner_id=owner.id, created_by_id=owner.id, created_at=now - timedelta(days=60),
+            ),
+            Opportunity(
+                name="Won now", pipeline_stage_id=test_won_stage.id, amount=2500.0,
+                actual_close_date=today, owner_id=owner.id, created_by_id=owner.id,
+            ),
+            Opportunity(
+                name="Won before", pipeline_stage_id=test_won_stage.id, amount=400.0,
+                actual_close_date=today - timedelta(days=45), owner_id=owner.id,
+                created_by_id=owner.id, created_at=now - timedelta(days=60),
+            ),
+        ])
+    await db_session.commit()
+    await DashboardRollupService(db_session).rebuild()
+    await db_session.commit()
+
+
+@pytest.fixture
+def rollups_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", True)
+
+
+async def _rollup_state(db: AsyncSession) -> set[tuple]:
+    rows = (await db.execute(select(DashboardDailyRollup))).scalars().all()
+    return {
+        (r.metric, r.owner_id, r.day, r.dimension, r.stage_id, r.record_count, round(r.amount, 2))
+        for r in rows
+    }
+
+
+def _sorted_data(chart: dict) -> list:
+    return sorted(chart["data"], key=lambda point: point["label"])
+
+
+class TestRollupReads:
+    @pytest.mark.parametrize("scoped", [False, True])
+    async def test_kpis_match_base_tables(
+        self, db_session: AsyncSession, test_user: User, seeded_book, monkeypatch, scoped: bool
+    ):
+        """Rollup-backed KPI cards equal the base-table cards"""
+        user_id = test_user.id if scoped else None
+        live = await NumberCardGenerator(db_session, user_id=user_id).get_all_kpis()
+        monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", True)
+        rolled = await NumberCardGenerator(db_session, user_id=user_id).get_all_kpis()
+        assert rolled == live
+
+    async def test_kpis_match_with_date_window(
+        self, db_session: AsyncSession, test_user: User, seeded_book, monkeypatch
+    ):
+        """Date windows select the same days from the rollups"""
+        kwargs = {"user_id": test_user.id, "date_from": date.today() - timedelta(days=7), "date_to": date.today()}
+        live = await NumberCardGenerator(db_session, **kwargs).get_all_kpis()
+        monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", True)
+        assert await NumberCardGenerator(db_session, **kwargs).get_all_kpis() == live
+
+    @pytest.mark.parametrize("method", [
+        "get_pipeline_funnel", "get_leads_by_status", "get_leads_by_source", "get_activities_by_type",
+    ])
+    async def test_charts_match_base_tables(
+        self, db_session: AsyncSession, test_user: User, seeded_book, monkeypatch, method: str
+    ):
+        """Rollup-backed charts equal the base-table charts"""
+        live = await getattr(ChartDataGenerator(db_session, user_id=test_user.id), method)()
+        monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", True)
+        rolled = await getattr(ChartDataGenerator(db_session, user_id=test_user.id), method)()
+        assert {**rolled, "data": _sorted_data(rolled)} == {**live, "data": _sorted_data(live)}
+
+    async def test_revenue_trend_buckets_by_close_month(
+        self, db_session: AsyncSession, test_user: User, seeded_book, rollups_enabled
+    ):
+        """Won revenue is bucketed by close month without date_trunc"""
+        chart = await ChartDataGenerator(db_session, user_id=test_user.id).get_revenue_trend()
+        assert chart["data"][-1] == {"label": date.today().strftime("%b %Y"), "value": 2500.0}
+        assert sum(point["value"] for point in chart["data"]) == 2900.0
+
+    async def test_new_leads_trend_buckets_by_week(
+        self, db_session: AsyncSession, test_user: User, seeded_book, rollups_enabled
+    ):
+        """Weekly lead counts come from the daily lead rows"""
+        chart = await ChartDataGenerator(db_session, user_id=test_user.id).get_new_leads_trend()
+        assert sum(point["value"] for point in chart["data"]) == 3
+        assert all(point["label"].startswith("Week of ") for point in chart["data"])
+
+
+class TestIncrementalMaintenance:
+    async def test_refresh_applies_updates_and_deletes(
+        self, db_session: AsyncSession, test_user: User, test_won_stage: PipelineStage, seeded_book
+    ):
+        """Refreshing changed and deleted records lands on the rebuilt state"""
+        lead = (await db_session.execute(select(Lead).where(Lead.status == "new").limit(1))).scalar_one()
+        opportunity = (await db_session.execute(
+            select(Opportunity).where(Opportunity.name == "Open").limit(1)
+        )).scalar_one()
+        activity = (await db_session.execute(select(Activity).limit(1))).scalar_one()
+
+        lead.status = "qualified"
+        opportunity.pipeline_stage_id = test_won_stage.id
+        opportunity.actual_close_date = date.today()
+        opportunity.amount = 1750.0
+        await db_session.delete(activity)
+        created = Lead(first_name="New", last_name="Lead", status="new", owner_id=test_user.id)
+        db_session.add(created)
+        await db_session.flush()
+
+        service = DashboardRollupService(db_session)
+        assert await service.refresh("lead", [lead.id, created.id]) == 2
+        assert await service.refresh("opportunity", [opportunity.id]) == 1
+        assert await service.refresh("activity", [activity.id]) == 1
+        incremental = await _rollup_state(db_session)
+
+        await service.rebuild()
+        assert incremental == await _rollup_state(db_session)
+
+    async def test_refresh_unchanged_record_is_noop(self, db_session: AsyncSession, seeded_book):
+        """Re-applying an unchanged record writes nothing"""
+        before = await _rollup_state(db_session)
+        lead_ids = list((await db_session.execute(select(Lead.id))).scalars())
+        assert await DashboardRollupService(db_session).refresh("lead", lead_ids) == 0
+        assert await _rollup_state(db_session) == before
+
+    async def test_emptied_grains_are_removed(self, db_session: AsyncSession, seeded_book):
+        """Deleting the last record in a grain deletes its rollup row"""
+        opportunities = (await db_session.execute(select(Opportunity))).scalars().all()
+        for opportunity in opportunities:
+            await db_session.delete(opportunity)
+        await db_session.flush()
+        await DashboardRollupService(db_session).refresh("opportunity", [o.id for o in opportunities])
+        rows = await _rollup_state(db_session)
+        assert not [row for row in rows if row[0].startswith("opportunity")]
+        sources = (await db_session.execute(
+            select(DashboardRollupSource).where(DashboardRollupSource.entity_type == "opportunity")
+        )).scalars().all()
+        assert sources == []
+
+    async def test_commits_mark_dirty_and_flush_refreshes(
+        self, db_session: AsyncSession, test_engine, test_user: User, rollups_enabled, monkeypatch
+    ):
+        """Lead writes queue the record in their transaction; the flush folds it in on its own session"""
+        monkeypatch.setattr(db_module, "async_session_maker", async_sessionmaker(
+            test_engine, class_=AsyncSession, expire_on_commit=False,
+        ))
+        lead = Lead(first_name="Evt", last_name="Lead", status="contacted", owner_id=test_user.id)
+        db_session.add(lead)
+        await db_session.flush()
+        lead.status = "qualified"
+        await db_session.commit()
+        marks = (await db_session.execute(
+            select(DashboardRollupDirty.entity_type, DashboardRollupDirty.entity_id)
+        )).all()
+        assert marks == [("lead", lead.id), ("lead", lead.id)]
+
+        assert await rollups.flush_dirty_rollups() == 1
+        assert await rollups.pending_rollup_refreshes(db_session) == 0
+        counts = await ChartDataGenerator(db_session, user_id=test_user.id)._rollup_counts(
+            rollups.METRIC_LEAD_STATUS
+        )
+        assert counts == {"qualified": 1}
+
+    async def test_rolled_back_write_is_not_queued(
+        self, db_session: AsyncSession, test_user: User, rollups_enabled
+    ):
+        db_session.add(Lead(first_name="Gone", last_name="Lead", status="new", owner_id=test_user.id))
+        await db_session.flush()
+        await db_session.rollback()
+        await db_session.commit()
+        assert await rollups.pending_rollup_refreshes(db_session) == 0
+
+    async def test_failed_flush_keeps_marks(
+        self, db_session: AsyncSession, test_engine, rollups_enabled, monkeypatch
+    ):
+        """A failed refresh leaves its marks for the next run"""
+        async def fail(self, entity_type, entity_ids):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(db_module, "async_session_maker", async_sessionmaker(
+            test_engine, class_=AsyncSession, expire_on_commit=False,
+        ))
+        monkeypatch.setattr(DashboardRollupService, "refresh", fail)
+        await rollups.mark_dirty(db_session, "lead", [99])
+        await db_session.commit()
+        assert await rollups.flush_dirty_rollups() == 0
+        assert await rollups.pending_rollup_refreshes(db_session) == 1
+
+    async def test_bulk_stage_backfill_marks_leads(
+        self,
+        client,
+        db_session: AsyncSession,
+        test_user: User,
+        superuser_token: str,
+        rollups_enabled,
+        monkeypatch,
+    ):
+        """The bulk pipeline-stage backfill queues every lead it updates"""
+        monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", False)
+        leads = [
+            Lead(first_name=f"B{i}", last_name="Lead", status="new", owner_id=test_user.id)
+            for i in range(3)
+        ]
+        db_session.add_all([PipelineStage(name="Inbox", order=1, pipeline_type="lead", is_active=True), *leads])
+        await db_session.commit()
+        monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", True)
+
+        response = await client.post(
+            "/api/leads/backfill-pipeline-stages", headers={"Authorization": f"Bearer {superuser_token}"}
+        )
+        assert response.status_code == 200
+        assert response.json()["updated"] == 3
+        marked = (await db_session.execute(
+            select(DashboardRollupDirty.entity_id).where(DashboardRollupDirty.entity_type == "lead")
+        )).scalars().all()
+        assert sorted(marked) == sorted(lead.id for lead in leads)
+
+    async def test_nothing_queued_when_disabled(
+        self, db_session: AsyncSession, test_user: User, monkeypatch
+    ):
+        """Nothing is queued while rollups are switched off"""
+        monkeypatch.setattr(settings, "DASHBOARD_ROLLUPS_ENABLED", False)
+        db_session.add(Lead(first_name="Off", last_name="Lead", status="new", owner_id=test_user.id))
+        await db_session.commit()
+        assert await rollups.pending_rollup_refreshes(db_session) == 0
@@ -159,12 +159,8 @@ class TestSchedulerConsolidation:
     once per interval."""
 
     def test_scheduler_registers_consolidated_tick_and_gmail_sync(self):
-        from src.core.scheduler import (
-            GMAIL_SYNC_INTERVAL_SECONDS,
-            scheduler,
-            start_scheduler,
-            stop_scheduler,
-        )
+        from src.config import settings
+        from src.core.scheduler import scheduler, start_scheduler, stop_scheduler
 
         was_running = scheduler.running
         if not was_running:
@@ -174,9 +170,11 @@ class TestSchedulerConsolidation:
             # `contract_lifecycle` retired 2026-05-14 with the Contracts module.
             # `marketing_daily` added with the in-CRM Marketing Analytics feature —
             # a dedicated daily cron (NOT folded into the 90-min tick, D1).
-            assert job_ids == {"background_tick", "gmail_sync", "marketing_daily"}, (
-                f"unexpected scheduler jobs: {job_ids}"
-            )
+            # `notification_emails` sends the emails notification dispatchers
+            # queue; it runs on the Gmail sync cadence by default.
+            assert job_ids == {
+                "background_tick", "gmail_sync", "marketing_daily", "notification_emails",
+            }, f"unexpected scheduler jobs: {job_ids}"
 
             tick = scheduler.get_job("background_tick")
             assert tick.trigger.interval.total_seconds() == 90 * 60
@@ -184,10 +182,15 @@ class TestSchedulerConsolidation:
             assert tick.max_instances == 1
 
             gmail = scheduler.get_job("gmail_sync")
-            assert gmail.trigger.interval.total_seconds() == GMAIL_SYNC_INTERVAL_SECONDS
+            assert gmail.trigger.interval.total_seconds() == settings.GMAIL_SYNC_TICK_SECONDS
             assert gmail.coalesce is True
             assert gmail.max_instances == 1
 
+            notif = scheduler.get_job("notification_emails")
+            assert notif.trigger.interval.total_seconds() == settings.NOTIFICATION_EMAIL_FLUSH_SECONDS
+            assert notif.coalesce is True
+            assert notif.max_instances == 1
+
             # Marketing ingest runs on its own daily cron with a misfire grace so a
             # deploy spanning the fire time still runs the day (D1).
             mktg = scheduler.get_job("marketing_daily")
@@ -305,6 +305,64 @@ class TestDedupCheckLeads:
         assert data["has_duplicates"] is False
 
 
+class TestDedupMatchKeys:
+    """Tests for the persisted normalized keys behind duplicate checks."""
+
+    @pytest.mark.asyncio
+    async def test_keys_follow_inserts_and_updates(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        """Test that phone/name keys are written on insert and refreshed on update."""
+        contact = Contact(
+            first_name="  Ada ", last_name="LOVELACE", phone="(555) 010-2000",
+            owner_id=test_user.id, created_by_id=test_user.id,
+        )
+        company = Company(name="Analytical Engines, Inc.", phone="+1 555 010 3000", owner_id=test_user.id)
+        lead = Lead(first_name="Grace", last_name="Hopper", phone="555.010.4000", owner_id=test_user.id)
+        db_session.add_all([contact, company, lead])
+        await db_session.commit()
+
+        assert (contact.phone_normalized, contact.name_normalized) == ("5550102000", "ada lovelace")
+        assert (company.phone_normalized, company.name_normalized) == ("15550103000", "analytical engines")
+        assert lead.phone_normalized == "5550104000"
+
+        contact.phone = None
+        contact.last_name = "Byron"
+        company.name = "Difference Engines LLC"
+        await db_session.commit()
+
+        assert (contact.phone_normalized, contact.name_normalized) == (None, "ada byron")
+        assert company.name_normalized == "difference engines"
+
+    @pytest.mark.asyncio
+    async def test_check_duplicate_lead_phone_any_format(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        test_user: User,
+    ):
+        """Test that lead phone matches ignore formatting and skip non-matching phones."""
+        db_session.add_all([
+            Lead(first_name="Match", last_name="Me", phone="(312) 555-0199", owner_id=test_user.id),
+            Lead(first_name="Other", last_name="Lead", phone="312-555-0100", owner_id=test_user.id),
+        ])
+        await db_session.commit()
+
+        response = await client.post(
+            "/api/dedup/check",
+            headers=auth_headers,
+            json={"entity_type": "leads", "data": {"phone": "312.555.0199"}},
+        )
+
+        assert response.status_code == 200
+        duplicates = response.json()["duplicates"]
+        assert [d["display_name"] for d in duplicates] == ["Match Me"]
+        assert duplicates[0]["match_reason"] == "Phone match"
+
+
 class TestDedupCheckValidation:
     """Tests for dedup endpoint validation."""
 
@@ -1476,6 +1534,93 @@ class TestClustersEndpoint:
         # leads doesn't support name-key (no canonical name normalization)
         assert resp.status_code == 400
 
+    @pytest.mark.asyncio
+    async def test_clusters_paginate_with_cursor(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        manager_auth_headers: dict,
+        test_user: User,
+    ):
+        """Clusters come back biggest-first, one page at a time via next_cursor."""
+        for phone, size in (("3125557001", 2), ("3125557002", 3), ("3125557003", 2)):
+            db_session.add_all([
+                Contact(
+                    first_name=f"Page{i}", last_name=phone, phone=phone,
+                    owner_id=test_user.id, created_by_id=test_user.id,
+                )
+                for i in range(size)
+            ])
+        await db_session.commit()
+
+        seen = []
+        cursor = None
+        for page in range(4):
+            params = {"entity_type": "contacts", "key": "phone", "limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            resp = await client.get("/api/dedup/clusters", params=params, headers=manager_auth_headers)
+            assert resp.status_code == 200
+            body = resp.json()
+            if page == 0:
+                assert body["total_clusters"] == 3
+                assert body["total_redundant"] == 4
+            else:
+                assert body["total_clusters"] is None
+            seen.extend(c["key_value"] for c in body["clusters"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == ["3125557002", "3125557001", "3125557003"]
+
+    @pytest.mark.asyncio
+    async def test_clusters_cache_invalidated_by_merge(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        manager_auth_headers: dict,
+        test_user: User,
+    ):
+        """A merge drops the cached cluster pages so the next read is fresh."""
+        winner = Contact(
+            first_name="Cached", last_name="Winner", phone="3125557100",
+            owner_id=test_user.id, created_by_id=test_user.id,
+        )
+        loser = Contact(
+            first_name="Cached", last_name="Loser", phone="3125557100",
+            owner_id=test_user.id, created_by_id=test_user.id,
+        )
+        db_session.add_all([winner, loser])
+        await db_session.commit()
+        url = "/api/dedup/clusters?entity_type=contacts&key=phone"
+
+        body = (await client.get(url, headers=manager_auth_headers)).json()
+        assert [c["key_value"] for c in body["clusters"]] == ["3125557100"]
+
+        resp = await client.post(
+            "/api/dedup/merge-cluster",
+            headers=manager_auth_headers,
+            json={"entity_type": "contacts", "winner_id": winner.id, "loser_ids": [loser.id]},
+        )
+        assert resp.status_code == 200
+
+        body = (await client.get(url, headers=manager_auth_headers)).json()
+        assert body["clusters"] == []
+        assert body["total_clusters"] == 0
+
+    @pytest.mark.asyncio
+    async def test_clusters_invalid_cursor_returns_400(
+        self,
+        client: AsyncClient,
+        manager_auth_headers: dict,
+    ):
+        resp = await client.get(
+            "/api/dedup/clusters?entity_type=contacts&key=email&cursor=not-a-cursor",
+            headers=manager_auth_headers,
+        )
+        assert resp.status_code == 400
+
 
 class TestMergeCluster:
     """POST /api/dedup/merge-cluster — winner_id + list of loser_ids."""
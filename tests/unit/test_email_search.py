@@ -31,6 +31,7 @@ async def _make_sent_email(
     to_email: str = "dest@example.com",
     entity_type: str | None = None,
     entity_id: int | None = None,
+    sent_at=None,
 ) -> EmailQueue:
     eq = EmailQueue(
         to_email=to_email,
@@ -41,6 +42,7 @@ async def _make_sent_email(
         sent_by_id=user_id,
         entity_type=entity_type,
         entity_id=entity_id,
+        sent_at=sent_at,
     )
     db.add(eq)
     await db.commit()
@@ -317,3 +319,162 @@ class TestEmailSearch:
         items = resp.json()["items"]
         assert len(items) >= 1
         assert "uniqueSnippetWord" in items[0]["snippet"]
+
+
+class TestEmailSearchIndex:
+    @pytest.mark.asyncio
+    async def test_words_match_as_prefixes_in_any_field(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        auth_headers: dict,
+    ):
+        """Every query word must prefix-match some indexed word; order is free."""
+        await _make_sent_email(
+            db_session,
+            user_id=test_user.id,
+            subject="Renewal terms",
+            body="<p>Attached the <b>Quarterly</b> forecast</p>",
+            to_email="buyer@northwind-traders.com",
+        )
+        await _make_sent_email(db_session, user_id=test_user.id, subject="Renewal only")
+
+        resp = await client.get(
+            "/api/email/search",
+            params={"q": "northwind quart REN"},
+            headers=auth_headers,
+        )
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["items"][0]["subject"] == "Renewal terms"
+
+    @pytest.mark.asyncio
+    async def test_punctuation_only_query_returns_nothing(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        auth_headers: dict,
+    ):
+        await _make_sent_email(db_session, user_id=test_user.id, subject="100% done")
+        resp = await client.get("/api/email/search", params={"q": "%"}, headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.json()["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_subject_hits_rank_above_body_hits(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        auth_headers: dict,
+    ):
+        subject_hit = await _make_sent_email(
+            db_session, user_id=test_user.id, subject="Rankprobe pricing", body="x"
+        )
+        await _make_sent_email(
+            db_session, user_id=test_user.id, subject="Other", body="mentions rankprobe"
+        )
+        resp = await client.get(
+            "/api/email/search", params={"q": "rankprobe"}, headers=auth_headers
+        )
+        items = resp.json()["items"]
+        assert [i["id"] for i in items][0] == subject_hit.id
+        assert items[0]["rank"] > items[1]["rank"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_every_match_once(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        auth_headers: dict,
+    ):
+        from datetime import UTC, datetime
+
+        # Three share a timestamp so the (kind, id) tiebreak is exercised.
+        for i in range(7):
+            await _make_sent_email(
+                db_session,
+                user_id=test_user.id,
+                subject=f"Keysetprobe {i}",
+                body="b",
+                sent_at=datetime(2026, 1, 1 + max(i, 2), tzinfo=UTC),
+            )
+
+        seen, cursor, first = [], None, None
+        for _ in range(5):
+            params = {"q": "keysetprobe", "page_size": 3}
+            if cursor:
+                params["cursor"] = cursor
+            data = (await client.get("/api/email/search", params=params, headers=auth_headers)).json()
+            first = first or data
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+            assert data["total"] is None or data is first
+
+        assert first["total"] == 7
+        assert first["total_capped"] is False
+        assert len(seen) == len(set(seen)) == 7
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(self, client: AsyncClient, auth_headers: dict):
+        resp = await client.get(
+            "/api/email/search", params={"q": "x", "cursor": "not-a-cursor"}, headers=auth_headers
+        )
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_highlights_point_at_matches(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        auth_headers: dict,
+    ):
+        await _make_sent_email(
+            db_session,
+            user_id=test_user.id,
+            subject="Hi",
+            body="Let us talk about the Highlightprobe contract &amp; terms",
+        )
+        resp = await client.get(
+            "/api/email/search", params={"q": "highlightprobe"}, headers=auth_headers
+        )
+        item = resp.json()["items"][0]
+        assert "&amp;" not in item["snippet"]
+        assert [item["snippet"][s:e] for s, e in item["highlights"]] == ["Highlightprobe"]
+
+    @pytest.mark.asyncio
+    async def test_edited_subject_is_reindexed(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        auth_headers: dict,
+    ):
+        email = await _make_sent_email(db_session, user_id=test_user.id, subject="Draft title")
+        email.subject = "Reindexprobe title"
+        await db_session.commit()
+
+        resp = await client.get(
+            "/api/email/search", params={"q": "reindexprobe"}, headers=auth_headers
+        )
+        assert [i["id"] for i in resp.json()["items"]] == [email.id]
+
+
+class TestSplitHeadline:
+    def test_markers_become_offsets(self):
+        from src.email.search import split_headline
+
+        snippet, highlights = split_headline("see \ue000Acme\ue001 &amp; \ue000acme\ue001 co")
+        assert snippet == "see Acme & acme co"
+        assert [snippet[s:e] for s, e in highlights] == ["Acme", "acme"]
+
+    def test_empty_headline(self):
+        from src.email.search import split_headline
+
+        assert split_headline(None) == ("", [])
@@ -0,0 +1,224 @@
+"""
+Durable event bus — event_outbox + OutboxDispatcher.
+
+emit() queues durable handlers in the caller's transaction when
+EVENT_BUS_DURABLE is on; the dispatcher delivers them after commit with
+per-handler retries, per-entity ordering and latency/queue metrics.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.config import settings
+from src.events.dispatcher import OutboxDispatcher, queue_depth
+from src.events.models import OUTBOX_DEAD, OUTBOX_DONE, OUTBOX_PENDING, EventOutbox
+from src.events.service import emit, handler_name, off, on
+
+
+class _Recorder:
+    """Durable test handler that can be told to fail its first N calls."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.calls: list[tuple[str, dict]] = []
+        self.failures = failures
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, event_type, payload):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("subscriber down")
+            self.calls.append((event_type, payload))
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def durable_bus(monkeypatch):
+    monkeypatch.setattr(settings, "EVENT_BUS_DURABLE", True)
+
+
+@pytest.fixture
+def recorder():
+    """A durable handler for `test.event`, registered under a unique name."""
+    handler = _Recorder()
+
+    async def durable_test_handler(event_type, payload):
+        await handler(event_type, payload)
+
+    handler.fn = durable_test_handler
+    on("test.event", durable_test_handler, durable=True)
+    yield handler
+    off("test.event", durable_test_handler)
+
+
+@pytest.fixture
+async def outbox_sessions(tmp_path):
+    """A pooled file-backed SQLite DB holding only the outbox table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(EventOutbox.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _queue(sessions, *payloads) -> None:
+    async with sessions() as session:
+        for payload in payloads:
+            await emit("test.event", payload, db=session)
+        await session.commit()
+
+
+async def _rows(sessions) -> list[EventOutbox]:
+    async with sessions() as session:
+        return list((await session.execute(select(EventOutbox).order_by(EventOutbox.id))).scalars())
+
+
+class TestEmitToOutbox:
+    async def test_durable_handlers_are_queued_not_awaited(
+        self, db_session: AsyncSession, durable_bus, recorder
+    ):
+        """Durable handlers get an outbox row; inline handlers still run now"""
+        inline: list = []
+
+        async def inline_handler(event_type, payload):
+            inline.append(payload)
+
+        on("test.event", inline_handler)
+        try:
+            await emit("test.event", {"entity_type": "lead", "entity_id": 7}, db=db_session)
+        finally:
+            off("test.event", inline_handler)
+        await db_session.commit()
+
+        rows = (await db_session.execute(select(EventOutbox))).scalars().all()
+        assert inline == [{"entity_type": "lead", "entity_id": 7}]
+        assert recorder.calls == []
+        assert [(r.handler, r.ordering_key, r.status) for r in rows] == [
+            (handler_name(recorder.fn), "lead:7", OUTBOX_PENDING),
+        ]
+
+    async def test_rollback_discards_queued_events(
+        self, db_session: AsyncSession, durable_bus, recorder
+    ):
+        """Outbox rows share the request transaction"""
+        await emit("test.event", {"entity_type": "lead", "entity_id": 1}, db=db_session)
+        await db_session.rollback()
+        assert (await db_session.execute(select(EventOutbox))).scalars().all() == []
+
+    @pytest.mark.parametrize("with_session", [False, True])
+    async def test_runs_inline_without_session_or_flag(
+        self, db_session: AsyncSession, recorder, monkeypatch, with_session: bool
+    ):
+        """No session, or the flag off, keeps the old inline behaviour"""
+        monkeypatch.setattr(settings, "EVENT_BUS_DURABLE", not with_session)
+        await emit("test.event", {"entity_id": 3}, db=db_session if with_session else None)
+        assert recorder.calls == [("test.event", {"entity_id": 3})]
+        assert (await db_session.execute(select(EventOutbox))).scalars().all() == []
+
+
+class TestOutboxDispatcher:
+    async def test_delivers_and_marks_done(self, outbox_sessions, durable_bus, recorder):
+        """Committed rows are delivered once and marked done"""
+        await _queue(outbox_sessions, {"entity_type": "lead", "entity_id": 1, "n": 1})
+        dispatcher = OutboxDispatcher(outbox_sessions)
+        assert await dispatcher.drain() == 1
+        assert await dispatcher.drain() == 0
+        assert recorder.calls == [("test.event", {"entity_type": "lead", "entity_id": 1, "n": 1})]
+        [row] = await _rows(outbox_sessions)
+        assert (row.status, row.attempts, row.locked_until) == (OUTBOX_DONE, 1, None)
+
+    async def test_failure_backs_off_then_retries(self, outbox_sessions, durable_bus, recorder):
+        """A failing handler is rescheduled with backoff and retried later"""
+        recorder.failures = 1
+        await _queue(outbox_sessions, {"entity_type": "lead", "entity_id": 1})
+        dispatcher = OutboxDispatcher(outbox_sessions, base_backoff=60)
+        await dispatcher.drain()
+        [row] = await _rows(outbox_sessions)
+        assert (row.status, row.attempts) == (OUTBOX_PENDING, 1)
+        assert "subscriber down" in row.last_error
+        assert await dispatcher.drain() == 0  # still backing off
+
+        async with outbox_sessions() as session:
+            await session.execute(update(EventOutbox).values(next_attempt_at=datetime.now(UTC)))
+            await session.commit()
+        assert await dispatcher.drain() == 1
+        [row] = await _rows(outbox_sessions)
+        assert (row.status, row.attempts) == (OUTBOX_DONE, 2)
+        assert dispatcher.stats()["handlers"][row.handler]["failed"] == 1
+
+    async def test_gives_up_after_max_attempts(self, outbox_sessions, durable_bus, recorder):
+        """Rows that keep failing are parked as dead"""
+        recorder.failures = 5
+        await _queue(outbox_sessions, {"entity_id": 1})
+        dispatcher = OutboxDispatcher(outbox_sessions, max_attempts=2, base_backoff=0)
+        await dispatcher.drain()
+        await dispatcher.drain()
+        [row] = await _rows(outbox_sessions)
+        assert (row.status, row.attempts) == (OUTBOX_DEAD, 2)
+        async with outbox_sessions() as session:
+            depth = await queue_depth(session)
+        assert depth[row.handler]["dead"] == 1
+
+    async def test_per_entity_order_survives_retries(self, outbox_sessions, durable_bus, recorder):
+        """A later event for the same entity waits for the earlier one"""
+        recorder.failures = 1
+        await _queue(
+            outbox_sessions,
+            {"entity_type": "lead", "entity_id": 1, "seq": 1},
+            {"entity_type": "lead", "entity_id": 1, "seq": 2},
+            {"entity_type": "lead", "entity_id": 2, "seq": 3},
+        )
+        dispatcher = OutboxDispatcher(outbox_sessions, base_backoff=60)
+        await dispatcher.drain()
+        assert [p["seq"] for _, p in recorder.calls] == [3]
+
+        async with outbox_sessions() as session:
+            await session.execute(update(EventOutbox).values(next_attempt_at=datetime.now(UTC)))
+            await session.commit()
+        await dispatcher.drain()
+        assert [p["seq"] for _, p in recorder.calls] == [3, 1, 2]
+
+    async def test_independent_entities_run_concurrently(self, outbox_sessions, durable_bus, recorder):
+        """Events for different entities are delivered in parallel, bounded by workers"""
+        recorder.delay = 0.05
+        await _queue(outbox_sessions, *[{"entity_type": "lead", "entity_id": i} for i in range(6)])
+        await OutboxDispatcher(outbox_sessions, workers=3).drain()
+        assert len(recorder.calls) == 6
+        assert recorder.peak == 3
+
+    async def test_expired_lease_is_reclaimed(self, outbox_sessions, durable_bus, recorder):
+        """Rows held by a crashed worker are picked up once the lease lapses"""
+        await _queue(outbox_sessions, {"entity_id": 1})
+        dispatcher = OutboxDispatcher(outbox_sessions)
+        assert len(await dispatcher._claim(10)) == 1
+        assert await dispatcher._claim(10) == []
+        async with outbox_sessions() as session:
+            await session.execute(
+                update(EventOutbox).values(locked_until=datetime.now(UTC) - timedelta(seconds=1))
+            )
+            await session.commit()
+        assert await dispatcher.drain() == 1
+
+    async def test_background_loop_drains_on_wake(self, outbox_sessions, durable_bus, recorder):
+        """The running dispatcher delivers new rows without waiting a full poll"""
+        dispatcher = OutboxDispatcher(outbox_sessions, poll_interval=30)
+        dispatcher.start()
+        try:
+            await _queue(outbox_sessions, {"entity_id": 1})
+            dispatcher.wake()
+            for _ in range(50):
+                if recorder.calls:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await dispatcher.stop()
+        assert len(recorder.calls) == 1
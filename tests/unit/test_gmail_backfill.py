@@ -10,8 +10,11 @@ Covers:
 - Idempotency: re-run after a prior backfill doesn't duplicate rows
 - Thread-stitching: backfilled message inherits entity link from prior forward-sync row
 - 401/400 from refresh token converts to GmailAuthError + connection.revoked_at flips
+- Pipeline against a fake Gmail API: bounded concurrent fetches, stored ids
+  never re-fetched, resume from the saved page token after a failure
 """
 
+import asyncio
 import base64
 import os
 import sys
@@ -32,7 +35,7 @@ from src.contacts.models import Contact
 from src.database import Base
 from src.email.models import EmailQueue, InboundEmail
 from src.integrations.gmail.models import GmailBackfillState, GmailConnection
-from src.integrations.gmail.sync import GmailSyncWorker
+from src.integrations.gmail.sync import GMAIL_FETCH_CONCURRENCY, GmailSyncWorker
 
 # ---------------------------------------------------------------------------
 # In-memory DB fixtures
@@ -154,6 +157,55 @@ def _make_http_client(routes: dict[str, dict | tuple]) -> httpx.AsyncClient:
     return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
 
+class _FakeGmail:
+    """Local stand-in for messages.list / messages.get.
+
+    Serves ``message_ids`` newest-first in pages of ``page_size`` (page
+    tokens are the next offset), records every list and get call, tracks
+    how many gets overlap, and can fail the listing of chosen offsets.
+    """
+
+    def __init__(self, message_ids: list[str], sender: str, to: str, page_size: int = 10):
+        self.message_ids = message_ids
+        self.sender = sender
+        self.to = to
+        self.page_size = page_size
+        self.fail_offsets: set[int] = set()
+        self.list_tokens: list[str | None] = []
+        self.fetched: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/users/me/messages"):
+            token = request.url.params.get("pageToken")
+            self.list_tokens.append(token)
+            offset = int(token or 0)
+            if offset in self.fail_offsets:
+                self.fail_offsets.discard(offset)
+                return httpx.Response(503, json={"error": "backend error"})
+            page = self.message_ids[offset:offset + self.page_size]
+            body: dict = {
+                "messages": [{"id": msg_id} for msg_id in page],
+                "resultSizeEstimate": len(self.message_ids),
+            }
+            if offset + self.page_size < len(self.message_ids):
+                body["nextPageToken"] = str(offset + self.page_size)
+            return httpx.Response(200, json=body)
+        msg_id = path.rsplit("/", 1)[-1]
+        if msg_id not in self.message_ids:
+            return httpx.Response(404, json={"error": "not found"})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+        finally:
+            self.in_flight -= 1
+        self.fetched.append(msg_id)
+        return httpx.Response(200, json=_gmail_message(msg_id, f"t-{msg_id}", self.sender, self.to))
+
+
 def _patch_gmail_client(http: httpx.AsyncClient):
     """Context manager that injects a pre-built httpx client into GmailClient."""
     from src.integrations.gmail.client import GmailClient as _GC
@@ -332,6 +384,67 @@ class TestBackfillIdempotency:
         assert len(ib_rows) == 0, "Row already in EmailQueue must not be duplicated to InboundEmail"
 
 
+# ---------------------------------------------------------------------------
+# Tests: staged pipeline against a fake Gmail API
+# ---------------------------------------------------------------------------
+
+class TestBackfillPipeline:
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_and_skips_stored_ids(self, connection, db, test_user):
+        db.add(Contact(email="bulk@client.com", first_name="B", last_name="Ulk", owner_id=test_user.id))
+        await db.commit()
+        fake = _FakeGmail([f"pipe{i:03d}" for i in range(45)], "bulk@client.com", connection.email)
+
+        with _patch_gmail_client(httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))):
+            await GmailSyncWorker.backfill(connection, db, days=30)
+
+        assert len((await db.execute(select(InboundEmail))).scalars().all()) == 45
+        assert fake.list_tokens == [None, "10", "20", "30", "40"]
+        assert 1 < fake.max_in_flight <= GMAIL_FETCH_CONCURRENCY
+        state = (await db.execute(
+            select(GmailBackfillState).where(GmailBackfillState.user_id == connection.user_id)
+        )).scalar_one()
+        assert (state.status, state.processed_count, state.total_count) == ("complete", 45, 45)
+        assert state.page_token is None
+
+        # A second run finds every id already stored and fetches nothing.
+        fake.fetched.clear()
+        with _patch_gmail_client(httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))):
+            await GmailSyncWorker.backfill(connection, db, days=30)
+        assert fake.fetched == []
+        assert len((await db.execute(select(InboundEmail))).scalars().all()) == 45
+
+    @pytest.mark.asyncio
+    async def test_failed_run_resumes_from_saved_page(self, connection, db, test_user):
+        db.add(Contact(email="resume@client.com", first_name="R", last_name="Esume", owner_id=test_user.id))
+        await db.commit()
+        fake = _FakeGmail([f"res{i:03d}" for i in range(25)], "resume@client.com", connection.email)
+        fake.fail_offsets = {20}
+
+        with (
+            _patch_gmail_client(httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await GmailSyncWorker.backfill(connection, db, days=30)
+
+        state = (await db.execute(
+            select(GmailBackfillState).where(GmailBackfillState.user_id == connection.user_id)
+        )).scalar_one()
+        assert (state.status, state.processed_count, state.page_token) == ("failed", 20, "20")
+        assert len((await db.execute(select(InboundEmail))).scalars().all()) == 20
+
+        fake.list_tokens.clear()
+        fake.fetched.clear()
+        with _patch_gmail_client(httpx.AsyncClient(transport=httpx.MockTransport(fake.handler))):
+            await GmailSyncWorker.backfill(connection, db, days=30)
+
+        assert fake.list_tokens == ["20"]
+        assert sorted(fake.fetched) == [f"res{i:03d}" for i in range(20, 25)]
+        await db.refresh(state)
+        assert (state.status, state.processed_count, state.page_token) == ("complete", 25, None)
+        assert len((await db.execute(select(InboundEmail))).scalars().all()) == 25
+
+
 # ---------------------------------------------------------------------------
 # Tests: thread-stitching
 # ---------------------------------------------------------------------------
@@ -2,17 +2,21 @@
 Unit tests for GmailClient using httpx.MockTransport.
 
 Covers: send_message b64 encoding, list_history_since pagination,
-get_message header extraction, _refresh_if_needed on expired token.
+get_message header extraction, inline-image storage, _refresh_if_needed
+on expired token.
 """
 
 import base64
+import hashlib
 import json
+import time
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.integrations.gmail import inline_images
 from src.integrations.gmail.client import (
     GmailAuthError,
     GmailClient,
@@ -23,6 +27,20 @@ from src.integrations.gmail.client import (
 )
 from src.integrations.gmail.models import GmailConnection
 
+
+@pytest.fixture(autouse=True)
+def inline_image_dir(tmp_path, monkeypatch):
+    """Store inline images on local disk under tmp_path."""
+    monkeypatch.setattr(inline_images, "_use_object_storage", lambda: False)
+    monkeypatch.setattr(inline_images, "INLINE_IMAGE_DIR", tmp_path)
+    monkeypatch.setattr(inline_images, "_stored", set())
+    return tmp_path
+
+
+def _image_url(content: bytes, ext: str = "png") -> str:
+    digest = hashlib.sha256(content).hexdigest()
+    return f"{inline_images.INLINE_IMAGE_URL_PREFIX}{digest}.{ext}"
+
 # ---------------------------------------------------------------------------
 # Fake GmailConnection builder
 # ---------------------------------------------------------------------------
@@ -287,9 +305,9 @@ class TestGetMessage:
     @pytest.mark.asyncio
     async def test_inline_cid_image_substituted_into_body_html(self):
         """An <img src="cid:..."> in body_html with a matching inline image
-        part should be rewritten to a data: URI so the browser can render
-        it. This is the regression for Giancarlo's "image shows as link
-        instead of rendering" complaint.
+        part should be rewritten to the stored image's URL so the browser
+        can render it. This is the regression for Giancarlo's "image shows
+        as link instead of rendering" complaint.
         """
         import base64
         png_bytes = (
@@ -333,7 +351,10 @@ class TestGetMessage:
 
         assert msg["body_html"] is not None
         assert "cid:logo123" not in msg["body_html"]
-        assert "data:image/png;base64," in msg["body_html"]
+        assert f'src="{_image_url(png_bytes)}"' in msg["body_html"]
+        assert "base64" not in msg["body_html"]
+        name = _image_url(png_bytes).rsplit("/", 1)[1]
+        assert inline_images.inline_image_path(name).read_bytes() == png_bytes
         # Attachment metadata is preserved + flagged inline.
         items = (msg.get("attachments") or [])
         assert any(a["filename"] == "logo.png" and a["is_inline"] for a in items)
@@ -381,6 +402,7 @@ class TestGetMessage:
         msg = await client.get_message("m1")
         assert "cid:huge" in (msg["body_html"] or "")
         assert "data:image/jpeg" not in (msg["body_html"] or "")
+        assert inline_images.INLINE_IMAGE_URL_PREFIX not in (msg["body_html"] or "")
 
     @pytest.mark.asyncio
     async def test_inline_cid_image_substituted_when_src_is_unquoted(self):
@@ -431,7 +453,7 @@ class TestGetMessage:
         msg = await client.get_message("m1")
 
         assert "cid:logo123" not in msg["body_html"]
-        assert "data:image/png;base64," in msg["body_html"]
+        assert f'src="{_image_url(png_bytes)}"' in msg["body_html"]
 
     @pytest.mark.asyncio
     async def test_inline_cid_duplicate_last_wins(self):
@@ -450,7 +472,7 @@ class TestGetMessage:
         )
         # Different but valid PNG bytes for the second part.
         blue_png = red_png + b"\x00"  # any byte difference is enough; the test
-        # only cares that the resulting data: URI is the LATER one.
+        # only cares that the resulting image URL is the LATER one.
         html = b'<img src="cid:dup">'
         payload = {
             "id": "m1",
@@ -492,10 +514,9 @@ class TestGetMessage:
         client, _ = _make_client(_make_conn(), payload)
         msg = await client.get_message("m1")
 
-        assert "data:image/png;base64," in msg["body_html"]
-        # Last-wins: the substituted URI corresponds to blue_png.
-        expected_b64 = base64.b64encode(blue_png).decode("ascii")
-        assert expected_b64 in msg["body_html"]
+        # Last-wins: the substituted URL is blue_png's digest.
+        assert _image_url(blue_png) in msg["body_html"]
+        assert _image_url(red_png) not in msg["body_html"]
 
     def test_inline_cid_decode_failure_logs_with_message_id(
         self, caplog, monkeypatch,
@@ -514,7 +535,7 @@ class TestGetMessage:
         import logging
 
         import src.integrations.gmail.client as client_mod
-        from src.integrations.gmail.client import _inline_cid_images
+        from src.integrations.gmail.client import _inline_image_payloads
 
         def _raise(_data: bytes) -> bytes:
             raise ValueError("forced decode failure")
@@ -531,18 +552,16 @@ class TestGetMessage:
                 "attachment_id": None,
             },
         ]
-        html = '<p><img src="cid:logo" alt="x"></p>'
 
         with caplog.at_level(
             logging.WARNING, logger="src.integrations.gmail.client",
         ):
-            out = _inline_cid_images(
-                html, attachments, gmail_msg_id="msg-correlation-id-7",
+            payloads = _inline_image_payloads(
+                attachments, gmail_msg_id="msg-correlation-id-7",
             )
 
-        # Substitution didn't happen — the broken cid: stayed.
-        assert "cid:logo" in out
-        assert "data:image/png;base64," not in out
+        # Nothing to substitute — the broken cid: stays in the HTML.
+        assert payloads == {}
 
         # And the warning carries gmail_msg_id for correlation.
         decode_warnings = [
@@ -905,7 +924,7 @@ class TestHydrateInlineAttachments:
         """Gmail's declared body.size is advisory. If a fetch returns
         actual bytes that exceed the 2.5MB cap, the part is dropped
         and a WARN log fires with declared vs. actual bytes — without
-        the re-check, _inline_cid_images silently drops the substitution
+        the re-check, _inline_image_payloads silently drops the image
         downstream and the operator sees a "broken logo" report with
         no log trail.
         """
@@ -990,7 +1009,7 @@ class TestGetMessageHydration:
     async def test_get_message_substitutes_cid_after_hydration(self):
         """End-to-end: a message with cid: ref + image part that only has
         attachment_id (no inline data) should trigger get_attachment, and
-        the returned data should be substituted into body_html as a data: URI.
+        the returned data should be stored and referenced from body_html.
         """
         import base64
 
@@ -1053,4 +1072,136 @@ class TestGetMessageHydration:
 
         assert msg["body_html"] is not None
         assert "cid:fetched-logo" not in msg["body_html"]
-        assert "data:image/png;base64," in msg["body_html"]
+        assert _image_url(png_bytes) in msg["body_html"]
+
+
+# ---------------------------------------------------------------------------
+# Inline image storage
+# ---------------------------------------------------------------------------
+
+_LOGO_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+    b"\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\rIDATx\x9cc\xf8\xff\xff?\x00\x05\xfe\x02\xfe\xa6"
+    b"\xa3\x10\x84\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+def _inline_attachment(content: bytes, mime_type: str = "image/png", cid: str = "logo") -> dict:
+    return {
+        "cid": cid,
+        "mime_type": mime_type,
+        "data": base64.urlsafe_b64encode(content).decode().rstrip("="),
+        "size": len(content),
+        "filename": "logo",
+        "attachment_id": None,
+    }
+
+
+class TestInlineImageStorage:
+    @pytest.mark.asyncio
+    async def test_repeated_image_is_stored_once(self, inline_image_dir):
+        """A signature logo on many emails is one object, written once."""
+        from src.integrations.gmail.client import _embed_inline_images
+
+        html = '<img src="cid:logo">'
+        with patch.object(
+            inline_images.Path, "write_bytes", autospec=True,
+            side_effect=inline_images.Path.write_bytes,
+        ) as write:
+            first = await _embed_inline_images(html, [_inline_attachment(_LOGO_PNG)])
+            inline_images._stored.clear()
+            second = await _embed_inline_images(html, [_inline_attachment(_LOGO_PNG)])
+
+        assert first == second == f'<img src="{_image_url(_LOGO_PNG)}">'
+        assert write.call_count == 1
+        assert len(list(inline_image_dir.rglob("*.png"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_unstorable_type_keeps_data_uri(self):
+        """Only raster types the route renders inline are stored."""
+        from src.integrations.gmail.client import _embed_inline_images
+
+        out = await _embed_inline_images(
+            '<img src="cid:logo">', [_inline_attachment(b"BM\x00\x00", "image/bmp")],
+        )
+        assert out.startswith('<img src="data:image/bmp;base64,')
+
+    def test_object_storage_upload_is_privately_cacheable(self, monkeypatch):
+        client = MagicMock()
+        monkeypatch.setattr(inline_images, "_use_object_storage", lambda: True)
+        monkeypatch.setattr(inline_images, "_get_r2_client", lambda: client)
+        monkeypatch.setattr(inline_images, "_get_bucket_name", lambda: "bucket")
+        monkeypatch.setattr(inline_images, "_object_stored", lambda _client, _key: False)
+
+        inline_images.store_inline_image_sync(_LOGO_PNG, "image/png")
+
+        kwargs = client.put_object.call_args.kwargs
+        assert kwargs["CacheControl"] == "private, max-age=31536000, immutable"
+        assert kwargs["ContentType"] == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_falls_back_to_data_uri(self, monkeypatch):
+        from src.integrations.gmail.client import _embed_inline_images
+
+        def _fail(*_args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(inline_images, "store_inline_image_sync", _fail)
+        out = await _embed_inline_images(
+            '<img src="cid:logo">', [_inline_attachment(_LOGO_PNG)],
+        )
+        assert out.startswith('<img src="data:image/png;base64,')
+
+    @staticmethod
+    def _signed(name: str, **kwargs) -> dict:
+        url = inline_images.signed_inline_image_url(name, **kwargs)
+        query = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+        return {"expires": int(query["expires"]), "sig": query["sig"]}
+
+    @pytest.mark.asyncio
+    async def test_route_serves_stored_image(self):
+        from fastapi import HTTPException
+        from src.integrations.gmail.router import gmail_inline_image
+
+        name = inline_images.store_inline_image_sync(_LOGO_PNG, "image/png").rsplit("/", 1)[1]
+        response = await gmail_inline_image(name, **self._signed(name))
+        assert response.media_type == "image/png"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        max_age = int(response.headers["Cache-Control"].split("max-age=")[1].split(",")[0])
+        assert 0 < max_age <= 2 * inline_images.INLINE_IMAGE_URL_TTL_SECONDS
+
+        for bad in ("0" * 64 + ".svg", "../secret.png", name.replace(".png", ".jpg")):
+            with pytest.raises(HTTPException) as exc:
+                await gmail_inline_image(bad, **self._signed(bad))
+            assert exc.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_route_rejects_unsigned_forged_and_expired_urls(self):
+        from fastapi import HTTPException
+        from src.integrations.gmail.router import gmail_inline_image
+
+        name = inline_images.store_inline_image_sync(_LOGO_PNG, "image/png").rsplit("/", 1)[1]
+        other = "0" * 64 + ".png"
+        for params in (
+            {},
+            {**self._signed(name), "sig": self._signed(other)["sig"]},
+            self._signed(name, now=time.time() - 3 * inline_images.INLINE_IMAGE_URL_TTL_SECONDS),
+        ):
+            with pytest.raises(HTTPException) as exc:
+                await gmail_inline_image(name, **params)
+            assert exc.value.status_code == 403
+
+    def test_email_responses_sign_stored_image_urls(self):
+        from src.email.schemas import InboundEmailResponse
+
+        url = _image_url(_LOGO_PNG)
+        row = InboundEmailResponse(
+            id=1, resend_email_id="r", from_email="a@example.com", to_email="b@example.com",
+            subject="Hi", body_html=f'<img src="{url}"><img src="data:image/bmp;base64,Qk0=">',
+            received_at=datetime.now(UTC), created_at=datetime.now(UTC),
+        )
+        assert f'<img src="{url}?expires=' in row.body_html
+        assert row.body_html.count("sig=") == 1
+        # Re-validating a response never signs twice.
+        assert InboundEmailResponse(**row.model_dump()).body_html == row.body_html
@@ -29,10 +29,20 @@ from src.auth.security import get_password_hash
 from src.contacts.models import Contact
 from src.database import Base, get_db
 from src.email.models import EmailQueue, InboundEmail
+from src.integrations.gmail import inline_images
 from src.integrations.gmail.router import router as gmail_router
 
 TEST_DB_URL = "sqlite+aiosqlite:///:memory:"
 
+
+@pytest.fixture(autouse=True)
+def inline_image_dir(tmp_path, monkeypatch):
+    """Store rehydrated inline images on local disk under tmp_path."""
+    monkeypatch.setattr(inline_images, "_use_object_storage", lambda: False)
+    monkeypatch.setattr(inline_images, "INLINE_IMAGE_DIR", tmp_path)
+    monkeypatch.setattr(inline_images, "_stored", set())
+    return tmp_path
+
 # ---------------------------------------------------------------------------
 # DB fixtures
 # ---------------------------------------------------------------------------
@@ -461,8 +471,8 @@ def _make_gmail_message_with_unhydrated_attachment(msg_id: str, conn_email: str)
     attachmentId set (no body.data) — simulating the pre-hydration state.
 
     The HTML body references the image via a cid: src.  After impl-worker's
-    _hydrate_inline_attachments fetches the attachment data and _inline_cid_images
-    runs, the src will become a data: URI.
+    _hydrate_inline_attachments fetches the attachment data and get_message
+    stores it, the src will become the stored image's URL.
     """
     html_b64 = base64.urlsafe_b64encode(
         b'<img src="cid:logo@example.com">'
@@ -566,7 +576,7 @@ class TestRehydrateInlineImages:
           - messages.attachments.get → {"data": "<base64url PNG>"}
 
         After the endpoint runs, body_html must no longer contain "cid:" and
-        must instead embed the image as a data:image/png;base64, URI.
+        must instead reference the stored image by URL.
         """
         from src.integrations.gmail.models import GmailConnection
 
@@ -622,9 +632,10 @@ class TestRehydrateInlineImages:
         assert "cid:" not in (row.body_html or ""), (
             "body_html still contains a cid: reference after rehydration"
         )
-        assert "data:image/png;base64," in (row.body_html or ""), (
-            "body_html does not contain the expected data: URI after rehydration"
+        assert inline_images.INLINE_IMAGE_URL_PREFIX in (row.body_html or ""), (
+            "body_html does not reference the stored image after rehydration"
         )
+        assert "base64" not in (row.body_html or "")
 
     @pytest.mark.asyncio
     async def test_rehydrate_dry_run_does_not_write(
@@ -1131,7 +1131,7 @@ class TestSyncMultiRecipient:
 
 class TestSyncTokenRevocation:
     @pytest.mark.asyncio
-    async def test_auth_error_from_process_message_revokes_connection(self, connection, db):
+    async def test_auth_error_while_fetching_revokes_connection(self, connection, db):
         """A GmailAuthError raised while processing a single message must
         propagate to the outer handler and flip ``connection.revoked_at``.
         Regression: the inner ``except Exception`` previously swallowed
@@ -1164,7 +1164,7 @@ class TestSyncTokenRevocation:
         with (
             patch("src.integrations.gmail.client.httpx.AsyncClient", return_value=http),
             patch.object(GmailClient, "__init__", patched_init),
-            patch("src.integrations.gmail.sync._process_message", side_effect=_raise_auth),
+            patch.object(GmailClient, "get_message", side_effect=_raise_auth),
             pytest.raises(GmailAuthError),
         ):
             await GmailSyncWorker.sync_account(connection, db)
@@ -0,0 +1,258 @@
+"""
+Unit tests for per-account Gmail sync scheduling.
+
+Covers:
+- adaptive cadence: new mail resets the interval, idle polls back off,
+  failures back off further
+- claim_due_connections only returns due, non-revoked accounts and leases them
+- GmailSyncScheduler.tick claims no more accounts than it has free slots
+- sync_lag reports per-account lag
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend"))
+
+from src.auth.models import User
+from src.config import settings
+from src.database import Base
+from src.integrations.gmail.models import GmailConnection, GmailSyncState
+from src.integrations.gmail.scheduler import (
+    GmailSyncScheduler,
+    claim_due_connections,
+    sync_lag,
+)
+from src.integrations.gmail.sync import GmailSyncWorker, _schedule_next
+
+TEST_DB_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def engine():
+    eng = create_async_engine(
+        TEST_DB_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield eng
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await eng.dispose()
+
+
+@pytest_asyncio.fixture
+async def maker(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture
+async def db(maker) -> AsyncSession:
+    async with maker() as session:
+        yield session
+        await session.rollback()
+
+
+async def _connect(db: AsyncSession, n: int, *, revoked: bool = False) -> GmailConnection:
+    user = User(
+        email=f"sched{n}@example.com",
+        hashed_password="x",
+        full_name=f"Sched {n}",
+        is_active=True,
+    )
+    db.add(user)
+    await db.flush()
+    conn = GmailConnection(
+        user_id=user.id,
+        email=user.email,
+        access_token="tok",
+        refresh_token="rtok",
+        token_expiry=datetime.now(UTC) + timedelta(hours=1),
+        scopes="https://mail.google.com/",
+        revoked_at=datetime.now(UTC) if revoked else None,
+    )
+    db.add(conn)
+    await db.commit()
+    return conn
+
+
+class TestAdaptiveCadence:
+    def test_new_mail_resets_interval_to_minimum(self):
+        state = GmailSyncState(user_id=1, failure_count=0, sync_interval_seconds=120)
+        _schedule_next(state, time.perf_counter(), new_messages=3)
+
+        assert state.sync_interval_seconds == settings.GMAIL_SYNC_MIN_INTERVAL_SECONDS
+        assert state.last_activity_at is not None
+        assert state.last_sync_duration_ms is not None
+        wait = (state.next_sync_at - datetime.now(UTC)).total_seconds()
+        assert wait == pytest.approx(settings.GMAIL_SYNC_MIN_INTERVAL_SECONDS, abs=2)
+
+    def test_idle_polls_double_up_to_maximum(self):
+        state = GmailSyncState(user_id=1, failure_count=0)
+        intervals = []
+        for _ in range(5):
+            _schedule_next(state, time.perf_counter())
+            intervals.append(state.sync_interval_seconds)
+
+        low = settings.GMAIL_SYNC_MIN_INTERVAL_SECONDS
+        assert intervals[0] == min(low * 2, settings.GMAIL_SYNC_MAX_INTERVAL_SECONDS)
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == settings.GMAIL_SYNC_MAX_INTERVAL_SECONDS
+        assert state.last_activity_at is None
+
+    def test_failures_back_off_past_idle_maximum(self):
+        state = GmailSyncState(user_id=1, failure_count=1)
+        _schedule_next(state, time.perf_counter(), failed=True)
+        assert state.sync_interval_seconds == settings.GMAIL_SYNC_MAX_INTERVAL_SECONDS
+
+        state.failure_count = 30
+        _schedule_next(state, time.perf_counter(), failed=True)
+        assert state.sync_interval_seconds == settings.GMAIL_SYNC_FAILURE_MAX_SECONDS
+
+
+class TestClaimDueConnections:
+    @pytest.mark.asyncio
+    async def test_claims_due_and_unsynced_accounts_once(self, db):
+        now = datetime.now(UTC)
+        due = await _connect(db, 1)
+        later = await _connect(db, 2)
+        fresh = await _connect(db, 3)
+        await _connect(db, 4, revoked=True)
+        db.add_all([
+            GmailSyncState(user_id=due.user_id, failure_count=0,
+                           next_sync_at=now - timedelta(seconds=5)),
+            GmailSyncState(user_id=later.user_id, failure_count=0,
+                           next_sync_at=now + timedelta(minutes=1)),
+        ])
+        await db.commit()
+
+        claimed = await claim_due_connections(db, now)
+        assert {c.user_id for c in claimed} == {due.user_id, fresh.user_id}
+
+        # The due account is leased: a second claim (another process) skips it.
+        again = await claim_due_connections(db, now)
+        assert {c.user_id for c in again} == {fresh.user_id}
+
+        state = (await db.execute(
+            select(GmailSyncState).where(GmailSyncState.user_id == due.user_id)
+        )).scalar_one()
+        await db.refresh(state)
+        assert state.next_sync_at.replace(tzinfo=UTC) > now
+
+
+async def _connect_due(db: AsyncSession, count: int) -> list[GmailConnection]:
+    """``count`` connections whose sync-state rows are all due now."""
+    connections = [await _connect(db, n) for n in range(count)]
+    db.add_all([
+        GmailSyncState(
+            user_id=conn.user_id,
+            failure_count=0,
+            next_sync_at=datetime.now(UTC) - timedelta(seconds=n + 1),
+        )
+        for n, conn in enumerate(connections)
+    ])
+    await db.commit()
+    return connections
+
+
+class TestSchedulerTick:
+    @pytest.mark.asyncio
+    async def test_tick_claims_only_free_slots(self, db, maker):
+        await _connect_due(db, 6)
+
+        running = 0
+        peak = 0
+        synced: list[int] = []
+        release = asyncio.Event()
+
+        async def _fake_sync(connection, _db):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            synced.append(connection.user_id)
+            return 0
+
+        gmail_scheduler = GmailSyncScheduler(maker, concurrency=2)
+        with patch.object(GmailSyncWorker, "sync_account", side_effect=_fake_sync):
+            assert await gmail_scheduler.tick() == 2
+            # Both slots busy: nothing more is claimed, so the other four
+            # accounts stay due rather than leased behind the semaphore.
+            assert await gmail_scheduler.tick() == 0
+            leased = (await db.execute(
+                select(GmailSyncState.user_id)
+                .where(GmailSyncState.next_sync_at > datetime.now(UTC))
+            )).scalars().all()
+            assert len(leased) == 2
+
+            for _ in range(2):
+                release.set()
+                await gmail_scheduler.wait_idle()
+                release.clear()
+                assert await gmail_scheduler.tick() == 2
+            release.set()
+            await gmail_scheduler.wait_idle()
+
+        assert len(synced) == 6
+        assert peak == 2
+        assert gmail_scheduler.stats() == {
+            "concurrency": 2, "in_flight": 0, "started": 6, "failed": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failing_account_does_not_stop_others(self, db, maker):
+        await _connect_due(db, 3)
+        synced: list[int] = []
+
+        async def _fake_sync(connection, _db):
+            if not synced:
+                synced.append(-1)
+                raise RuntimeError("boom")
+            synced.append(connection.user_id)
+            return 0
+
+        gmail_scheduler = GmailSyncScheduler(maker, concurrency=1)
+        with patch.object(GmailSyncWorker, "sync_account", side_effect=_fake_sync):
+            for _ in range(3):
+                await gmail_scheduler.tick()
+                await gmail_scheduler.wait_idle()
+
+        assert len(synced) == 3
+        assert gmail_scheduler.stats()["failed"] == 1
+
+
+class TestSyncLag:
+    @pytest.mark.asyncio
+    async def test_reports_lag_per_account(self, db):
+        now = datetime.now(UTC)
+        synced = await _connect(db, 1)
+        never = await _connect(db, 2)
+        db.add(GmailSyncState(
+            user_id=synced.user_id,
+            failure_count=0,
+            last_synced_at=now - timedelta(seconds=90),
+            next_sync_at=now - timedelta(seconds=30),
+            sync_interval_seconds=60,
+        ))
+        await db.commit()
+
+        accounts = {a["user_id"]: a for a in await sync_lag(db, now)}
+        assert accounts[synced.user_id]["lag_seconds"] == pytest.approx(90, abs=1)
+        assert accounts[synced.user_id]["overdue_seconds"] == pytest.approx(30, abs=1)
+        assert accounts[synced.user_id]["interval_seconds"] == 60
+        assert accounts[never.user_id]["lag_seconds"] is None
+        assert accounts[never.user_id]["failure_count"] == 0
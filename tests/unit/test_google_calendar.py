@@ -6,15 +6,23 @@ Validates:
 - Disconnect endpoint
 - Sync endpoint
 - Push endpoint
+- Incremental sync (sync tokens, batched upserts)
 - Authentication requirements (401 without token)
 - Request validation (422 on bad input)
 - No mocking — uses real DB operations via in-memory SQLite
 """
 
+from datetime import UTC, datetime, timedelta
+
+import httpx
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import select
+from src.activities.models import Activity
 from src.auth.models import User
 from src.auth.security import create_access_token
+from src.integrations.google_calendar.models import CalendarSyncEvent
 
 
 def _token(user: User) -> dict:
@@ -526,6 +534,140 @@ class TestSyncHorizon:
         assert data["events"] == []
 
 
+# =========================================================================
+# Incremental sync
+# =========================================================================
+
+def _calendar_event(event_id: str, start: datetime, **extra) -> dict:
+    return {
+        "id": event_id,
+        "summary": f"Event {event_id}",
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+        **extra,
+    }
+
+
+class _FakeGoogleCalendar:
+    """events.list stand-in: full passes return ``events``, token pulls ``changes``."""
+
+    def __init__(self, events: list[dict]):
+        self.events = events
+        self.changes: list[dict] = []
+        self.expire_token = False
+        self.requests: list[dict] = []
+        self.tokens_issued = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        if "syncToken" in params and self.expire_token:
+            return httpx.Response(410, json={"error": {"code": 410}})
+        items = self.changes if "syncToken" in params else self.events
+        self.tokens_issued += 1
+        return httpx.Response(
+            200, json={"items": items, "nextSyncToken": f"token-{self.tokens_issued}"},
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+class TestIncrementalSync:
+    """Pulls after the first use Google's sync token and touch only changes."""
+
+    @pytest_asyncio.fixture
+    async def credential(self, db_session, test_user):
+        from src.integrations.google_calendar.models import GoogleCalendarCredential
+
+        credential = GoogleCalendarCredential(
+            user_id=test_user.id,
+            access_token="access",
+            refresh_token="refresh",
+            calendar_id="primary",
+            is_active=True,
+        )
+        db_session.add(credential)
+        await db_session.commit()
+        return credential
+
+    async def _activities(self, db_session, user_id: int) -> dict[str, Activity]:
+        rows = await db_session.execute(
+            select(CalendarSyncEvent.google_event_id, Activity)
+            .join(Activity, Activity.id == CalendarSyncEvent.activity_id)
+            .where(CalendarSyncEvent.user_id == user_id)
+        )
+        return {event_id: activity for event_id, activity in rows.all()}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_calendar_costs_one_empty_request(
+        self, db_session, test_user, credential,
+    ):
+        from src.integrations.google_calendar.service import GoogleCalendarService
+
+        soon = datetime.now(UTC) + timedelta(days=1)
+        google = _FakeGoogleCalendar([_calendar_event("a", soon), _calendar_event("b", soon)])
+        async with google.client() as http:
+            service = GoogleCalendarService(db_session, http=http)
+            first = await service.sync_from_google(test_user.id)
+            second = await service.sync_from_google(test_user.id)
+
+        assert len(first) == 2
+        assert second == []
+        assert "timeMin" in google.requests[0] and "timeMax" in google.requests[0]
+        assert google.requests[1]["syncToken"] == "token-1"
+        assert "timeMin" not in google.requests[1]
+        assert credential.sync_token == "token-2"
+        assert len(await self._activities(db_session, test_user.id)) == 2
+
+    @pytest.mark.asyncio
+    async def test_changes_update_cancel_and_create(
+        self, db_session, test_user, credential,
+    ):
+        from src.integrations.google_calendar.service import GoogleCalendarService
+
+        now = datetime.now(UTC)
+        soon = now + timedelta(days=1)
+        google = _FakeGoogleCalendar([_calendar_event("keep", soon), _calendar_event("gone", soon)])
+        later = (now + timedelta(minutes=5)).isoformat()
+        google.changes = [
+            _calendar_event("keep", soon + timedelta(hours=2), summary="Moved", updated=later),
+            {"id": "gone", "status": "cancelled"},
+            _calendar_event("new", soon),
+            # Outside the horizon: not mirrored.
+            _calendar_event("far", now + timedelta(days=400)),
+        ]
+        async with google.client() as http:
+            service = GoogleCalendarService(db_session, http=http)
+            await service.sync_from_google(test_user.id)
+            created = await service.sync_from_google(test_user.id)
+
+        assert [item["google_event_id"] for item in created] == ["new"]
+        activities = await self._activities(db_session, test_user.id)
+        assert set(activities) == {"keep", "new"}
+        assert activities["keep"].subject == "Moved"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_falls_back_to_full_sync(
+        self, db_session, test_user, credential,
+    ):
+        from src.integrations.google_calendar.service import GoogleCalendarService
+
+        soon = datetime.now(UTC) + timedelta(days=1)
+        google = _FakeGoogleCalendar([_calendar_event("a", soon)])
+        async with google.client() as http:
+            service = GoogleCalendarService(db_session, http=http)
+            await service.sync_from_google(test_user.id)
+            google.expire_token = True
+            google.events.append(_calendar_event("b", soon))
+            created = await service.sync_from_google(test_user.id)
+
+        assert [item["google_event_id"] for item in created] == ["b"]
+        assert "syncToken" in google.requests[1]
+        assert "timeMin" in google.requests[2]
+        assert credential.sync_token == "token-2"
+
+
 # =========================================================================
 # login_hint Tests
 # =========================================================================
@@ -3,8 +3,11 @@
 Validates that _sync_google_calendars:
 - Completes without raising when there are no credentials
 - Isolates per-user failures so one revoked token does not abort the whole tick
+- Syncs users concurrently, never more than CALENDAR_SYNC_CONCURRENCY at once
 """
 
+import asyncio
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth.models import User
@@ -64,3 +67,57 @@ class TestSyncGoogleCalendarsIsolation:
             await _sync_google_calendars()
         finally:
             GoogleCalendarService.sync_from_google = original
+
+
+class TestSyncGoogleCalendarsConcurrency:
+    """Users sync concurrently under CALENDAR_SYNC_CONCURRENCY."""
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_user_syncs(self, db_session: AsyncSession, client):
+        from src.core.scheduler import _sync_google_calendars
+        from src.integrations.google_calendar.service import (
+            CALENDAR_SYNC_CONCURRENCY,
+            GoogleCalendarService,
+        )
+
+        count = CALENDAR_SYNC_CONCURRENCY * 2 + 1
+        for n in range(count):
+            user = User(
+                email=f"gcal_concurrency_{n}@example.com",
+                hashed_password=get_password_hash("testpass123"),
+                full_name=f"GCal User {n}",
+                is_active=True,
+                is_superuser=False,
+            )
+            db_session.add(user)
+            await db_session.flush()
+            db_session.add(GoogleCalendarCredential(
+                user_id=user.id,
+                access_token="token",
+                calendar_id="primary",
+                is_active=True,
+            ))
+        await db_session.commit()
+
+        running = 0
+        peak = 0
+        synced: list[int] = []
+        original = GoogleCalendarService.sync_from_google
+
+        async def _track(self, user_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            synced.append(user_id)
+            return []
+
+        GoogleCalendarService.sync_from_google = _track
+        try:
+            await _sync_google_calendars()
+        finally:
+            GoogleCalendarService.sync_from_google = original
+
+        assert len(synced) == count
+        assert peak == CALENDAR_SYNC_CONCURRENCY
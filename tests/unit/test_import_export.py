@@ -6,6 +6,7 @@ duplicate detection, and preview.
 """
 
 import csv
+import gzip
 import io
 from datetime import UTC
 
@@ -18,6 +19,7 @@ from src.auth.security import get_password_hash
 from src.companies.models import Company
 from src.contacts.models import Contact
 from src.import_export.csv_handler import (
+    CSVHandler,
     _find_name_column,
     _map_columns,
     _normalize_header,
@@ -201,6 +203,55 @@ class TestExportLeads:
         assert test_lead.email in lead_emails
 
 
+class TestStreamingExport:
+    """Tests for the batched, optionally gzipped export stream."""
+
+    @pytest.mark.asyncio
+    async def test_export_chunks_one_per_batch(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        db_session.add_all([
+            Contact(
+                first_name=f"Batch{i}", last_name="Export", email=f"batch{i}@example.com",
+                phone="=cmd" if i == 0 else None,
+                owner_id=test_user.id, created_by_id=test_user.id,
+            )
+            for i in range(5)
+        ])
+        await db_session.commit()
+
+        chunks = [
+            chunk async for chunk in CSVHandler(db_session).iter_export_chunks(
+                "contacts", user_id=test_user.id, batch_size=2,
+            )
+        ]
+        # Header, then batches of 2 + 2 + 1.
+        assert len(chunks) == 4
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert [r["first_name"] for r in rows] == [f"Batch{i}" for i in range(5)]
+        assert rows[0]["phone"] == "'=cmd"
+        assert rows[1]["phone"] == ""
+
+    @pytest.mark.asyncio
+    async def test_export_gzip(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        test_contact: Contact,
+    ):
+        response = await client.get(
+            "/api/import-export/export/contacts?gzip=true",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert "contacts_export.csv.gz" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+        assert test_contact.email in [row["email"] for row in rows]
+
+
 class TestImportContacts:
     """Tests for contacts import endpoint."""
 
@@ -364,6 +364,86 @@ class TestLeadKanban:
         for stage in data["stages"]:
             assert stage["count"] == 0
             assert stage["leads"] == []
+            assert stage["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_kanban_pages_each_column_by_score(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        test_user: User,
+        lead_pipeline_stages: list[PipelineStage],
+    ):
+        """Columns report full counts but ship one page; the cursor walks the rest."""
+        new_stage, discovery_stage = lead_pipeline_stages[0], lead_pipeline_stages[1]
+        db_session.add_all([
+            Lead(
+                first_name=f"Lead{i}",
+                last_name="New",
+                status="new",
+                score=i % 3,
+                pipeline_stage_id=new_stage.id,
+                owner_id=test_user.id,
+                created_by_id=test_user.id,
+            )
+            for i in range(7)
+        ])
+        db_session.add(Lead(
+            first_name="Solo",
+            last_name="Discovery",
+            status="new",
+            score=5,
+            pipeline_stage_id=discovery_stage.id,
+            owner_id=test_user.id,
+            created_by_id=test_user.id,
+        ))
+        await db_session.commit()
+        expected = (await db_session.execute(
+            select(Lead.id)
+            .where(Lead.pipeline_stage_id == new_stage.id)
+            .order_by(Lead.score.desc(), Lead.id.desc())
+        )).scalars().all()
+
+        response = await client.get(
+            "/api/leads/kanban", headers=auth_headers, params={"per_stage": 3}
+        )
+        assert response.status_code == 200
+        stages_map = {s["stage_id"]: s for s in response.json()["stages"]}
+        column = stages_map[new_stage.id]
+        assert column["count"] == 7
+        assert [lead["id"] for lead in column["leads"]] == expected[:3]
+        assert column["leads"][0]["owner_name"] == test_user.full_name
+        assert stages_map[discovery_stage.id]["count"] == 1
+        assert stages_map[discovery_stage.id]["next_cursor"] is None
+
+        seen = [lead["id"] for lead in column["leads"]]
+        cursor = column["next_cursor"]
+        while cursor:
+            page = await client.get(
+                f"/api/leads/kanban/stages/{new_stage.id}",
+                headers=auth_headers,
+                params={"cursor": cursor, "limit": 3},
+            )
+            assert page.status_code == 200
+            seen.extend(lead["id"] for lead in page.json()["leads"])
+            cursor = page.json()["next_cursor"]
+        assert seen == expected
+
+    @pytest.mark.asyncio
+    async def test_kanban_column_rejects_bad_cursor(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        lead_pipeline_stages: list[PipelineStage],
+    ):
+        """A garbled cursor is a 400, not a 500."""
+        response = await client.get(
+            f"/api/leads/kanban/stages/{lead_pipeline_stages[0].id}",
+            headers=auth_headers,
+            params={"cursor": "not-a-cursor"},
+        )
+        assert response.status_code == 400
 
 
 class TestMoveLeadStage:
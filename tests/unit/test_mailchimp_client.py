@@ -5,11 +5,14 @@ header, URL composition, JSON decoding, error mapping) without making
 network calls.
 """
 
+import asyncio
 import hashlib
+import json
 
 import httpx
 import pytest
 from src.integrations.mailchimp.client import (
+    BATCH_MEMBER_LIMIT,
     MailchimpClient,
     MailchimpError,
     split_api_key,
@@ -49,6 +52,89 @@ def _client(transport: httpx.MockTransport, server_prefix: str = "us19") -> Mail
     return MailchimpClient("apikey-us19", server_prefix, transport=transport)
 
 
+class _FakeMailchimp:
+    """In-process stand-in for the batch list-member endpoint.
+
+    Keeps the audience (seeded from ``existing``, email -> status), refuses
+    ``unsubscribed`` addresses the way Mailchimp does (compliance state) and
+    ``invalid`` ones with a generic error, honours ``update_existing``,
+    applies member ``PATCH``es, and records how many batch calls were in
+    flight at once.
+    """
+
+    def __init__(self, *, existing=None, unsubscribed=(), invalid=(), status_code: int = 200):
+        self.audience: dict[str, dict] = {
+            email: {"email_address": email, "status": status}
+            for email, status in (existing or {}).items()
+        }
+        self.unsubscribed = set(unsubscribed)
+        self.invalid = set(invalid)
+        self.status_code = status_code
+        self.batch_sizes: list[int] = []
+        self.patches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH" and request.url.path.startswith("/3.0/lists/list1/members/"):
+            return self._patch(request)
+        if request.method != "POST" or request.url.path != "/3.0/lists/list1":
+            return httpx.Response(599, json={"detail": "unmocked"})
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"detail": "API key not found"})
+        body = json.loads(request.content)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        self.batch_sizes.append(len(body["members"]))
+        new, updated, errors = [], [], []
+        for member in body["members"]:
+            email = member["email_address"]
+            if email in self.unsubscribed:
+                errors.append({
+                    "email_address": email,
+                    "error": f"{email} is in a compliance state due to unsubscribe, "
+                    "bounce, or compliance review and cannot be subscribed.",
+                    "error_code": "ERROR_GENERIC",
+                })
+            elif email in self.invalid:
+                errors.append({
+                    "email_address": email,
+                    "error": f"{email} looks fake or invalid, please enter a real email address.",
+                    "error_code": "ERROR_GENERIC",
+                })
+            elif email in self.audience and not body["update_existing"]:
+                errors.append({
+                    "email_address": email,
+                    "error": f"{email} is already a list member. "
+                    "Use PUT to insert or update list members.",
+                    "error_code": "ERROR_CONTACT_EXISTS",
+                })
+            else:
+                (updated if email in self.audience else new).append({"email_address": email})
+                self.audience[email] = member
+        return httpx.Response(200, json={
+            "new_members": new,
+            "updated_members": updated,
+            "errors": errors,
+            "total_created": len(new),
+            "total_updated": len(updated),
+            "error_count": len(errors),
+        })
+
+    def _patch(self, request: httpx.Request) -> httpx.Response:
+        self.patches += 1
+        by_hash = {subscriber_hash(email): member for email, member in self.audience.items()}
+        member = by_hash.get(request.url.path.rsplit("/", 1)[1])
+        if member is None:
+            return httpx.Response(404, json={"detail": "The requested resource could not be found."})
+        member.update(json.loads(request.content))
+        return httpx.Response(200, json=member)
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -138,6 +224,95 @@ class TestMembers:
         assert captured["path"] == f"/3.0/lists/list1/members/{expected_hash}"
         assert "status_if_new" in captured["body"]
 
+    @pytest.mark.asyncio
+    async def test_sync_members_batches_concurrently_and_sorts_errors(self):
+        fake = _FakeMailchimp(
+            unsubscribed={"gone@example.com"}, invalid={"fake@example.com"}
+        )
+        members = [{"email_address": f"m{i}@example.com"} for i in range(1200)]
+        members[3] = {"email_address": "gone@example.com"}
+        members[700] = {"email_address": "fake@example.com"}
+
+        async with _client(httpx.MockTransport(fake.handler)) as mc:
+            result = await mc.sync_members("list1", members, concurrency=2)
+
+        assert sorted(fake.batch_sizes) == [200, BATCH_MEMBER_LIMIT, BATCH_MEMBER_LIMIT]
+        assert fake.max_in_flight == 2
+        assert result.skipped == ["gone@example.com"]
+        assert list(result.failed) == ["fake@example.com"]
+        assert "looks fake" in result.failed["fake@example.com"]
+        assert result.synced == [
+            m["email_address"] for m in members
+            if m["email_address"] not in {"gone@example.com", "fake@example.com"}
+        ]
+        assert all(m["status"] == "subscribed" for m in fake.audience.values())
+
+    @pytest.mark.asyncio
+    async def test_sync_members_never_resubscribes_existing_members(self):
+        fake = _FakeMailchimp(existing={
+            "left@example.com": "unsubscribed",
+            "bounced@example.com": "cleaned",
+            "kept@example.com": "subscribed",
+        })
+        members = [
+            {"email_address": email}
+            for email in ("left@example.com", "bounced@example.com", "kept@example.com", "new@example.com")
+        ]
+
+        async with _client(httpx.MockTransport(fake.handler)) as mc:
+            result = await mc.sync_members("list1", members)
+
+        assert result.synced == [m["email_address"] for m in members]
+        assert not result.failed
+        assert not result.skipped
+        assert {email: m["status"] for email, m in fake.audience.items()} == {
+            "left@example.com": "unsubscribed",
+            "bounced@example.com": "cleaned",
+            "kept@example.com": "subscribed",
+            "new@example.com": "subscribed",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_members_refreshes_names_of_existing_members(self):
+        fake = _FakeMailchimp(existing={
+            "left@example.com": "unsubscribed",
+            "kept@example.com": "subscribed",
+            "plain@example.com": "subscribed",
+        })
+        members = [
+            {"email_address": "left@example.com", "merge_fields": {"FNAME": "Ada"}},
+            {"email_address": "kept@example.com", "merge_fields": {"FNAME": "Grace", "LNAME": "Hopper"}},
+            {"email_address": "plain@example.com"},
+            {"email_address": "new@example.com", "merge_fields": {"FNAME": "Alan"}},
+        ]
+
+        async with _client(httpx.MockTransport(fake.handler)) as mc:
+            result = await mc.sync_members("list1", members)
+
+        assert result.synced == [m["email_address"] for m in members]
+        # Only existing members with names get a PATCH; new ones got theirs in the batch.
+        assert fake.patches == 2
+        assert fake.audience["left@example.com"]["status"] == "unsubscribed"
+        assert fake.audience["left@example.com"]["merge_fields"] == {"FNAME": "Ada"}
+        assert fake.audience["kept@example.com"]["merge_fields"] == {"FNAME": "Grace", "LNAME": "Hopper"}
+        assert fake.audience["new@example.com"]["merge_fields"] == {"FNAME": "Alan"}
+
+    @pytest.mark.asyncio
+    async def test_sync_members_raises_on_request_failure(self):
+        fake = _FakeMailchimp(status_code=401)
+        members = [{"email_address": f"m{i}@example.com"} for i in range(600)]
+        async with _client(httpx.MockTransport(fake.handler)) as mc:
+            with pytest.raises(MailchimpError) as exc_info:
+                await mc.sync_members("list1", members)
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_batch_upsert_members_rejects_oversized_batch(self):
+        members = [{"email_address": f"m{i}@example.com"} for i in range(BATCH_MEMBER_LIMIT + 1)]
+        async with _client(httpx.MockTransport(_FakeMailchimp().handler)) as mc:
+            with pytest.raises(ValueError):
+                await mc.batch_upsert_members("list1", members)
+
 
 class TestCampaigns:
     @pytest.mark.asyncio
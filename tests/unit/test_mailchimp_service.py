@@ -45,6 +45,23 @@ def _route(handlers: dict[tuple[str, str], object]) -> httpx.MockTransport:
     return httpx.MockTransport(handler)
 
 
+def _batch_response(request: httpx.Request, *, rejected: dict[str, str] | None = None) -> httpx.Response:
+    """Mailchimp batch list-member reply: every member added except ``rejected``."""
+    rejected = rejected or {}
+    members = json.loads(request.content)["members"]
+    return httpx.Response(200, json={
+        "new_members": [
+            {"email_address": m["email_address"]}
+            for m in members if m["email_address"] not in rejected
+        ],
+        "updated_members": [],
+        "errors": [
+            {"email_address": email, "error": error, "error_code": "ERROR_GENERIC"}
+            for email, error in rejected.items()
+        ],
+    })
+
+
 def _factory(transport: httpx.MockTransport):
     async def make(api_key: str, server_prefix: str) -> MailchimpClient:
         return MailchimpClient(api_key, server_prefix, transport=transport)
@@ -336,8 +353,8 @@ class TestSendCampaignStep:
 
         def handler(request: httpx.Request) -> httpx.Response:
             seen_paths.append(f"{request.method} {request.url.path}")
-            if request.url.path.startswith("/3.0/lists/list-1/members/"):
-                return httpx.Response(200, json={"id": "h", "email_address": "ada@example.com"})
+            if request.url.path == "/3.0/lists/list-1" and request.method == "POST":
+                return _batch_response(request)
             if request.url.path == "/3.0/lists/list-1/segments" and request.method == "POST":
                 captured_segment_body.update(json.loads(request.content))
                 return httpx.Response(200, json={"id": 4242, "name": "seg"})
@@ -368,7 +385,7 @@ class TestSendCampaignStep:
         assert campaign.mailchimp_campaign_id == "mc-camp-1"
         assert campaign.num_sent == 1
         # Verify the right Mailchimp endpoints were hit in order.
-        assert any("PUT /3.0/lists/list-1/members/" in p for p in seen_paths)
+        assert "POST /3.0/lists/list-1" in seen_paths
         assert "POST /3.0/lists/list-1/segments" in seen_paths
         assert "POST /3.0/campaigns" in seen_paths
         assert "PUT /3.0/campaigns/mc-camp-1/content" in seen_paths
@@ -479,7 +496,7 @@ class TestSendCampaignStep:
         await db_session.commit()
 
         def handler(request: httpx.Request) -> httpx.Response:
-            if request.url.path.startswith("/3.0/lists/list-1/members/"):
+            if request.url.path == "/3.0/lists/list-1":
                 return httpx.Response(401, json={"detail": "API key not found"})
             raise AssertionError(
                 f"send was attempted after auth failure: {request.url.path}"
@@ -593,8 +610,8 @@ class TestSendCampaignStep:
         captured_campaign_body: dict = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            if request.url.path.startswith("/3.0/lists/list-blast/members/"):
-                return httpx.Response(200, json={"id": "h"})
+            if request.url.path == "/3.0/lists/list-blast":
+                return _batch_response(request)
             if request.url.path == "/3.0/lists/list-blast/segments":
                 captured_segment_body.update(json.loads(request.content))
                 return httpx.Response(200, json={"id": 9999, "name": "seg"})
@@ -627,6 +644,93 @@ class TestSendCampaignStep:
             == 9999
         )
 
+    @pytest.mark.asyncio
+    async def test_send_campaign_step_leaves_compliance_skips_pending(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Members the batch response rejects for compliance are left out of
+        the segment and not marked sent."""
+        tenant = await _make_tenant(db_session, slug="skips")
+        db_session.add(TenantUser(
+            tenant_id=tenant.id, user_id=test_user.id, is_primary=True,
+        ))
+        db_session.add(MailchimpConnection(
+            tenant_id=tenant.id,
+            api_key="key-us19",
+            server_prefix="us19",
+            default_audience_id="list-skips",
+            connected_by_id=test_user.id,
+            account_email="ops@example.com",
+        ))
+        ada = Contact(
+            first_name="Ada", last_name="Lovelace",
+            email="ada@example.com", owner_id=test_user.id,
+        )
+        grace = Contact(
+            first_name="Grace", last_name="Hopper",
+            email="grace@example.com", owner_id=test_user.id,
+        )
+        template = EmailTemplate(
+            name="skips-tmpl",
+            subject_template="Hi",
+            body_template="<p>Body</p>",
+            created_by_id=test_user.id,
+        )
+        campaign = Campaign(
+            name="Skips",
+            campaign_type="email",
+            send_via="mailchimp",
+            owner_id=test_user.id,
+        )
+        db_session.add_all([ada, grace, template, campaign])
+        await db_session.flush()
+        ada_member = CampaignMember(
+            campaign_id=campaign.id, member_type="contact", member_id=ada.id
+        )
+        grace_member = CampaignMember(
+            campaign_id=campaign.id, member_type="contacts", member_id=grace.id
+        )
+        db_session.add_all([ada_member, grace_member])
+        await db_session.commit()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path == "/3.0/lists/list-skips":
+                return _batch_response(request, rejected={
+                    "grace@example.com": (
+                        "grace@example.com is in a compliance state due to "
+                        "unsubscribe, bounce, or compliance review and cannot be subscribed."
+                    ),
+                })
+            if path == "/3.0/lists/list-skips/segments":
+                assert json.loads(request.content)["static_segment"] == ["ada@example.com"]
+                return httpx.Response(200, json={"id": 7, "name": "seg"})
+            if path == "/3.0/campaigns" and request.method == "POST":
+                return httpx.Response(200, json={"id": "mc-camp-skips"})
+            if path == "/3.0/campaigns/mc-camp-skips/content":
+                return httpx.Response(200, json={"html": "ok"})
+            if path == "/3.0/campaigns/mc-camp-skips/actions/send":
+                return httpx.Response(204)
+            return httpx.Response(599, json={"detail": "unmocked"})
+
+        service = MailchimpService(
+            db_session, client_factory=_factory(httpx.MockTransport(handler))
+        )
+        summary = await service.send_campaign_step(
+            campaign=campaign,
+            template_id=template.id,
+            sent_by_id=test_user.id,
+            tenant_id=tenant.id,
+        )
+        await db_session.commit()
+        await db_session.refresh(ada_member)
+        await db_session.refresh(grace_member)
+
+        assert summary["emails_sent"] == 1
+        assert ada_member.status == "sent"
+        assert ada_member.sent_at is not None
+        assert grace_member.status == "pending"
+
     @pytest.mark.asyncio
     async def test_send_campaign_step_refuses_when_no_members(
         self, db_session: AsyncSession, test_user: User
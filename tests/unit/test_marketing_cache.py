@@ -6,6 +6,8 @@ never collide and that a missing/wrong-typed company_id raises rather than
 silently sharing a key.
 """
 
+import asyncio
+
 import pytest
 
 from src.marketing import cache
@@ -100,6 +102,22 @@ class TestGetOrComputeAndInvalidate:
         assert served["n"] == 0
         await cache.invalidate(5002)
 
+    async def test_concurrent_cold_reads_compute_once(self):
+        key = cache.make_key(company_id=4244, endpoint="overview")
+        calls = {"n": 0}
+
+        async def compute():
+            calls["n"] += 1
+            await asyncio.sleep(0.01)
+            return {"spend": "2.00"}
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute(key, compute, ttl=60) for _ in range(8))
+        )
+        assert calls["n"] == 1
+        assert all(r == {"spend": "2.00"} for r in results)
+        await cache.invalidate(4244)
+
     async def test_invalidate_rejects_bool(self):
         with pytest.raises(TypeError):
             await cache.invalidate(True)  # type: ignore[arg-type]
@@ -581,6 +581,7 @@ class TestNotesMentions:
         from src.email.models import EmailQueue
         from src.notes.schemas import NoteCreate
         from src.notes.service import NoteService
+        from src.notifications.delivery import NotificationDeliveryService
         from src.whitelabel.models import Tenant, TenantUser
 
         tenant_a = Tenant(name="Tenant A", slug="tenant-a", is_active=True)
@@ -614,6 +615,7 @@ class TestNotesMentions:
             user_id=test_user.id,
         )
         await db_session.commit()
+        await NotificationDeliveryService(db_session).deliver_due_emails()
 
         email_row = await db_session.execute(
             select(EmailQueue).where(EmailQueue.to_email == bob.email)
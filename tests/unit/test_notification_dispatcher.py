@@ -0,0 +1,238 @@
+"""Tests for batched notification fan-out and deferred email delivery.
+
+Verifies:
+
+- ``notify_mentions`` costs the same number of statements for 2 or 20
+  recipients, writes one in-app row per opted-in recipient and queues
+  (but does not send) their emails.
+- Queuing an email that is due now wakes the delivery job on commit,
+  not on rollback.
+- ``NotificationDeliveryService`` sends due rows, leaves future rows
+  alone, merges a user's digest rows into one email, and commits its
+  lease on the rows before sending.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.account.models import UserNotificationPrefs
+from src.auth.models import User
+from src.email.models import EmailQueue
+from src.email.service import EmailService
+from src.notifications import delivery as delivery_module
+from src.notifications.delivery import NotificationDeliveryService
+from src.notifications.models import (
+    NOTIFICATION_EMAIL_PENDING,
+    NOTIFICATION_EMAIL_SENT,
+    Notification,
+    NotificationEmail,
+)
+from src.notifications.service import notify_admins_of_pending_user, notify_mentions
+
+
+async def _make_users(db: AsyncSession, count: int, prefix: str) -> list[int]:
+    users = [
+        User(email=f"{prefix}{i}@example.com", hashed_password="x", full_name=f"{prefix} {i}")
+        for i in range(count)
+    ]
+    db.add_all(users)
+    await db.flush()
+    db.add_all([
+        UserNotificationPrefs(
+            user_id=user.id,
+            in_app_enabled=True,
+            email_enabled=True,
+            event_matrix={"mention": {"in_app": True, "email": True}},
+        )
+        for user in users
+    ])
+    await db.commit()
+    return [user.id for user in users]
+
+
+async def _count_statements(db: AsyncSession, coro) -> int:
+    statements = 0
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal statements
+        statements += 1
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        await coro
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return statements
+
+
+class TestBatchedFanOut:
+    async def test_mention_cost_is_independent_of_recipient_count(
+        self, db_session: AsyncSession
+    ):
+        few = await _make_users(db_session, 2, "few")
+        many = await _make_users(db_session, 20, "many")
+
+        few_cost = await _count_statements(
+            db_session, notify_mentions(db_session, few, "Ann", "contacts", 1, "hi")
+        )
+        many_cost = await _count_statements(
+            db_session, notify_mentions(db_session, many, "Ann", "contacts", 1, "hi")
+        )
+
+        assert many_cost == few_cost
+        notifs = (await db_session.execute(
+            select(Notification).where(Notification.user_id.in_(many))
+        )).scalars().all()
+        assert len(notifs) == 20
+        queued = (await db_session.execute(
+            select(NotificationEmail).where(NotificationEmail.user_id.in_(many))
+        )).scalars().all()
+        assert len(queued) == 20
+        assert {row.status for row in queued} == {NOTIFICATION_EMAIL_PENDING}
+        # Nothing is sent inside the request.
+        assert (await db_session.execute(select(EmailQueue))).scalars().first() is None
+
+    async def test_opted_out_recipients_are_skipped(
+        self, db_session: AsyncSession, test_user
+    ):
+        opted_in = await _make_users(db_session, 1, "in")
+
+        created = await notify_mentions(
+            db_session, [*opted_in, test_user.id], "Ann", "contacts", 1, "hi"
+        )
+
+        assert set(created) == set(opted_in)
+
+    async def test_due_email_wakes_delivery_after_commit(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        wakes = []
+        monkeypatch.setattr(delivery_module, "wake_delivery_job", lambda: wakes.append(1))
+        recipients = await _make_users(db_session, 2, "wake")
+
+        await notify_mentions(db_session, recipients, "Ann", "contacts", 1, "hi")
+        assert wakes == []
+        await db_session.rollback()
+        assert wakes == []
+
+        await notify_mentions(db_session, recipients, "Ann", "contacts", 1, "hi")
+        await db_session.commit()
+        await asyncio.sleep(0)
+        assert wakes == [1]
+
+    async def test_wake_waits_for_the_outer_commit_and_never_raises(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        wakes = []
+
+        def wake() -> None:
+            wakes.append(1)
+            raise RuntimeError("Event loop is closed")
+
+        monkeypatch.setattr(delivery_module, "wake_delivery_job", wake)
+        recipients = await _make_users(db_session, 1, "nested")
+
+        async with db_session.begin_nested():
+            await notify_mentions(db_session, recipients, "Ann", "contacts", 1, "hi")
+        await asyncio.sleep(0)
+        assert wakes == []
+
+        await db_session.commit()
+        await asyncio.sleep(0)
+        assert wakes == [1]
+
+    async def test_admin_broadcast_is_in_app_only(self, db_session: AsyncSession, test_user):
+        admins = [
+            User(email=f"admin{i}@example.com", hashed_password="x", full_name="A", role="admin")
+            for i in range(3)
+        ]
+        db_session.add_all(admins)
+        await db_session.commit()
+
+        await notify_admins_of_pending_user(db_session, test_user)
+
+        notifs = (await db_session.execute(
+            select(Notification).where(Notification.type == "pending_approval")
+        )).scalars().all()
+        assert {n.user_id for n in notifs} == {a.id for a in admins}
+        assert (await db_session.execute(select(NotificationEmail))).scalars().first() is None
+
+
+class TestDeliveryService:
+    def _row(self, user_id: int, *, deliver_after: datetime, digest: bool, label: str):
+        return NotificationEmail(
+            user_id=user_id,
+            event_type="mention",
+            context={"author_name": "Ann", "entity_label": label, "content_snippet": "hi"},
+            link=f"http://localhost:3000/contacts/{label}",
+            deliver_after=deliver_after,
+            digest=digest,
+        )
+
+    async def test_sends_due_rows_and_merges_digest(
+        self, db_session: AsyncSession, test_user
+    ):
+        now = datetime.now(UTC)
+        past = now - timedelta(minutes=1)
+        instant = self._row(test_user.id, deliver_after=past, digest=False, label="Acme")
+        held = [
+            self._row(test_user.id, deliver_after=past, digest=True, label=label)
+            for label in ("Beta", "Gamma")
+        ]
+        future = self._row(test_user.id, deliver_after=now + timedelta(hours=8), digest=True, label="Later")
+        db_session.add_all([instant, *held, future])
+        await db_session.commit()
+
+        sent = await NotificationDeliveryService(db_session).deliver_due_emails()
+
+        assert sent == 2
+        emails = (await db_session.execute(
+            select(EmailQueue).where(EmailQueue.to_email == test_user.email)
+        )).scalars().all()
+        subjects = sorted(email.subject for email in emails)
+        assert subjects == ["Ann mentioned you on Acme", "You have 2 new notifications"]
+        digest = next(e for e in emails if e.subject.startswith("You have"))
+        assert "Ann mentioned you on Beta" in digest.body
+        assert "/contacts/Gamma" in digest.body
+        assert {instant.status, *(row.status for row in held)} == {NOTIFICATION_EMAIL_SENT}
+        assert future.status == NOTIFICATION_EMAIL_PENDING
+
+    async def test_nothing_due_is_a_noop(self, db_session: AsyncSession):
+        assert await NotificationDeliveryService(db_session).deliver_due_emails() == 0
+
+    async def test_lease_commits_before_sending(
+        self, db_session: AsyncSession, test_user, monkeypatch
+    ):
+        now = datetime.now(UTC)
+        row = self._row(test_user.id, deliver_after=now - timedelta(minutes=1), digest=False, label="Acme")
+        db_session.add(row)
+        await db_session.commit()
+
+        commits = 0
+        real_commit = db_session.commit
+
+        async def counting_commit():
+            nonlocal commits
+            commits += 1
+            await real_commit()
+
+        seen = []
+
+        async def fake_queue_email(service, **kwargs):
+            lease = (await db_session.execute(
+                select(NotificationEmail.deliver_after).where(NotificationEmail.id == row.id)
+            )).scalar_one()
+            seen.append((commits, lease.replace(tzinfo=UTC) > now))
+
+        monkeypatch.setattr(db_session, "commit", counting_commit)
+        monkeypatch.setattr(EmailService, "queue_email", fake_queue_email)
+
+        assert await NotificationDeliveryService(db_session).deliver_due_emails() == 1
+        assert seen == [(1, True)]
+        assert commits == 2
+        assert row.status == NOTIFICATION_EMAIL_SENT
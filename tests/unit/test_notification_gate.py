@@ -8,14 +8,23 @@ Verifies:
   refactor — was 2 round-trips per dispatcher).
 - Fail-closed on both channels: missing prefs row, missing event entry,
   or recoverable DB error all return (False, False).
+- The preloaded fan-out path (``load_recipient_contexts`` +
+  ``resolve_channels`` / ``email_schedule``) gives the same answers and
+  schedules quiet-hours / daily digests.
 """
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.account.models import UserNotificationPrefs
+from src.account.models import UserNotificationPrefs, UserPreferences
 from src.account.notification_gate import (
+    RecipientContext,
+    email_schedule,
     gate_event,
+    load_recipient_contexts,
+    resolve_channels,
     should_notify_in_app,
     should_send_email,
 )
@@ -188,3 +197,71 @@ class TestGateEventFailModes:
         )
         assert in_app is False   # fail-closed: no notification leaks
         assert email is False    # fail-closed: opt-out violation is worse
+
+
+def _ctx(timezone: str = "UTC", **prefs) -> RecipientContext:
+    fields = {
+        "in_app_enabled": True,
+        "email_enabled": True,
+        "email_digest": "instant",
+        "quiet_hours_enabled": False,
+        "event_matrix": {"mention": {"in_app": True, "email": True}},
+    }
+    fields.update(prefs)
+    return RecipientContext(
+        user_id=1,
+        email="u@example.com",
+        prefs=UserNotificationPrefs(user_id=1, **fields),
+        timezone=timezone,
+    )
+
+
+class TestPreloadedRecipients:
+    """load_recipient_contexts + resolve_channels agree with gate_event."""
+
+    async def test_one_row_per_existing_user(
+        self, db_session: AsyncSession, test_user, test_user_opted_in
+    ):
+        db_session.add(UserPreferences(user_id=test_user.id, timezone="Europe/Paris"))
+        await db_session.commit()
+
+        contexts = await load_recipient_contexts(db_session, [test_user.id, 999_999])
+
+        assert set(contexts) == {test_user.id}
+        ctx = contexts[test_user.id]
+        assert ctx.email == test_user.email
+        assert ctx.timezone == "Europe/Paris"
+        assert resolve_channels(ctx, "mention") == await gate_event(
+            db_session, test_user.id, "mention"
+        )
+
+    async def test_missing_prefs_blocks_both(self, db_session: AsyncSession, test_user):
+        contexts = await load_recipient_contexts(db_session, [test_user.id])
+        assert contexts[test_user.id].prefs is None
+        assert contexts[test_user.id].timezone == "America/Chicago"
+        assert resolve_channels(contexts[test_user.id], "mention") == (False, False)
+
+    def test_quiet_hours_suppress_in_app_but_not_email(self):
+        ctx = _ctx(quiet_hours_enabled=True, quiet_hours_start="22:00", quiet_hours_end="07:00")
+        now = datetime(2026, 3, 2, 23, 30, tzinfo=UTC)
+        assert resolve_channels(ctx, "mention", now) == (False, True)
+        assert resolve_channels(ctx, "mention", now.replace(hour=12)) == (True, True)
+
+
+class TestEmailSchedule:
+    """email_schedule decides when an allowed email goes out."""
+
+    def test_instant_outside_quiet_hours_sends_now(self):
+        now = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+        assert email_schedule(_ctx(), now) == (now, False)
+
+    def test_quiet_hours_hold_until_window_ends_as_digest(self):
+        ctx = _ctx(quiet_hours_enabled=True, quiet_hours_start="22:00", quiet_hours_end="07:00")
+        now = datetime(2026, 3, 2, 23, 30, tzinfo=UTC)
+        assert email_schedule(ctx, now) == (datetime(2026, 3, 3, 7, 0, tzinfo=UTC), True)
+
+    def test_daily_digest_waits_for_8am_local(self):
+        ctx = _ctx(timezone="America/New_York", email_digest="daily_8am")
+        # 10:00 in New York — already past today's 08:00.
+        now = datetime(2026, 1, 10, 15, 0, tzinfo=UTC)
+        assert email_schedule(ctx, now) == (datetime(2026, 1, 11, 13, 0, tzinfo=UTC), True)
@@ -0,0 +1,243 @@
+"""Tests for pushed unread counts and keyset-paged notification lists.
+
+Verifies:
+
+- the unread count is loaded with one COUNT and then served from memory,
+  moved by committed ORM writes, dispatcher fan-out and mark-all-read,
+  and left alone by rolled-back writes.
+- streams subscribed to a user receive each new count, and broadcasts
+  from another worker are applied (but a worker's own are skipped).
+- ``GET /api/notifications/stream`` sends the count, then each change;
+  without a shared cache backend it recounts on its keepalive, so writes
+  made on another worker still reach it.
+- ``GET /api/notifications`` pages with ``next_cursor``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.models import User
+from src.notifications.dispatcher import NotificationDraft, dispatch_notifications
+from src.notifications.models import Notification
+from src.notifications.realtime import BROADCAST_PREFIX, get_notification_hub
+from src.notifications.service import NotificationService
+
+
+def _notification(user_id: int, n: int, **extra) -> Notification:
+    return Notification(
+        user_id=user_id, type="test", title=f"Notif {n}", message=f"Msg {n}", **extra,
+    )
+
+
+async def test_count_is_loaded_once_then_moved_by_commits(
+    db_session: AsyncSession, test_user: User,
+):
+    hub = get_notification_hub()
+    db_session.add_all([_notification(test_user.id, n) for n in range(2)])
+    await db_session.commit()
+
+    service = NotificationService(db_session)
+    assert await service.get_unread_count(test_user.id) == 2
+    loads = hub.stats()["loads"]
+
+    notif = await service.create_notification(test_user.id, "test", "New", "Msg")
+    await db_session.commit()
+    assert await service.get_unread_count(test_user.id) == 3
+
+    await service.mark_read(notif.id, test_user.id)
+    await db_session.commit()
+    assert await service.get_unread_count(test_user.id) == 2
+
+    draft = NotificationDraft(type="test", title="Fan-out", message="Msg")
+    await dispatch_notifications(db_session, "test", {test_user.id: draft}, gated=False)
+    await db_session.commit()
+    assert await service.get_unread_count(test_user.id) == 3
+
+    await service.mark_all_read(test_user.id)
+    await db_session.commit()
+    assert await service.get_unread_count(test_user.id) == 0
+
+    assert hub.stats()["loads"] == loads
+
+
+async def test_rolled_back_write_leaves_count_alone(
+    db_session: AsyncSession, test_user: User,
+):
+    user_id = test_user.id
+    service = NotificationService(db_session)
+    assert await service.get_unread_count(user_id) == 0
+
+    await service.create_notification(user_id, "test", "Rolled back", "Msg")
+    await db_session.rollback()
+    await db_session.commit()
+
+    assert await service.get_unread_count(user_id) == 0
+
+
+async def test_mark_all_read_keeps_a_concurrent_insert_unread(
+    db_session: AsyncSession, test_user: User,
+):
+    hub = get_notification_hub()
+    db_session.add_all([_notification(test_user.id, n) for n in range(2)])
+    await db_session.commit()
+    service = NotificationService(db_session)
+    assert await service.get_unread_count(test_user.id) == 2
+
+    assert await service.mark_all_read(test_user.id) == 2
+    # Another worker commits a notification the UPDATE never saw.
+    hub.on_broadcast(f"{BROADCAST_PREFIX}other-worker:{test_user.id}:1")
+    await db_session.commit()
+
+    assert await service.get_unread_count(test_user.id) == 1
+
+
+async def test_delete_all_only_drops_the_unread_it_deleted(
+    db_session: AsyncSession, test_user: User,
+):
+    db_session.add_all([
+        _notification(test_user.id, 0),
+        _notification(test_user.id, 1, is_read=True),
+    ])
+    await db_session.commit()
+    service = NotificationService(db_session)
+    assert await service.get_unread_count(test_user.id) == 1
+    loads = get_notification_hub().stats()["loads"]
+
+    assert await service.delete_all_notifications(test_user.id) == 2
+    await db_session.commit()
+
+    assert await service.get_unread_count(test_user.id) == 0
+    assert get_notification_hub().stats()["loads"] == loads
+
+
+async def test_count_read_mid_transaction_is_not_cached(
+    db_session: AsyncSession, test_user: User,
+):
+    service = NotificationService(db_session)
+    await service.create_notification(test_user.id, "test", "Pending", "Msg")
+    # The COUNT already sees the uncommitted row; caching it would count
+    # the row twice once the commit applies its +1.
+    assert await service.get_unread_count(test_user.id) == 1
+    await db_session.commit()
+
+    assert await service.get_unread_count(test_user.id) == 1
+
+
+async def test_subscribers_receive_changes_and_remote_broadcasts(
+    db_session: AsyncSession, test_user: User,
+):
+    hub = get_notification_hub()
+    service = NotificationService(db_session)
+    assert await service.get_unread_count(test_user.id) == 0
+    queue = hub.subscribe(test_user.id)
+    try:
+        await service.create_notification(test_user.id, "test", "Pushed", "Msg")
+        await db_session.commit()
+        assert queue.get_nowait() == 1
+
+        hub.on_broadcast(f"{BROADCAST_PREFIX}other-worker:{test_user.id}:2")
+        assert queue.get_nowait() == 3
+
+        # This worker's own broadcast is already applied.
+        hub.on_broadcast(f"{BROADCAST_PREFIX}{hub.origin}:{test_user.id}:5")
+        assert queue.empty()
+
+        hub.on_broadcast(f"{BROADCAST_PREFIX}other-worker:{test_user.id}:-3")
+        assert queue.get_nowait() == 0
+    finally:
+        hub.unsubscribe(test_user.id, queue)
+    assert hub.stats()["streams"] == 0
+
+
+async def test_stream_sends_count_then_changes(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    from src.notifications.router import stream_notifications
+
+    db_session.add(_notification(test_user.id, 0))
+    await db_session.commit()
+
+    response = await stream_notifications(test_user)
+    events = response.body_iterator
+    try:
+        assert await anext(events) == "retry: 5000\n\n"
+        assert await anext(events) == 'event: unread\ndata: {"count": 1}\n\n'
+
+        await NotificationService(db_session).mark_all_read(test_user.id)
+        await db_session.commit()
+        update = await asyncio.wait_for(anext(events), timeout=1)
+        assert update == 'event: unread\ndata: {"count": 0}\n\n'
+    finally:
+        await events.aclose()
+    assert get_notification_hub().stats()["streams"] == 0
+
+
+async def test_stream_recounts_on_keepalive_without_a_shared_backend(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, monkeypatch,
+):
+    from src.config import settings
+    from src.notifications.router import stream_notifications
+
+    hub = get_notification_hub()
+    assert not hub.shared
+    assert hub.ttl_seconds == settings.NOTIFICATION_UNREAD_LOCAL_TTL_SECONDS
+    monkeypatch.setattr(settings, "NOTIFICATION_STREAM_KEEPALIVE_SECONDS", 0.05)
+    monkeypatch.setattr(settings, "NOTIFICATION_UNREAD_LOCAL_TTL_SECONDS", 0)
+
+    response = await stream_notifications(test_user)
+    events = response.body_iterator
+    try:
+        assert await anext(events) == "retry: 5000\n\n"
+        assert await anext(events) == 'event: unread\ndata: {"count": 0}\n\n'
+        assert await asyncio.wait_for(anext(events), timeout=1) == ": keepalive\n\n"
+
+        # Another worker's write: no hook in this process sees it.
+        await db_session.execute(
+            insert(Notification).values(user_id=test_user.id, type="test", title="T", message="M")
+        )
+        await db_session.commit()
+        update = await asyncio.wait_for(anext(events), timeout=1)
+        assert update == 'event: unread\ndata: {"count": 1}\n\n'
+    finally:
+        await events.aclose()
+
+
+async def test_list_pages_with_cursor(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession, test_user: User,
+):
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    # Two rows share a timestamp so the id tie-break is exercised.
+    stamps = [base, base + timedelta(minutes=1), base + timedelta(minutes=1),
+              base + timedelta(minutes=2), base + timedelta(minutes=3)]
+    rows = [_notification(test_user.id, n, created_at=at) for n, at in enumerate(stamps)]
+    db_session.add_all(rows)
+    await db_session.commit()
+
+    first = (await client.get(
+        "/api/notifications", params={"page_size": 2}, headers=auth_headers,
+    )).json()
+    assert first["total"] == 5
+    seen = [item["id"] for item in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = (await client.get(
+            "/api/notifications",
+            params={"page_size": 2, "cursor": cursor},
+            headers=auth_headers,
+        )).json()
+        assert page["total"] is None
+        seen += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+
+    expected = sorted(rows, key=lambda row: (row.created_at, row.id), reverse=True)
+    assert seen == [row.id for row in expected]
+
+    bad = await client.get(
+        "/api/notifications", params={"cursor": "not-a-cursor"}, headers=auth_headers,
+    )
+    assert bad.status_code == 400
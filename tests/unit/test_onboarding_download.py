@@ -133,6 +133,42 @@ async def test_download_document_proxies_bytes_with_security_headers(
         await cleanup_packet_storage(db_session, service, packet.id)
 
 
+async def test_download_document_ranges_and_revalidates_with_security_headers(
+    client, db_session, test_contact, test_user
+):
+    """Range → 206 and a matching If-None-Match → 304, both still no-store."""
+    service, packet, raw_download = await _complete_packet_via_routes(
+        client, db_session, test_contact.id, test_user.id
+    )
+    try:
+        landing = await client.get(f"/api/onboarding/download/{raw_download}")
+        doc_url = landing.json()["documents"][0]["url"]
+        full = await client.get(doc_url)
+        assert full.headers["accept-ranges"] == "bytes"
+        etag = full.headers["etag"]
+
+        partial = await client.get(doc_url, headers={"Range": "bytes=0-3"})
+        assert partial.status_code == 206
+        assert partial.content == b"%PDF"
+        assert partial.headers["content-range"] == f"bytes 0-3/{len(full.content)}"
+        assert partial.headers["cache-control"] == "no-store"
+        assert partial.headers["referrer-policy"] == "no-referrer"
+
+        unchanged = await client.get(doc_url, headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["cache-control"] == "no-store"
+        assert unchanged.headers["referrer-policy"] == "no-referrer"
+
+        past_end = await client.get(
+            doc_url, headers={"Range": f"bytes={len(full.content)}-"}
+        )
+        assert past_end.status_code == 416
+        assert past_end.headers["content-range"] == f"bytes */{len(full.content)}"
+    finally:
+        await cleanup_packet_storage(db_session, service, packet.id)
+
+
 async def test_unknown_download_token_404(client):
     """An unknown download token is a 404."""
     resp = await client.get(f"/api/onboarding/download/{tokens.mint_token()}")
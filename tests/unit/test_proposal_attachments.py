@@ -226,12 +226,15 @@ class TestSigningWithAttachments:
         assert response.status_code == 400
         assert "open every" in response.json()["detail"].lower()
 
-        async def fake_download(_: str) -> bytes:
-            return b"%PDF-1.4 fake signing document"
+        content = b"%PDF-1.4 fake signing document"
+
+        class FakeR2Client:
+            def get_object(self, **_):
+                return {"Body": io.BytesIO(content), "ContentLength": len(content)}
 
         monkeypatch.setattr(
-            "src.attachments.object_storage.download_object_bytes",
-            fake_download,
+            "src.attachments.object_storage._get_r2_client",
+            FakeR2Client,
         )
 
         download = await client.get(
@@ -240,6 +243,7 @@ class TestSigningWithAttachments:
             headers={"User-Agent": "SignDocView/1.0"},
         )
         assert download.status_code == 200, download.text
+        assert download.content == content
 
         rows = await db_session.execute(
             select(ProposalSigningDocumentView).where(
@@ -264,6 +268,56 @@ class TestSigningWithAttachments:
         assert response.json()["status"] == "accepted"
 
 
+    @pytest.mark.asyncio
+    async def test_signing_document_stream_is_closed_when_recording_fails(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        sent_proposal: Proposal,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        document = ProposalSigningDocument(
+            proposal_id=sent_proposal.id,
+            original_filename="service-agreement.pdf",
+            file_size=1200,
+            content_type="application/pdf",
+            pdf_path="proposals/1/signing-documents/1/source.pdf",
+            signature_field_coords={"page": 1, "x": 10, "y": 10, "w": 100, "h": 40},
+            date_field_coords={"page": 1, "x": 140, "y": 10, "w": 80, "h": 24},
+            display_order=0,
+            created_by_id=test_user.id,
+        )
+        db_session.add(document)
+        await db_session.commit()
+        await db_session.refresh(document)
+
+        body = io.BytesIO(b"%PDF-1.4 fake signing document")
+
+        class FakeR2Client:
+            def get_object(self, **_):
+                return {"Body": body, "ContentLength": len(body.getvalue())}
+
+        async def failing_record(*_, **__):
+            raise RuntimeError("view ledger unavailable")
+
+        monkeypatch.setattr(
+            "src.attachments.object_storage._get_r2_client",
+            FakeR2Client,
+        )
+        monkeypatch.setattr(
+            "src.proposals.router.record_signing_document_view",
+            failing_record,
+        )
+
+        with pytest.raises(RuntimeError, match="view ledger unavailable"):
+            await client.get(
+                f"/api/proposals/public/{sent_proposal.public_token}"
+                f"/signing-documents/{document.id}/download",
+            )
+        assert body.closed
+
+
 class TestPublicDownload:
     """GET /api/proposals/public/{token}/attachments/{id}/download"""
 
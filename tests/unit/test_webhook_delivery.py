@@ -0,0 +1,232 @@
+"""
+Webhook delivery engine — src.webhooks.delivery + WebhookService delivery.
+
+Covers the indexed event-subscription lookup, concurrent fan-out over the
+shared client, retry bookkeeping on WebhookDelivery and per-endpoint
+circuit breaking. HTTP goes through an httpx.MockTransport.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.models import User
+from src.webhooks import delivery as delivery_module
+from src.webhooks.delivery import WebhookDeliveryEngine
+from src.webhooks.models import WebhookDelivery
+from src.webhooks.schemas import WebhookCreate, WebhookUpdate
+from src.webhooks.service import WebhookService
+
+
+class _Endpoints:
+    """Scripted responses per URL path, recording calls and peak concurrency."""
+
+    def __init__(self):
+        self.responses: dict[str, list[int]] = {}
+        self.delays: dict[str, float] = {}
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.on_call = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls.append(path)
+        if self.on_call is not None:
+            await self.on_call()
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(path, 0))
+        finally:
+            self.active -= 1
+        script = self.responses.get(path) or [200]
+        status = script.pop(0) if len(script) > 1 else script[0]
+        return httpx.Response(status, text="ok" if status < 400 else "boom")
+
+
+@pytest.fixture
+def endpoints(monkeypatch):
+    recorder = _Endpoints()
+    engine = WebhookDeliveryEngine(
+        failure_threshold=2, reset_seconds=0.1, transport=httpx.MockTransport(recorder),
+    )
+    monkeypatch.setattr(delivery_module, "_engine", engine)
+    recorder.engine = engine
+    yield recorder
+
+
+async def _create(db: AsyncSession, user: User, path: str, events: list[str]):
+    return await WebhookService(db).create_webhook(
+        WebhookCreate(name=path, url=f"https://hooks.example.com{path}", events=events),
+        user.id,
+    )
+
+
+class TestSubscriptionLookup:
+    async def test_lookup_follows_events_and_active_flag(self, db_session: AsyncSession, test_user: User):
+        """Only active webhooks subscribed to the event are returned"""
+        service = WebhookService(db_session)
+        a = await _create(db_session, test_user, "/a", ["lead.created", "lead.created", "lead.updated"])
+        b = await _create(db_session, test_user, "/b", ["lead.updated"])
+        await _create(db_session, test_user, "/c", ["contact.created"])
+
+        assert {w.id for w in await service.get_active_webhooks_for_event("lead.updated")} == {a.id, b.id}
+
+        await service.update_webhook(a, WebhookUpdate(events=["contact.created"]))
+        await service.update_webhook(b, WebhookUpdate(is_active=False))
+        assert await service.get_active_webhooks_for_event("lead.updated") == []
+        assert len(await service.get_active_webhooks_for_event("contact.created")) == 2
+
+
+class TestDelivery:
+    async def test_fan_out_is_concurrent(self, db_session: AsyncSession, test_user: User, endpoints):
+        """A slow endpoint does not serialize delivery to the others"""
+        webhooks = [await _create(db_session, test_user, f"/{i}", ["lead.created"]) for i in range(4)]
+        endpoints.delays = {"/0": 0.2, "/1": 0.2, "/2": 0.2, "/3": 0.2}
+
+        deliveries = await WebhookService(db_session).deliver_to_webhooks(
+            webhooks, "lead.created", {"event": "lead.created", "data": {"id": 1}},
+        )
+        assert endpoints.peak == 4
+        assert [(d.status, d.attempts, d.response_code) for d in deliveries] == [("success", 1, 200)] * 4
+
+    async def test_retryable_failure_is_retried_later(self, db_session: AsyncSession, test_user: User, endpoints):
+        """A 503 leaves the delivery in retry; the sweep re-sends it once due"""
+        webhook = await _create(db_session, test_user, "/flaky", ["lead.created"])
+        endpoints.responses["/flaky"] = [503, 200]
+        service = WebhookService(db_session)
+
+        delivery = await service.deliver_webhook(webhook, "lead.created", {"event": "lead.created"})
+        assert (delivery.status, delivery.attempts, delivery.response_code) == ("retry", 1, 503)
+        assert delivery.next_retry_at is not None
+        assert await service.process_retries() == 0  # backoff not elapsed
+
+        await db_session.execute(
+            update(WebhookDelivery).values(next_retry_at=datetime.now(UTC))
+        )
+        assert await service.process_retries() == 1
+        await db_session.refresh(delivery)
+        assert (delivery.status, delivery.attempts, delivery.error, delivery.next_retry_at) == (
+            "success", 2, None, None,
+        )
+
+    async def test_retry_is_sent_after_the_claim_commits(
+        self, db_session: AsyncSession, test_user: User, endpoints
+    ):
+        """No transaction is open while a retry is in flight, and the row is leased"""
+        webhook = await _create(db_session, test_user, "/slow", ["lead.created"])
+        endpoints.responses["/slow"] = [503, 200]
+        service = WebhookService(db_session)
+        delivery = await service.deliver_webhook(webhook, "lead.created", {"event": "lead.created"})
+        await db_session.execute(update(WebhookDelivery).values(next_retry_at=datetime.now(UTC)))
+        await db_session.commit()
+
+        seen = []
+
+        async def during_send():
+            seen.append(db_session.in_transaction())
+            lease = (await db_session.execute(
+                select(WebhookDelivery.next_retry_at).where(WebhookDelivery.id == delivery.id)
+            )).scalar_one()
+            seen.append(lease.replace(tzinfo=UTC) > datetime.now(UTC))
+            await db_session.rollback()
+
+        endpoints.on_call = during_send
+        assert await service.process_retries() == 1
+        assert seen == [False, True]
+        await db_session.refresh(delivery)
+        assert (delivery.status, delivery.next_retry_at) == ("success", None)
+
+    @pytest.mark.parametrize(("status", "retry"), [(400, True), (503, False)])
+    async def test_permanent_failures_are_not_retried(
+        self, db_session: AsyncSession, test_user: User, endpoints, status: int, retry: bool
+    ):
+        """Rejected requests, and deliveries sent with retry=False, fail at once"""
+        webhook = await _create(db_session, test_user, "/bad", ["lead.created"])
+        endpoints.responses["/bad"] = [status]
+        delivery = await WebhookService(db_session).deliver_webhook(
+            webhook, "lead.created", {"event": "lead.created"}, retry=retry,
+        )
+        assert (delivery.status, delivery.next_retry_at) == ("failed", None)
+
+    async def test_gives_up_after_max_attempts(
+        self, db_session: AsyncSession, test_user: User, endpoints, monkeypatch
+    ):
+        """The final retryable failure is recorded as failed"""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "WEBHOOK_MAX_ATTEMPTS", 2)
+        endpoints.engine.failure_threshold = 10
+        webhook = await _create(db_session, test_user, "/down", ["lead.created"])
+        endpoints.responses["/down"] = [500]
+        service = WebhookService(db_session)
+        delivery = await service.deliver_webhook(webhook, "lead.created", {"event": "lead.created"})
+        await db_session.execute(update(WebhookDelivery).values(next_retry_at=datetime.now(UTC)))
+        await service.process_retries()
+        await db_session.refresh(delivery)
+        assert (delivery.status, delivery.attempts) == ("failed", 2)
+
+
+class TestEventHandler:
+    async def test_handler_errors_reach_the_outbox(self, db_session: AsyncSession, monkeypatch):
+        """A failed delivery run raises, so the outbox dispatcher retries the row"""
+        from src.events.service import emit, off, on
+        from src.webhooks.event_handler import webhook_event_handler
+
+        async def lookup_fails(self, event_type):
+            raise RuntimeError("database went away")
+
+        monkeypatch.setattr(WebhookService, "get_active_webhooks_for_event", lookup_fails)
+        with pytest.raises(RuntimeError, match="database went away"):
+            await webhook_event_handler("lead.created", {"entity_id": 1})
+
+        # Inline delivery (no outbox) still only logs it.
+        on("test.webhook", webhook_event_handler)
+        try:
+            await emit("test.webhook", {"entity_id": 1})
+        finally:
+            off("test.webhook", webhook_event_handler)
+
+class TestCircuitBreaker:
+    async def test_open_circuit_skips_endpoint_until_probe(self, endpoints):
+        """Consecutive failures open the breaker; after the reset window one probe goes out"""
+        engine = endpoints.engine
+        url = "https://hooks.example.com/dead"
+        endpoints.responses["/dead"] = [502, 502, 200]
+
+        for _ in range(2):
+            assert (await engine.post(url, b"{}", {})).retryable
+        skipped = await engine.post(url, b"{}", {})
+        assert skipped.status_code is None and skipped.retry_after > 0
+        assert endpoints.calls == ["/dead", "/dead"]
+        assert (await engine.post("https://hooks.example.com/other", b"{}", {})).ok
+
+        await asyncio.sleep(0.12)
+        assert (await engine.post(url, b"{}", {})).ok
+        assert engine.breaker(url).state == "closed"
+
+    async def test_failed_probe_reopens(self, endpoints):
+        """A failing half-open probe re-opens the breaker for another window"""
+        engine = endpoints.engine
+        url = "https://hooks.example.com/dead"
+        endpoints.responses["/dead"] = [500]
+        for _ in range(2):
+            await engine.post(url, b"{}", {})
+        await asyncio.sleep(0.12)
+        await engine.post(url, b"{}", {})
+        assert engine.breaker(url).state == "open"
+        assert len(endpoints.calls) == 3
+
+    async def test_client_errors_do_not_trip_breaker(self, endpoints):
+        """4xx responses show the endpoint is up"""
+        engine = endpoints.engine
+        url = "https://hooks.example.com/strict"
+        endpoints.responses["/strict"] = [422]
+        for _ in range(3):
+            result = await engine.post(url, b"{}", {})
+            assert result.status_code == 422 and not result.retryable
+        assert engine.breaker(url).state == "closed"